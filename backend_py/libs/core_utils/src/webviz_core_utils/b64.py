@@ -1,4 +1,5 @@
 import base64
+from enum import StrEnum
 from typing import Literal
 from pydantic import BaseModel
 
@@ -21,6 +22,38 @@ class B64IntArray(BaseModel):
     data_b64str: str
 
 
+class B64QuantizedFloatArray(BaseModel):
+    """
+    Float array quantized to unsigned integers, decoded as: value = offset + scale * quantized_value
+
+    The max value of the element type is reserved for undefined (non-finite) values, which decode to NaN.
+    The absolute error of every decoded defined value is at most max_abs_error.
+    """
+
+    element_type: Literal["uint8", "uint16"]
+    data_b64str: str
+    scale: float
+    offset: float
+    undefined_value: int
+    max_abs_error: float
+
+
+class ValueEncoding(StrEnum):
+    """
+    Encoding options for value arrays in responses
+
+    * float32: 32bit float values, the default
+    * uint16q: float values quantized to 16 bit, lossy
+    * uint8q: float values quantized to 8 bit, lossy
+    * native_int: integer values are kept as integers of the smallest possible size, float values are sent as float32
+    """
+
+    FLOAT32 = "float32"
+    UINT16Q = "uint16q"
+    UINT8Q = "uint8q"
+    NATIVE_INT = "native_int"
+
+
 # class B64TypedArray(BaseModel):
 #     element_type: Literal["float32", "float64", "uint16", "uint32", "uint64", "int16", "int32"]
 #     data_b64str: str
@@ -44,6 +77,56 @@ def b64_encode_float_array_as_float64(input_arr: NDArray[np.floating] | list[flo
     return B64FloatArray(element_type="float64", data_b64str=base64_str)
 
 
+def b64_encode_float_array_quantized(
+    input_arr: NDArray[np.floating] | list[float], element_type: Literal["uint8", "uint16"]
+) -> B64QuantizedFloatArray:
+    """
+    Base64 encodes an array of floating point numbers quantized to 8 or 16 bit unsigned integers.
+    The quantization range spans the finite values of the array, and non-finite values are encoded as undefined.
+    """
+    np_arr = np.asarray(input_arr, dtype=np.float64)
+    dtype = np.uint8 if element_type == "uint8" else np.uint16
+    undefined_value = int(np.iinfo(dtype).max)
+    num_steps = undefined_value - 1
+
+    is_finite = np.isfinite(np_arr)
+    finite_values = np_arr[is_finite]
+    min_value = float(finite_values.min()) if len(finite_values) > 0 else 0.0
+    max_value = float(finite_values.max()) if len(finite_values) > 0 else 0.0
+
+    value_range = max_value - min_value
+    scale = value_range / num_steps if value_range > 0 else 1.0
+    max_abs_error = scale / 2 if value_range > 0 else 0.0
+
+    quantized_arr = np.full(np_arr.shape, undefined_value, dtype=dtype)
+    quantized_arr[is_finite] = np.rint((finite_values - min_value) / scale)
+
+    base64_str = _base64_encode_numpy_arr_to_str(quantized_arr)
+    return B64QuantizedFloatArray(
+        element_type=element_type,
+        data_b64str=base64_str,
+        scale=scale,
+        offset=min_value,
+        undefined_value=undefined_value,
+        max_abs_error=max_abs_error,
+    )
+
+
+def b64_encode_float_array_with_value_encoding(
+    input_arr: NDArray[np.floating] | list[float], value_encoding: ValueEncoding
+) -> B64FloatArray | B64QuantizedFloatArray:
+    """
+    Base64 encodes an array of floating point numbers using the requested value encoding.
+    The native_int encoding does not apply to float values, which are then encoded as float32.
+    """
+    if value_encoding == ValueEncoding.UINT16Q:
+        return b64_encode_float_array_quantized(input_arr, "uint16")
+    if value_encoding == ValueEncoding.UINT8Q:
+        return b64_encode_float_array_quantized(input_arr, "uint8")
+
+    return b64_encode_float_array_as_float32(input_arr)
+
+
 def b64_encode_int_array_as_int32(input_arr: NDArray[np.integer] | list[int]) -> B64IntArray:
     """
     Base64 encodes an array of signed integers as using 32bit int element size.
@@ -142,6 +225,20 @@ def b64_decode_float_array(base64_arr: B64FloatArray) -> NDArray[np.floating]:
     raise ValueError(f"Unknown element_type: {base64_arr.element_type}")
 
 
+def b64_decode_quantized_float_array(base64_arr: B64QuantizedFloatArray) -> NDArray[np.float32]:
+    decoded_bytes = _base64_decode_b64str_to_bytes(base64_arr.data_b64str)
+    if base64_arr.element_type == "uint8":
+        quantized_arr: NDArray[np.unsignedinteger] = np.frombuffer(decoded_bytes, dtype=np.uint8)
+    elif base64_arr.element_type == "uint16":
+        quantized_arr = np.frombuffer(decoded_bytes, dtype=np.uint16)
+    else:
+        raise ValueError(f"Unknown element_type: {base64_arr.element_type}")
+
+    np_array = base64_arr.offset + base64_arr.scale * quantized_arr.astype(np.float64)
+    np_array[quantized_arr == base64_arr.undefined_value] = np.nan
+    return np_array.astype(np.float32)
+
+
 def b64_decode_int_array(base64_arr: B64IntArray) -> NDArray[np.integer]:
     decoded_bytes = _base64_decode_b64str_to_bytes(base64_arr.data_b64str)
     if base64_arr.element_type == "int8":
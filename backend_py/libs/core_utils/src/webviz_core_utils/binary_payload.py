@@ -0,0 +1,169 @@
+import base64
+import struct
+from collections.abc import AsyncIterator
+from typing import Literal, cast, get_args
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from webviz_core_utils.b64 import B64FloatArray, B64IntArray, B64UintArray
+
+# Binary payload format:
+#   [header length as little endian uint32][header as utf8 encoded JSON][concatenated raw array buffers]
+# The header describes the arrays by reference to their location in the buffer section of the payload.
+#
+# Multiple payloads can be streamed as frames, where each frame is prefixed by its length as little endian uint32.
+
+_HEADER_LENGTH_STRUCT = struct.Struct("<I")
+
+BufferElementType = Literal["float32", "float64", "uint8", "uint16", "uint32", "int8", "int16", "int32"]
+_SUPPORTED_ELEMENT_TYPES: tuple[str, ...] = get_args(BufferElementType)
+
+
+class BinaryBufferRef(BaseModel):
+    """Reference to a raw little endian array buffer within the buffer section of a binary payload"""
+
+    element_type: BufferElementType
+    byte_offset: int
+    byte_length: int
+
+
+class BinaryPayloadWriter:
+    """
+    Builds a binary payload consisting of a JSON header followed by raw array buffers.
+
+    Arrays are added first, each returning a reference that should be included in the header model,
+    before the payload is assembled with to_bytes().
+    """
+
+    def __init__(self) -> None:
+        self._buffers: list[bytes | memoryview] = []
+        self._byte_count = 0
+
+    def add_array(self, np_arr: NDArray) -> BinaryBufferRef:
+        element_type = str(np_arr.dtype)
+        if element_type not in _SUPPORTED_ELEMENT_TYPES:
+            raise ValueError(f"Unsupported element type for binary payload: {element_type}")
+
+        contiguous_arr = np.ascontiguousarray(np_arr).ravel()
+        buffer = memoryview(contiguous_arr).cast("B")
+        buffer_ref = BinaryBufferRef(
+            element_type=cast(BufferElementType, element_type), byte_offset=self._byte_count, byte_length=len(buffer)
+        )
+
+        self._buffers.append(buffer)
+        self._byte_count += len(buffer)
+        return buffer_ref
+
+    def to_bytes(self, header: BaseModel) -> bytes:
+        header_bytes = header.model_dump_json().encode("utf-8")
+        return b"".join([_HEADER_LENGTH_STRUCT.pack(len(header_bytes)), header_bytes, *self._buffers])
+
+
+def as_smallest_uint_array(input_arr: NDArray[np.integer] | list[int], max_value: int) -> NDArray[np.unsignedinteger]:
+    """
+    Convert to the smallest unsigned int element type able to hold max_value, for adding to a binary payload.
+    Same choice of element size as b64_encode_uint_array_as_smallest_size(), except that 64bit is not supported.
+    """
+    if max_value <= np.iinfo(np.uint8).max:
+        return np.asarray(input_arr, dtype=np.uint8)
+    if max_value <= np.iinfo(np.uint16).max:
+        return np.asarray(input_arr, dtype=np.uint16)
+    if max_value <= np.iinfo(np.uint32).max:
+        return np.asarray(input_arr, dtype=np.uint32)
+
+    raise ValueError(f"Max value {max_value} does not fit in any supported unsigned int element type")
+
+
+def as_smallest_int_array(input_arr: NDArray[np.integer], min_value: int, max_value: int) -> NDArray[np.signedinteger]:
+    """
+    Convert to the smallest signed int element type able to hold min_value and max_value, for adding to a binary
+    payload. Same choice of element size as b64_encode_int_array_as_smallest_size().
+    """
+    if min_value >= np.iinfo(np.int8).min and max_value <= np.iinfo(np.int8).max:
+        return np.asarray(input_arr, dtype=np.int8)
+    if min_value >= np.iinfo(np.int16).min and max_value <= np.iinfo(np.int16).max:
+        return np.asarray(input_arr, dtype=np.int16)
+    if min_value >= np.iinfo(np.int32).min and max_value <= np.iinfo(np.int32).max:
+        return np.asarray(input_arr, dtype=np.int32)
+
+    raise ValueError(f"Value range [{min_value}, {max_value}] does not fit in any supported int element type")
+
+
+def split_binary_payload(payload: bytes) -> tuple[bytes, memoryview]:
+    """Split binary payload into the JSON header bytes and a zero-copy view of the buffer section"""
+    if len(payload) < _HEADER_LENGTH_STRUCT.size:
+        raise ValueError("Binary payload is too short to contain a header")
+
+    (header_length,) = _HEADER_LENGTH_STRUCT.unpack_from(payload, 0)
+    header_end = _HEADER_LENGTH_STRUCT.size + header_length
+    if header_end > len(payload):
+        raise ValueError("Binary payload header length exceeds payload size")
+
+    payload_view = memoryview(payload)
+    return bytes(payload_view[_HEADER_LENGTH_STRUCT.size : header_end]), payload_view[header_end:]
+
+
+def make_length_prefixed_frame(payload: bytes) -> bytes:
+    return _HEADER_LENGTH_STRUCT.pack(len(payload)) + payload
+
+
+async def iterate_length_prefixed_frames_async(byte_chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Reassemble length prefixed frames from a stream of arbitrarily sized byte chunks"""
+    pending = bytearray()
+    async for chunk in byte_chunks:
+        pending.extend(chunk)
+        while len(pending) >= _HEADER_LENGTH_STRUCT.size:
+            (frame_length,) = _HEADER_LENGTH_STRUCT.unpack_from(pending, 0)
+            frame_end = _HEADER_LENGTH_STRUCT.size + frame_length
+            if len(pending) < frame_end:
+                break
+
+            frame = bytes(pending[_HEADER_LENGTH_STRUCT.size : frame_end])
+            del pending[:frame_end]
+            yield frame
+
+    if pending:
+        raise ValueError("Stream ended with an incomplete frame")
+
+
+def get_buffer_view(buffers_view: memoryview, buffer_ref: BinaryBufferRef) -> memoryview:
+    end = buffer_ref.byte_offset + buffer_ref.byte_length
+    if end > len(buffers_view):
+        raise ValueError("Buffer reference exceeds the size of the binary payload")
+
+    return buffers_view[buffer_ref.byte_offset : end]
+
+
+def get_numpy_array_view(buffers_view: memoryview, buffer_ref: BinaryBufferRef) -> NDArray:
+    """Get a read only numpy array viewing the referenced buffer, no data is copied"""
+    return np.frombuffer(get_buffer_view(buffers_view, buffer_ref), dtype=np.dtype(buffer_ref.element_type))
+
+
+def b64_encode_buffer_as_float_array(buffers_view: memoryview, buffer_ref: BinaryBufferRef) -> B64FloatArray:
+    if buffer_ref.element_type not in ("float32", "float64"):
+        raise ValueError(f"Buffer element type {buffer_ref.element_type} is not a float type")
+
+    data_b64str = _base64_encode_buffer_to_str(get_buffer_view(buffers_view, buffer_ref))
+    return B64FloatArray(element_type=buffer_ref.element_type, data_b64str=data_b64str)
+
+
+def b64_encode_buffer_as_uint_array(buffers_view: memoryview, buffer_ref: BinaryBufferRef) -> B64UintArray:
+    if buffer_ref.element_type not in ("uint8", "uint16", "uint32"):
+        raise ValueError(f"Buffer element type {buffer_ref.element_type} is not an unsigned int type")
+
+    data_b64str = _base64_encode_buffer_to_str(get_buffer_view(buffers_view, buffer_ref))
+    return B64UintArray(element_type=buffer_ref.element_type, data_b64str=data_b64str)
+
+
+def b64_encode_buffer_as_int_array(buffers_view: memoryview, buffer_ref: BinaryBufferRef) -> B64IntArray:
+    if buffer_ref.element_type not in ("int8", "int16", "int32"):
+        raise ValueError(f"Buffer element type {buffer_ref.element_type} is not a signed int type")
+
+    data_b64str = _base64_encode_buffer_to_str(get_buffer_view(buffers_view, buffer_ref))
+    return B64IntArray(element_type=buffer_ref.element_type, data_b64str=data_b64str)
+
+
+def _base64_encode_buffer_to_str(buffer: memoryview) -> str:
+    return base64.b64encode(buffer).decode("ascii")
@@ -0,0 +1,149 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True, kw_only=True)
+class LruCacheStats:
+    num_entries: int
+    total_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class LruCache(Generic[K, V]):
+    """
+    Simple in-process LRU cache with optional time to live and optional size budget.
+
+    The size budget is only enforced if a size_func is given, in which case the total size of all entries
+    (as reported by size_func) is kept below max_total_size by evicting least recently used entries.
+    An entry that is larger than the entire budget will not be stored at all.
+
+    Note that the cache is not thread safe, it is intended for use from code running on a single event loop.
+
+    Caches given a name are registered for reporting of their stats, see get_all_named_cache_stats().
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_s: float | None = None,
+        max_total_size: int | None = None,
+        size_func: Callable[[V], int] | None = None,
+        name: str | None = None,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be a positive number")
+        if (max_total_size is None) != (size_func is None):
+            raise ValueError("max_total_size and size_func must be specified together")
+
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._max_total_size = max_total_size
+        self._size_func = size_func
+
+        # Per key we store (value, size, expiry time)
+        self._entries: OrderedDict[K, tuple[V, int, float | None]] = OrderedDict()
+        self._total_size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        if name is not None:
+            _NAMED_CACHE_REGISTRY[name] = self
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        value, _size, expiry_s = entry
+        if expiry_s is not None and time.monotonic() >= expiry_s:
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_s: float | None = None) -> None:
+        """Store value under key, the ttl_s argument overrides the cache's default time to live"""
+        if key in self._entries:
+            self._remove(key)
+
+        size = self._size_func(value) if self._size_func else 0
+        if self._max_total_size is not None and size > self._max_total_size:
+            return
+
+        use_ttl_s = ttl_s if ttl_s is not None else self._ttl_s
+        expiry_s = time.monotonic() + use_ttl_s if use_ttl_s is not None else None
+
+        self._entries[key] = (value, size, expiry_s)
+        self._total_size += size
+
+        while len(self._entries) > self._max_entries or (
+            self._max_total_size is not None and self._total_size > self._max_total_size
+        ):
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def pop(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        self._remove(key)
+        return entry[0]
+
+    def pop_matching(self, predicate: Callable[[K], bool]) -> int:
+        """Remove all entries whose key satisfies the predicate, returns number of removed entries"""
+        keys_to_remove = [key for key in self._entries if predicate(key)]
+        for key in keys_to_remove:
+            self._remove(key)
+
+        return len(keys_to_remove)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._total_size = 0
+
+    def get_stats(self) -> LruCacheStats:
+        return LruCacheStats(
+            num_entries=len(self._entries),
+            total_size=self._total_size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: K) -> bool:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+
+        expiry_s = entry[2]
+        return expiry_s is None or time.monotonic() < expiry_s
+
+    def _remove(self, key: K) -> None:
+        _value, size, _expiry_s = self._entries.pop(key)
+        self._total_size -= size
+
+
+# All named cache instances by name, for reporting of stats
+_NAMED_CACHE_REGISTRY: dict[str, LruCache] = {}
+
+
+def get_all_named_cache_stats() -> dict[str, LruCacheStats]:
+    return {name: cache.get_stats() for name, cache in _NAMED_CACHE_REGISTRY.items()}
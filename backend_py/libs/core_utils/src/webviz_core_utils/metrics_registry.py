@@ -0,0 +1,190 @@
+import bisect
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Literal
+
+# Upper bounds (in ms) of the histogram buckets used for durations, an implicit +Inf bucket is always added
+DURATION_BUCKETS_MS: tuple[float, ...] = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+# Name of the histogram fed by the lap metrics recorded through PerfMetrics and ResponsePerfMetrics
+LAP_DURATION_METRIC_NAME = "webviz_lap_duration_ms"
+
+# Sorted (label name, label value) pairs
+MetricLabels = tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, kw_only=True)
+class CollectedMetricSample:
+    """Sample produced by a collector at scrape time, e.g. from the stats of a cache"""
+
+    kind: Literal["counter", "gauge"]
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+class _Histogram:
+    __slots__ = ("bucket_counts", "sum", "count")
+
+    def __init__(self, num_buckets: int) -> None:
+        # The last bucket is the +Inf bucket. Counts are per bucket, they are accumulated when rendered.
+        self.bucket_counts = [0] * (num_buckets + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """
+    In-process registry of counters, gauges and histograms, which can be rendered in the Prometheus text format.
+
+    Updates are plain in-memory increments without any locking, and all aggregation into the exposition format
+    is deferred until scrape time, keeping the cost of recording a sample to a dict lookup and a few additions.
+    The registry is intended to be updated from code running on a single event loop. Updates done concurrently
+    from worker threads may occasionally be lost, which is accepted rather than paying for a lock on every update.
+
+    Collectors can be registered to produce samples at scrape time from state that is tracked elsewhere.
+    """
+
+    def __init__(self, duration_buckets_ms: tuple[float, ...] = DURATION_BUCKETS_MS) -> None:
+        self._bucket_bounds = duration_buckets_ms
+        self._counters: dict[tuple[str, MetricLabels], float] = {}
+        self._gauges: dict[tuple[str, MetricLabels], float] = {}
+        self._histograms: dict[tuple[str, MetricLabels], _Histogram] = {}
+        self._collectors: list[Callable[[], Iterable[CollectedMetricSample]]] = []
+
+    def increment_counter(self, name: str, amount: float = 1, **labels: str) -> None:
+        key = (name, _make_labels(labels))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def add_to_gauge(self, name: str, amount: float, **labels: str) -> None:
+        key = (name, _make_labels(labels))
+        self._gauges[key] = self._gauges.get(key, 0) + amount
+
+    def set_gauge(self, name: str, value: float, **labels: str) -> None:
+        self._gauges[(name, _make_labels(labels))] = value
+
+    def observe_histogram(self, name: str, value: float, **labels: str) -> None:
+        key = (name, _make_labels(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = _Histogram(len(self._bucket_bounds))
+            self._histograms[key] = histogram
+
+        histogram.bucket_counts[bisect.bisect_left(self._bucket_bounds, value)] += 1
+        histogram.sum += value
+        histogram.count += 1
+
+    def register_collector(self, collector: Callable[[], Iterable[CollectedMetricSample]]) -> None:
+        self._collectors.append(collector)
+
+    def clear(self) -> None:
+        """Remove all recorded samples, registered collectors are kept"""
+        self._counters.clear()
+        self._gauges.clear()
+        self._histograms.clear()
+
+    def to_prometheus_text(self) -> str:
+        """Render all metrics, including the samples of the registered collectors, in the Prometheus text format"""
+        counters = dict(self._counters)
+        gauges = dict(self._gauges)
+        for collector in self._collectors:
+            for sample in collector():
+                target = counters if sample.kind == "counter" else gauges
+                target[(sample.name, _make_labels(sample.labels))] = sample.value
+
+        lines: list[str] = []
+        _append_simple_metric_lines(lines, "counter", counters)
+        _append_simple_metric_lines(lines, "gauge", gauges)
+
+        # Copy the histograms, since new keys may be added by requests completing while rendering
+        histograms = sorted(self._histograms.items())
+        prev_name: str | None = None
+        for (name, labels), histogram in histograms:
+            if name != prev_name:
+                lines.append(f"# TYPE {name} histogram")
+                prev_name = name
+
+            cumulative_count = 0
+            for bound, bucket_count in zip([*self._bucket_bounds, None], list(histogram.bucket_counts)):
+                cumulative_count += bucket_count
+                le_str = "+Inf" if bound is None else _format_value(bound)
+                lines.append(f"{name}_bucket{_format_labels((*labels, ('le', le_str)))} {cumulative_count}")
+
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _make_labels(labels: dict[str, str]) -> MetricLabels:
+    if not labels:
+        return ()
+    return tuple(sorted(labels.items()))
+
+
+def _append_simple_metric_lines(
+    lines: list[str], kind: Literal["counter", "gauge"], samples: dict[tuple[str, MetricLabels], float]
+) -> None:
+    prev_name: str | None = None
+    for (name, labels), value in sorted(samples.items()):
+        if name != prev_name:
+            lines.append(f"# TYPE {name} {kind}")
+            prev_name = name
+        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+
+def _format_labels(labels: MetricLabels) -> str:
+    if not labels:
+        return ""
+
+    label_strings = [f'{label_name}="{_escape_label_value(value)}"' for label_name, value in labels]
+    return "{" + ",".join(label_strings) + "}"
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# The process wide registry
+METRICS_REGISTRY = MetricsRegistry()
+
+# Laps recorded during the current request, the list is shared with any tasks spawned while handling the request
+_REQUEST_LAPS_CONTEXT: ContextVar[list[tuple[str, float]] | None] = ContextVar("_REQUEST_LAPS_CONTEXT", default=None)
+
+
+def record_lap_metric(lap_name: str, duration_ms: float) -> None:
+    """
+    Feed a lap duration to the lap duration histogram.
+
+    Inside a request, see collect_request_laps(), the lap is buffered so that it can be labelled with the request's
+    route once the request completes. Outside a request the lap is dropped, so that processes without a metrics
+    endpoint, or work not tied to a request, do not grow the process wide registry.
+    """
+    request_laps = _REQUEST_LAPS_CONTEXT.get()
+    if request_laps is not None:
+        request_laps.append((lap_name, duration_ms))
+
+
+@contextmanager
+def collect_request_laps() -> Iterator[list[tuple[str, float]]]:
+    """Collect the laps recorded within the context, yields the list of (lap name, duration in ms) as it fills up"""
+    request_laps: list[tuple[str, float]] = []
+    token = _REQUEST_LAPS_CONTEXT.set(request_laps)
+    try:
+        yield request_laps
+    finally:
+        _REQUEST_LAPS_CONTEXT.reset(token)
+
+
+def observe_request_laps(route: str, request_laps: Iterable[tuple[str, float]]) -> None:
+    """Record laps collected with collect_request_laps() in the lap duration histogram, labelled with the route"""
+    for lap_name, duration_ms in request_laps:
+        METRICS_REGISTRY.observe_histogram(LAP_DURATION_METRIC_NAME, duration_ms, route=route, lap=lap_name)
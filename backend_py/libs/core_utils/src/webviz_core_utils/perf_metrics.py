@@ -1,3 +1,4 @@
+from .metrics_registry import record_lap_metric
 from .perf_timer import PerfTimer
 
 
@@ -9,6 +10,7 @@ class PerfMetrics:
     def set_metric(self, metric_name: str, duration_ms: int | float) -> None:
         int_duration_ms = int(duration_ms)
         self._metrics_dict[metric_name] = int_duration_ms
+        record_lap_metric(metric_name, int_duration_ms)
 
     def record_lap(self, metric_name: str) -> None:
         """Records metric with a duration since the last lap"""
@@ -114,3 +114,52 @@ def test_encode_uint_as_smallest_size() -> None:
     decoded_arr = b64.b64_decode_uint_array(b64_arr)
     assert decoded_arr.dtype == np.uint64
     assert np.array_equal(decoded_arr, input_list_uint64)
+
+
+def test_encode_quantized_uint8() -> None:
+    input_list = [0.0, float("nan"), 2.5, 10.0, float("inf")]
+    b64_arr = b64.b64_encode_float_array_quantized(input_list, "uint8")
+    assert b64_arr.element_type == "uint8"
+    assert b64_arr.offset == 0.0
+    assert b64_arr.max_abs_error == 10.0 / 254 / 2
+
+    decoded_list = b64.b64_decode_quantized_float_array(b64_arr).tolist()
+    assert decoded_list[0] == 0.0
+    assert math.isnan(decoded_list[1])
+    assert abs(decoded_list[2] - 2.5) <= b64_arr.max_abs_error
+    assert decoded_list[3] == 10.0
+    assert math.isnan(decoded_list[4])
+
+
+def test_encode_quantized_uint16_error_bound() -> None:
+    input_arr = np.random.default_rng(seed=123).uniform(-1000, 1000, size=1000).astype(np.float32)
+    b64_arr = b64.b64_encode_float_array_quantized(input_arr, "uint16")
+    assert b64_arr.element_type == "uint16"
+
+    decoded_arr = b64.b64_decode_quantized_float_array(b64_arr)
+    # Allow for float32 rounding of the decoded values
+    assert np.max(np.abs(decoded_arr - input_arr)) <= b64_arr.max_abs_error * 1.001
+
+
+def test_encode_quantized_constant_and_empty() -> None:
+    b64_arr = b64.b64_encode_float_array_quantized([5.0, 5.0], "uint8")
+    assert b64_arr.max_abs_error == 0.0
+    assert b64.b64_decode_quantized_float_array(b64_arr).tolist() == [5.0, 5.0]
+
+    b64_arr = b64.b64_encode_float_array_quantized([], "uint16")
+    assert len(b64.b64_decode_quantized_float_array(b64_arr)) == 0
+
+
+def test_encode_with_value_encoding() -> None:
+    input_list = [1.0, 2.0]
+    assert (
+        b64.b64_encode_float_array_with_value_encoding(input_list, b64.ValueEncoding.FLOAT32).element_type == "float32"
+    )
+    assert (
+        b64.b64_encode_float_array_with_value_encoding(input_list, b64.ValueEncoding.NATIVE_INT).element_type
+        == "float32"
+    )
+    assert (
+        b64.b64_encode_float_array_with_value_encoding(input_list, b64.ValueEncoding.UINT16Q).element_type == "uint16"
+    )
+    assert b64.b64_encode_float_array_with_value_encoding(input_list, b64.ValueEncoding.UINT8Q).element_type == "uint8"
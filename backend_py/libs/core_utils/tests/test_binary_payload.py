@@ -0,0 +1,166 @@
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from webviz_core_utils import b64
+from webviz_core_utils.binary_payload import BinaryBufferRef, BinaryPayloadWriter
+from webviz_core_utils.binary_payload import split_binary_payload, get_numpy_array_view
+from webviz_core_utils.binary_payload import b64_encode_buffer_as_float_array, b64_encode_buffer_as_int_array
+from webviz_core_utils.binary_payload import b64_encode_buffer_as_uint_array
+from webviz_core_utils.binary_payload import make_length_prefixed_frame, iterate_length_prefixed_frames_async
+from webviz_core_utils.binary_payload import as_smallest_int_array, as_smallest_uint_array
+
+
+class _Header(BaseModel):
+    name: str
+    floats: BinaryBufferRef
+    uints: BinaryBufferRef
+    ints: BinaryBufferRef
+
+
+class _IntHeader(BaseModel):
+    values: BinaryBufferRef
+
+
+def _make_payload() -> bytes:
+    writer = BinaryPayloadWriter()
+    header = _Header(
+        name="test",
+        floats=writer.add_array(np.array([1.5, -2.0, np.nan], dtype=np.float32)),
+        uints=writer.add_array(np.array([[1, 2], [3, 4]], dtype=np.uint16)),
+        ints=writer.add_array(np.array([-1, 5], dtype=np.int8)),
+    )
+    return writer.to_bytes(header)
+
+
+def test_round_trip() -> None:
+    header_bytes, buffers_view = split_binary_payload(_make_payload())
+    header = _Header.model_validate_json(header_bytes)
+    assert header.name == "test"
+    assert header.uints.element_type == "uint16"
+    assert header.uints.byte_length == 8
+
+    float_arr = get_numpy_array_view(buffers_view, header.floats)
+    assert float_arr.dtype == np.float32
+    assert float_arr[:2].tolist() == [1.5, -2.0]
+    assert np.isnan(float_arr[2])
+    assert get_numpy_array_view(buffers_view, header.uints).tolist() == [1, 2, 3, 4]
+    assert get_numpy_array_view(buffers_view, header.ints).tolist() == [-1, 5]
+
+
+def test_buffers_encode_to_same_b64_as_arrays() -> None:
+    header_bytes, buffers_view = split_binary_payload(_make_payload())
+    header = _Header.model_validate_json(header_bytes)
+
+    b64_float_arr = b64_encode_buffer_as_float_array(buffers_view, header.floats)
+    assert b64_float_arr == b64.b64_encode_float_array_as_float32(np.array([1.5, -2.0, np.nan]))
+
+    b64_uint_arr = b64_encode_buffer_as_uint_array(buffers_view, header.uints)
+    assert b64.b64_decode_uint_array(b64_uint_arr).tolist() == [1, 2, 3, 4]
+
+    b64_int_arr = b64_encode_buffer_as_int_array(buffers_view, header.ints)
+    assert b64_int_arr == b64.b64_encode_int_array_as_smallest_size([-1, 5])
+
+    with pytest.raises(ValueError):
+        b64_encode_buffer_as_float_array(buffers_view, header.ints)
+
+
+def test_invalid_payloads() -> None:
+    with pytest.raises(ValueError):
+        BinaryPayloadWriter().add_array(np.array([1, 2], dtype=np.int64))
+
+    with pytest.raises(ValueError):
+        split_binary_payload(b"\x01")
+
+    payload = _make_payload()
+    with pytest.raises(ValueError):
+        split_binary_payload(payload[:10])
+
+    header_bytes, buffers_view = split_binary_payload(payload[:-1])
+    header = _Header.model_validate_json(header_bytes)
+    with pytest.raises(ValueError):
+        get_numpy_array_view(buffers_view, header.ints)
+
+
+@pytest.mark.parametrize(
+    "max_value, expected_dtype",
+    [(0, np.uint8), (255, np.uint8), (256, np.uint16), (65535, np.uint16), (65536, np.uint32), (2**32 - 1, np.uint32)],
+)
+def test_as_smallest_uint_array_round_trip(max_value: int, expected_dtype: type) -> None:
+    values = [0, max_value // 2, max_value]
+    uint_arr = as_smallest_uint_array(np.array(values, dtype=np.int64), max_value)
+    assert uint_arr.dtype == expected_dtype
+
+    # Should pick the same element type as the base64 encoding
+    assert str(uint_arr.dtype) == b64.b64_encode_uint_array_as_smallest_size(values, max_value).element_type
+
+    writer = BinaryPayloadWriter()
+    header = _IntHeader(values=writer.add_array(uint_arr))
+    header_bytes, buffers_view = split_binary_payload(writer.to_bytes(header))
+    received_header = _IntHeader.model_validate_json(header_bytes)
+    assert received_header.values.element_type == np.dtype(expected_dtype).name
+    assert get_numpy_array_view(buffers_view, received_header.values).tolist() == values
+
+
+def test_as_smallest_uint_array_too_large() -> None:
+    with pytest.raises(ValueError):
+        as_smallest_uint_array([0, 2**32], 2**32)
+
+
+@pytest.mark.parametrize(
+    "min_value, max_value, expected_dtype",
+    [
+        (-128, 127, np.int8),
+        (-129, 0, np.int16),
+        (0, 128, np.int16),
+        (-32768, 32767, np.int16),
+        (-32769, 0, np.int32),
+        (0, 32768, np.int32),
+        (-(2**31), 2**31 - 1, np.int32),
+    ],
+)
+def test_as_smallest_int_array_round_trip(min_value: int, max_value: int, expected_dtype: type) -> None:
+    values = [min_value, -1, 0, max_value]
+    int_arr = as_smallest_int_array(np.array(values, dtype=np.int64), min_value, max_value)
+    assert int_arr.dtype == expected_dtype
+    assert str(int_arr.dtype) == b64.b64_encode_int_array_as_smallest_size(values, min_value, max_value).element_type
+
+    writer = BinaryPayloadWriter()
+    header = _IntHeader(values=writer.add_array(int_arr))
+    header_bytes, buffers_view = split_binary_payload(writer.to_bytes(header))
+    received_header = _IntHeader.model_validate_json(header_bytes)
+    assert get_numpy_array_view(buffers_view, received_header.values).tolist() == values
+
+    b64_int_arr = b64_encode_buffer_as_int_array(buffers_view, received_header.values)
+    assert b64.b64_decode_int_array(b64_int_arr).tolist() == values
+
+
+def test_as_smallest_int_array_out_of_range() -> None:
+    with pytest.raises(ValueError):
+        as_smallest_int_array(np.array([-(2**31) - 1, 0]), -(2**31) - 1, 0)
+    with pytest.raises(ValueError):
+        as_smallest_int_array(np.array([0, 2**31]), 0, 2**31)
+
+
+async def _chunked_async(data: bytes, chunk_size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
+@pytest.mark.asyncio
+async def test_length_prefixed_frames() -> None:
+    frames = [_make_payload(), b"", b"abc"]
+    stream_bytes = b"".join(make_length_prefixed_frame(frame) for frame in frames)
+
+    # Chunk boundaries should not matter, including chunks that split the length prefix
+    for chunk_size in [1, 3, 7, len(stream_bytes)]:
+        received = [
+            frame async for frame in iterate_length_prefixed_frames_async(_chunked_async(stream_bytes, chunk_size))
+        ]
+        assert received == frames
+
+    with pytest.raises(ValueError):
+        async for _frame in iterate_length_prefixed_frames_async(_chunked_async(stream_bytes[:-1], 5)):
+            pass
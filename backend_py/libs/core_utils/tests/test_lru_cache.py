@@ -0,0 +1,56 @@
+import time
+
+from webviz_core_utils.lru_cache import LruCache
+
+
+def test_lru_eviction_by_entry_count() -> None:
+    cache: LruCache[str, int] = LruCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    # Touch "a" so that "b" becomes least recently used
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+    assert cache.get_stats().evictions == 1
+
+
+def test_size_budget_eviction() -> None:
+    cache: LruCache[str, bytes] = LruCache(max_entries=100, max_total_size=10, size_func=len)
+    cache.set("a", b"12345")
+    cache.set("b", b"12345")
+    assert cache.get_stats().total_size == 10
+
+    cache.set("c", b"123")
+    assert "a" not in cache
+    assert cache.get_stats().total_size == 8
+
+    # Entries larger than the whole budget are not stored
+    cache.set("d", b"12345678901")
+    assert "d" not in cache
+    assert len(cache) == 2
+
+
+def test_ttl_expiry() -> None:
+    cache: LruCache[str, int] = LruCache(max_entries=10, ttl_s=0.01)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_s=60)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_pop_matching() -> None:
+    cache: LruCache[tuple[str, int], int] = LruCache(max_entries=10)
+    cache.set(("x", 1), 1)
+    cache.set(("x", 2), 2)
+    cache.set(("y", 1), 3)
+
+    assert cache.pop_matching(lambda key: key[0] == "x") == 2
+    assert cache.pop(("y", 1)) == 3
+    assert len(cache) == 0
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from webviz_core_utils.metrics_registry import MetricsRegistry, CollectedMetricSample
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY, LAP_DURATION_METRIC_NAME
+from webviz_core_utils.metrics_registry import collect_request_laps, observe_request_laps
+from webviz_core_utils.perf_metrics import PerfMetrics
+
+
+def test_counters_and_gauges_are_rendered_with_labels() -> None:
+    registry = MetricsRegistry()
+    registry.increment_counter("requests_total", host="sumo")
+    registry.increment_counter("requests_total", amount=2, host="sumo")
+    registry.add_to_gauge("in_flight", 1)
+    registry.set_gauge("temperature", 1.5, unit='"c"')
+
+    text = registry.to_prometheus_text()
+    assert '# TYPE requests_total counter\nrequests_total{host="sumo"} 3\n' in text
+    assert "in_flight 1\n" in text
+    assert 'temperature{unit="\\"c\\""} 1.5\n' in text
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry(duration_buckets_ms=(10, 100))
+    registry.observe_histogram("duration_ms", 5, route="/a")
+    registry.observe_histogram("duration_ms", 10, route="/a")
+    registry.observe_histogram("duration_ms", 50, route="/a")
+    registry.observe_histogram("duration_ms", 500, route="/a")
+
+    lines = registry.to_prometheus_text().splitlines()
+    assert lines == [
+        "# TYPE duration_ms histogram",
+        'duration_ms_bucket{route="/a",le="10"} 2',
+        'duration_ms_bucket{route="/a",le="100"} 3',
+        'duration_ms_bucket{route="/a",le="+Inf"} 4',
+        'duration_ms_sum{route="/a"} 565',
+        'duration_ms_count{route="/a"} 4',
+    ]
+
+
+def test_collector_samples_are_included() -> None:
+    registry = MetricsRegistry()
+    registry.register_collector(
+        lambda: [CollectedMetricSample(kind="counter", name="cache_hits_total", labels={"cache": "x"}, value=7)]
+    )
+
+    assert 'cache_hits_total{cache="x"} 7\n' in registry.to_prometheus_text()
+
+
+@pytest.mark.asyncio
+async def test_laps_recorded_in_request_are_labelled_with_route() -> None:
+    METRICS_REGISTRY.clear()
+
+    async def record_in_child_task_async() -> None:
+        PerfMetrics().set_metric("child-lap", 20)
+
+    with collect_request_laps() as request_laps:
+        PerfMetrics().set_metric("parent-lap", 10)
+        await asyncio.create_task(record_in_child_task_async())
+
+    assert request_laps == [("parent-lap", 10), ("child-lap", 20)]
+
+    observe_request_laps("/my/route", request_laps)
+    PerfMetrics().set_metric("outside-lap", 30)
+
+    text = METRICS_REGISTRY.to_prometheus_text()
+    assert f'{LAP_DURATION_METRIC_NAME}_count{{lap="parent-lap",route="/my/route"}} 1' in text
+    assert f'{LAP_DURATION_METRIC_NAME}_count{{lap="child-lap",route="/my/route"}} 1' in text
+    assert "outside-lap" not in text
+
+
+def test_laps_outside_request_are_not_recorded() -> None:
+    METRICS_REGISTRY.clear()
+
+    perf_metrics = PerfMetrics()
+    perf_metrics.set_metric("outside-lap", 30)
+
+    # The lap is still available for logging, but does not reach the registry
+    assert perf_metrics.to_dict() == {"outside-lap": 30}
+    assert LAP_DURATION_METRIC_NAME not in METRICS_REGISTRY.to_prometheus_text()
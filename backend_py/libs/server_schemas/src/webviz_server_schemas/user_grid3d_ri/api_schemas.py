@@ -1,6 +1,9 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 from webviz_core_utils.b64 import B64FloatArray, B64UintArray, B64IntArray
+from webviz_core_utils.binary_payload import BinaryBufferRef
 
 
 class BoundingBox3D(BaseModel):
@@ -43,11 +46,16 @@ class GridGeometryRequest(BaseModel):
     grid_blob_object_uuid: str
     include_inactive_cells: bool
     ijk_index_filter: IJKIndexFilter | None
+    # Requested layout of polys_b64arr in the response
+    # - vtk: each poly is prefixed by its vertex count
+    # - quads: four vertex indices per poly without count prefix, only used if all polys are quads
+    poly_layout: Literal["vtk", "quads"] = "vtk"
 
 
 class GridGeometryResponse(BaseModel):
     vertices_b64arr: B64FloatArray
     polys_b64arr: B64UintArray
+    poly_layout: Literal["vtk", "quads"] = "vtk"
     poly_source_cell_indices_b64arr: B64UintArray
     origin_utm_x: float
     origin_utm_y: float
@@ -73,6 +81,32 @@ class MappedGridPropertiesResponse(BaseModel):
     stats: Stats | None
 
 
+class MappedGridPropertiesBatchRequest(BaseModel):
+    sas_token: str
+    blob_store_base_uri: str
+    grid_blob_object_uuid: str
+    property_blob_object_uuids: list[str]
+    include_inactive_cells: bool
+    ijk_index_filter: IJKIndexFilter | None
+
+
+class MappedGridPropertiesFrameHeader(BaseModel):
+    """
+    Header of one frame in the streamed batch response, each frame being a binary payload as defined
+    in webviz_core_utils.binary_payload. Frames are sent in order of completion, not in order of request.
+
+    There is one frame per requested property blob. For a property blob that failed, error_message is set
+    and the frame holds no property values.
+    """
+
+    property_blob_object_uuid: str
+    poly_props: BinaryBufferRef | None
+    undefined_int_value: int | None
+    min_grid_prop_value: float | int | None
+    max_grid_prop_value: float | int | None
+    error_message: str | None = None
+
+
 class PolylineIntersectionRequest(BaseModel):
     sas_token: str
     blob_store_base_uri: str
@@ -82,21 +116,26 @@ class PolylineIntersectionRequest(BaseModel):
     polyline_utm_xy: list[float]
 
 
-class FenceMeshSection(BaseModel):
+class FenceMeshSectionBinaryHeader(BaseModel):
     # U-axis defined by unit length vector from start to end, Z is global Z
-    vertices_uz_b64arr: B64FloatArray
-    poly_indices_b64arr: B64UintArray
-    vertices_per_poly_b64arr: B64UintArray
-    poly_source_cell_indices_b64arr: B64UintArray
-    poly_props_b64arr: B64FloatArray | B64IntArray
+    # The arrays are references into the buffers of the binary payload
+    vertices_uz: BinaryBufferRef
+    poly_indices: BinaryBufferRef
+    vertices_per_poly: BinaryBufferRef
+    poly_source_cell_indices: BinaryBufferRef
+    poly_props: BinaryBufferRef
     start_utm_x: float
     start_utm_y: float
     end_utm_x: float
     end_utm_y: float
 
 
-class PolylineIntersectionResponse(BaseModel):
-    fence_mesh_sections: list[FenceMeshSection]
+class PolylineIntersectionBinaryHeader(BaseModel):
+    """
+    Header of the binary polyline intersection response, see webviz_core_utils.binary_payload for the payload format
+    """
+
+    fence_mesh_sections: list[FenceMeshSectionBinaryHeader]
     grid_dimensions: GridDimensions
     undefined_int_value: int | None
     min_grid_prop_value: float
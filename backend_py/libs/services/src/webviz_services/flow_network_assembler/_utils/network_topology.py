@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Literal
+
+import polars as pl
+
+from webviz_services.service_exceptions import NoDataError, Service
+from webviz_services.flow_network_assembler.flow_network_types import (
+    DataType,
+    EdgeOrNode,
+    NodeType,
+    StaticNodeWorkingData,
+)
+
+from webviz_services.flow_network_assembler._utils import network_node_utils
+
+
+@dataclass(frozen=True)
+class NetworkTopologyNode:
+    """
+    Node in a network topology, i.e. a node of the group tree with everything needed to create its network node
+    except for the summary values, which depend on the dates of the network.
+    """
+
+    node_name: str
+    parent_name: str
+    node_type: Literal["Well", "Group"]
+    edge_label: str
+    # Summary vector per data type, where vector is None when not present in the summary data
+    summary_vectors: list[tuple[DataType, EdgeOrNode, str | None]]
+
+
+def create_grouptree_key_and_edge_labels(grouptree_at_date: pl.DataFrame) -> tuple[tuple, list[str]]:
+    """
+    Create a hashable key for the group tree at a date, i.e. its rows of (CHILD, PARENT, KEYWORD, edge label),
+    along with the edge labels for the rows.
+    """
+    node_names = grouptree_at_date["CHILD"].to_list()
+    parent_names = grouptree_at_date["PARENT"].to_list()
+    keywords = grouptree_at_date["KEYWORD"].to_list()
+
+    # Create edge label for nodes
+    edge_labels = [""] * len(node_names)
+    if "VFP_TABLE" in grouptree_at_date.columns:
+        edge_labels = network_node_utils.create_edge_label_list_from_vfp_table_column(grouptree_at_date["VFP_TABLE"])
+
+    return tuple(zip(node_names, parent_names, keywords, edge_labels)), edge_labels
+
+
+def create_network_topology(
+    grouptree_key: tuple,
+    edge_labels: list[str],
+    node_static_working_data_dict: dict[str, StaticNodeWorkingData],
+    selected_node_types: set[NodeType],
+    smry_columns_set: set[str],
+    data_types_of_interest: set[DataType] | None,
+) -> list[NetworkTopologyNode]:
+    """
+    Create the topology nodes of a group tree, in row order of the group tree.
+
+    Nodes that are not of the selected node types are excluded, and only the first row of each node is used.
+    """
+    topology: list[NetworkTopologyNode] = []
+    added_node_names: set[str] = set()
+
+    for (node_name, parent_name, node_keyword, _), edge_label in zip(grouptree_key, edge_labels):
+        if node_name in added_node_names:
+            continue
+
+        node_static_working_data = node_static_working_data_dict.get(node_name)
+        if node_static_working_data is None:
+            raise NoDataError(f"No summary vector info found for node {node_name}", Service.GENERAL)
+        if not network_node_utils.is_valid_node_type(node_static_working_data.node_classification, selected_node_types):
+            continue
+
+        summary_vectors: list[tuple[DataType, EdgeOrNode, str | None]] = []
+        for sumvec, info in node_static_working_data.node_summary_vectors_info.items():
+            if data_types_of_interest is not None and info.DATATYPE not in data_types_of_interest:
+                continue
+            summary_vectors.append((info.DATATYPE, info.EDGE_NODE, sumvec if sumvec in smry_columns_set else None))
+
+        topology.append(
+            NetworkTopologyNode(
+                node_name=node_name,
+                parent_name=parent_name,
+                node_type="Well" if node_keyword == "WELSPECS" else "Group",
+                edge_label=edge_label,
+                summary_vectors=summary_vectors,
+            )
+        )
+        added_node_names.add(node_name)
+
+    return topology
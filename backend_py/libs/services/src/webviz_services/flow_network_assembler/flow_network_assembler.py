@@ -1,11 +1,11 @@
 import logging
 import asyncio
-from typing import Literal
 from dataclasses import dataclass
 
 import numpy as np
 import polars as pl
 
+from webviz_core_utils.lru_cache import LruCache
 from webviz_core_utils.perf_timer import PerfTimer
 
 from webviz_services.service_exceptions import InvalidDataError, InvalidParameterError, NoDataError, Service
@@ -15,6 +15,11 @@ from webviz_services.sumo_access.group_tree_access import GroupTreeAccess
 from ._types import network_node_types
 from ._utils import network_node_utils
 from ._utils.assembler_performance_times import PerformanceTimes
+from ._utils.network_topology import (
+    NetworkTopologyNode,
+    create_grouptree_key_and_edge_labels,
+    create_network_topology,
+)
 from ._utils.group_tree_dataframe_model import (
     GroupTreeDataframeModel,
 )
@@ -37,6 +42,43 @@ from .flow_network_types import (
 
 LOGGER = logging.getLogger(__name__)
 
+type FlowNetworkResultPerTreeType = dict[
+    TreeType, tuple[list[DatedFlowNetwork], list[FlowNetworkMetadata], list[FlowNetworkMetadata]]
+]
+
+# Key for the in-process cache of assembled flow networks:
+#   (case_uuid, ensemble_name, ensemble_fingerprint, realization, frequency, node types, terminal node, well exclusions)
+# Since the ensemble fingerprint is part of the key, entries will never be stale, we only need to bound the memory usage
+type _FlowNetworkResultCacheKey = tuple[
+    str, str, str, int, Frequency, frozenset[NodeType], str, tuple[str, ...] | None, tuple[str, ...] | None
+]
+
+# Approximate size of a value in a Python list, i.e. the list slot and the float object
+_LIST_VALUE_NBYTES = 32
+
+
+def _count_network_node_values(node: NetworkNode) -> int:
+    num_values = sum(len(values) for values in node.node_data.values())
+    num_values += sum(len(values) for values in node.edge_data.values())
+    return num_values + sum(_count_network_node_values(child) for child in node.children)
+
+
+def _estimate_flow_network_result_nbytes(result: FlowNetworkResultPerTreeType) -> int:
+    """Approximate memory usage of an assembled result, which is dominated by the node and edge data value lists"""
+    num_values = 0
+    for dated_networks, _edge_metadata, _node_metadata in result.values():
+        num_values += sum(_count_network_node_values(dated_network.network) for dated_network in dated_networks)
+
+    return num_values * _LIST_VALUE_NBYTES
+
+
+_FLOW_NETWORK_RESULT_CACHE: LruCache[_FlowNetworkResultCacheKey, FlowNetworkResultPerTreeType] = LruCache(
+    name="flow_network_result",
+    max_entries=32,
+    max_total_size=128 * 1024 * 1024,
+    size_func=_estimate_flow_network_result_nbytes,
+)
+
 
 @dataclass
 class FlatNetworkNodeData:
@@ -57,6 +99,9 @@ class FlowNetworkAssembler:
     tables, and assembling them together to create a collection of dated flow networks trees
 
     **Note: Currently, only the single realization (SINGLE_REAL) mode is supported**
+
+    If an ensemble fingerprint is specified, the assembled networks are cached in-process, and subsequent requests
+    with the same configuration against the same ensemble content will skip both fetching and assembly.
     """
 
     # As before, fixing the arguments would be breaking, and out of scope for now. Leaving it as I found it
@@ -73,6 +118,7 @@ class FlowNetworkAssembler:
         # tree_type: TreeType = TreeType.GRUPTREE,
         excl_well_startswith: list[str] | None = None,
         excl_well_endswith: list[str] | None = None,
+        ensemble_fingerprint: str | None = None,
     ):
         # NOTE: Temporary only supporting single real
         if flow_network_mode != NetworkModeOptions.SINGLE_REAL:
@@ -90,6 +136,10 @@ class FlowNetworkAssembler:
         self._selected_node_types = selected_node_types
         self._terminal_node = terminal_node
 
+        # Result cache, only used when the ensemble fingerprint is known
+        self._result_cache_key = self._make_result_cache_key(ensemble_fingerprint)
+        self._cached_result: FlowNetworkResultPerTreeType | None = None
+
         # Vector names and summary data maps are shared across all tree types
         self._all_available_vectors: set[str] | None = None
         self._vector_metadata_by_keyword: dict[str, list[VectorMetadata]] = {}
@@ -106,6 +156,22 @@ class FlowNetworkAssembler:
             HAS_GAS_INJ=False, HAS_WATER_INJ=False, TERMINAL_NODE=terminal_node
         )
 
+    def _make_result_cache_key(self, ensemble_fingerprint: str | None) -> _FlowNetworkResultCacheKey | None:
+        if ensemble_fingerprint is None:
+            return None
+
+        return (
+            self._group_tree_access.case_uuid,
+            self._group_tree_access.ensemble_name,
+            ensemble_fingerprint,
+            self._realization,
+            self._summary_resampling_frequency,
+            frozenset(self._selected_node_types),
+            self._terminal_node,
+            tuple(self._excl_well_startswith) if self._excl_well_startswith is not None else None,
+            tuple(self._excl_well_endswith) if self._excl_well_endswith is not None else None,
+        )
+
     @property
     def _group_tree_df_model_safe(self) -> GroupTreeDataframeModel:
         if self._group_tree_df_model is None:
@@ -199,6 +265,12 @@ class FlowNetworkAssembler:
         self._performance_times = PerformanceTimes()
         self._validate_assembler_config()
 
+        if self._result_cache_key is not None:
+            self._cached_result = _FLOW_NETWORK_RESULT_CACHE.get(self._result_cache_key)
+            if self._cached_result is not None:
+                LOGGER.debug("Using cached flow networks, skipping fetch and initialization")
+                return
+
         # Run data fetch + init concurrently
         await asyncio.gather(self._initialize_all_available_vectors_async(), self._initialize_group_tree_dfs_async())
         self._performance_times.init_sumo_data = timer.lap_ms()
@@ -273,9 +345,7 @@ class FlowNetworkAssembler:
         self._performance_times.log_sumo_download_times()
         self._performance_times.log_structure_init_times()
 
-    def create_dated_networks_and_metadata_lists_per_tree_type(
-        self,
-    ) -> dict[TreeType, tuple[list[DatedFlowNetwork], list[FlowNetworkMetadata], list[FlowNetworkMetadata]]]:
+    def create_dated_networks_and_metadata_lists_per_tree_type(self) -> FlowNetworkResultPerTreeType:
         """
         This method creates date flow networks and metadata lists for a single realization dataset.
 
@@ -288,6 +358,9 @@ class FlowNetworkAssembler:
             - list of edge metadata
             - list of node metadata
         """
+        if self._cached_result is not None:
+            return self._cached_result
+
         if self._network_mode != NetworkModeOptions.SINGLE_REAL:
             raise InvalidParameterError(
                 "Network mode must be SINGLE_REAL to create a single realization dataset", Service.GENERAL
@@ -300,9 +373,7 @@ class FlowNetworkAssembler:
             raise NoDataError("GroupTree dataframes model has not been initialized", Service.GENERAL)
 
         # Get network classification and filtered group tree df for each tree type
-        result_per_tree_type: dict[
-            TreeType, tuple[list[DatedFlowNetwork], list[FlowNetworkMetadata], list[FlowNetworkMetadata]]
-        ] = {}
+        result_per_tree_type: FlowNetworkResultPerTreeType = {}
         for tree_type in self._group_tree_df_model.tree_types:
             edge_data_types = self._edge_data_types
             node_data_types = self._node_data_types
@@ -324,6 +395,9 @@ class FlowNetworkAssembler:
                 self._assemble_metadata_for_data_types(node_data_types),
             )
 
+        if self._result_cache_key is not None:
+            _FLOW_NETWORK_RESULT_CACHE.set(self._result_cache_key, result_per_tree_type)
+
         return result_per_tree_type
 
     def _assemble_metadata_for_data_types(self, data_types: list[DataType]) -> list[FlowNetworkMetadata]:
@@ -740,6 +814,10 @@ def _create_dated_networks(
     The node structure for a dated network in the list is static. The summary data for each node in the dated network is given by
     the time span where the associated network is valid (from date of the network to the next network).
 
+    The node structure (topology) is only resolved once for each distinct group tree, and is reused for all dates where the
+    group tree is identical. For each date, the summary values are sliced from arrays extracted once from the date sorted
+    summary data.
+
     `Arguments`:
     - `group_tree_df`: pl.DataFrame - Dataframe with group tree for dates - expected columns: [KEYWORD, CHILD, PARENT], optional column: [VFP_TABLE]
     - `smry_sorted_by_date_df`. pl.DataFrame - Summary data sorted by date. Expected columns: [DATE, summary_vector_1, ... , summary_vector_n]
@@ -755,9 +833,17 @@ def _create_dated_networks(
 
     timer = PerfTimer()
 
-    # Group the group tree data by date and get unique dates
-    grouptree_per_date = group_tree_df.group_by("DATE", maintain_order=True)
-    grouptree_dates = group_tree_df["DATE"].unique(maintain_order=True).sort()
+    # Split the group tree data per date, ordered by date
+    grouptree_per_date = group_tree_df.sort("DATE", maintain_order=True).partition_by("DATE", maintain_order=True)
+
+    # Extract summary dates and rounded values once, each dated network gets a slice of these
+    smry_dates = smry_sorted_by_date_df["DATE"]
+    smry_formatted_dates = [dt.strftime("%Y-%m-%d") for dt in smry_dates.to_list()]
+    smry_values_by_vector: dict[str, list[float]] = {
+        vector: smry_sorted_by_date_df[vector].to_numpy().round(2).tolist()
+        for vector in smry_sorted_by_date_df.columns
+        if vector != "DATE"
+    }
 
     timer.lap_ms()  # initial_grouping_and_dates_extract_time_ms
 
@@ -765,114 +851,129 @@ def _create_dated_networks(
     # A lot of "No summary data found for gruptree between {date} and {next_date}" is printed
     # Pick the latest group tree state or? Can a node change states prod/inj in between and details are
     total_create_dated_networks_time_ms = 0
-    total_smry_table_filtering_ms = 0
-    total_find_next_date_time_ms = 0
+    total_create_topology_time_ms = 0
+
+    # Network topologies keyed by the group tree rows they were created from
+    topology_by_grouptree_key: dict[tuple, list[NetworkTopologyNode]] = {}
 
     total_loop_time_ms_start = timer.elapsed_ms()
 
-    for group_by_tuple, grouptree_at_date in grouptree_per_date:
-        # Polars returns a tuple with one element per group by column
-        date = group_by_tuple[0]
+    for grouptree_index, grouptree_at_date in enumerate(grouptree_per_date):
+        date = grouptree_at_date["DATE"][0]
 
-        timer.lap_ms()
-        # Find next date greater than current date
-        next_date = grouptree_dates.filter(grouptree_dates > date).min()
-        if next_date is None:
-            # Pick last smry date from sorted date column
-            next_date = smry_sorted_by_date_df["DATE"][-1]
-        total_find_next_date_time_ms += timer.lap_ms()
+        # The next group tree date, or the last summary date for the last group tree
+        if grouptree_index + 1 < len(grouptree_per_date):
+            next_date = grouptree_per_date[grouptree_index + 1]["DATE"][0]
+        else:
+            next_date = smry_dates[-1]
+
+        # Rows of the summary data within the time span [date, next_date)
+        smry_start_index = int(smry_dates.search_sorted(date, side="left"))
+        smry_end_index = int(smry_dates.search_sorted(next_date, side="left"))
+
+        if smry_end_index <= smry_start_index:
+            LOGGER.info(f"No summary data found for gruptree between {str(date)} and {str(next_date)}")
+            continue
 
         timer.lap_ms()
-        # Filter summary data for the time span defined by the group tree date and the next group tree date
-        greater_equal_date_mask = pl.col("DATE") >= date
-        less_than_next_date_mask = pl.col("DATE") < next_date
-        smry_in_datespan_sorted_by_date = smry_sorted_by_date_df.filter(
-            greater_equal_date_mask & less_than_next_date_mask
-        )
-        total_smry_table_filtering_ms += timer.lap_ms()
-
-        if smry_in_datespan_sorted_by_date.height > 0:
-            timer.lap_ms()
-            dates = smry_in_datespan_sorted_by_date["DATE"].to_list()
-            formatted_dates = [dt.strftime("%Y-%m-%d") for dt in dates]
-            formatted_date = date.strftime("%Y-%m-%d")
-            network = _create_dated_network(
-                grouptree_at_date,
-                formatted_date,
-                smry_in_datespan_sorted_by_date,
-                len(dates),
+        grouptree_key, edge_labels = create_grouptree_key_and_edge_labels(grouptree_at_date)
+        topology = topology_by_grouptree_key.get(grouptree_key)
+        if topology is None:
+            topology = create_network_topology(
+                grouptree_key,
+                edge_labels,
                 node_static_working_data_dict,
                 selected_node_types,
-                terminal_node,
+                set(smry_values_by_vector.keys()),
                 data_types_of_interest,
             )
+            topology_by_grouptree_key[grouptree_key] = topology
+        total_create_topology_time_ms += timer.lap_ms()
+
+        network = _create_dated_network_from_topology(
+            topology,
+            date.strftime("%Y-%m-%d"),
+            smry_values_by_vector,
+            smry_start_index,
+            smry_end_index,
+            selected_node_types,
+            terminal_node,
+        )
 
-            dated_networks.append(DatedFlowNetwork(dates=formatted_dates, network=network))
-            total_create_dated_networks_time_ms += timer.lap_ms()
-        else:
-            LOGGER.info(f"No summary data found for gruptree between {str(date)} and {str(next_date)}")
+        dated_networks.append(
+            DatedFlowNetwork(dates=smry_formatted_dates[smry_start_index:smry_end_index], network=network)
+        )
+        total_create_dated_networks_time_ms += timer.lap_ms()
 
     total_loop_time_ms = timer.elapsed_ms() - total_loop_time_ms_start
 
     LOGGER.info(
         f"Total time create_dated_networks func: {timer.elapsed_ms()}ms, "
         f"Total loop time for grouptree_per_date: {total_loop_time_ms}ms, "
-        f"Total filter smry table: {total_smry_table_filtering_ms}ms "
+        f"Total create topologies: {total_create_topology_time_ms}ms "
+        f"({len(topology_by_grouptree_key)} unique of {len(grouptree_per_date)} group trees), "
         f"Total create dated network: {total_create_dated_networks_time_ms}ms "
     )
 
     return dated_networks
 
 
-def _create_dated_network(
-    grouptree_at_date: pl.DataFrame,
+def _create_dated_network_from_topology(
+    topology: list[NetworkTopologyNode],
     date_str: str,
-    smry_for_grouptree_sorted_by_date: pl.DataFrame,
-    number_of_dates_in_smry: int,
-    node_static_working_data_dict: dict[str, StaticNodeWorkingData],
+    smry_values_by_vector: dict[str, list[float]],
+    smry_start_index: int,
+    smry_end_index: int,
     selected_node_types: set[NodeType],
     terminal_node: str,
-    data_types_of_interest: set[DataType] | None,
 ) -> NetworkNode:
     """
-    Create a static flowm network with summary data for a set of dates.
-
-    The node structure is static, but the summary data for each node is given for a set of dates.
+    Create a static flow network with summary data for a set of dates.
 
-    `Arguments`:
-    - `grouptree_at_date`: pl.DataFrame - Dataframe with group tree for one date - expected columns: [KEYWORD, CHILD, PARENT, EDGE_LABEL]
-    - `date_str`: str - Date of the group tree as string
-    - `smry_for_grouptree_sorted_by_date`: Summary data for time span defined from the group tree at date to the next group tree date. The summary data is
-    sorted by date, which implies unique dates, ordered by date. Thereby each node or edge is a column in the summary dataframe.
-    - `number_of_dates_in_smry`: Number of unique dates in the summary data df. To be used for filling missing data - i.e. num rows of smry_sorted_by_date
-    - `node_static_working_data_dict`: Dictionary with node name as key and its static work data for building networks
-    - `selected_node_types`: Set of selected node types for the group tree
-    - `terminal_node`: Name of the terminal node in the group tree
-    - `data_types_of_interest`: Set of data types to include for edges and nodes. If None, all data types are included.
+    The node structure is given by the topology, and the summary data for each node is the slice [smry_start_index, smry_end_index)
+    of the summary values, i.e. the dates from the group tree date to the next group tree date.
 
     `Returns`:
     A dated flow network with a recursive node structure, with summary data for the each date added to each node.
     """
-    # Dictionary of node name, with info about parent nodename RecursiveTreeNode with empty child array
-    # I.e. iterate over rows in df (better than recursive search)
-    nodes_dict = _create_flat_network_nodes_map(
-        grouptree_at_date,
-        node_static_working_data_dict,
-        selected_node_types,
-        smry_for_grouptree_sorted_by_date,
-        number_of_dates_in_smry,
-        data_types_of_interest,
-    )
-
-    if not nodes_dict:
+    if not topology:
         raise NoDataError(
             f"No nodes found in the group tree for the selected node types: {[network_node_types.NODE_TYPE_ENUM_TO_STRING_MAPPING[elm] for elm in selected_node_types]}",
             Service.GENERAL,
         )
 
-    terminal_node_elm = nodes_dict.get(terminal_node)
+    number_of_dates_in_smry = smry_end_index - smry_start_index
+
+    # Dictionary of node name, with info about parent nodename and network node with empty child array
+    nodes_dict: dict[str, FlatNetworkNodeData] = {}
+    for topology_node in topology:
+        edge_data: dict[str, list[float]] = {}
+        node_data: dict[str, list[float]] = {}
+        for datatype, edge_or_node, sumvec in topology_node.summary_vectors:
+            if sumvec is not None:
+                data = smry_values_by_vector[sumvec][smry_start_index:smry_end_index]
+            else:
+                data = [np.nan] * number_of_dates_in_smry
+
+            if edge_or_node == EdgeOrNode.EDGE:
+                edge_data[datatype] = data
+            else:
+                node_data[datatype] = data
+
+        # children = [], and are added below after each node is created, to prevent recursive search
+        network_node = NetworkNode(
+            node_label=topology_node.node_name,
+            node_type=topology_node.node_type,
+            edge_label=topology_node.edge_label,
+            edge_data=edge_data,
+            node_data=node_data,
+            children=[],
+        )
+        nodes_dict[topology_node.node_name] = FlatNetworkNodeData(
+            parent_name=topology_node.parent_name, node_without_children=network_node
+        )
 
-    if terminal_node_elm is None:
+    if terminal_node not in nodes_dict:
         raise InvalidDataError(
             f"No terminal node {terminal_node} found in group tree at date {date_str}", Service.GENERAL
         )
@@ -885,111 +986,4 @@ def _create_dated_network(
             nodes_dict[parent_name].node_without_children.children.append(flat_node_data.node_without_children)
 
     # The terminal node is the final network
-    result = nodes_dict[terminal_node].node_without_children
-
-    return result
-
-
-def _create_flat_network_nodes_map(
-    grouptree_at_date: pl.DataFrame,
-    node_static_working_data_dict: dict[str, StaticNodeWorkingData],
-    selected_node_types: set[NodeType],
-    smry_for_grouptree_sorted_by_date: pl.DataFrame,
-    number_of_dates_in_smry: int,
-    data_types_of_interest: set[DataType] | None,
-) -> dict[str, FlatNetworkNodeData]:
-    """
-    Creates a map with node names and their respective flat network node data.
-
-    The network nodes are created flat, i.e. non-recursively. This implies nodes without children.
-    Thereby the flat network node data contains info of parent node to assemble recursive structure
-    after data fetching
-    """
-    nodes_dict: dict[str, FlatNetworkNodeData] = {}
-
-    # Extract columns as numpy arrays for index access resulting in faster processing
-    # NOTE: Expect all columns to be 1D arrays and present in the dataframe
-    node_names = grouptree_at_date["CHILD"].to_numpy()
-    parent_names = grouptree_at_date["PARENT"].to_numpy()
-    keywords = grouptree_at_date["KEYWORD"].to_numpy()
-
-    # Extract the names of all summary columns once
-    smry_columns_set = set(smry_for_grouptree_sorted_by_date.columns)
-
-    # Create edge label for nodes
-    edge_labels = [""] * len(node_names)
-    if "VFP_TABLE" in grouptree_at_date.columns:
-        edge_labels = network_node_utils.create_edge_label_list_from_vfp_table_column(grouptree_at_date["VFP_TABLE"])
-
-    # Iterate over every row in the grouptree dataframe to create the network nodes
-    for node_name, parent_name, node_keyword, edge_label in zip(node_names, parent_names, keywords, edge_labels):
-        if node_name in nodes_dict:
-            continue
-
-        node_static_working_data = node_static_working_data_dict.get(node_name)
-        if node_static_working_data is None:
-            raise NoDataError(f"No summary vector info found for node {node_name}", Service.GENERAL)
-        if not network_node_utils.is_valid_node_type(node_static_working_data.node_classification, selected_node_types):
-            continue
-
-        network_node = _create_network_node(
-            node_name,
-            node_keyword,
-            edge_label,
-            node_static_working_data,
-            smry_columns_set,
-            smry_for_grouptree_sorted_by_date,
-            number_of_dates_in_smry,
-            data_types_of_interest,
-        )
-
-        nodes_dict[node_name] = FlatNetworkNodeData(parent_name=parent_name, node_without_children=network_node)
-
-    return nodes_dict
-
-
-def _create_network_node(
-    node_name: str,
-    keyword: str,
-    edge_label: str,
-    working_data: StaticNodeWorkingData,
-    smry_columns_set: set,
-    smry_for_grouptree_sorted_by_date: pl.DataFrame,
-    number_of_dates_in_smry: int,
-    data_types_of_interest: set[DataType] | None,
-) -> NetworkNode:
-    # Find working data for the node
-    node_type: Literal["Well", "Group"] = "Well" if keyword == "WELSPECS" else "Group"
-    edge_data: dict[str, list[float]] = {}
-    node_data: dict[str, list[float]] = {}
-
-    # Array for vectors not existing in summary table
-    nan_array = np.array([np.nan] * number_of_dates_in_smry)
-
-    # Each row in summary data is a unique date
-    summary_vector_info = working_data.node_summary_vectors_info
-    for sumvec, info in summary_vector_info.items():
-        datatype = info.DATATYPE
-
-        if data_types_of_interest is not None and datatype not in data_types_of_interest:
-            continue
-
-        if sumvec in smry_columns_set:
-            data = smry_for_grouptree_sorted_by_date[sumvec].to_numpy().round(2)
-        else:
-            data = nan_array
-
-        if info.EDGE_NODE == EdgeOrNode.EDGE:
-            edge_data[datatype] = list(data)
-        else:
-            node_data[datatype] = list(data)
-
-    # children = [], and are added below after each node is created, to prevent recursive search
-    return NetworkNode(
-        node_label=node_name,
-        node_type=node_type,
-        edge_label=edge_label,
-        edge_data=edge_data,
-        node_data=node_data,
-        children=[],
-    )
+    return nodes_dict[terminal_node].node_without_children
@@ -1,10 +1,21 @@
 from dataclasses import dataclass
+from typing import Sequence
 
 import pyarrow as pa
 import pyarrow.compute as pc
 import numpy as np
 
-from webviz_services.utils.arrow_helpers import validate_summary_vector_table_pa
+from webviz_services.service_exceptions import InvalidDataError, Service
+from webviz_services.utils.arrow_helpers import (
+    is_table_sorted_on_real_then_date,
+    sort_table_on_real_then_date,
+    validate_summary_vector_table_pa,
+)
+
+# Layout of the composite (REAL, DATE) row keys, with the REAL number in the upper bits and the DATE in the lower bits.
+# The DATE offset makes dates before 1970 positive, supporting dates within approx. +/- 2000 years of 1970.
+_REAL_KEY_SHIFT = 47
+_DATE_KEY_OFFSET_MS = 1 << 46
 
 
 @dataclass
@@ -22,6 +33,62 @@ class RealizationDeltaVector:
     unit: str
 
 
+class AlignedVectorTable:
+    """
+    Vector table prepared for delta calculations.
+
+    The table is sorted on REAL then DATE, and each row is given a composite int64 key with the same ordering.
+    This allows two tables to be aligned on their shared ("DATE", "REAL") rows using a sorted merge (binary search)
+    instead of a hash join. Instances are immutable and can be cached and reused, e.g. for a reference ensemble that
+    is compared against many other ensembles.
+
+    The table must contain columns "DATE" and "REAL" and one or more vector columns.
+    """
+
+    def __init__(self, vector_table: pa.Table) -> None:
+        vector_names = [name for name in vector_table.column_names if name not in ["DATE", "REAL"]]
+        for vector_name in vector_names:
+            validate_summary_vector_table_pa(vector_table.select(["DATE", "REAL", vector_name]), vector_name)
+
+        if not is_table_sorted_on_real_then_date(vector_table):
+            vector_table = sort_table_on_real_then_date(vector_table)
+
+        self._table = vector_table
+        self._vector_names = vector_names
+
+        real_np = vector_table.column("REAL").to_numpy().astype(np.int64)
+        date_ms_np = vector_table.column("DATE").to_numpy().astype(np.int64)
+        self._row_keys_np: np.ndarray = (real_np << _REAL_KEY_SHIFT) + (date_ms_np + _DATE_KEY_OFFSET_MS)
+
+        self._values_np_dict: dict[str, np.ndarray] = {}
+
+    @property
+    def table(self) -> pa.Table:
+        return self._table
+
+    @property
+    def vector_names(self) -> list[str]:
+        return list(self._vector_names)
+
+    @property
+    def row_keys_np(self) -> np.ndarray:
+        return self._row_keys_np
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint, including the underlying table and any value arrays created so far"""
+        values_nbytes = sum(arr.nbytes for arr in self._values_np_dict.values())
+        return self._table.nbytes + self._row_keys_np.nbytes + values_nbytes
+
+    def get_values_np(self, vector_name: str) -> np.ndarray:
+        """Get the values of a vector as numpy array, with NaN for null values. The array is created on first access"""
+        values_np = self._values_np_dict.get(vector_name)
+        if values_np is None:
+            values_np = self._table.column(vector_name).to_numpy().astype(np.float32)
+            self._values_np_dict[vector_name] = values_np
+        return values_np
+
+
 def create_delta_vector_table(
     comparison_vector_table: pa.Table, reference_vector_table: pa.Table, vector_name: str
 ) -> pa.Table:
@@ -42,22 +109,61 @@ def create_delta_vector_table(
     validate_summary_vector_table_pa(comparison_vector_table, vector_name)
     validate_summary_vector_table_pa(reference_vector_table, vector_name)
 
-    joined_vector_table = comparison_vector_table.join(
-        reference_vector_table, keys=["DATE", "REAL"], join_type="inner", right_suffix="_reference"
-    )
-    delta_vector = pc.subtract(
-        joined_vector_table.column(vector_name), joined_vector_table.column(f"{vector_name}_reference")
+    return create_aligned_delta_vectors_table(
+        AlignedVectorTable(comparison_vector_table), AlignedVectorTable(reference_vector_table), [vector_name]
     )
 
-    delta_table = pa.table(
-        {
-            "DATE": joined_vector_table.column("DATE"),
-            "REAL": joined_vector_table.column("REAL"),
-            vector_name: delta_vector,
-        }
-    )
 
-    return delta_table
+def create_aligned_delta_vectors_table(
+    comparison: AlignedVectorTable, reference: AlignedVectorTable, vector_names: Sequence[str]
+) -> pa.Table:
+    """
+    Create a table with delta values for the requested vector names between the two aligned vector tables.
+
+    Definition:
+
+        delta_vector = comparison_vector - reference_vector
+
+    Only rows with a ["DATE", "REAL"] combination present in both tables are included, i.e. an inner join.
+    The matching rows are found by binary search of the comparison's row keys in the reference's sorted row keys,
+    and the deltas for all vectors are calculated in one vectorized subtraction.
+
+    Returns: A table with columns ["DATE", "REAL", *vector_names] sorted on REAL then DATE.
+    """
+    for vector_name in vector_names:
+        if vector_name not in comparison.vector_names or vector_name not in reference.vector_names:
+            raise InvalidDataError(f"Vector {vector_name} is missing from comparison or reference", Service.GENERAL)
+
+    comparison_keys_np = comparison.row_keys_np
+    reference_keys_np = reference.row_keys_np
+
+    reference_rows_np = np.searchsorted(reference_keys_np, comparison_keys_np)
+    is_match_np = reference_rows_np < len(reference_keys_np)
+    is_match_np[is_match_np] = reference_keys_np[reference_rows_np[is_match_np]] == comparison_keys_np[is_match_np]
+
+    comparison_rows_np = np.flatnonzero(is_match_np)
+    reference_rows_np = reference_rows_np[is_match_np]
+
+    comparison_values_np = np.vstack([comparison.get_values_np(name) for name in vector_names])
+    reference_values_np = np.vstack([reference.get_values_np(name) for name in vector_names])
+    delta_values_np = comparison_values_np[:, comparison_rows_np] - reference_values_np[:, reference_rows_np]
+
+    # Avoid the take when all comparison rows have a match, which is the typical case for resampled data
+    if len(comparison_rows_np) == comparison.table.num_rows:
+        date_column = comparison.table.column("DATE")
+        real_column = comparison.table.column("REAL")
+    else:
+        date_column = comparison.table.column("DATE").take(comparison_rows_np)
+        real_column = comparison.table.column("REAL").take(comparison_rows_np)
+
+    delta_columns: dict[str, pa.Array] = {}
+    for idx, vector_name in enumerate(vector_names):
+        null_mask_np = _get_null_mask_np(comparison.table.column(vector_name), comparison_rows_np) | _get_null_mask_np(
+            reference.table.column(vector_name), reference_rows_np
+        )
+        delta_columns[vector_name] = pa.array(delta_values_np[idx], type=pa.float32(), mask=null_mask_np)
+
+    return pa.table({"DATE": date_column, "REAL": real_column, **delta_columns})
 
 
 def create_realization_delta_vector_list(
@@ -92,3 +198,9 @@ def create_realization_delta_vector_list(
         )
 
     return ret_arr
+
+
+def _get_null_mask_np(column: pa.ChunkedArray, row_indices_np: np.ndarray) -> np.ndarray:
+    if column.null_count == 0:
+        return np.zeros(len(row_indices_np), dtype=bool)
+    return pc.is_null(column).to_numpy()[row_indices_np]
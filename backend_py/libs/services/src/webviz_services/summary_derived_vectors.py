@@ -4,10 +4,16 @@ from enum import StrEnum
 
 import numpy as np
 import pyarrow as pa
-import polars as pl
+import pyarrow.compute as pc
 
 from webviz_services.service_exceptions import InvalidDataError, Service
-from webviz_services.utils.arrow_helpers import validate_summary_vector_table_pa
+from webviz_services.utils.arrow_helpers import (
+    is_table_sorted_on_real_then_date,
+    sort_table_on_real_then_date,
+    validate_summary_vector_table_pa,
+)
+
+_MS_PER_DAY = 24 * 60 * 60 * 1000
 
 
 class DerivedVectorType(StrEnum):
@@ -178,43 +184,8 @@ def create_per_interval_vector_table_pa(total_vector_table_pa: pa.Table) -> pa.T
 
     Raises InvalidDataError if the input table does not contain the expected columns.
     """
-
-    column_names = set(total_vector_table_pa.column_names)
-    if len(column_names) != 3:
-        raise InvalidDataError("Table must contain at least 3 columns", Service.GENERAL)
-
-    if not column_names.issuperset(["DATE", "REAL"]):
-        raise InvalidDataError("Table must contain columns 'DATE' and 'REAL'", Service.GENERAL)
-
-    total_vector_name: str = (column_names - {"DATE", "REAL"}).pop()
-    validate_summary_vector_table_pa(total_vector_table_pa, total_vector_name)
-
-    per_interval_vector_name = create_per_interval_vector_name(total_vector_name)
-
-    # Convert to polars DataFrame
-    # - Utilize polars for efficient group_by operation and expressions
-    # - Sort by "REAL" thereafter "DATE"
-    sorted_total_vector_df = pl.DataFrame(total_vector_table_pa).sort(["REAL", "DATE"])
-
-    # Calculate per interval delta values
-    # - group_by("REAL") to create per interval delta values per realization for vector.
-    # - diff() calculates diff between element n and n-1 for a vector and given realization, sorted by date. First element is then null.
-    # - The resulting interval value for element n yields from n to n+1, thus shift(-1).
-    # - After shift(-1) the last value is null, thereby fill_null with 0.0.
-    # - explode() to make per interval dataframe grouped per realization into one dataframe in long format:
-    #        -  https://docs.pola.rs/api/python/stable/reference/dataframe/api/polars.DataFrame.explode.html#polars-dataframe-explode
-
-    per_interval_expr: pl.Expr = (
-        pl.col(total_vector_name).diff().shift(-1).fill_null(0.0).alias(per_interval_vector_name)
-    )
-
-    sorted_per_interval_vector_df = (
-        sorted_total_vector_df.group_by("REAL")
-        .agg([pl.col("DATE"), per_interval_expr])
-        .explode(["DATE", per_interval_vector_name])
-    )
-
-    return sorted_per_interval_vector_df.to_arrow()
+    _validate_single_total_vector_table(total_vector_table_pa)
+    return create_derived_vectors_table_pa(total_vector_table_pa, DerivedVectorType.PER_INTERVAL)
 
 
 def create_per_day_vector_table_pa(total_vector_table_pa: pa.Table) -> pa.Table:
@@ -233,7 +204,76 @@ def create_per_day_vector_table_pa(total_vector_table_pa: pa.Table) -> pa.Table:
 
     Raises InvalidDataError if the input table does not contain the expected columns.
     """
+    _validate_single_total_vector_table(total_vector_table_pa)
+    return create_derived_vectors_table_pa(total_vector_table_pa, DerivedVectorType.PER_DAY)
+
+
+def create_derived_vectors_table_pa(total_vectors_table_pa: pa.Table, derived_type: DerivedVectorType) -> pa.Table:
+    """
+    Calculates derived vectors of the given type for all total vector columns in the provided table.
+
+    The input table must contain columns "DATE" and "REAL" and one or more total vector columns. The output table will
+    contain columns "DATE", "REAL" and one derived vector column per total vector, named according to the derived type.
+    The output table is segmented on "REAL" and sorted on "DATE" within each segment, which is the layout produced by
+    `sort_table_on_real_then_date()`. Input tables already in this layout are used as is, other tables are sorted first.
+
+    The value at element `n` is calculated from the difference between element `n` and `n+1` within a realization,
+    and the last value of each realization is set to 0.0. Intervals with null values in the total vector are also set to 0.0.
+    All vectors are calculated in one vectorized pass, using a mask for the realization segment boundaries.
+
+    Raises InvalidDataError if the input table does not contain the expected columns.
+    """
+    total_vector_names = [name for name in total_vectors_table_pa.column_names if name not in ["DATE", "REAL"]]
+    if len(total_vector_names) == 0:
+        raise InvalidDataError("Table must contain at least one vector column", Service.GENERAL)
+    for vector_name in total_vector_names:
+        validate_summary_vector_table_pa(total_vectors_table_pa.select(["DATE", "REAL", vector_name]), vector_name)
+
+    table = total_vectors_table_pa
+    if not is_table_sorted_on_real_then_date(table):
+        table = sort_table_on_real_then_date(table)
+
+    num_rows = table.num_rows
+    real_np = table.column("REAL").to_numpy()
+
+    # Row n is the last row of its realization segment if row n+1 belongs to another realization
+    is_segment_end_np = np.ones(num_rows, dtype=bool)
+    is_segment_end_np[:-1] = real_np[1:] != real_np[:-1]
 
+    # Stack the vectors as rows, so that the diff for all vectors is done in one operation
+    values_np = np.vstack([table.column(name).to_numpy().astype(np.float32) for name in total_vector_names])
+    derived_values_np = np.zeros_like(values_np)
+    derived_values_np[:, :-1] = values_np[:, 1:] - values_np[:, :-1]
+
+    if derived_type == DerivedVectorType.PER_DAY:
+        # Cast to float32 to avoid integer division, number of days is truncated to whole days
+        date_ms_np = table.column("DATE").to_numpy().astype(np.int64)
+        diff_days_np = np.zeros(num_rows, dtype=np.float32)
+        diff_days_np[:-1] = ((date_ms_np[1:] - date_ms_np[:-1]) // _MS_PER_DAY).astype(np.float32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            derived_values_np /= diff_days_np
+    elif derived_type != DerivedVectorType.PER_INTERVAL:
+        raise InvalidDataError(f"Unhandled derived vector type: {derived_type}", Service.GENERAL)
+
+    # Intervals crossing a realization boundary, or involving null values, are set to 0.0
+    derived_values_np[:, is_segment_end_np] = 0.0
+    for vector_idx, vector_name in enumerate(total_vector_names):
+        column = table.column(vector_name)
+        if column.null_count > 0:
+            is_null_np = pc.is_null(column).to_numpy()
+            is_null_interval_np = is_null_np.copy()
+            is_null_interval_np[:-1] |= is_null_np[1:]
+            derived_values_np[vector_idx, is_null_interval_np] = 0.0
+
+    derived_columns = {
+        _create_derived_vector_name_for_type(name, derived_type): pa.array(derived_values_np[idx], type=pa.float32())
+        for idx, name in enumerate(total_vector_names)
+    }
+
+    return pa.table({"DATE": table.column("DATE"), "REAL": table.column("REAL"), **derived_columns})
+
+
+def _validate_single_total_vector_table(total_vector_table_pa: pa.Table) -> None:
     column_names = set(total_vector_table_pa.column_names)
     if len(column_names) != 3:
         raise InvalidDataError("Table must contain at least 3 columns", Service.GENERAL)
@@ -244,34 +284,11 @@ def create_per_day_vector_table_pa(total_vector_table_pa: pa.Table) -> pa.Table:
     total_vector_name: str = (column_names - {"DATE", "REAL"}).pop()
     validate_summary_vector_table_pa(total_vector_table_pa, total_vector_name)
 
-    per_day_vector_name = create_per_day_vector_name(total_vector_name)
-
-    # Convert to polars DataFrame
-    # - Utilize polars for efficient group_by operation and expressions
-    # - Sort by "REAL" thereafter "DATE"
-    sorted_total_vector_df = pl.DataFrame(total_vector_table_pa).sort(["REAL", "DATE"])
-
-    # Calculate per interval delta values
-    # - group_by("REAL") to create per interval delta values per realization for vector.
-    # - diff() calculates diff between element n and n-1 for a vector and given realization, sorted by date. First element is then null.
-    # - The resulting interval value for element n yields from n to n+1, thus shift(-1).
-    # - After shift(-1) the last value is null, thereby fill_null with 0.0.
-    # - per day is per interval delta divided by number of days between each date.
-    # - explode() to make per interval dataframe grouped per realization into one dataframe in long format:
-    #        -  https://docs.pola.rs/api/python/stable/reference/dataframe/api/polars.DataFrame.explode.html#polars-dataframe-explode
-
-    # Cast to float32 to avoid integer division
-    per_interval_expr = pl.col(total_vector_name).diff().shift(-1).fill_null(0.0).cast(pl.Float32)
-    diff_dates_expr = pl.col("DATE").diff().shift(-1).dt.total_days().cast(pl.Float32)
-    per_day_expr = (per_interval_expr / diff_dates_expr).fill_null(0.0).alias(per_day_vector_name)
-
-    sorted_per_day_vector_df = (
-        sorted_total_vector_df.group_by("REAL")
-        .agg([pl.col("DATE"), per_day_expr])
-        .explode(["DATE", per_day_vector_name])
-    )
-
-    return sorted_per_day_vector_df.to_arrow()
+
+def _create_derived_vector_name_for_type(total_vector_name: str, derived_type: DerivedVectorType) -> str:
+    if derived_type == DerivedVectorType.PER_DAY:
+        return create_per_day_vector_name(total_vector_name)
+    return create_per_interval_vector_name(total_vector_name)
 
 
 def create_derived_realization_vector_list(
@@ -6,6 +6,7 @@ from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 from fmu.sumo.explorer.objects import Table
 
 from webviz_core_utils.perf_metrics import PerfMetrics
+from webviz_services.utils.single_flight import SingleFlight
 from webviz_services.service_exceptions import (
     InvalidDataError,
     InvalidParameterError,
@@ -15,8 +16,14 @@ from webviz_services.service_exceptions import (
     ServiceLayerException,
 )
 
+from .sumo_client_factory import get_sumo_client_token_scope
+
 LOGGER = logging.getLogger(__name__)
 
+# Coalesces concurrent identical column loads, which may also include aggregating the column and writing the
+# aggregation back to Sumo. Arrow tables are immutable, so the result can safely be shared between callers.
+_AGGREGATED_COLUMN_SINGLE_FLIGHT: SingleFlight[pa.Table] = SingleFlight("aggregated_table_column")
+
 
 class ArrowTableLoader:
     def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
@@ -47,6 +54,25 @@ class ArrowTableLoader:
         """Filters for a single table and column, aggregates the column (if it does not already exist),
         and returns the result as an Arrow table"""
 
+        token_scope = get_sumo_client_token_scope(self._sumo_client)
+        if token_scope is None:
+            return await self._load_aggregated_single_column_async(column_name)
+
+        single_flight_key = (
+            token_scope,
+            self._case_uuid,
+            self._ensemble_name,
+            column_name,
+            self._req_table_name,
+            tuple(self._req_content_types) if self._req_content_types else None,
+            self._req_tagname,
+            self._req_standard_result,
+        )
+        return await _AGGREGATED_COLUMN_SINGLE_FLIGHT.run_async(
+            single_flight_key, lambda: self._load_aggregated_single_column_async(column_name)
+        )
+
+    async def _load_aggregated_single_column_async(self, column_name: str) -> pa.Table:
         perf_metrics = PerfMetrics()
 
         sc_tables_basis = SearchContext(sumo=self._sumo_client).tables.filter(
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import Literal, Sequence, cast
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from webviz_services.service_exceptions import InvalidDataError, Service
+
+from .rft_types import RftRealizationData
+
+
+@dataclass(frozen=True)
+class _RunOffsets:
+    """Contiguous runs of rows belonging to one (well, date, realization)"""
+
+    starts: np.ndarray
+    ends: np.ndarray
+    reals: np.ndarray
+
+
+@dataclass(frozen=True)
+class _SegmentOffsets:
+    """Contiguous segments of rows belonging to one (well, date), with the range of runs inside each segment"""
+
+    starts: np.ndarray
+    ends: np.ndarray
+    run_begins: np.ndarray
+    run_ends: np.ndarray
+
+
+class RftDataIndex:
+    """
+    Index over an aggregated RFT table for a single response.
+
+    The rows of the table are sorted on WELL, DATE and REAL so that all rows for one (well, date) pair, and within
+    that all rows for one realization, are contiguous. Offset arrays for these segments are computed once, which
+    makes lookup of the data for a well and date an O(1) operation returning zero-copy slices.
+
+    Note that the sort is stable, so the original ordering of the rows (typically increasing depth) within a
+    realization is retained.
+    """
+
+    def __init__(self, aggregated_table: pa.Table, response_name: str) -> None:
+        for column_name in ["WELL", "DATE", "REAL", "DEPTH", response_name]:
+            if column_name not in aggregated_table.column_names:
+                raise InvalidDataError(f"Column {column_name} is missing from the RFT table", Service.SUMO)
+
+        sort_keys: list[tuple[str, Literal["ascending", "descending"]]] = [
+            ("WELL", "ascending"),
+            ("DATE", "ascending"),
+            ("REAL", "ascending"),
+        ]
+        sorted_table = aggregated_table.take(pc.sort_indices(aggregated_table, sort_keys=sort_keys))
+        sorted_table = sorted_table.select(["WELL", "DATE", "REAL", "DEPTH", response_name]).combine_chunks()
+
+        self._table: pa.Table = sorted_table
+        self._response_name = response_name
+
+        date_ms_np = _date_column_to_timestamp_ms_np(sorted_table["DATE"])
+        self._segments, self._runs = _calc_segment_and_run_offsets(sorted_table, date_ms_np)
+
+        # The returned timestamps are calculated the same way as in the original polars based implementation
+        segment_dates_pl = cast(pl.Series, pl.from_arrow(sorted_table["DATE"].take(self._segments.starts)))
+        self._segment_ret_timestamps: list[int] = (segment_dates_pl.cast(pl.Datetime).dt.timestamp() * 1000).to_list()
+
+        # Lookup from well name to its contiguous range of segments, and for each well from date to segment index
+        self._well_segment_ranges: dict[str, tuple[int, int]] = {}
+        self._well_date_to_segment: dict[str, dict[int, int]] = {}
+        segment_wells = cast(list[str], sorted_table["WELL"].take(self._segments.starts).to_pylist())
+        segment_dates_ms = date_ms_np[self._segments.starts].tolist()
+        for segment_idx, (well_name, date_ms) in enumerate(zip(segment_wells, segment_dates_ms)):
+            first_segment_idx, _end = self._well_segment_ranges.get(well_name, (segment_idx, segment_idx))
+            self._well_segment_ranges[well_name] = (first_segment_idx, segment_idx + 1)
+            self._well_date_to_segment.setdefault(well_name, {})[date_ms] = segment_idx
+
+        self._depth_np = sorted_table["DEPTH"].to_numpy()
+        self._value_np = sorted_table[response_name].to_numpy()
+
+    @property
+    def response_name(self) -> str:
+        return self._response_name
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint of the index, including the underlying table"""
+        index_arrays = [
+            self._segments.starts,
+            self._segments.ends,
+            self._segments.run_begins,
+            self._segments.run_ends,
+            self._runs.starts,
+            self._runs.ends,
+            self._runs.reals,
+            self._depth_np,
+            self._value_np,
+        ]
+        return self._table.nbytes + sum(arr.nbytes for arr in index_arrays)
+
+    def get_well_names(self) -> list[str]:
+        return list(self._well_segment_ranges.keys())
+
+    def get_well_date_table(self, well_name: str, timestamp_utc_ms: int) -> pa.Table | None:
+        """Get zero-copy slice of the sorted table containing all rows for the given well and date"""
+        segment_idx = self._well_date_to_segment.get(well_name, {}).get(timestamp_utc_ms)
+        if segment_idx is None:
+            return None
+
+        start = int(self._segments.starts[segment_idx])
+        end = int(self._segments.ends[segment_idx])
+        return self._table.slice(start, end - start)
+
+    def get_well_realization_data(
+        self,
+        well_name: str,
+        timestamps_utc_ms: Sequence[int] | None,
+        realizations: Sequence[int] | None,
+    ) -> list[RftRealizationData]:
+        """
+        Get per realization depth and value arrays for one well, ordered by date and then realization.
+        Only dates in timestamps_utc_ms and realizations in realizations are included, if specified.
+        """
+        segment_range = self._well_segment_ranges.get(well_name)
+        if segment_range is None:
+            return []
+
+        if timestamps_utc_ms is None:
+            segment_indices = list(range(segment_range[0], segment_range[1]))
+        else:
+            date_to_segment = self._well_date_to_segment[well_name]
+            segment_indices = sorted(date_to_segment[ts] for ts in set(timestamps_utc_ms) if ts in date_to_segment)
+
+        realizations_np = np.asarray(realizations) if realizations is not None else None
+
+        ret_arr: list[RftRealizationData] = []
+        for segment_idx in segment_indices:
+            run_begin = int(self._segments.run_begins[segment_idx])
+            run_end = int(self._segments.run_ends[segment_idx])
+            run_indices = np.arange(run_begin, run_end)
+            if realizations_np is not None:
+                run_indices = run_indices[np.isin(self._runs.reals[run_begin:run_end], realizations_np)]
+
+            timestamp_utc_ms = self._segment_ret_timestamps[segment_idx]
+            for run_idx in run_indices.tolist():
+                start = self._runs.starts[run_idx]
+                end = self._runs.ends[run_idx]
+                ret_arr.append(
+                    RftRealizationData(
+                        well_name=well_name,
+                        realization=int(self._runs.reals[run_idx]),
+                        timestamp_utc_ms=timestamp_utc_ms,
+                        depth_arr=self._depth_np[start:end].tolist(),
+                        value_arr=self._value_np[start:end].tolist(),
+                    )
+                )
+
+        return ret_arr
+
+
+def _calc_segment_and_run_offsets(
+    sorted_table: pa.Table, date_ms_np: np.ndarray
+) -> tuple[_SegmentOffsets, _RunOffsets]:
+    num_rows = sorted_table.num_rows
+    real_np = sorted_table["REAL"].to_numpy()
+
+    # Mark the rows where a new (well, date) segment starts, and where a new realization run starts
+    is_segment_start = np.zeros(num_rows, dtype=bool)
+    is_run_start = np.zeros(num_rows, dtype=bool)
+    if num_rows > 0:
+        well_column = sorted_table["WELL"]
+        well_changed_np = pc.not_equal(well_column.slice(1), well_column.slice(0, num_rows - 1)).to_numpy()
+        is_segment_start[0] = True
+        is_segment_start[1:] = well_changed_np | (date_ms_np[1:] != date_ms_np[:-1])
+        is_run_start[:] = is_segment_start
+        is_run_start[1:] |= real_np[1:] != real_np[:-1]
+
+    segment_starts_np = np.flatnonzero(is_segment_start)
+    segment_ends_np = np.append(segment_starts_np[1:], num_rows)
+    run_starts_np = np.flatnonzero(is_run_start)
+
+    runs = _RunOffsets(
+        starts=run_starts_np,
+        ends=np.append(run_starts_np[1:], num_rows),
+        reals=real_np[run_starts_np],
+    )
+    segments = _SegmentOffsets(
+        starts=segment_starts_np,
+        ends=segment_ends_np,
+        run_begins=np.searchsorted(run_starts_np, segment_starts_np),
+        run_ends=np.searchsorted(run_starts_np, segment_ends_np),
+    )
+
+    return segments, runs
+
+
+def _date_column_to_timestamp_ms_np(date_column: pa.ChunkedArray) -> np.ndarray:
+    """Get the DATE column as an int64 numpy array of UTC milliseconds, regardless of the column's date type"""
+    if pa.types.is_timestamp(date_column.type) or pa.types.is_date(date_column.type):
+        date_column = pc.cast(date_column, pa.timestamp("ms"))
+    return pc.cast(date_column, pa.int64()).to_numpy()
@@ -27,6 +27,14 @@ class GroupTreeAccess:
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
 
+    @property
+    def case_uuid(self) -> str:
+        return self._case_uuid
+
+    @property
+    def ensemble_name(self) -> str:
+        return self._ensemble_name
+
     @classmethod
     def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "GroupTreeAccess":
         sumo_client = create_sumo_client(access_token)
@@ -2,6 +2,7 @@ from typing import Any, Dict, Tuple, Optional
 
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer import TimeFilter, TimeType
+from webviz_core_utils.timestamp_utils import iso_str_to_timestamp_utc_ms
 
 from webviz_services.service_exceptions import (
     InvalidDataError,
@@ -119,19 +120,7 @@ async def get_grid_geometry_and_property_blob_ids_async(
     time_filter = get_time_filter(parameter_time_or_interval_str)
 
     grid_property_must_clause = query["bool"]["should"][1]["bool"]["must"]
-
-    if time_filter.time_type == TimeType.NONE:
-        grid_property_must_clause.append({"bool": {"must_not": {"exists": {"field": "data.time"}}}})
-
-    elif time_filter.time_type == TimeType.TIMESTAMP:
-        # For a single timestamp, t0 must match AND t1 must NOT exist.
-        grid_property_must_clause.append({"term": {"data.time.t0.value": time_filter.start}})
-        grid_property_must_clause.append({"bool": {"must_not": {"exists": {"field": "data.time.t1"}}}})
-
-    elif time_filter.time_type == TimeType.INTERVAL:
-        # For an interval, both t0 and t1 must match exactly.
-        grid_property_must_clause.append({"term": {"data.time.t0.value": time_filter.start}})
-        grid_property_must_clause.append({"term": {"data.time.t1.value": time_filter.end}})
+    grid_property_must_clause.extend(_make_time_filter_clauses(time_filter))
 
     payload = {
         "query": query,
@@ -159,3 +148,157 @@ async def get_grid_geometry_and_property_blob_ids_async(
         )
 
     return grid_geometry_id, grid_property_id
+
+
+async def get_grid_geometry_and_property_blob_ids_for_time_steps_async(
+    sumo_client: SumoClient,
+    case_uuid: str,
+    ensemble_name: str,
+    realization: int,
+    grid_name: str,
+    parameter_name: str,
+    parameter_time_or_interval_strs: list[str],
+) -> Tuple[str, Dict[str, str]]:
+    """
+    Get the blob id of the grid geometry and the blob ids of the grid property for multiple time steps in a single query.
+    Returns the grid geometry blob id and a dict mapping each time or interval string to its grid property blob id.
+    """
+    time_filters = {time_str: get_time_filter(time_str) for time_str in parameter_time_or_interval_strs}
+
+    query: Dict[str, Any] = {
+        "bool": {
+            "should": [
+                {
+                    "bool": {
+                        "must": [
+                            {"term": {"_sumo.parent_object.keyword": case_uuid}},
+                            {"term": {"class.keyword": "cpgrid"}},
+                            {"term": {"fmu.ensemble.name.keyword": ensemble_name}},
+                            {"term": {"fmu.realization.id": realization}},
+                            {"term": {"data.name.keyword": grid_name}},
+                        ]
+                    }
+                },
+                {
+                    "bool": {
+                        "must": [
+                            {"term": {"_sumo.parent_object.keyword": case_uuid}},
+                            {"term": {"class.keyword": "cpgrid_property"}},
+                            {"term": {"fmu.ensemble.name.keyword": ensemble_name}},
+                            {"term": {"fmu.realization.id": realization}},
+                            {"term": {"data.name.keyword": parameter_name}},
+                            {
+                                "bool": {
+                                    "should": [
+                                        {"term": {"data.geometry.name.keyword": grid_name}},
+                                        {"term": {"data.tagname.keyword": grid_name}},
+                                    ],
+                                    "minimum_should_match": 1,
+                                }
+                            },
+                            {
+                                "bool": {
+                                    "should": [
+                                        {"bool": {"must": _make_time_filter_clauses(time_filter)}}
+                                        for time_filter in time_filters.values()
+                                    ],
+                                    "minimum_should_match": 1,
+                                }
+                            },
+                        ]
+                    }
+                },
+            ],
+            "minimum_should_match": 1,
+        }
+    }
+
+    # Get the times as epoch milliseconds, so that we can match the hits to the requested time steps
+    payload = {
+        "query": query,
+        "size": len(time_filters) + 1,
+        "_source": ["class"],
+        "docvalue_fields": [
+            {"field": "data.time.t0.value", "format": "epoch_millis"},
+            {"field": "data.time.t1.value", "format": "epoch_millis"},
+        ],
+    }
+    response = await sumo_client.post_async("/search", json=payload)
+    hits = response.json()["hits"]["hits"]
+
+    grid_geometry_id: str | None = None
+    property_hits: list[Dict[str, Any]] = []
+    for hit in hits:
+        if hit["_source"]["class"] == "cpgrid":
+            grid_geometry_id = hit["_id"]
+        elif hit["_source"]["class"] == "cpgrid_property":
+            property_hits.append(hit)
+
+    if not grid_geometry_id:
+        raise InvalidDataError(f"Did not find grid geometry {grid_name=}", service=Service.SUMO)
+
+    property_ids_by_time_ms = _get_property_ids_by_time_ms(property_hits, parameter_name)
+
+    property_ids_by_time_str: Dict[str, str] = {}
+    for time_str, time_filter in time_filters.items():
+        property_id = property_ids_by_time_ms.get(_make_time_filter_epoch_ms_key(time_filter))
+        if property_id is None:
+            raise InvalidDataError(
+                f"Did not find grid property {parameter_name=} for {time_str=} {grid_name=}", service=Service.SUMO
+            )
+        property_ids_by_time_str[time_str] = property_id
+
+    return grid_geometry_id, property_ids_by_time_str
+
+
+def _make_time_filter_clauses(time_filter: TimeFilter) -> list[Dict[str, Any]]:
+    if time_filter.time_type == TimeType.NONE:
+        return [{"bool": {"must_not": {"exists": {"field": "data.time"}}}}]
+
+    if time_filter.time_type == TimeType.TIMESTAMP:
+        # For a single timestamp, t0 must match AND t1 must NOT exist.
+        return [
+            {"term": {"data.time.t0.value": time_filter.start}},
+            {"bool": {"must_not": {"exists": {"field": "data.time.t1"}}}},
+        ]
+
+    if time_filter.time_type == TimeType.INTERVAL:
+        # For an interval, both t0 and t1 must match exactly.
+        return [
+            {"term": {"data.time.t0.value": time_filter.start}},
+            {"term": {"data.time.t1.value": time_filter.end}},
+        ]
+
+    return []
+
+
+def _get_property_ids_by_time_ms(
+    property_hits: list[Dict[str, Any]], parameter_name: str
+) -> Dict[Tuple[int | None, int | None], str]:
+    property_ids_by_time_ms: Dict[Tuple[int | None, int | None], str] = {}
+    for hit in property_hits:
+        fields = hit.get("fields", {})
+        t0_ms = _get_epoch_ms_field(fields, "data.time.t0.value")
+        t1_ms = _get_epoch_ms_field(fields, "data.time.t1.value")
+        if (t0_ms, t1_ms) in property_ids_by_time_ms:
+            raise MultipleDataMatchesError(
+                f"Multiple grid properties found for {parameter_name=} at time {t0_ms=} {t1_ms=}", Service.SUMO
+            )
+        property_ids_by_time_ms[(t0_ms, t1_ms)] = hit["_id"]
+
+    return property_ids_by_time_ms
+
+
+def _get_epoch_ms_field(fields: Dict[str, Any], field_name: str) -> int | None:
+    values = fields.get(field_name)
+    if not values:
+        return None
+    return int(float(values[0]))
+
+
+def _make_time_filter_epoch_ms_key(time_filter: TimeFilter) -> Tuple[int | None, int | None]:
+    t0_ms = iso_str_to_timestamp_utc_ms(time_filter.start) if time_filter.start else None
+    t1_ms: int | None = None
+    if time_filter.time_type == TimeType.INTERVAL and time_filter.end:
+        t1_ms = iso_str_to_timestamp_utc_ms(time_filter.end)
+    return (t0_ms, t1_ms)
@@ -3,9 +3,9 @@ from typing import List, Optional, Sequence, cast
 
 import pyarrow as pa
 import pyarrow.compute as pc
-import polars as pl
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 
+from webviz_core_utils.lru_cache import LruCache
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_services.service_exceptions import (
     Service,
@@ -14,6 +14,7 @@ from webviz_services.service_exceptions import (
 )
 
 from ._arrow_table_loader import ArrowTableLoader
+from ._rft_data_index import RftDataIndex
 from .rft_types import RftTableDefinition, RftWellInfo, RftRealizationData
 from .sumo_client_factory import create_sumo_client
 
@@ -22,20 +23,43 @@ LOGGER = logging.getLogger(__name__)
 
 ALLOWED_RFT_RESPONSE_NAMES = ["PRESSURE", "SGAS", "SWAT", "SOIL"]
 
+# In-process cache of RFT data indices, keyed on (case_uuid, ensemble_name, ensemble_fingerprint, response_name)
+# Since the ensemble fingerprint is part of the key, entries will never be stale, we only need to bound the memory usage
+_RFT_DATA_INDEX_CACHE: LruCache[tuple[str, str, str, str], RftDataIndex] = LruCache(
+    name="rft_data_index", max_entries=32, max_total_size=512 * 1024 * 1024, size_func=lambda index: index.nbytes
+)
+
 
 class RftAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
         self._ensemble_context = SearchContext(sumo=self._sumo_client).filter(
             uuid=self._case_uuid, ensemble=self._ensemble_name
         )
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "RftAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "RftAccess":
+        """
+        Create access object for an ensemble.
+
+        If an ensemble fingerprint is specified, the indexed RFT data will be cached in-process and reused for
+        subsequent requests against the same ensemble content. The fingerprint must be obtained on behalf of the
+        same user as the access token, see SumoFingerprinter.
+        """
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def get_rft_info_async(self) -> RftTableDefinition:
         """Get a collection of rft tables for a case and ensemble"""
@@ -87,44 +111,51 @@ class RftAccess:
         timestamps_utc_ms: Optional[Sequence[int]],
         realizations: Optional[Sequence[int]],
     ) -> List[RftRealizationData]:
+        return await self.get_rft_wells_realization_data_async(
+            well_names=[well_name],
+            response_name=response_name,
+            timestamps_utc_ms=timestamps_utc_ms,
+            realizations=realizations,
+        )
 
+    async def get_rft_wells_realization_data_async(
+        self,
+        well_names: Sequence[str],
+        response_name: str,
+        timestamps_utc_ms: Optional[Sequence[int]],
+        realizations: Optional[Sequence[int]],
+    ) -> List[RftRealizationData]:
+        """Get RFT data per realization for multiple wells, ordered by well, date and realization"""
         timer = PerfMetrics()
-        column_names = [response_name, "DEPTH"]
+
+        rft_index = await self._get_or_create_rft_data_index_async(response_name)
+        timer.record_lap("get_rft_data_index")
+
+        ret_arr: list[RftRealizationData] = []
+        for well_name in well_names:
+            ret_arr.extend(rft_index.get_well_realization_data(well_name, timestamps_utc_ms, realizations))
+        timer.record_lap("extract_well_data")
+
+        LOGGER.debug(
+            f"{timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {well_names=}, {response_name=}"
+        )
+        return ret_arr
+
+    async def _get_or_create_rft_data_index_async(self, response_name: str) -> RftDataIndex:
+        cache_key: tuple[str, str, str, str] | None = None
+        if self._ensemble_fingerprint is not None:
+            cache_key = (self._case_uuid, self._ensemble_name, self._ensemble_fingerprint, response_name)
+            cached_index = _RFT_DATA_INDEX_CACHE.get(cache_key)
+            if cached_index is not None:
+                return cached_index
 
         table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
         table_loader.require_content_type("rft")
+        table = await table_loader.get_aggregated_multiple_columns_async([response_name, "DEPTH"])
 
-        table = await table_loader.get_aggregated_multiple_columns_async(column_names)
+        rft_index = RftDataIndex(table, response_name)
 
-        timer.record_lap("load_aggregated_arrow_table")
+        if cache_key is not None:
+            _RFT_DATA_INDEX_CACHE.set(cache_key, rft_index)
 
-        if realizations is not None:
-            mask = pc.is_in(table["REAL"], value_set=pa.array(realizations))
-            table = table.filter(mask)
-
-        mask = pc.equal(table["WELL"], pa.scalar(well_name))
-        table = table.filter(mask)
-        if timestamps_utc_ms is not None:
-            mask = pc.is_in(table["DATE"], value_set=pa.array(timestamps_utc_ms))
-            table = table.filter(mask)
-
-        timer.record_lap("filter_table")
-        polars_table: pl.DataFrame = pl.from_arrow(table)  # type: ignore
-
-        polars_table = (
-            polars_table.group_by(["REAL", "DATE"])
-            .agg([pl.col("DEPTH").alias("depth_arr"), pl.col(response_name).alias("value_arr")])
-            .with_columns(
-                [
-                    pl.lit(well_name).alias("well_name"),
-                    (pl.col("DATE").cast(pl.Datetime).dt.timestamp() * 1000).alias("timestamp_utc_ms"),
-                    pl.col("REAL").alias("realization"),
-                ]
-            )
-            .select(["well_name", "realization", "timestamp_utc_ms", "depth_arr", "value_arr"])
-        )
-        timer.record_lap("process_table_in_polars")
-        ret_arr_rows = polars_table.iter_rows(named=True)
-        ret_arr = [RftRealizationData(**row) for row in ret_arr_rows]
-        LOGGER.debug(f"{timer.to_string()}, {self._case_uuid=}, {self._ensemble_name=}, {well_name=}, {response_name=}")
-        return ret_arr
+        return rft_index
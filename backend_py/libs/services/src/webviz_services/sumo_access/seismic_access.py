@@ -1,28 +1,61 @@
+import datetime
 import logging
 from typing import List
+from urllib.parse import parse_qs
+
 from fmu.sumo.explorer import TimeFilter, TimeType
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
 from fmu.sumo.explorer.objects.cube import Cube
+from webviz_core_utils.lru_cache import LruCache
 
 from webviz_services.service_exceptions import InvalidDataError, NoDataError, Service
 
 from .seismic_types import SeismicCubeMeta, SeismicCubeSpec, VdsHandle, SeismicRepresentation
-from .sumo_client_factory import create_sumo_client
+from .sumo_client_factory import create_sumo_client, get_sumo_client_token_scope
 
 LOGGER = logging.getLogger(__name__)
 
+# Key for the in-process VDS handle cache:
+#   (token_scope, case_uuid, ensemble_name, ensemble_fingerprint, seismic_attribute, representation, realization,
+#    time_or_interval_str)
+# A VDS handle carries a SAS token issued for the user that searched for the cube, so handles are scoped to the
+# access token, see make_token_scope(). Entries expire ahead of the expiry of their SAS token.
+type _VdsHandleCacheKey = tuple[str, str, str, str, str, SeismicRepresentation, int | None, str]
+
+_VDS_HANDLE_CACHE: LruCache[_VdsHandleCacheKey, VdsHandle] = LruCache(name="seismic_vds_handle", max_entries=512)
+
+# Margin before the SAS token expiry at which a cached VDS handle is no longer used, and TTL for handles where
+# the expiry can not be determined from the SAS token
+_SAS_EXPIRY_MARGIN_S = 5 * 60
+_DEFAULT_VDS_HANDLE_TTL_S = 5 * 60
+
 
 class SeismicAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint = ensemble_fingerprint
         self._case_context = SearchContext(sumo=self._sumo_client).filter(uuid=self._case_uuid)
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "SeismicAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "SeismicAccess":
+        """
+        If an ensemble fingerprint is specified, VDS handles will be cached in-process until shortly before their SAS
+        token expires, avoiding a Sumo search for each request against the same cube. Cached handles are only shared
+        between calls with the same access token.
+        """
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     async def get_seismic_cube_meta_list_async(self) -> List[SeismicCubeMeta]:
         cube_meta_arr: list[SeismicCubeMeta] = []
@@ -54,17 +87,41 @@ class SeismicAccess:
         time_or_interval_str: str,
     ) -> VdsHandle:
         """Get the vds handle for a given cube"""
+        cache_key: _VdsHandleCacheKey | None = None
+        token_scope = get_sumo_client_token_scope(self._sumo_client)
+        if self._ensemble_fingerprint is not None and token_scope is not None:
+            cache_key = (
+                token_scope,
+                self._case_uuid,
+                self._ensemble_name,
+                self._ensemble_fingerprint,
+                seismic_attribute,
+                representation,
+                realization,
+                time_or_interval_str,
+            )
+            cached_handle = _VDS_HANDLE_CACHE.get(cache_key)
+            if cached_handle is not None:
+                return cached_handle
+
         time_filter = _create_time_filter(time_or_interval_str)
         cube_context = self._get_cube_context(seismic_attribute, representation, realization, time_filter)
         cube = await _find_matching_cube_async(cube_context, representation, seismic_attribute, self._case_uuid)
 
         url, sas_token = await cube.auth_async
 
-        return VdsHandle(
+        vds_handle = VdsHandle(
             sas_token=sas_token,
             vds_url=clean_vds_url(url),
         )
 
+        if cache_key is not None:
+            ttl_s = _calc_vds_handle_ttl_s(sas_token)
+            if ttl_s > 0:
+                _VDS_HANDLE_CACHE.set(cache_key, vds_handle, ttl_s=ttl_s)
+
+        return vds_handle
+
     def _get_cube_context(
         self,
         seismic_attribute: str,
@@ -143,6 +200,24 @@ def _determine_representation(is_observed: bool, realization_stage: bool) -> Sei
     raise InvalidDataError("In case stage, only observed cubes are allowed", Service.SUMO)
 
 
+def _calc_vds_handle_ttl_s(sas_token: str) -> float:
+    """Time to live for a cached VDS handle, based on the expiry time ("se" parameter) of the SAS token"""
+    expiry_values = parse_qs(sas_token.lstrip("?")).get("se")
+    if not expiry_values:
+        return _DEFAULT_VDS_HANDLE_TTL_S
+
+    try:
+        expiry_time = datetime.datetime.fromisoformat(expiry_values[0])
+    except ValueError:
+        return _DEFAULT_VDS_HANDLE_TTL_S
+
+    if expiry_time.tzinfo is None:
+        expiry_time = expiry_time.replace(tzinfo=datetime.timezone.utc)
+
+    time_to_expiry_s = (expiry_time - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    return time_to_expiry_s - _SAS_EXPIRY_MARGIN_S
+
+
 def clean_vds_url(vds_url: str) -> str:
     """clean vds url"""
     return vds_url.replace(":443", "")
@@ -4,6 +4,7 @@ from typing import List, Optional, Sequence, Tuple, Set
 import numpy as np
 import pyarrow as pa
 import pyarrow.compute as pc
+from webviz_core_utils.lru_cache import LruCache
 from webviz_core_utils.perf_timer import PerfTimer
 
 from fmu.sumo.explorer.explorer import SearchContext, SumoClient
@@ -20,7 +21,13 @@ from webviz_services.service_exceptions import (
     InvalidParameterError,
     NoDataError,
 )
-
+from webviz_services.summary_derived_vectors import (
+    DerivedVectorType,
+    create_derived_vector_table_for_type,
+    get_derived_vector_type,
+    get_total_vector_name,
+)
+from webviz_services.summary_delta_vectors import AlignedVectorTable
 
 from ._field_metadata import create_vector_metadata_from_field_meta
 from ._resampling import resample_segmented_multi_real_table, resample_single_real_table
@@ -31,17 +38,60 @@ from .sumo_client_factory import create_sumo_client
 
 LOGGER = logging.getLogger(__name__)
 
+# Key for the in-process vector table caches:
+#   (case_uuid, ensemble_name, ensemble_fingerprint, vector_name, resampling_frequency, sorted realizations or None)
+# Since the ensemble fingerprint is part of the key, entries will never be stale, we only need to bound the memory usage
+_VectorTableCacheKey = Tuple[str, str, str, str, Optional[Frequency], Optional[Tuple[int, ...]]]
+
+_VECTOR_TABLE_CACHE: LruCache[_VectorTableCacheKey, Tuple[pa.Table, VectorMetadata]] = LruCache(
+    name="summary_vector_table",
+    max_entries=512,
+    max_total_size=256 * 1024 * 1024,
+    size_func=lambda entry: entry[0].nbytes,
+)
+_DERIVED_VECTOR_TABLE_CACHE: LruCache[Tuple[_VectorTableCacheKey, DerivedVectorType], pa.Table] = LruCache(
+    name="summary_derived_vector_table",
+    max_entries=512,
+    max_total_size=128 * 1024 * 1024,
+    size_func=lambda table: table.nbytes,
+)
+# Aligned tables are typically used as the reference ensemble in delta ensembles, and are kept so that one reference
+# can be compared against many other ensembles without being re-aligned
+_ALIGNED_VECTOR_TABLE_CACHE: LruCache[_VectorTableCacheKey, Tuple[AlignedVectorTable, VectorMetadata]] = LruCache(
+    name="summary_aligned_vector_table",
+    max_entries=128,
+    max_total_size=128 * 1024 * 1024,
+    size_func=lambda entry: entry[0].nbytes,
+)
+
 
 class SummaryAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str):
+    def __init__(
+        self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str, ensemble_fingerprint: Optional[str] = None
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str = ensemble_name
+        self._ensemble_fingerprint: Optional[str] = ensemble_fingerprint
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "SummaryAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: Optional[str] = None
+    ) -> "SummaryAccess":
+        """
+        Create access object for an ensemble.
+
+        If an ensemble fingerprint is specified, resampled vector tables and derived vector tables will be cached
+        in-process and reused for subsequent requests against the same ensemble content. The fingerprint must be
+        obtained on behalf of the same user as the access token, see SumoFingerprinter.
+        """
         sumo_client = create_sumo_client(access_token)
-        return cls(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return cls(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     @otel_span_decorator()
     async def get_available_vectors_async(self) -> List[VectorInfo]:
@@ -106,6 +156,12 @@ class SummaryAccess:
         The vector column will be of type float32.
         If `resampling_frequency` is None, the data will be returned with full/raw resolution.
         """
+        cache_key = self._make_vector_table_cache_key(vector_name, resampling_frequency, realizations)
+        if cache_key is not None:
+            cached_entry = _VECTOR_TABLE_CACHE.get(cache_key)
+            if cached_entry is not None:
+                return cached_entry
+
         timer = PerfTimer()
 
         table_loader = ArrowTableLoader(self._sumo_client, self._case_uuid, self._ensemble_name)
@@ -153,8 +209,74 @@ class SummaryAccess:
             f"({vector_name=} {resampling_frequency=} {table.shape=})"
         )
 
+        if cache_key is not None:
+            _VECTOR_TABLE_CACHE.set(cache_key, (table, vector_metadata))
+
         return table, vector_metadata
 
+    @otel_span_decorator()
+    async def get_derived_vector_table_async(
+        self,
+        derived_vector_name: str,
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]],
+    ) -> Tuple[pa.Table, VectorMetadata]:
+        """
+        Get pyarrow.Table containing values for the specified derived vector (PER_DAY_ or PER_INTVL_ vector),
+        calculated from its total vector. See get_vector_table_async() for the layout of the returned table.
+
+        Note that the returned metadata is the metadata of the source total vector.
+        """
+        derived_vector_type = get_derived_vector_type(derived_vector_name)
+        total_vector_name = get_total_vector_name(derived_vector_name)
+
+        cache_key = self._make_vector_table_cache_key(total_vector_name, resampling_frequency, realizations)
+        total_vector_table, vector_metadata = await self.get_vector_table_async(
+            total_vector_name, resampling_frequency, realizations
+        )
+
+        if cache_key is not None:
+            cached_table = _DERIVED_VECTOR_TABLE_CACHE.get((cache_key, derived_vector_type))
+            if cached_table is not None:
+                return cached_table, vector_metadata
+
+        derived_vector_table = create_derived_vector_table_for_type(total_vector_table, derived_vector_type)
+
+        if cache_key is not None:
+            _DERIVED_VECTOR_TABLE_CACHE.set((cache_key, derived_vector_type), derived_vector_table)
+
+        return derived_vector_table, vector_metadata
+
+    @otel_span_decorator()
+    async def get_aligned_vector_table_async(
+        self,
+        vector_name: str,
+        resampling_frequency: Optional[Frequency],
+        realizations: Optional[Sequence[int]],
+    ) -> Tuple[AlignedVectorTable, VectorMetadata]:
+        """
+        Get the vector table prepared for delta ensemble calculations, see AlignedVectorTable.
+        See get_vector_table_async() for the layout of the underlying table.
+        """
+        cache_key = self._make_vector_table_cache_key(vector_name, resampling_frequency, realizations)
+        if cache_key is not None:
+            cached_entry = _ALIGNED_VECTOR_TABLE_CACHE.get(cache_key)
+            if cached_entry is not None:
+                return cached_entry
+
+        vector_table, vector_metadata = await self.get_vector_table_async(
+            vector_name, resampling_frequency, realizations
+        )
+        aligned_vector_table = AlignedVectorTable(vector_table)
+
+        # Create the value array up front so that it is accounted for in the cache's size budget
+        aligned_vector_table.get_values_np(vector_name)
+
+        if cache_key is not None:
+            _ALIGNED_VECTOR_TABLE_CACHE.set(cache_key, (aligned_vector_table, vector_metadata))
+
+        return aligned_vector_table, vector_metadata
+
     @otel_span_decorator()
     async def get_vector_async(
         self,
@@ -347,6 +469,22 @@ class SummaryAccess:
 
         return pc.unique(table.column("DATE")).to_numpy().astype(int).tolist()
 
+    def _make_vector_table_cache_key(
+        self, vector_name: str, resampling_frequency: Optional[Frequency], realizations: Optional[Sequence[int]]
+    ) -> Optional[_VectorTableCacheKey]:
+        if self._ensemble_fingerprint is None:
+            return None
+
+        realizations_key = tuple(sorted(set(realizations))) if realizations is not None else None
+        return (
+            self._case_uuid,
+            self._ensemble_name,
+            self._ensemble_fingerprint,
+            vector_name,
+            resampling_frequency,
+            realizations_key,
+        )
+
 
 def _validate_single_vector_table(arrow_table: pa.Table, vector_name: str) -> None:
 
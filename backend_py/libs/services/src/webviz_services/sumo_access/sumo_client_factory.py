@@ -1,13 +1,18 @@
 import logging
+import weakref
 
 from sumo.wrapper import SumoClient, RetryStrategy
 from webviz_core_utils.perf_timer import PerfTimer
 
 from webviz_services.services_config import get_services_config
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
+from webviz_services.utils.single_flight import make_token_scope
 
 LOGGER = logging.getLogger(__name__)
 
+# Token scope of the clients created by create_sumo_client(), used for scoping coalesced work to the caller's access
+_TOKEN_SCOPE_BY_CLIENT: weakref.WeakKeyDictionary[SumoClient, str] = weakref.WeakKeyDictionary()
+
 
 class _FakeSyncHttpClient:
     """A fake HTTP client to ensure we use async methods instead of sync ones.
@@ -38,7 +43,17 @@ def create_sumo_client(access_token: str) -> SumoClient:
             timeout=120,
         )
 
+    _TOKEN_SCOPE_BY_CLIENT[sumo_client] = make_token_scope(access_token)
+
     if timer:
         LOGGER.debug(f"create_sumo_client() took: {timer.elapsed_ms()}ms")
 
     return sumo_client
+
+
+def get_sumo_client_token_scope(sumo_client: SumoClient) -> str | None:
+    """
+    Get the token scope of a client created by create_sumo_client(), see make_token_scope().
+    Returns None for clients created by other means.
+    """
+    return _TOKEN_SCOPE_BY_CLIENT.get(sumo_client)
@@ -13,8 +13,10 @@ from fmu.sumo.explorer.explorer import SumoClient, SearchContext
 from fmu.sumo.explorer.objects import Surface
 
 from webviz_core_utils.exponential_backoff_timer import ExponentialBackoffTimer
+from webviz_core_utils.lru_cache import LruCache
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_services.utils.otel_span_tracing import otel_span_decorator, start_otel_span, start_otel_span_async
+from webviz_services.utils.single_flight import SingleFlight
 from webviz_services.utils.statistic_function import StatisticFunction
 from webviz_services.utils.surface_helpers import are_all_surface_values_undefined
 from webviz_services.service_exceptions import (
@@ -31,10 +33,25 @@ from .surface_types import SurfaceMeta, SurfaceMetaSet
 from .generic_types import SumoContent
 from .queries.surface_queries import SurfTimeType, SurfInfo, TimePoint, TimeInterval
 from .queries.surface_queries import RealizationSurfQueries, ObservedSurfQueries
-from .sumo_client_factory import create_sumo_client
+from .sumo_client_factory import create_sumo_client, get_sumo_client_token_scope
 
 LOGGER = logging.getLogger(__name__)
 
+# In-process cache of realization surfaces, keyed on
+#   (case_uuid, ensemble_name, ensemble_fingerprint, realization, name, attribute, time_or_interval_str)
+# Since the ensemble fingerprint is part of the key, entries will never be stale, we only need to bound the memory usage
+_RealizationSurfaceCacheKey = tuple[str, str, str, int, str, str, str | None]
+_REALIZATION_SURFACE_CACHE: LruCache[_RealizationSurfaceCacheKey, xtgeo.RegularSurface] = LruCache(
+    name="realization_surface",
+    max_entries=64,
+    max_total_size=512 * 1024 * 1024,
+    size_func=lambda surf: surf.values.nbytes,
+)
+
+# Coalescing of concurrent identical surface downloads and statistical aggregations
+_REALIZATION_SURFACE_SINGLE_FLIGHT: SingleFlight[xtgeo.RegularSurface] = SingleFlight("realization_surface")
+_STATISTICAL_SURFACE_SINGLE_FLIGHT: SingleFlight[xtgeo.RegularSurface | None] = SingleFlight("statistical_surface")
+
 
 @dataclass(frozen=True)
 class InProgress:
@@ -47,15 +64,36 @@ class ExpectedError:
 
 
 class SurfaceAccess:
-    def __init__(self, sumo_client: SumoClient, case_uuid: str, ensemble_name: str | None):
+    def __init__(
+        self,
+        sumo_client: SumoClient,
+        case_uuid: str,
+        ensemble_name: str | None,
+        ensemble_fingerprint: str | None = None,
+    ):
         self._sumo_client = sumo_client
         self._case_uuid: str = case_uuid
         self._ensemble_name: str | None = ensemble_name
+        self._ensemble_fingerprint: str | None = ensemble_fingerprint
 
     @classmethod
-    def from_ensemble_name(cls, access_token: str, case_uuid: str, ensemble_name: str) -> "SurfaceAccess":
+    def from_ensemble_name(
+        cls, access_token: str, case_uuid: str, ensemble_name: str, ensemble_fingerprint: str | None = None
+    ) -> "SurfaceAccess":
+        """
+        Create access object for an ensemble.
+
+        If an ensemble fingerprint is specified, realization surfaces will be cached in-process and reused for
+        subsequent requests against the same ensemble content. The fingerprint must be obtained on behalf of the
+        same user as the access token, see SumoFingerprinter.
+        """
         sumo_client = create_sumo_client(access_token)
-        return SurfaceAccess(sumo_client=sumo_client, case_uuid=case_uuid, ensemble_name=ensemble_name)
+        return SurfaceAccess(
+            sumo_client=sumo_client,
+            case_uuid=case_uuid,
+            ensemble_name=ensemble_name,
+            ensemble_fingerprint=ensemble_fingerprint,
+        )
 
     @classmethod
     def from_case_uuid_no_ensemble(cls, access_token: str, case_uuid: str) -> "SurfaceAccess":
@@ -152,6 +190,56 @@ class SurfaceAccess:
         if not self._ensemble_name:
             raise InvalidParameterError("Ensemble name must be set to get realization surface", Service.SUMO)
 
+        surf_str = self._make_real_surf_log_str(real_num, name, attribute, time_or_interval_str)
+
+        cache_key: _RealizationSurfaceCacheKey | None = None
+        if self._ensemble_fingerprint is not None:
+            cache_key = (
+                self._case_uuid,
+                self._ensemble_name,
+                self._ensemble_fingerprint,
+                real_num,
+                name,
+                attribute,
+                time_or_interval_str,
+            )
+            cached_surf = _REALIZATION_SURFACE_CACHE.get(cache_key)
+            if cached_surf is not None:
+                # Hand out a copy, since callers are free to modify the returned surface
+                LOGGER.debug(f"Got realization surface from cache ({surf_str})")
+                return cached_surf.copy()
+
+        token_scope = get_sumo_client_token_scope(self._sumo_client)
+        if token_scope is None:
+            return await self._load_realization_surface_async(
+                real_num, name, attribute, time_or_interval_str, cache_key
+            )
+
+        single_flight_key = (
+            token_scope,
+            self._case_uuid,
+            self._ensemble_name,
+            real_num,
+            name,
+            attribute,
+            time_or_interval_str,
+        )
+        shared_surf = await _REALIZATION_SURFACE_SINGLE_FLIGHT.run_async(
+            single_flight_key,
+            lambda: self._load_realization_surface_async(real_num, name, attribute, time_or_interval_str, cache_key),
+        )
+
+        # The surface is shared with any coalesced callers, hand out a copy since callers are free to modify it
+        return shared_surf.copy()
+
+    async def _load_realization_surface_async(
+        self,
+        real_num: int,
+        name: str,
+        attribute: str,
+        time_or_interval_str: str | None,
+        cache_key: _RealizationSurfaceCacheKey | None,
+    ) -> xtgeo.RegularSurface:
         perf_metrics = PerfMetrics()
 
         surf_str = self._make_real_surf_log_str(real_num, name, attribute, time_or_interval_str)
@@ -197,6 +285,9 @@ class SurfaceAccess:
             f"[{xtgeo_surf.ncol}x{xtgeo_surf.nrow}, {size_mb:.2f}MB] ({surf_str})"
         )
 
+        if cache_key is not None:
+            _REALIZATION_SURFACE_CACHE.set(cache_key, xtgeo_surf.copy())
+
         return xtgeo_surf
 
     @otel_span_decorator()
@@ -311,8 +402,9 @@ class SurfaceAccess:
                 )
 
         sumo_stat_op_str = _map_to_sumo_aggregation_operation(statistic_function)
-        sumo_surf_obj = await search_context.aggregate_async(operation=sumo_stat_op_str)
-        xtgeo_surf = await sumo_surf_obj.to_regular_surface_async() if isinstance(sumo_surf_obj, Surface) else None
+        xtgeo_surf = await self._aggregate_statistical_surface_async(
+            search_context, sumo_stat_op_str, name, attribute, realizations, time_or_interval_str
+        )
         perf_metrics.record_lap("calc-stat")
 
         if not xtgeo_surf:
@@ -330,6 +422,39 @@ class SurfaceAccess:
 
         return xtgeo_surf
 
+    async def _aggregate_statistical_surface_async(
+        self,
+        search_context: SearchContext,
+        sumo_stat_op_str: str,
+        name: str,
+        attribute: str,
+        realizations: Sequence[int] | None,
+        time_or_interval_str: str | None,
+    ) -> xtgeo.RegularSurface | None:
+        # The aggregation is expensive and is written back to Sumo, so identical concurrent requests are coalesced
+        async def _aggregate_async() -> xtgeo.RegularSurface | None:
+            sumo_surf_obj = await search_context.aggregate_async(operation=sumo_stat_op_str)
+            return await sumo_surf_obj.to_regular_surface_async() if isinstance(sumo_surf_obj, Surface) else None
+
+        token_scope = get_sumo_client_token_scope(self._sumo_client)
+        if token_scope is None:
+            return await _aggregate_async()
+
+        single_flight_key = (
+            token_scope,
+            self._case_uuid,
+            self._ensemble_name,
+            sumo_stat_op_str,
+            name,
+            attribute,
+            tuple(sorted(realizations)) if realizations is not None else None,
+            time_or_interval_str,
+        )
+        shared_surf = await _STATISTICAL_SURFACE_SINGLE_FLIGHT.run_async(single_flight_key, _aggregate_async)
+
+        # The surface is shared with any coalesced callers, hand out a copy since callers are free to modify it
+        return shared_surf.copy() if shared_surf is not None else None
+
     @otel_span_decorator()
     async def submit_statistical_surface_calculation_task_async(
         self,
@@ -1,4 +1,6 @@
 import logging
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
 from typing import Literal, Sequence
 
 import httpx
@@ -8,15 +10,18 @@ from pydantic import BaseModel
 from sumo.wrapper import SumoClient
 
 from webviz_core_utils.b64 import B64FloatArray, B64IntArray, B64UintArray
-from webviz_core_utils.b64 import b64_decode_float_array_to_list, b64_decode_int_array
 from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_core_utils.binary_payload import split_binary_payload, get_numpy_array_view
+from webviz_core_utils.binary_payload import iterate_length_prefixed_frames_async
+from webviz_core_utils.binary_payload import b64_encode_buffer_as_float_array, b64_encode_buffer_as_uint_array
 from webviz_core_utils.perf_metrics import PerfMetrics, make_metrics_string_s
 from webviz_server_schemas.user_grid3d_ri import api_schemas as server_api_schemas
 
 from webviz_services.utils.authenticated_user import AuthenticatedUser
-from webviz_services.service_exceptions import Service
+from webviz_services.service_exceptions import InvalidDataError, Service
 from webviz_services.service_exceptions import ServiceRequestError, ServiceTimeoutError, ServiceUnavailableError
 from webviz_services.sumo_access.queries.grid3d import get_grid_geometry_and_property_blob_ids_async
+from webviz_services.sumo_access.queries.grid3d import get_grid_geometry_and_property_blob_ids_for_time_steps_async
 from webviz_services.sumo_access.queries.grid3d import get_grid_geometry_blob_id_async
 from webviz_services.sumo_access.sumo_blob_access import get_sas_token_and_blob_base_uri_for_case_async
 from webviz_services.sumo_access.sumo_client_factory import create_sumo_client
@@ -52,6 +57,7 @@ class GridDimensions(BaseModel):
 class GridGeometry(BaseModel):
     vertices_b64arr: B64FloatArray
     polys_b64arr: B64UintArray
+    poly_layout: Literal["vtk", "quads"]
     poly_source_cell_indices_b64arr: B64UintArray
     origin_utm_x: float
     origin_utm_y: float
@@ -66,6 +72,18 @@ class MappedGridProperties(BaseModel):
     max_grid_prop_value: float | int
 
 
+@dataclass(frozen=True, kw_only=True)
+class MappedGridPropertiesFrame:
+    property_time_or_interval_str: str
+    # Float or int array, note that the array may be a read only view into the received frame
+    # The array and the min/max values are None if the user session failed for this time step
+    poly_props_arr: NDArray | None
+    undefined_int_value: int | None
+    min_grid_prop_value: float | int | None
+    max_grid_prop_value: float | int | None
+    error_message: str | None = None
+
+
 class FenceMeshSection(BaseModel):
     # U-axis defined by unit length vector from start to end, Z is global Z
     vertices_uz_b64arr: B64FloatArray
@@ -130,8 +148,19 @@ class UserGrid3dService:
         return service_object
 
     async def get_grid_geometry_async(
-        self, ensemble_name: str, realization: int, grid_name: str, ijk_index_filter: IJKIndexFilter | None
+        self,
+        ensemble_name: str,
+        realization: int,
+        grid_name: str,
+        ijk_index_filter: IJKIndexFilter | None,
+        poly_layout: Literal["vtk", "quads"] = "vtk",
     ) -> GridGeometry:
+        """
+        Get the grid surface geometry.
+
+        With the vtk poly layout each poly in polys_b64arr is prefixed by its vertex count. The quads layout stores
+        four vertex indices per poly without count prefix, and is only returned if all polys are quads.
+        """
         perf_metrics = PerfMetrics()
 
         grid_blob_object_uuid = await get_grid_geometry_blob_id_async(
@@ -150,6 +179,7 @@ class UserGrid3dService:
             grid_blob_object_uuid=grid_blob_object_uuid,
             include_inactive_cells=self._include_inactive_cells,
             ijk_index_filter=effective_ijk_index_filter,
+            poly_layout=poly_layout,
         )
 
         perf_metrics.reset_lap_timer()
@@ -166,6 +196,7 @@ class UserGrid3dService:
         ret_obj = GridGeometry(
             vertices_b64arr=api_obj.vertices_b64arr,
             polys_b64arr=api_obj.polys_b64arr,
+            poly_layout=api_obj.poly_layout,
             poly_source_cell_indices_b64arr=api_obj.poly_source_cell_indices_b64arr,
             origin_utm_x=api_obj.origin_utm_x,
             origin_utm_y=api_obj.origin_utm_y,
@@ -240,6 +271,71 @@ class UserGrid3dService:
 
         return ret_obj
 
+    async def get_mapped_grid_properties_for_time_steps_stream_async(
+        self,
+        ensemble_name: str,
+        realization: int,
+        grid_name: str,
+        property_name: str,
+        property_time_or_interval_strs: list[str],
+        ijk_index_filter: IJKIndexFilter | None,
+    ) -> AsyncIterator[MappedGridPropertiesFrame]:
+        """
+        Resolve the blobs of the property for all the time steps in a single query and return an async iterator
+        that yields the mapped properties as they become ready in the user session, in order of completion.
+
+        The request to the user session is sent and its status checked before returning, so that failing to start
+        the stream raises like the other calls to the user session. A frame is yielded for every unique requested
+        time step, also when several time steps resolve to the same property blob. Time steps for which the user
+        session fails to produce data, including after the stream has started, are yielded as frames with
+        error_message set and no property values.
+        """
+        perf_metrics = PerfMetrics()
+
+        unique_time_or_interval_strs = list(dict.fromkeys(property_time_or_interval_strs))
+        grid_blob_object_uuid, property_blob_ids_by_time = (
+            await get_grid_geometry_and_property_blob_ids_for_time_steps_async(
+                self._sumo_client,
+                self._case_uuid,
+                ensemble_name,
+                realization,
+                grid_name,
+                property_name,
+                unique_time_or_interval_strs,
+            )
+        )
+        LOGGER.debug(f".get_mapped_grid_properties_for_time_steps_stream_async() - {grid_blob_object_uuid=}")
+        perf_metrics.record_lap("blob-ids")
+
+        # Different time strings may resolve to the same blob, while the user session sends one frame per blob
+        time_strs_by_property_blob_id: dict[str, list[str]] = {}
+        for time_str, blob_id in property_blob_ids_by_time.items():
+            time_strs_by_property_blob_id.setdefault(blob_id, []).append(time_str)
+
+        effective_ijk_index_filter: server_api_schemas.IJKIndexFilter | None = None
+        if ijk_index_filter:
+            effective_ijk_index_filter = server_api_schemas.IJKIndexFilter.model_validate(ijk_index_filter.model_dump())
+
+        request_body = server_api_schemas.MappedGridPropertiesBatchRequest(
+            sas_token=self._sas_token,
+            blob_store_base_uri=self._blob_store_base_uri,
+            grid_blob_object_uuid=grid_blob_object_uuid,
+            property_blob_object_uuids=list(time_strs_by_property_blob_id),
+            include_inactive_cells=self._include_inactive_cells,
+            ijk_index_filter=effective_ijk_index_filter,
+        )
+
+        byte_chunks = await self._open_stream_from_service_endpoint_post_async(
+            endpoint="get_mapped_grid_properties_batch",
+            body_pydantic_model=request_body,
+            operation_descr="streaming mapped grid properties from grid3d user session",
+        )
+        perf_metrics.record_lap("open-stream")
+
+        LOGGER.debug(f".get_mapped_grid_properties_for_time_steps_stream_async() took: {perf_metrics.to_string_s()}")
+
+        return _iterate_mapped_grid_properties_frames_async(byte_chunks, time_strs_by_property_blob_id)
+
     async def get_polyline_intersection_async(
         self,
         ensemble_name: str,
@@ -274,36 +370,23 @@ class UserGrid3dService:
         )
 
         response = await self._call_service_endpoint_post_async(
-            endpoint="get_polyline_intersection",
+            endpoint="get_polyline_intersection_binary",
             body_pydantic_model=request_body,
             operation_descr="getting polyline intersection from grid3d user session",
         )
         perf_metrics.record_lap("call-user-session")
 
-        api_obj = server_api_schemas.PolylineIntersectionResponse.model_validate_json(response.content)
+        try:
+            header_bytes, buffers_view = split_binary_payload(response.content)
+            api_obj = server_api_schemas.PolylineIntersectionBinaryHeader.model_validate_json(header_bytes)
+        except ValueError as exc:
+            raise InvalidDataError(f"Invalid polyline intersection payload: {exc}", Service.USER_SESSION) from exc
         perf_metrics.record_lap("validate-response")
 
-        # Not sure how we should be doing this wrt performance.
-        # Right now we end up doing one validation here and another when creating the return object.
-        ret_mesh_section_list: list[FenceMeshSection] = []
-        for api_sect in api_obj.fence_mesh_sections:
-            if isinstance(api_sect.poly_props_b64arr, B64FloatArray):
-                poly_props_float_list = b64_decode_float_array_to_list(api_sect.poly_props_b64arr)
-            else:
-                poly_props_float_list = b64_decode_int_array(api_sect.poly_props_b64arr).astype(float).tolist()
-
-            sect = FenceMeshSection(
-                vertices_uz_b64arr=api_sect.vertices_uz_b64arr,
-                poly_indices_b64arr=api_sect.poly_indices_b64arr,
-                vertices_per_poly_b64arr=api_sect.vertices_per_poly_b64arr,
-                poly_source_cell_indices_b64arr=api_sect.poly_source_cell_indices_b64arr,
-                poly_props_b64arr=b64_encode_float_array_as_float32(poly_props_float_list),
-                start_utm_x=api_sect.start_utm_x,
-                start_utm_y=api_sect.start_utm_y,
-                end_utm_x=api_sect.end_utm_x,
-                end_utm_y=api_sect.end_utm_y,
-            )
-            ret_mesh_section_list.append(sect)
+        # The array buffers are base64 encoded directly from the binary payload without decoding the values
+        ret_mesh_section_list = [
+            _fence_mesh_section_from_binary_payload(api_sect, buffers_view) for api_sect in api_obj.fence_mesh_sections
+        ]
 
         ret_obj = PolylineIntersection(
             fence_mesh_sections=ret_mesh_section_list,
@@ -415,20 +498,189 @@ class UserGrid3dService:
 
         return response
 
+    async def _open_stream_from_service_endpoint_post_async(
+        self, endpoint: str, body_pydantic_model: BaseModel, operation_descr: str
+    ) -> AsyncGenerator[bytes, None]:
+        """
+        Streaming variant of _call_service_endpoint_post_async(). The request is sent and the response status checked
+        before returning, raising the same errors as the non-streaming calls. The returned generator yields the
+        response body in chunks, and closes the connection when exhausted or closed.
+        """
+
+        url = f"{self._base_url}/{endpoint}"
+        LOGGER.debug(f"._open_stream_from_service_endpoint_post_async() - {endpoint=}, {url=}")
+
+        client = httpx.AsyncClient(timeout=self._call_timeout)
+        try:
+            try:
+                request = client.build_request("POST", url=url, content=body_pydantic_model.model_dump_json())
+                response = await client.send(request, stream=True)
+                if response.is_error:
+                    await response.aread()
+                response.raise_for_status()
+
+            except httpx.TimeoutException as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, request timed out for POST to {url=}\n  exception: {e}"
+                )
+                raise ServiceTimeoutError(f"Timeout {operation_descr}", Service.USER_SESSION) from e
+
+            except httpx.RequestError as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, request error occurred for POST to {url=}\n  exception: {e}"
+                )
+                raise ServiceRequestError(f"Error {operation_descr}", Service.USER_SESSION) from e
+
+            except httpx.HTTPStatusError as e:
+                LOGGER.error(
+                    f"Error calling '{endpoint}' endpoint, HTTP error {e.response.status_code} for POST to {url=}"
+                    f"\n  response: {e.response.text}"
+                    f"\n  exception: {e}"
+                )
+                raise ServiceRequestError(f"Error {operation_descr}", Service.USER_SESSION) from e
+
+        except BaseException:
+            await client.aclose()
+            raise
+
+        LOGGER.debug(f"._open_stream_from_service_endpoint_post_async() succeeded - {endpoint=}, {url=}")
+
+        return _iterate_response_bytes_async(client, response)
+
+
+async def _iterate_response_bytes_async(
+    client: httpx.AsyncClient, response: httpx.Response
+) -> AsyncGenerator[bytes, None]:
+    try:
+        async for chunk in response.aiter_bytes():
+            yield chunk
+    finally:
+        await response.aclose()
+        await client.aclose()
+
+
+async def _iterate_mapped_grid_properties_frames_async(
+    byte_chunks: AsyncGenerator[bytes, None],
+    time_strs_by_property_blob_id: dict[str, list[str]],
+) -> AsyncIterator[MappedGridPropertiesFrame]:
+    """
+    Convert the frames streamed from the user session, yielding one frame per requested time step.
+
+    The stream has already been started, so failures while streaming do not raise. Instead the time steps that have
+    not been received are yielded as error frames.
+    """
+    perf_metrics = PerfMetrics()
+    frame_count = 0
+    error_frame_count = 0
+    expected_frame_count = sum(len(time_strs) for time_strs in time_strs_by_property_blob_id.values())
+
+    pending_time_strs_by_property_blob_id = dict(time_strs_by_property_blob_id)
+    missing_frame_error_message = "No data received from user session"
+    try:
+        async for frame in iterate_length_prefixed_frames_async(byte_chunks):
+            header_bytes, buffers_view = split_binary_payload(frame)
+            api_header = server_api_schemas.MappedGridPropertiesFrameHeader.model_validate_json(header_bytes)
+
+            time_strs = pending_time_strs_by_property_blob_id.pop(api_header.property_blob_object_uuid, None)
+            if time_strs is None:
+                LOGGER.warning(f"Ignoring frame for unexpected blob {api_header.property_blob_object_uuid=}")
+                continue
+
+            if api_header.error_message is not None:
+                LOGGER.warning(f"User session failed for {time_strs=}: {api_header.error_message}")
+                error_frame_count += len(time_strs)
+
+            poly_props_arr = None
+            if api_header.poly_props is not None:
+                poly_props_arr = get_numpy_array_view(buffers_view, api_header.poly_props)
+
+            for time_str in time_strs:
+                frame_count += 1
+                yield MappedGridPropertiesFrame(
+                    property_time_or_interval_str=time_str,
+                    poly_props_arr=poly_props_arr,
+                    undefined_int_value=api_header.undefined_int_value,
+                    min_grid_prop_value=api_header.min_grid_prop_value,
+                    max_grid_prop_value=api_header.max_grid_prop_value,
+                    error_message=api_header.error_message,
+                )
+
+    except (httpx.HTTPError, ValueError) as exc:
+        LOGGER.error(f"Streaming mapped grid properties from user session failed: {exc=}")
+        missing_frame_error_message = f"Streaming from user session failed: {type(exc).__name__}"
+    finally:
+        await byte_chunks.aclose()
+
+    # Time steps the user session did not send, e.g. because the stream broke off
+    for time_strs in pending_time_strs_by_property_blob_id.values():
+        for time_str in time_strs:
+            frame_count += 1
+            error_frame_count += 1
+            yield MappedGridPropertiesFrame(
+                property_time_or_interval_str=time_str,
+                poly_props_arr=None,
+                undefined_int_value=None,
+                min_grid_prop_value=None,
+                max_grid_prop_value=None,
+                error_message=missing_frame_error_message,
+            )
+
+    perf_metrics.record_lap("stream-frames")
+    LOGGER.debug(
+        f"_iterate_mapped_grid_properties_frames_async() - yielded {frame_count} of {expected_frame_count} frames, "
+        f"{error_frame_count} of which failed, in: {perf_metrics.to_string_s()}"
+    )
+
+
+def _fence_mesh_section_from_binary_payload(
+    api_sect: server_api_schemas.FenceMeshSectionBinaryHeader, buffers_view: memoryview
+) -> FenceMeshSection:
+    # Only discrete properties need conversion, since the response schema specifies float properties
+    if api_sect.poly_props.element_type.startswith("float"):
+        poly_props_b64arr = b64_encode_buffer_as_float_array(buffers_view, api_sect.poly_props)
+    else:
+        int_props_arr_np = get_numpy_array_view(buffers_view, api_sect.poly_props)
+        poly_props_b64arr = b64_encode_float_array_as_float32(int_props_arr_np.astype(np.float32))
+
+    return FenceMeshSection(
+        vertices_uz_b64arr=b64_encode_buffer_as_float_array(buffers_view, api_sect.vertices_uz),
+        poly_indices_b64arr=b64_encode_buffer_as_uint_array(buffers_view, api_sect.poly_indices),
+        vertices_per_poly_b64arr=b64_encode_buffer_as_uint_array(buffers_view, api_sect.vertices_per_poly),
+        poly_source_cell_indices_b64arr=b64_encode_buffer_as_uint_array(
+            buffers_view, api_sect.poly_source_cell_indices
+        ),
+        poly_props_b64arr=poly_props_b64arr,
+        start_utm_x=api_sect.start_utm_x,
+        start_utm_y=api_sect.start_utm_y,
+        end_utm_x=api_sect.end_utm_x,
+        end_utm_y=api_sect.end_utm_y,
+    )
+
 
 def _build_vtk_style_polys(
-    poly_indices_arr_np: Sequence[int], vertices_per_poly_arr_np: Sequence[int]
+    poly_indices_arr_np: NDArray[np.integer] | Sequence[int],
+    vertices_per_poly_arr_np: NDArray[np.integer] | Sequence[int],
 ) -> NDArray[np.uint32]:
-    num_polys = len(vertices_per_poly_arr_np)
-    polys_arr = np.empty(num_polys + len(poly_indices_arr_np), dtype=np.uint32)
-
-    src_idx = 0
-    dst_idx = 0
-    for num_verts_in_poly in vertices_per_poly_arr_np:
-        polys_arr[dst_idx] = num_verts_in_poly
-        dst_idx += 1
-        polys_arr[dst_idx : dst_idx + num_verts_in_poly] = poly_indices_arr_np[src_idx : src_idx + num_verts_in_poly]
-        src_idx += num_verts_in_poly
-        dst_idx += num_verts_in_poly
+    """
+    Build VTK style polys array, where the vertex indices of each poly are prefixed by the poly's vertex count.
+    """
+    poly_indices_np = np.asarray(poly_indices_arr_np, dtype=np.uint32)
+    vertices_per_poly_np = np.asarray(vertices_per_poly_arr_np, dtype=np.int64)
+    if int(vertices_per_poly_np.sum()) != len(poly_indices_np):
+        raise ValueError("Number of poly indices does not match the sum of vertices per poly")
+
+    num_polys = len(vertices_per_poly_np)
+    polys_arr = np.empty(num_polys + len(poly_indices_np), dtype=np.uint32)
+
+    # The count of each poly goes after the counts and indices of all preceding polys,
+    # all remaining positions are filled with the indices in their original order
+    count_positions_np = np.arange(num_polys, dtype=np.int64)
+    count_positions_np[1:] += np.cumsum(vertices_per_poly_np[:-1])
+
+    is_index_position = np.ones(len(polys_arr), dtype=bool)
+    is_index_position[count_positions_np] = False
+
+    polys_arr[count_positions_np] = vertices_per_poly_np
+    polys_arr[is_index_position] = poly_indices_np
 
     return polys_arr
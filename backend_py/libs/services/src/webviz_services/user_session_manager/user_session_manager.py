@@ -53,7 +53,8 @@ _USER_SESSION_DEFS: dict[UserComponent, _UserSessionDef] = {
         job_component_name="user-grid3d-ri",
         port=8002,
         resource_req=RadixResourceRequests(cpu="4", memory="16Gi"),
-        payload_dict={"ri_omp_num_treads": 4},
+        # The OpenMP threads are per ResInsight instance, keep the total across the pool within the requested CPUs
+        payload_dict={"ri_omp_num_treads": 2, "ri_pool_size": 2},
     ),
 }
 
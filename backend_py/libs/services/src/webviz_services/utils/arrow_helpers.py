@@ -38,6 +38,19 @@ def sort_table_on_real_then_date(table: pa.Table) -> pa.Table:
     return table.sort_by([("REAL", "ascending"), ("DATE", "ascending")])
 
 
+def is_table_sorted_on_real_then_date(table: pa.Table) -> bool:
+    """
+    Check if the table is segmented on REAL in ascending order, with strictly increasing DATE within each segment.
+    This is the layout produced by sort_table_on_real_then_date().
+    """
+    real_diff_np = np.diff(table.column("REAL").to_numpy().astype(np.int32))
+    if np.any(real_diff_np < 0):
+        return False
+
+    date_diff_np = np.diff(table.column("DATE").to_numpy().astype(np.int64))
+    return bool(np.all(date_diff_np[real_diff_np == 0] > 0))
+
+
 def sort_table_on_date(table: pa.Table) -> pa.Table:
     return table.sort_by("DATE")
 
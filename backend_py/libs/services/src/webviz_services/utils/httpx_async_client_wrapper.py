@@ -2,6 +2,7 @@ from typing import Optional
 import logging
 
 import httpx
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY
 
 LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +31,7 @@ class HTTPXAsyncClientWrapper:
             # Try and increase the maximum number of concurrent connections and the max number of
             # keep-alive connections from their defualts of 100 and 20 respectively.
             limits = httpx.Limits(max_connections=300, max_keepalive_connections=100)
-            self._async_client = httpx.AsyncClient(limits=limits)
+            self._async_client = httpx.AsyncClient(limits=limits, event_hooks={"response": [_count_response_async]})
             LOGGER.info(f"httpx AsyncClient instantiated: id={id(self._async_client)}, {limits=}")
 
     async def stop_async(self) -> None:
@@ -47,5 +48,12 @@ class HTTPXAsyncClientWrapper:
             LOGGER.info("httpx AsyncClient closed")
 
 
+async def _count_response_async(response: httpx.Response) -> None:
+    # Count outgoing requests per host, e.g. to track the number of calls to Sumo
+    METRICS_REGISTRY.increment_counter(
+        "webviz_http_client_responses_total", host=response.request.url.host, status=f"{response.status_code // 100}xx"
+    )
+
+
 # Create a singleton instance of the async client
 HTTPX_ASYNC_CLIENT_WRAPPER = HTTPXAsyncClientWrapper()
@@ -0,0 +1,85 @@
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, kw_only=True)
+class SingleFlightStats:
+    executed: int
+    coalesced: int
+    in_flight: int
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces concurrent calls for identical work, so that the work runs only once and the result
+    (or exception) is handed to all callers that asked for it while it was in flight.
+
+    The work runs in a separate task, so that a cancelled caller, e.g. due to a client disconnect,
+    does not fail the other callers waiting for the same result.
+
+    Results are shared between the callers, so the work should return immutable data, or callers must
+    not modify the returned object.
+
+    Keys must include everything the result depends on. When the result depends on data the caller
+    must be authorized to access, the key must be scoped to the caller's access token, see make_token_scope().
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._in_flight: dict[Hashable, asyncio.Task[T]] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+        _SINGLE_FLIGHT_REGISTRY[name] = self
+
+    async def run_async(self, key: Hashable, work_func: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(_await_work_async(work_func))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done_task: self._on_task_done(key, done_task))
+            self._executed += 1
+        else:
+            self._coalesced += 1
+            LOGGER.debug(f"Coalesced call in single flight {self._name}")
+
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(executed=self._executed, coalesced=self._coalesced, in_flight=len(self._in_flight))
+
+    def _on_task_done(self, key: Hashable, done_task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is done_task:
+            del self._in_flight[key]
+
+        # Mark any exception as retrieved, all callers may have been cancelled before the work failed
+        if not done_task.cancelled():
+            done_task.exception()
+
+
+async def _await_work_async(work_func: Callable[[], Awaitable[T]]) -> T:
+    return await work_func()
+
+
+# All single flight instances by name, for reporting of stats
+_SINGLE_FLIGHT_REGISTRY: dict[str, SingleFlight] = {}
+
+
+def get_all_single_flight_stats() -> dict[str, SingleFlightStats]:
+    return {name: single_flight.get_stats() for name, single_flight in _SINGLE_FLIGHT_REGISTRY.items()}
+
+
+def make_token_scope(access_token: str) -> str:
+    """
+    Make a key component scoping coalesced work to an access token, so that a result is only shared between
+    calls authorized by the same token. The token itself is not retained.
+    """
+    return hashlib.sha256(access_token.encode()).hexdigest()[:32]
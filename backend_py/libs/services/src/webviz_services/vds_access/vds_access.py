@@ -1,3 +1,5 @@
+import asyncio
+import hashlib
 import logging
 from typing import List, Tuple
 import json
@@ -6,8 +8,9 @@ import numpy as np
 from numpy.typing import NDArray
 from requests_toolbelt.multipart.decoder import MultipartDecoder, BodyPart
 import httpx
+from webviz_core_utils.lru_cache import LruCache
 
-from webviz_services.service_exceptions import InvalidDataError, Service
+from webviz_services.service_exceptions import InvalidDataError, InvalidParameterError, Service
 
 from webviz_services.services_config import get_services_config
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
@@ -27,6 +30,34 @@ from .request_types import (
 
 LOGGER = logging.getLogger(__name__)
 
+# In-process caches of cube metadata, decoded slices and fence chunks. The content of a vds blob is immutable, so the
+# entries are keyed on the vds url (without SAS token) and shared between users. This is acceptable since the cached
+# values hold no credentials, and a VdsAccess can only be created from a VDS handle, which is obtained through a Sumo
+# search with the user's own access token (the VDS handle cache is token scoped). So a user can only reach entries for
+# cubes that Sumo has granted the user access to.
+_METADATA_CACHE: LruCache[str, VdsMetadata] = LruCache(name="vds_metadata", max_entries=256)
+
+# Key: (vds_url, coordinate system, interpolation, digest of chunk coordinates)
+_FENCE_CHUNK_CACHE: LruCache[Tuple[str, VdsCoordinateSystem, VdsInterpolation, str], NDArray[np.float32]] = LruCache(
+    name="vds_fence_chunk", max_entries=2048, max_total_size=256 * 1024 * 1024, size_func=lambda chunk: chunk.nbytes
+)
+
+# Fences are requested in chunks of coordinates, with a bounded number of concurrent requests per fence.
+# The chunk boundaries are fixed relative to the start of the polyline, so that a polyline which is extended
+# at its end will reuse the cached chunks of the unchanged part.
+_FENCE_CHUNK_NUM_TRACES = 512
+_FENCE_MAX_CONCURRENT_CHUNK_REQUESTS = 4
+
+# Temporary hard coded fill value for points outside of the seismic cube.
+# If no fill value is provided in the request is rejected with error if list of coordinates
+# contain points outside of the seismic cube.
+_FENCE_FILL_VALUE = -999.25
+
+# Key: (vds_url, direction, line number)
+_SLICE_CACHE: LruCache[Tuple[str, VdsDirection, int], Tuple[NDArray[np.float32], VdsSliceMetadata]] = LruCache(
+    name="vds_slice", max_entries=1024, max_total_size=512 * 1024 * 1024, size_func=lambda entry: entry[0].nbytes
+)
+
 
 def bytes_to_ndarray_float32(bytes_data: bytes, shape: List[int]) -> NDArray[np.float32]:
     """
@@ -81,54 +112,51 @@ class VdsAccess:
 
     async def get_metadata_async(self) -> VdsMetadata:
         """Gets metadata from the cube"""
+        cached_metadata = _METADATA_CACHE.get(self.vds_url)
+        if cached_metadata is not None:
+            return cached_metadata
+
         endpoint = "metadata"
 
         metadata_request = VdsMetadataRequest(vds=self.vds_url, sas=self.sas)
         response = await self._query_async(endpoint, metadata_request)
 
-        metadata = response.json()
-        return VdsMetadata(**metadata)
+        metadata = VdsMetadata(**response.json())
+        _METADATA_CACHE.set(self.vds_url, metadata)
+        return metadata
 
     async def get_inline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
-        endpoint = "slice"
-        slice_request = VdsSliceRequest(
-            vds=self.vds_url,
-            sas=self.sas,
-            direction=VdsDirection.INLINE,
-            line_no=line_no,
-        )
-        response = await self._query_async(endpoint, slice_request)
+        return await self._get_slice_async(VdsDirection.INLINE, line_no)
 
-        parts = self._extract_and_validate_body_parts_from_response(response)
-        response_metadata = json.loads(parts[0].content)
-        metadata = VdsSliceMetadata(
-            format=response_metadata["format"],
-            shape=response_metadata["shape"],
-            x_axis=VdsAxis(**response_metadata["x"]),
-            y_axis=VdsAxis(**response_metadata["y"]),
-            geospatial=response_metadata["geospatial"],
-        )
-        self._assert_valid_metadata_format_and_shape(metadata)
+    async def get_crossline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        return await self._get_slice_async(VdsDirection.CROSSLINE, line_no)
 
-        byte_array = parts[1].content
+    async def get_depth_slice_async(self, depth_slice_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        return await self._get_slice_async(VdsDirection.DEPTH, depth_slice_no)
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+    async def _get_slice_async(
+        self, direction: VdsDirection, line_no: int
+    ) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
+        """
+        Get a slice of the cube as flattened array with row major order, along with its metadata.
 
-        return (flattened_fence_traces_float32_array, metadata)
+        Decoded slices are cached, and the returned array is read-only as it may be shared between requests.
+        """
+        cache_key = (self.vds_url, direction, line_no)
+        cached_slice = _SLICE_CACHE.get(cache_key)
+        if cached_slice is not None:
+            return cached_slice
 
-    async def get_crossline_slice_async(self, line_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
         endpoint = "slice"
         slice_request = VdsSliceRequest(
             vds=self.vds_url,
             sas=self.sas,
-            direction=VdsDirection.CROSSLINE,
+            direction=direction,
             line_no=line_no,
         )
         response = await self._query_async(endpoint, slice_request)
 
         parts = self._extract_and_validate_body_parts_from_response(response)
-
         response_metadata = json.loads(parts[0].content)
         metadata = VdsSliceMetadata(
             format=response_metadata["format"],
@@ -142,45 +170,27 @@ class VdsAccess:
         byte_array = parts[1].content
 
         # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+        flattened_slice_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+        flattened_slice_traces_float32_array.flags.writeable = False
 
-        return (flattened_fence_traces_float32_array, metadata)
+        _SLICE_CACHE.set(cache_key, (flattened_slice_traces_float32_array, metadata))
 
-    async def get_depth_slice_async(self, depth_slice_no: int) -> Tuple[NDArray[np.float32], VdsSliceMetadata]:
-        endpoint = "slice"
-        slice_request = VdsSliceRequest(
-            vds=self.vds_url,
-            sas=self.sas,
-            direction=VdsDirection.DEPTH,
-            line_no=depth_slice_no,
-        )
-        response = await self._query_async(endpoint, slice_request)
-
-        parts = self._extract_and_validate_body_parts_from_response(response)
-
-        response_metadata = json.loads(parts[0].content)
-        metadata = VdsSliceMetadata(
-            format=response_metadata["format"],
-            shape=response_metadata["shape"],
-            x_axis=VdsAxis(**response_metadata["x"]),
-            y_axis=VdsAxis(**response_metadata["y"]),
-            geospatial=response_metadata["geospatial"],
-        )
-        self._assert_valid_metadata_format_and_shape(metadata)
-
-        byte_array = parts[1].content
-
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
-
-        return (flattened_fence_traces_float32_array, metadata)
+        return (flattened_slice_traces_float32_array, metadata)
 
     async def get_flattened_fence_traces_array_and_metadata_async(
-        self, coordinates: VdsCoordinates, coordinate_system: VdsCoordinateSystem = VdsCoordinateSystem.CDP
+        self,
+        coordinates: VdsCoordinates,
+        coordinate_system: VdsCoordinateSystem = VdsCoordinateSystem.CDP,
+        max_num_traces: int | None = None,
     ) -> Tuple[NDArray[np.float32], int, int]:
         """
         Gets traces along an arbitrary path of (x, y) coordinates, with a trace per coordinate.
 
+        If `max_num_traces` is specified and the path has more coordinates, the coordinates are decimated to
+        `max_num_traces` coordinates evenly spaced by index along the path, always including the first and last.
+
+        The traces are fetched in chunks of coordinates with bounded concurrency, and the chunks are cached.
+
         The traces are perpendicular on the on the coordinates in the x-y plane, and each trace has number
         of samples equal to the depth of the seismic cube.
 
@@ -230,20 +240,68 @@ class VdsAccess:
         ```
         """
 
-        endpoint = "fence"
+        x_points_np = np.asarray(coordinates.x_points, dtype=np.float64)
+        y_points_np = np.asarray(coordinates.y_points, dtype=np.float64)
+        if len(x_points_np) == 0:
+            raise InvalidParameterError("Fence requires at least one coordinate", Service.VDS)
+
+        if max_num_traces is not None and len(x_points_np) > max_num_traces:
+            if max_num_traces < 1:
+                raise InvalidParameterError("max_num_traces must be a positive number", Service.VDS)
+            decimated_indices = np.round(np.linspace(0, len(x_points_np) - 1, max_num_traces)).astype(np.int64)
+            x_points_np = x_points_np[decimated_indices]
+            y_points_np = y_points_np[decimated_indices]
+
+        num_traces = len(x_points_np)
+        chunk_starts = list(range(0, num_traces, _FENCE_CHUNK_NUM_TRACES))
+        semaphore = asyncio.Semaphore(_FENCE_MAX_CONCURRENT_CHUNK_REQUESTS)
+
+        async def get_chunk_async(chunk_start: int) -> NDArray[np.float32]:
+            chunk_end = chunk_start + _FENCE_CHUNK_NUM_TRACES
+            async with semaphore:
+                return await self._get_fence_chunk_async(
+                    x_points_np[chunk_start:chunk_end], y_points_np[chunk_start:chunk_end], coordinate_system
+                )
+
+        chunk_arrays = await asyncio.gather(*[get_chunk_async(chunk_start) for chunk_start in chunk_starts])
+
+        # fence array data: [[t11, t12, ..., t1n], [t21, t22, ..., t2n], ..., [tm1, tm2, ..., tmn]]
+        # m = num_traces, n = num_samples_per_trace
+        num_samples_per_trace = chunk_arrays[0].shape[1]
+        if any(chunk_array.shape[1] != num_samples_per_trace for chunk_array in chunk_arrays):
+            raise InvalidDataError("Inconsistent number of samples per trace between fence chunks", service=Service.VDS)
 
-        # Temporary hard coded fill value for points outside of the seismic cube.
-        # If no fill value is provided in the request is rejected with error if list of coordinates
-        # contain points outside of the seismic cube.
-        hard_coded_fill_value = -999.25
+        # Stitch the chunks into one buffer with row major order, i.e. C-order in numpy
+        fence_traces_float32_array = np.empty((num_traces, num_samples_per_trace), dtype=np.float32)
+        for chunk_start, chunk_array in zip(chunk_starts, chunk_arrays):
+            fence_traces_float32_array[chunk_start : chunk_start + chunk_array.shape[0]] = chunk_array
+
+        return (fence_traces_float32_array.reshape(-1), num_traces, num_samples_per_trace)
+
+    async def _get_fence_chunk_async(
+        self, x_points_np: NDArray[np.float64], y_points_np: NDArray[np.float64], coordinate_system: VdsCoordinateSystem
+    ) -> NDArray[np.float32]:
+        """
+        Get the traces for a chunk of fence coordinates as a 2D array with shape (num_traces, num_samples_per_trace),
+        where values outside of the seismic cube are set to np.nan.
+
+        Chunks are cached, and the returned array is read-only as it may be shared between requests.
+        """
+        coordinates_digest = hashlib.blake2b(x_points_np.tobytes() + y_points_np.tobytes(), digest_size=16).hexdigest()
+        cache_key = (self.vds_url, coordinate_system, self._interpolation, coordinates_digest)
+        cached_chunk = _FENCE_CHUNK_CACHE.get(cache_key)
+        if cached_chunk is not None:
+            return cached_chunk
+
+        endpoint = "fence"
 
         fence_request = VdsFenceRequest(
             vds=self.vds_url,
             sas=self.sas,
             coordinate_system=coordinate_system,
-            coordinates=coordinates,
+            coordinates=VdsCoordinates(x_points_np.tolist(), y_points_np.tolist()),
             interpolation=self._interpolation,
-            fill_value=hard_coded_fill_value,
+            fill_value=_FENCE_FILL_VALUE,
         )
 
         # Fence query returns two parts - metadata and data
@@ -253,20 +311,19 @@ class VdsAccess:
 
         metadata = VdsFenceMetadata(**json.loads(parts[0].content))
         self._assert_valid_metadata_format_and_shape(metadata)
+        if metadata.shape[0] != len(x_points_np):
+            raise InvalidDataError(
+                f"Expected {len(x_points_np)} traces in fence response, got {metadata.shape[0]}", service=Service.VDS
+            )
 
-        byte_array = parts[1].content
-
-        # fence array data: [[t11, t12, ..., t1n], [t21, t22, ..., t2n], ..., [tm1, tm2, ..., tmn]]
-        # m = num_traces, n = num_samples_per_trace
-        num_traces = metadata.shape[0]
-        num_samples_per_trace = metadata.shape[1]
+        # Convert every value of the fill value to np.nan, creating an array independent of the response buffer
+        raw_chunk_array = bytes_to_ndarray_float32(parts[1].content, shape=metadata.shape)
+        chunk_array = np.where(raw_chunk_array == _FENCE_FILL_VALUE, np.float32(np.nan), raw_chunk_array)
+        chunk_array.flags.writeable = False
 
-        # Flattened array with row major order, i.e. C-order in numpy
-        flattened_fence_traces_float32_array = bytes_to_flatten_ndarray_float32(byte_array, shape=metadata.shape)
+        _FENCE_CHUNK_CACHE.set(cache_key, chunk_array)
 
-        # Convert every value of `hard_coded_fill_value` to np.nan
-        flattened_fence_traces_float32_array[flattened_fence_traces_float32_array == hard_coded_fill_value] = np.nan
-        return (flattened_fence_traces_float32_array, num_traces, num_samples_per_trace)
+        return chunk_array
 
     def _extract_and_validate_body_parts_from_response(self, response: httpx.Response) -> Tuple[BodyPart, BodyPart]:
         """Extract parts from response's body and validate them"""
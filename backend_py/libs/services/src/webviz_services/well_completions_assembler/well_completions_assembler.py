@@ -1,8 +1,10 @@
 import datetime
+from typing import Sequence
+
 import pyarrow as pa
 import pyarrow.compute as pc
 import polars as pl
-
+from webviz_core_utils.lru_cache import LruCache
 
 from webviz_services.service_exceptions import InvalidDataError, InvalidParameterError, Service
 from webviz_services.sumo_access.well_completions_access import WellCompletionsAccess
@@ -17,13 +19,44 @@ from webviz_services.sumo_access.well_completions_types import (
     WellCompletionsUnits,
 )
 
+# Key for the in-process cache of assembled well completions data:
+#   (case_uuid, ensemble_name, ensemble_fingerprint, sorted realizations or None)
+# Since the ensemble fingerprint is part of the key, entries will never be stale, we only need to bound the memory usage
+_WellCompletionsDataCacheKey = tuple[str, str, str, tuple[int, ...] | None]
+
+# Approximate size of a value in a Python list, i.e. the list slot and the int or float object
+_LIST_VALUE_NBYTES = 32
+
+
+def _estimate_well_completions_data_nbytes(data: WellCompletionsData) -> int:
+    """Approximate memory usage of assembled data, which is dominated by the per date value lists of the completions"""
+    num_values = 0
+    for well in data.wells:
+        for completions in well.completions.values():
+            # Date indices, open, shut, kh mean, kh min and kh max have one value per date
+            num_values += 6 * len(completions.sorted_completion_date_indices)
+
+    return num_values * _LIST_VALUE_NBYTES
+
+
+_WELL_COMPLETIONS_DATA_CACHE: LruCache[_WellCompletionsDataCacheKey, WellCompletionsData] = LruCache(
+    name="well_completions_data",
+    max_entries=64,
+    max_total_size=128 * 1024 * 1024,
+    size_func=_estimate_well_completions_data_nbytes,
+)
+
 
+# pylint: disable-next=too-many-instance-attributes
 class WellCompletionsAssembler:
     """
     Class for assembling WellCompletionData for front-end consumption.
 
     Accessor retrieves well completions data from Sumo as table data. This assembler class handles
     the table and assembles well completion data, providing a data structure for API to consume.
+
+    If an ensemble fingerprint is specified, the assembled data is cached in-process per realization set, and
+    subsequent requests against the same ensemble content will skip both fetching and assembly.
     """
 
     _well_completions_df: pl.DataFrame | None
@@ -33,9 +66,14 @@ class WellCompletionsAssembler:
     _well_attributes: dict[str, dict[str, WellCompletionsAttributeType]] | None
     _kh_unit: str
     _kh_decimal_places: int
+    _cache_key: _WellCompletionsDataCacheKey | None
+    _cached_data: WellCompletionsData | None
 
-    def __init__(self, well_completions_access: WellCompletionsAccess) -> None:
+    def __init__(self, well_completions_access: WellCompletionsAccess, ensemble_fingerprint: str | None = None) -> None:
         self._well_completions_access = well_completions_access
+        self._ensemble_fingerprint = ensemble_fingerprint
+        self._cache_key = None
+        self._cached_data = None
 
         self._well_completions_df = None
         self._sorted_unique_dates = None
@@ -55,9 +93,12 @@ class WellCompletionsAssembler:
         self._well_attributes: dict[str, dict[str, WellCompletionsAttributeType]] = {}
 
     async def fetch_and_initialize_well_completions_single_realization_table_data_async(self, realization: int) -> None:
-        if self._well_completions_df is not None:
+        if self._well_completions_df is not None or self._cached_data is not None:
             raise InvalidDataError("Well completions data already fetched and initialized!", Service.GENERAL)
 
+        if self._lookup_cached_data([realization]):
+            return
+
         well_completions_table = (
             await self._well_completions_access.get_well_completions_single_realization_table_async(
                 realization=realization
@@ -68,12 +109,15 @@ class WellCompletionsAssembler:
         self._initialize_well_completions_data_from_df()
 
     async def fetch_and_initialize_well_completions_table_data_async(self, realizations: list[int] | None) -> None:
-        if self._well_completions_df is not None:
+        if self._well_completions_df is not None or self._cached_data is not None:
             raise InvalidDataError("Well completions data already fetched and initialized!", Service.GENERAL)
 
         if realizations is not None and len(realizations) == 0:
             raise InvalidParameterError("Realizations must be non-empty list or None", Service.GENERAL)
 
+        if self._lookup_cached_data(realizations):
+            return
+
         well_completions_table = await self._well_completions_access.get_well_completions_table_async()
 
         # Filter rows based on the "REAL" column
@@ -88,6 +132,21 @@ class WellCompletionsAssembler:
 
         self._initialize_well_completions_data_from_df()
 
+    def _lookup_cached_data(self, realizations: Sequence[int] | None) -> bool:
+        """Set up the cache key for the realizations, returns True if assembled data was found in the cache"""
+        if self._ensemble_fingerprint is None:
+            return False
+
+        realizations_key = tuple(sorted(set(realizations))) if realizations is not None else None
+        self._cache_key = (
+            self._well_completions_access.case_uuid,
+            self._well_completions_access.ensemble_name,
+            self._ensemble_fingerprint,
+            realizations_key,
+        )
+        self._cached_data = _WELL_COMPLETIONS_DATA_CACHE.get(self._cache_key)
+        return self._cached_data is not None
+
     def _initialize_well_completions_data_from_df(self) -> None:
         if self._well_completions_df is None:
             raise InvalidDataError("Well completions data is not loaded", Service.GENERAL)
@@ -105,26 +164,22 @@ class WellCompletionsAssembler:
         #   in equinor/fmu-dataio to be resolved, providing order/priority of zones/stratigraphy
         self._zone_name_list = list(self._well_completions_df["ZONE"].unique(maintain_order=True))
 
-        # Create list of unique dates and date index column
-        self._sorted_unique_dates: list[datetime.datetime] = sorted(self._well_completions_df["DATE"].unique())
-        date_to_index_map: dict[datetime.datetime, int] = {
-            date: idx for idx, date in enumerate(self._sorted_unique_dates)
-        }
-
-        # Create date index column, for faster access to date index
-        date_index_column_expression = (
-            pl.col("DATE").map_elements(date_to_index_map.get, return_dtype=pl.Int64).alias("DATE_INDEX")
-        )
+        # Create list of unique dates and date index column, for faster access to date index
+        self._sorted_unique_dates = sorted(self._well_completions_df["DATE"].unique())
+        date_index_column_expression = (pl.col("DATE").rank(method="dense").cast(pl.Int64) - 1).alias("DATE_INDEX")
         self._well_completions_df = self._well_completions_df.with_columns(date_index_column_expression)
 
     def create_well_completions_data(self) -> WellCompletionsData:
         """Creates well completions dataset for front-end"""
+        if self._cached_data is not None:
+            return self._cached_data
+
         if self._well_completions_df is None:
             raise InvalidDataError("Well completions data is not initialized", Service.GENERAL)
         if self._zone_name_list is None:
             raise InvalidDataError("Zone name list is not initialized", Service.GENERAL)
 
-        return WellCompletionsData(
+        well_completions_data = WellCompletionsData(
             version="1.1.0",
             units=WellCompletionsUnits(
                 kh=WellCompletionsUnitInfo(unit=self._kh_unit, decimalPlaces=self._kh_decimal_places)
@@ -134,6 +189,11 @@ class WellCompletionsAssembler:
             wells=self._extract_wells(),
         )
 
+        if self._cache_key is not None:
+            _WELL_COMPLETIONS_DATA_CACHE.set(self._cache_key, well_completions_data)
+
+        return well_completions_data
+
     def _create_sorted_unique_dates_string_list(self) -> list[str]:
         """Returns a list of sorted completion dates as string"""
         if self._sorted_unique_dates is None:
@@ -143,7 +203,12 @@ class WellCompletionsAssembler:
         return sorted_unique_date_strings
 
     def _extract_wells(self) -> list[WellCompletionsWell]:
-        """Generates the wells part of the dataset to front-end"""
+        """
+        Generates the wells part of the dataset to front-end
+
+        The open/shut fractions of realizations and the kh statistics are computed for all (well, zone, date)
+        combinations in one group by, and then collected into per (well, zone) arrays sorted on date index.
+        """
         if self._well_completions_df is None:
             raise InvalidDataError("Well completions data is not initialized", Service.GENERAL)
         if self._well_attributes is None:
@@ -154,67 +219,47 @@ class WellCompletionsAssembler:
         if "REAL" in self._well_completions_df.columns:
             num_reals = self._well_completions_df["REAL"].n_unique()
 
-        well_list = []
-        for group_by_keys, well_group in self._well_completions_df.group_by("WELL"):
-            if len(group_by_keys) != 1:
-                raise InvalidDataError(
-                    f"Expect only one group key when grouping by well: {group_by_keys}", Service.GENERAL
-                )
-            well_name: str = str(group_by_keys[0])
-
-            well_data = self._extract_well(well_group, well_name, num_reals)
-            well_data.attributes = self._well_attributes[well_name] if well_name in self._well_attributes else {}
-            well_list.append(well_data)
-        return well_list
-
-    def _extract_well(
-        self, single_well_completion_df: pl.DataFrame, well_name: str, num_reals: int
-    ) -> WellCompletionsWell:
-        """
-        Extract completions events and kh values for a single well
+        # Without any realizations there is nothing to aggregate, and the open/shut fractions would divide by zero
+        if num_reals == 0 or self._well_completions_df.height == 0:
+            return []
 
-        The well group df is well completions data for a single well, i.e. original df grouped by "WELL".
-        """
-        well: WellCompletionsWell = WellCompletionsWell(name=well_name, attributes={}, completions={})
-
-        completions: dict[str, Completions] = {}
-        for (zone_key, date_index_key), group_df in single_well_completion_df.group_by(["ZONE", "DATE_INDEX"]):
-            zone = str(zone_key)
-
-            date_index = None
-            if isinstance(date_index_key, int):
-                date_index = date_index_key
-            if date_index is None:
-                raise InvalidDataError(
-                    f"Expected date index to be of type int, got: {type(date_index_key)}", Service.GENERAL
-                )
+        # Statistics are calculated as float64, and missing kh values give 0.0
+        kh_expression = pl.col("KH").cast(pl.Float64)
+        kh_decimals = self._kh_decimal_places
+        completions_df = (
+            self._well_completions_df.group_by(["WELL", "ZONE", "DATE_INDEX"])
+            .agg(
+                ((pl.col("OP/SH") == "OPEN").sum() / num_reals).alias("OPEN"),
+                ((pl.col("OP/SH") == "SHUT").sum() / num_reals).alias("SHUT"),
+                kh_expression.mean().fill_null(0.0).round(kh_decimals).alias("KH_MEAN"),
+                kh_expression.min().fill_null(0.0).round(kh_decimals).alias("KH_MIN"),
+                kh_expression.max().fill_null(0.0).round(kh_decimals).alias("KH_MAX"),
+            )
+            .sort(["WELL", "ZONE", "DATE_INDEX"])
+            .group_by(["WELL", "ZONE"], maintain_order=True)
+            .agg(pl.col("DATE_INDEX"), pl.col("OPEN"), pl.col("SHUT"), pl.col("KH_MEAN", "KH_MIN", "KH_MAX"))
+        )
 
-            if zone not in completions:
-                completions[zone] = Completions(
-                    sorted_completion_date_indices=[], open=[], shut=[], kh_mean=[], kh_min=[], kh_max=[]
+        wells_dict: dict[str, WellCompletionsWell] = {}
+        for row in completions_df.iter_rows(named=True):
+            well_name = str(row["WELL"])
+            well = wells_dict.get(well_name)
+            if well is None:
+                well = WellCompletionsWell(
+                    name=well_name, attributes=self._well_attributes.get(well_name, {}), completions={}
                 )
+                wells_dict[well_name] = well
+
+            well.completions[str(row["ZONE"])] = Completions(
+                sorted_completion_date_indices=row["DATE_INDEX"],
+                open=row["OPEN"],
+                shut=row["SHUT"],
+                kh_mean=row["KH_MEAN"],
+                kh_min=row["KH_MIN"],
+                kh_max=row["KH_MAX"],
+            )
 
-            # Get number of occurrences of "OPEN" and "SHUT" in "OP/SH" column
-            num_open = group_df.filter(pl.col("OP/SH") == "OPEN").height
-            num_shut = group_df.filter(pl.col("OP/SH") == "SHUT").height
-
-            kh_series: pl.Series = group_df.get_column("KH")
-
-            def _safe_float(value: float | None) -> float:
-                return float(value) if value is not None else 0.0
-
-            zone_completions = completions[zone]
-            zone_completions.sorted_completion_date_indices.append(date_index)
-            zone_completions.open.append(float(num_open / num_reals if num_reals > 0 else 0))
-            zone_completions.shut.append(float(num_shut / num_reals if num_reals > 0 else 0))
-
-            # Disable mypy check for mean, min, max - as linting is not correct
-            zone_completions.kh_mean.append(round(_safe_float(kh_series.mean()), 2))  # type: ignore
-            zone_completions.kh_min.append(round(_safe_float(kh_series.min()), 2))  # type: ignore
-            zone_completions.kh_max.append(round(_safe_float(kh_series.max()), 2))  # type: ignore
-
-        well.completions = completions
-        return well
+        return list(wells_dict.values())
 
     def _extract_well_completions_zones(
         self, zones: list[WellCompletionsZone] | None, zone_name_list: list[str]
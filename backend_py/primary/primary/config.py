@@ -32,3 +32,10 @@ if _is_on_radix_platform:
     COSMOS_DB_URL = os.getenv("WEBVIZ_COSMOS_DB_URL", "https://webviz-db.documents.azure.com:443/")
 else:
     COSMOS_DB_URL = os.getenv("WEBVIZ_COSMOS_DB_URL", "https://webviz-dev-db.documents.azure.com:443/")
+
+# Users allowed to profile requests using the X-Webviz-Profile header, as a comma separated list of user ids.
+# When running locally all users are allowed to profile requests.
+PROFILING_ALLOWED_USER_IDS = [
+    user_id.strip() for user_id in os.getenv("WEBVIZ_PROFILING_ALLOWED_USER_IDS", "").split(",") if user_id.strip()
+]
+PROFILING_ALLOW_ALL_USERS = not _is_on_radix_platform
@@ -11,6 +11,7 @@ from starsessions import SessionMiddleware
 from starsessions.stores.redis import RedisStore
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY
 from webviz_services.services_config import ServicesConfig, init_services_config
 from webviz_services.sumo_access.sumo_fingerprinter import SumoFingerprinterFactory
 from webviz_services.utils.httpx_async_client_wrapper import HTTPX_ASYNC_CLIENT_WRAPPER
@@ -20,6 +21,9 @@ from primary.auth.auth_helper import AuthHelper
 from primary.auth.enforce_logged_in_middleware import EnforceLoggedInMiddleware
 from primary.middleware.add_process_time_to_server_timing_middleware import AddProcessTimeToServerTimingMiddleware
 from primary.middleware.cache_control_middleware import CacheControlMiddleware
+from primary.middleware.compression_middleware import CompressionMiddleware
+from primary.middleware.metrics_middleware import MetricsMiddleware
+from primary.middleware.profiling_middleware import ProfilingMiddleware
 from primary.middleware.otel_span_enrichment_middleware import OtelSpanClientAddressEnrichmentMiddleware
 from primary.middleware.otel_span_enrichment_middleware import OtelSpanEndUserEnrichmentMiddleware
 from primary.persistence.persistence_stores import PersistenceStoresSingleton
@@ -45,9 +49,12 @@ from primary.routers.well_completions.router import router as well_completions_r
 from primary.routers.persistence.router import router as persistence_router
 from primary.utils.azure_monitor_setup import setup_azure_monitor_telemetry_for_primary
 from primary.utils.azure_service_credentials import ClientSecretVars, create_credential_for_azure_services
+from primary.utils.event_loop_monitor import EVENT_LOOP_MONITOR
 from primary.utils.exception_handlers import configure_service_level_exception_handlers
 from primary.utils.exception_handlers import override_default_fastapi_exception_handlers
 from primary.utils.logging_setup import ensure_console_log_handler_is_configured, setup_normal_log_levels
+from primary.utils.memory_monitor import MEMORY_MONITOR, collect_memory_metrics
+from primary.utils.service_metrics_collectors import collect_cache_metrics, collect_single_flight_metrics
 
 from . import config
 
@@ -91,6 +98,8 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
     # The first part of this function, before the yield, will be executed before the FastPI application starts.
     HTTPX_ASYNC_CLIENT_WRAPPER.start()
+    EVENT_LOOP_MONITOR.start()
+    MEMORY_MONITOR.start()
 
     client_secret_vars_for_dev = ClientSecretVars(
         tenant_id=config.TENANT_ID,
@@ -114,6 +123,8 @@ async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
     yield
 
     await PersistenceStoresSingleton.shutdown_async()
+    await EVENT_LOOP_MONITOR.stop_async()
+    await MEMORY_MONITOR.stop_async()
     await azure_services_credential.close()
     await HTTPX_ASYNC_CLIENT_WRAPPER.stop_async()
 
@@ -178,6 +189,15 @@ if config.PSEUDONYM_HMAC_KEY is not None:
     LOGGER.info("Adding OtelSpanEndUserEnrichmentMiddleware to enrich telemetry spans with end user information")
     app.add_middleware(OtelSpanEndUserEnrichmentMiddleware, hmac_secret_key=config.PSEUDONYM_HMAC_KEY)
 
+# Profile requests that ask for it using the X-Webviz-Profile header, for allowed users only.
+# Must run after the EnforceLoggedInMiddleware to have access to the user info.
+if config.PROFILING_ALLOW_ALL_USERS or config.PROFILING_ALLOWED_USER_IDS:
+    app.add_middleware(
+        ProfilingMiddleware,
+        allowed_user_ids=config.PROFILING_ALLOWED_USER_IDS,
+        allow_all_users=config.PROFILING_ALLOW_ALL_USERS,
+    )
+
 # Add our custom middleware to enforce that user is logged in
 # Also redirects to /login endpoint for some select paths
 unprotected_paths = ["/logout", "/logged_in_user", "/alive", "/openapi.json"]
@@ -199,6 +219,15 @@ app.add_middleware(ProxyHeadersMiddleware, trusted_hosts="*")  # type: ignore[ar
 
 app.add_middleware(CacheControlMiddleware)
 
+# Compress responses, after the cache headers are set so that a compressed response's ETag can be weakened
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+# Record request metrics, exposed together with the cache and single flight stats on /dev/metrics
+app.add_middleware(MetricsMiddleware)
+METRICS_REGISTRY.register_collector(collect_cache_metrics)
+METRICS_REGISTRY.register_collector(collect_single_flight_metrics)
+METRICS_REGISTRY.register_collector(collect_memory_metrics)
+
 # This middleware instance measures execution time of the endpoints, including the cost of other middleware
 app.add_middleware(AddProcessTimeToServerTimingMiddleware, metric_name="total")
 
@@ -4,7 +4,7 @@ from functools import wraps
 from contextvars import ContextVar
 from typing import Any, Callable
 
-from starlette.datastructures import MutableHeaders
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import ASGIApp, Scope, Receive, Send, Message
 
 
@@ -43,6 +43,15 @@ class CacheSettings:
 # None means no cache override set (middleware will use no-store by default)
 _cache_context: ContextVar[CacheSettings | None] = ContextVar("_cache_context", default=None)
 
+# ETag to add to a successful response, set by the endpoint. None means no ETag.
+_etag_context: ContextVar[str | None] = ContextVar("_etag_context", default=None)
+
+# The If-None-Match header of the current request, None if not present
+_if_none_match_context: ContextVar[str | None] = ContextVar("_if_none_match_context", default=None)
+
+# The path and query string of the current request, identifying the resource in the browser cache
+_request_target_context: ContextVar[str | None] = ContextVar("_request_target_context", default=None)
+
 
 def custom_cache_time(max_age_s: int, stale_while_revalidate_s: int | None) -> Callable:
     """
@@ -119,6 +128,24 @@ def set_cache_time(duration: CacheTime, stale_while_revalidate: StaleTime | None
     _cache_context.set(CacheSettings(max_age_s=duration.value, stale_while_revalidate_s=stale_while_revalidate_s))
 
 
+def set_response_etag(etag: str) -> None:
+    """
+    Set the ETag header of the endpoint response, added by the middleware to successful responses only.
+    The value must be a complete ETag, e.g. as made by make_strong_etag().
+    """
+    _etag_context.set(etag)
+
+
+def get_request_if_none_match() -> str | None:
+    """Get the If-None-Match header of the request currently being handled"""
+    return _if_none_match_context.get()
+
+
+def get_request_target() -> str | None:
+    """Get the path and query string of the request currently being handled"""
+    return _request_target_context.get()
+
+
 class CacheControlMiddleware:
     """
     Adds Cache-Control header to HTTP responses.
@@ -137,6 +164,8 @@ class CacheControlMiddleware:
     - `stale-while-revalidate`: when response is stale (after max-age expires), browser can still
                                 use cached response while it revalidates with server in background,
                                 for up to stale-while-revalidate seconds.
+
+    Also adds the ETag set by the endpoint through set_response_etag() to successful and 304 responses.
     """
 
     def __init__(self, app: ASGIApp) -> None:
@@ -148,6 +177,9 @@ class CacheControlMiddleware:
 
         # Reset context for each request
         _cache_context.set(None)
+        _etag_context.set(None)
+        _if_none_match_context.set(Headers(scope=scope).get("if-none-match"))
+        _request_target_context.set(f"{scope['path']}?{scope['query_string'].decode('latin-1')}")
 
         async def send_with_cache_header_async(message: Message) -> None:
             if message["type"] == "http.response.start":
@@ -158,6 +190,10 @@ class CacheControlMiddleware:
                     cache_control_str = self._build_cache_control_header()
                     headers.append("cache-control", cache_control_str)
 
+                etag = _etag_context.get()
+                if etag is not None and headers.get("etag") is None and message["status"] in (200, 304):
+                    headers.append("etag", etag)
+
             await send(message)
 
         await self.app(scope, receive, send_with_cache_header_async)
@@ -0,0 +1,305 @@
+import asyncio
+import gzip
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Protocol, Sequence
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from primary.utils.optional_import import import_optional_module
+
+# Brotli and zstd are only offered if the respective packages are installed, gzip is always available
+_BROTLI_MODULE = import_optional_module("brotli")
+_ZSTANDARD_MODULE = import_optional_module("zstandard")
+
+# Only these content types are compressed, everything else (e.g. PNG images and binary array payloads)
+# is considered to be already compressed or not worth the CPU time.
+_COMPRESSIBLE_CONTENT_TYPE_PREFIXES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+# Payloads above the size thresholds are compressed with progressively lower levels, so that the CPU time
+# spent on very large payloads stays bounded
+_MEDIUM_PAYLOAD_SIZE_BYTES = 64 * 1024
+_LARGE_PAYLOAD_SIZE_BYTES = 1024 * 1024
+
+# Payloads above this size are compressed in a worker thread to avoid blocking the event loop.
+# All the supported compressors release the GIL while compressing.
+_THREADED_COMPRESSION_SIZE_BYTES = 256 * 1024
+
+
+class _StreamCompressor(Protocol):
+    def compress_chunk(self, data: bytes) -> bytes:
+        """Compress a chunk and flush, so that the client can decode all data received so far"""
+
+    def finish(self) -> bytes: ...
+
+
+@dataclass(frozen=True, kw_only=True)
+class _Codec:
+    encoding: str
+    compress: Callable[[bytes, int], bytes]
+    make_stream_compressor: Callable[[int], _StreamCompressor]
+
+    # Compression levels for small, medium and large payloads
+    levels: tuple[int, int, int]
+
+    def get_level_for_size(self, size_bytes: int) -> int:
+        if size_bytes >= _LARGE_PAYLOAD_SIZE_BYTES:
+            return self.levels[2]
+        if size_bytes >= _MEDIUM_PAYLOAD_SIZE_BYTES:
+            return self.levels[1]
+        return self.levels[0]
+
+
+class _GzipStreamCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zlib.compressobj(level, wbits=31)
+
+    def compress_chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliStreamCompressor:
+    def __init__(self, level: int) -> None:
+        assert _BROTLI_MODULE is not None
+        self._compressor = _BROTLI_MODULE.Compressor(quality=level)
+
+    def compress_chunk(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdStreamCompressor:
+    def __init__(self, level: int) -> None:
+        assert _ZSTANDARD_MODULE is not None
+        self._compressor = _ZSTANDARD_MODULE.ZstdCompressor(level=level).compressobj()
+        self._flush_block_mode = _ZSTANDARD_MODULE.COMPRESSOBJ_FLUSH_BLOCK
+
+    def compress_chunk(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(self._flush_block_mode)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _make_available_codecs() -> list[_Codec]:
+    """Make the available codecs in order of preference"""
+    codecs: list[_Codec] = []
+
+    if _ZSTANDARD_MODULE is not None:
+        zstandard = _ZSTANDARD_MODULE
+        codecs.append(
+            _Codec(
+                encoding="zstd",
+                compress=lambda data, level: zstandard.ZstdCompressor(level=level).compress(data),
+                make_stream_compressor=_ZstdStreamCompressor,
+                levels=(6, 3, 1),
+            )
+        )
+
+    if _BROTLI_MODULE is not None:
+        brotli = _BROTLI_MODULE
+        codecs.append(
+            _Codec(
+                encoding="br",
+                compress=lambda data, level: brotli.compress(data, quality=level),
+                make_stream_compressor=_BrotliStreamCompressor,
+                levels=(5, 4, 2),
+            )
+        )
+
+    codecs.append(
+        _Codec(
+            encoding="gzip",
+            compress=lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+            make_stream_compressor=_GzipStreamCompressor,
+            levels=(6, 4, 1),
+        )
+    )
+
+    return codecs
+
+
+_AVAILABLE_CODECS = _make_available_codecs()
+
+
+def _parse_accepted_encodings(accept_encoding: str) -> set[str]:
+    """Get the encodings accepted by the client according to the Accept-Encoding header, ignoring q=0 entries"""
+    accepted: set[str] = set()
+    for entry in accept_encoding.split(","):
+        encoding, *params = [part.strip() for part in entry.split(";")]
+        if not encoding:
+            continue
+
+        q_value = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    q_value = float(param[2:])
+                except ValueError:
+                    q_value = 0.0
+
+        if q_value > 0:
+            accepted.add(encoding.lower())
+
+    return accepted
+
+
+def _negotiate_codec(accept_encoding: str | None) -> _Codec | None:
+    if not accept_encoding:
+        return None
+
+    accepted = _parse_accepted_encodings(accept_encoding)
+    for codec in _AVAILABLE_CODECS:
+        if codec.encoding in accepted or "*" in accepted:
+            return codec
+
+    return None
+
+
+class CompressionMiddleware:
+    """
+    Compresses HTTP responses using zstd, brotli or gzip, negotiated through the Accept-Encoding request header.
+
+    Only responses with a compressible content type are compressed, and complete responses only if they are at
+    least minimum_size bytes. The compression level is lowered for larger payloads. Streamed responses are
+    compressed chunk by chunk, flushing after each chunk so that the client can process the data as it arrives.
+
+    For complete responses, the compression time and ratio are added to the Server-Timing header.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, excluded_path_prefixes: Sequence[str] = ()) -> None:
+        self._app = app
+        self._minimum_size = minimum_size
+        self._excluded_path_prefixes = tuple(excluded_path_prefixes)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self._excluded_path_prefixes):
+            return await self._app(scope, receive, send)
+
+        codec = _negotiate_codec(Headers(scope=scope).get("accept-encoding"))
+        if codec is None:
+            return await self._app(scope, receive, send)
+
+        responder = _CompressionResponder(codec, self._minimum_size, send)
+        await self._app(scope, receive, responder.send_async)
+
+
+class _CompressionResponder:
+    def __init__(self, codec: _Codec, minimum_size: int, send: Send) -> None:
+        self._codec = codec
+        self._minimum_size = minimum_size
+        self._send = send
+
+        self._start_message: Message | None = None
+        self._is_passthrough = False
+        self._stream_compressor: _StreamCompressor | None = None
+
+    async def send_async(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold back the start message until the first body message tells whether the response is streamed
+            self._start_message = message
+            self._is_passthrough = not self._should_compress(message)
+            return
+
+        if message_type != "http.response.body" or self._is_passthrough:
+            await self._send_start_message_if_pending_async()
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._stream_compressor is not None:
+            compressed = self._stream_compressor.compress_chunk(body) if more_body else self._finish_stream(body)
+            await self._send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+            return
+
+        if not more_body:
+            await self._send_complete_body_async(body)
+            return
+
+        # First chunk of a streamed response
+        self._stream_compressor = self._codec.make_stream_compressor(self._codec.levels[1])
+        headers = self._get_start_message_headers()
+        headers["Content-Encoding"] = self._codec.encoding
+        headers.add_vary_header("Accept-Encoding")
+        del headers["Content-Length"]
+        _weaken_etag(headers)
+
+        await self._send_start_message_if_pending_async()
+        await self._send(
+            {"type": "http.response.body", "body": self._stream_compressor.compress_chunk(body), "more_body": True}
+        )
+
+    async def _send_complete_body_async(self, body: bytes) -> None:
+        if len(body) < self._minimum_size:
+            await self._send_start_message_if_pending_async()
+            await self._send({"type": "http.response.body", "body": body, "more_body": False})
+            return
+
+        level = self._codec.get_level_for_size(len(body))
+        start_time_s = time.perf_counter()
+        if len(body) >= _THREADED_COMPRESSION_SIZE_BYTES:
+            compressed = await asyncio.to_thread(self._codec.compress, body, level)
+        else:
+            compressed = self._codec.compress(body, level)
+        elapsed_time_ms = int(1000 * (time.perf_counter() - start_time_s))
+
+        headers = self._get_start_message_headers()
+        headers["Content-Encoding"] = self._codec.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        _weaken_etag(headers)
+
+        ratio = len(body) / max(len(compressed), 1)
+        headers.append("Server-Timing", f'compress; dur={elapsed_time_ms}; desc="{self._codec.encoding} {ratio:.1f}x"')
+
+        await self._send_start_message_if_pending_async()
+        await self._send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+    def _finish_stream(self, body: bytes) -> bytes:
+        assert self._stream_compressor is not None
+        return self._stream_compressor.compress_chunk(body) + self._stream_compressor.finish()
+
+    def _should_compress(self, start_message: Message) -> bool:
+        if start_message["status"] < 200 or start_message["status"] in (204, 304):
+            return False
+
+        headers = Headers(raw=start_message["headers"])
+        if "content-encoding" in headers:
+            return False
+
+        return headers.get("content-type", "").startswith(_COMPRESSIBLE_CONTENT_TYPE_PREFIXES)
+
+    def _get_start_message_headers(self) -> MutableHeaders:
+        assert self._start_message is not None
+        return MutableHeaders(scope=self._start_message)
+
+    async def _send_start_message_if_pending_async(self) -> None:
+        if self._start_message is not None:
+            start_message = self._start_message
+            self._start_message = None
+            await self._send(start_message)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    # The compressed representation is not byte-identical to the original, so a strong ETag must be weakened.
+    # Weak comparison is used for If-None-Match, so conditional requests still work.
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
@@ -0,0 +1,97 @@
+import asyncio
+import hashlib
+from functools import wraps
+from typing import Any, Callable
+
+from starlette import status
+from starlette.responses import Response
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+from primary.middleware.cache_control_middleware import get_request_if_none_match, get_request_target
+from primary.middleware.cache_control_middleware import set_response_etag
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
+from primary.utils.http_etag import is_etag_matched_by_if_none_match, make_strong_etag
+
+# Names of the endpoint parameters holding the case uuid and ensemble name of an ensemble the response depends on
+EnsembleParamNames = tuple[str, str]
+
+DEFAULT_ENSEMBLE_PARAM_NAMES: EnsembleParamNames = ("case_uuid", "ensemble_name")
+
+# Bump to invalidate all previously issued ETags, e.g. when the content of responses changes without the
+# underlying ensemble data changing
+_ETAG_FORMAT_VERSION = "1"
+
+
+def ensemble_etag(*ensemble_param_names: EnsembleParamNames) -> Callable:
+    """
+    Decorator that makes a GET endpoint respond with an ETag derived from the request path and query string
+    together with the fingerprints of the ensembles the response depends on.
+
+    If the request's If-None-Match header matches, an empty 304 response is returned without calling the endpoint,
+    so no ensemble data is loaded. If the fingerprint of any of the ensembles is unavailable, the endpoint is called
+    as usual without an ETag.
+
+    The response must only depend on the query parameters and the ensemble data. The endpoint must have an
+    `authenticated_user` parameter, and by default `case_uuid` and `ensemble_name` parameters.
+
+    Args:
+        ensemble_param_names: For each ensemble, the names of its case uuid and ensemble name parameters
+
+    Examples:
+        @ensemble_etag()
+        async def my_ensemble_endpoint(authenticated_user, case_uuid, ensemble_name):
+            ...
+
+        @ensemble_etag(("comparison_case_uuid", "comparison_ensemble_name"), ("reference_case_uuid", "reference_ensemble_name"))
+        async def my_delta_ensemble_endpoint(...):
+            ...
+    """
+    if not ensemble_param_names:
+        ensemble_param_names = (DEFAULT_ENSEMBLE_PARAM_NAMES,)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper_async(*args: Any, **kwargs: Any) -> Any:
+            authenticated_user: AuthenticatedUser = kwargs["authenticated_user"]
+            ensembles = [
+                (kwargs[case_param], kwargs[ensemble_param]) for case_param, ensemble_param in ensemble_param_names
+            ]
+
+            etag = await _make_ensemble_etag_or_none_async(authenticated_user, ensembles)
+            if etag is None:
+                return await func(*args, **kwargs)
+
+            set_response_etag(etag)
+            if is_etag_matched_by_if_none_match(get_request_if_none_match(), etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+            return await func(*args, **kwargs)
+
+        return wrapper_async
+
+    return decorator
+
+
+async def _make_ensemble_etag_or_none_async(
+    authenticated_user: AuthenticatedUser, ensembles: list[tuple[str, str]]
+) -> str | None:
+    request_target = get_request_target()
+    if request_target is None:
+        return None
+
+    fingerprints = await asyncio.gather(
+        *(
+            get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+            for case_uuid, ensemble_name in ensembles
+        )
+    )
+    if any(fp is None for fp in fingerprints):
+        return None
+
+    hasher = hashlib.sha256()
+    for part in [_ETAG_FORMAT_VERSION, request_target, *fingerprints]:
+        hasher.update(str(part).encode())
+        hasher.update(b"\0")
+
+    return make_strong_etag(hasher.hexdigest()[:32])
@@ -0,0 +1,61 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY, collect_request_laps, observe_request_laps
+
+from primary.utils.event_loop_monitor import attribute_event_loop_time_to_request
+from primary.utils.memory_monitor import MEMORY_MONITOR
+from primary.utils.route_label import get_route_label
+
+
+class MetricsMiddleware:
+    """
+    Records request metrics in the process wide metrics registry.
+
+    Tracks the number of in-flight requests and the request duration per route, and labels all laps recorded
+    through PerfMetrics/ResponsePerfMetrics while handling the request with the request's route. The route
+    is the path template of the matched endpoint, e.g. /surface/realization_surface_data/, not the actual path.
+
+    Also attributes time the request blocks the event loop and the memory growth during the request to the
+    request's route, see EventLoopMonitor and MemoryMonitor.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return await self._app(scope, receive, send)
+
+        start_time_s = time.perf_counter()
+        status_code = 500
+        attribute_event_loop_time_to_request(scope)
+
+        async def send_with_status_capture_async(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        METRICS_REGISTRY.add_to_gauge("webviz_http_requests_in_flight", 1)
+        with collect_request_laps() as request_laps, MEMORY_MONITOR.track_request(scope):
+            try:
+                await self._app(scope, receive, send_with_status_capture_async)
+            finally:
+                METRICS_REGISTRY.add_to_gauge("webviz_http_requests_in_flight", -1)
+                self._observe_request(scope, status_code, time.perf_counter() - start_time_s, request_laps)
+
+    def _observe_request(
+        self, scope: Scope, status_code: int, elapsed_time_s: float, request_laps: list[tuple[str, float]]
+    ) -> None:
+        route_path = get_route_label(scope)
+
+        METRICS_REGISTRY.observe_histogram(
+            "webviz_http_request_duration_ms",
+            1000 * elapsed_time_s,
+            route=route_path,
+            method=scope["method"],
+            status=f"{status_code // 100}xx",
+        )
+        observe_request_laps(route_path, request_laps)
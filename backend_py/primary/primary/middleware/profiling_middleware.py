@@ -0,0 +1,189 @@
+import asyncio
+import cProfile
+import logging
+import marshal
+import time
+from datetime import datetime, timezone
+from typing import Protocol, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+from primary.utils.optional_import import import_optional_module
+from primary.utils.request_profile_store import REQUEST_PROFILE_STORE, RequestProfileStore
+from primary.utils.request_profile_store import StoredRequestProfile, StoredRequestProfileInfo, make_profile_id
+
+LOGGER = logging.getLogger(__name__)
+
+# The sampling profiler is used if installed, otherwise we fall back to cProfile
+_PYINSTRUMENT_MODULE = import_optional_module("pyinstrument")
+
+PROFILE_REQUEST_HEADER_NAME = "X-Webviz-Profile"
+_PROFILE_REQUEST_HEADER_KEY = PROFILE_REQUEST_HEADER_NAME.lower().encode("latin-1")
+
+
+class _RequestProfiler(Protocol):
+    name: str
+
+    def start(self) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def render(self) -> tuple[bytes, str, str]:
+        """Render the profile, returns the content together with its media type and file extension"""
+
+
+class _PyinstrumentProfiler:
+    name = "pyinstrument"
+
+    def __init__(self) -> None:
+        assert _PYINSTRUMENT_MODULE is not None
+        # In async mode only the time spent in the request's task is profiled, and time spent awaiting is
+        # attributed to the awaiting code
+        self._profiler = _PYINSTRUMENT_MODULE.Profiler(interval=0.001, async_mode="enabled")
+
+    def start(self) -> None:
+        self._profiler.start()
+
+    def stop(self) -> None:
+        self._profiler.stop()
+
+    def render(self) -> tuple[bytes, str, str]:
+        return self._profiler.output_html().encode("utf-8"), "text/html", "html"
+
+
+class _CProfileProfiler:
+    name = "cprofile"
+
+    def __init__(self) -> None:
+        self._profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profiler.enable()
+
+    def stop(self) -> None:
+        self._profiler.disable()
+
+    def render(self) -> tuple[bytes, str, str]:
+        # Same format as written by cProfile's dump_stats(), can be loaded with pstats or e.g. snakeviz
+        self._profiler.create_stats()
+        return marshal.dumps(self._profiler.stats), "application/octet-stream", "prof"  # type: ignore[attr-defined]
+
+
+def _make_profiler() -> _RequestProfiler:
+    if _PYINSTRUMENT_MODULE is not None:
+        return _PyinstrumentProfiler()
+    return _CProfileProfiler()
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that have the X-Webviz-Profile: 1 header, for users that are allowed to profile.
+
+    The profile is stored in an in-memory ring buffer, and its download path is returned in the Server-Timing
+    header of the response, e.g. `profile; desc="/api/dev/profiles/<id>"`. Stored profiles can be listed and
+    downloaded through the dev router.
+
+    Profiling is done with pyinstrument if installed, otherwise with cProfile. Note that cProfile profiles all
+    code running on the event loop, so the profile includes any other requests being handled concurrently.
+    Only one request is profiled at a time, concurrent requests asking to be profiled are handled as usual.
+
+    Must be placed after EnforceLoggedInMiddleware, which provides the authenticated user. Requests without the
+    header only pay for a scan of the request headers.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allowed_user_ids: Sequence[str] = (),
+        allow_all_users: bool = False,
+        profile_store: RequestProfileStore = REQUEST_PROFILE_STORE,
+    ) -> None:
+        self._app = app
+        self._allowed_user_ids = frozenset(allowed_user_ids)
+        self._allow_all_users = allow_all_users
+        self._profile_store = profile_store
+        self._is_profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _has_profile_request_header(scope):
+            return await self._app(scope, receive, send)
+
+        user_id = self._get_allowed_user_id_or_none(scope)
+        if user_id is None:
+            LOGGER.debug("ProfilingMiddleware - user is not allowed to profile requests")
+            return await self._app(scope, receive, send)
+
+        if self._is_profiling:
+            LOGGER.info("ProfilingMiddleware - another request is already being profiled, skipping profiling")
+            return await self._app(scope, receive, send)
+
+        self._is_profiling = True
+        try:
+            await self._profile_request_async(scope, receive, send, user_id)
+        finally:
+            self._is_profiling = False
+
+    async def _profile_request_async(self, scope: Scope, receive: Receive, send: Send, user_id: str) -> None:
+        profile_id = make_profile_id()
+        profile_path = f"{scope.get('root_path', '')}/dev/profiles/{profile_id}"
+
+        async def send_with_profile_path_async(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f'profile; desc="{profile_path}"')
+            await send(message)
+
+        profiler = _make_profiler()
+        start_time_s = time.perf_counter()
+        try:
+            profiler.start()
+        except ValueError as e:
+            # Raised by cProfile if another profiler, e.g. a debugger, is already active
+            LOGGER.warning(f"ProfilingMiddleware - could not start profiler: {e}")
+            return await self._app(scope, receive, send)
+
+        try:
+            await self._app(scope, receive, send_with_profile_path_async)
+        finally:
+            profiler.stop()
+
+        duration_ms = int(1000 * (time.perf_counter() - start_time_s))
+
+        # Rendering the profile may be slow, do it without blocking the event loop
+        content, media_type, file_ext = await asyncio.to_thread(profiler.render)
+
+        info = StoredRequestProfileInfo(
+            profile_id=profile_id,
+            user_id=user_id,
+            created_at=datetime.now(timezone.utc),
+            method=scope["method"],
+            path=scope["path"],
+            duration_ms=duration_ms,
+            profiler=profiler.name,
+            media_type=media_type,
+            file_name=f"profile-{profile_id}.{file_ext}",
+            size_bytes=len(content),
+        )
+        self._profile_store.add(StoredRequestProfile(info=info, content=content))
+        LOGGER.info(f"Stored {profiler.name} profile of {info.method} {info.path} ({duration_ms}ms): {profile_path}")
+
+    def _get_allowed_user_id_or_none(self, scope: Scope) -> str | None:
+        maybe_authenticated_user_obj = getattr(Request(scope).state, "authenticated_user_obj", None)
+        if not isinstance(maybe_authenticated_user_obj, AuthenticatedUser):
+            return None
+
+        user_id = maybe_authenticated_user_obj.get_user_id()
+        if self._allow_all_users or user_id in self._allowed_user_ids:
+            return user_id
+
+        return None
+
+
+def _has_profile_request_header(scope: Scope) -> bool:
+    for header_key, header_value in scope["headers"]:
+        if header_key == _PROFILE_REQUEST_HEADER_KEY:
+            return header_value.strip() == b"1"
+    return False
@@ -1,8 +1,11 @@
 import hashlib
+from collections.abc import Hashable
 from typing import Any, TypeVar, cast
 
 from azure.core.async_paging import AsyncPageIterator, AsyncItemPaged
 
+from primary.persistence.cosmosdb.query_collation_options import Filter
+
 T = TypeVar("T")
 
 
@@ -35,3 +38,20 @@ def query_by_page(query_iterable: AsyncItemPaged[T], page_token: str | None) ->
         raise TypeError("Expected AsyncPageIterator from query_items_by_page_token_async")
 
     return cast(AsyncPageIterator[T], pager)
+
+
+def make_list_query_cache_key(
+    user_id: str,
+    page_token: str | None,
+    page_size: int,
+    sort_by: str | None,
+    sort_direction: str | None,
+    sort_lowercase: bool,
+    filters: list[Filter] | None,
+) -> tuple[Hashable, ...]:
+    """
+    Make a key for caching the result of a paged list query. The user id is always the first element,
+    so that all cached pages for a user can be invalidated with a key predicate.
+    """
+    filters_key = tuple((f.field, f.value, f.operator, f.prefix) for f in filters) if filters else None
+    return (user_id, page_token, page_size, sort_by, sort_direction, sort_lowercase, filters_key)
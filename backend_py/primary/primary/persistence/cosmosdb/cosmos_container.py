@@ -20,6 +20,7 @@ from .exceptions import (
 LOGGER = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+P = TypeVar("P", bound=BaseModel)
 
 
 class CosmosContainer(Generic[T]):
@@ -115,6 +116,37 @@ class CosmosContainer(Generic[T]):
 
         return (items, token)
 
+    async def query_projection_by_page_token_async(
+        self,
+        query: str,
+        page_token: str | None,
+        projection_model: Type[P],
+        parameters: Optional[List[Dict[str, object]]] = None,
+        page_size: Optional[int] = None,
+    ) -> tuple[list[P], str | None]:
+        """
+        Paged variant of query_projection_async(), where the projected items are validated against
+        the given projection model instead of the container's document model.
+        """
+        query_iterable = self._container.query_items(query=query, parameters=parameters, max_item_count=page_size)
+
+        pager = query_by_page(query_iterable, page_token)
+
+        try:
+            page = await anext(pager)
+            token = pager.continuation_token
+            items = [projection_model.model_validate(item) async for item in page]
+        except StopAsyncIteration:
+            # No items found - return empty list and no continuation token
+            return ([], None)
+        except ValidationError as validation_error:
+            LOGGER.error("[CosmosContainer] Validation error in '%s': %s", self._container_name, validation_error)
+            raise
+        except exceptions.CosmosHttpResponseError as error:
+            raise self._make_exception("query_projection_by_page_token_async", error) from error
+
+        return (items, token)
+
     async def get_item_async(self, item_id: str, partition_key: str) -> T:
         try:
             item = await self._container.read_item(item=item_id, partition_key=partition_key)
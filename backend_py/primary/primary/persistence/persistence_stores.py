@@ -15,6 +15,7 @@ from primary.persistence.snapshot_store import (
     SnapshotDocument,
     SnapshotAccessLogStore,
     SnapshotAccessLogDocument,
+    SnapshotVisitAggregator,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -38,8 +39,11 @@ class PersistenceStores:
         self._db_proxies: Dict[str, DatabaseProxy] = {}
         self._container_proxies: Dict[Tuple[str, str], ContainerProxy] = {}
         self._containers: Dict[Tuple[str, str, Type[BaseModel]], CosmosContainer] = {}
+        self._snapshot_visit_aggregator = SnapshotVisitAggregator(self.get_snapshot_access_log_store_for_user)
 
     async def _close_async(self) -> None:
+        # Buffered snapshot visits must be written before the client is closed
+        await self._snapshot_visit_aggregator.stop_async()
         await self._client.close()
 
     def _get_database_proxy(self, database_name: str) -> DatabaseProxy:
@@ -73,6 +77,9 @@ class PersistenceStores:
         container = self.get_container("persistence", "snapshot_access_logs", SnapshotAccessLogDocument)
         return SnapshotAccessLogStore(user_id, container, snapshot_store_factory=self.get_snapshot_store_for_user)
 
+    def get_snapshot_visit_aggregator(self) -> SnapshotVisitAggregator:
+        return self._snapshot_visit_aggregator
+
 
 class PersistenceStoresSingleton:
     _instance: PersistenceStores | None = None
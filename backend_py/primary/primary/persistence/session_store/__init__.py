@@ -1,2 +1,2 @@
 from .session_store import SessionStore
-from .documents import SessionDocument
+from .documents import SessionDocument, SessionMetadataProjection
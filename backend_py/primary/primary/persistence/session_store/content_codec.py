@@ -0,0 +1,39 @@
+import base64
+import zlib
+
+from .types import SessionContentEncoding
+
+# Content smaller than this is stored as plain text, the compression gain does not make up for the base64 overhead
+_MIN_COMPRESS_SIZE_BYTES = 1024
+
+# Session content is JSON, which compresses well already at moderate levels. Kept low to stay cheap on autosave.
+_COMPRESSION_LEVEL = 6
+
+
+def encode_session_content(content: str) -> tuple[str, SessionContentEncoding | None]:
+    """
+    Encode session content for storage in the session document.
+
+    Returns the stored content string together with its encoding marker, where None means plain text.
+    Content is only stored compressed when that actually makes it smaller.
+    """
+    content_bytes = content.encode("utf-8")
+    if len(content_bytes) < _MIN_COMPRESS_SIZE_BYTES:
+        return content, None
+
+    encoded = base64.b64encode(zlib.compress(content_bytes, _COMPRESSION_LEVEL)).decode("ascii")
+    if len(encoded) >= len(content_bytes):
+        return content, None
+
+    return encoded, SessionContentEncoding.ZLIB_BASE64_V1
+
+
+def decode_session_content(stored_content: str, encoding: SessionContentEncoding | None) -> str:
+    """Decode session content as stored in the session document back to the original string"""
+    if encoding is None:
+        return stored_content
+
+    if encoding == SessionContentEncoding.ZLIB_BASE64_V1:
+        return zlib.decompress(base64.b64decode(stored_content)).decode("utf-8")
+
+    raise ValueError(f"Unsupported session content encoding: {encoding}")
@@ -1,6 +1,8 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, computed_field
 
+from .types import SessionContentEncoding
+
 # CRITICAL: DATABASE SCHEMA - These models define the structure of session documents in Cosmos DB.
 # Changes break existing data: renaming/removing fields breaks queries, changing types causes validation errors,
 # making optional fields required breaks reads. Plan data migration first. Partition keys CANNOT be changed.
@@ -43,3 +45,16 @@ class SessionDocument(BaseModel):
     owner_id: str
     metadata: SessionMetadata
     content: str
+
+    # Encoding of the stored content, None for plain text content as in documents written before compression
+    content_encoding: SessionContentEncoding | None = None
+
+
+class SessionMetadataProjection(BaseModel):
+    """Projection of a session document without the content, as returned by metadata list queries"""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    owner_id: str
+    metadata: SessionMetadata
@@ -1,25 +1,67 @@
 from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from nanoid import generate
+from pydantic import TypeAdapter
+from webviz_core_utils.lru_cache import LruCache
 from webviz_services.service_exceptions import Service, ServiceRequestError
 
-from primary.persistence._utils import hash_session_content_string
+from primary.persistence._utils import hash_session_content_string, make_list_query_cache_key
 from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
 from primary.persistence.cosmosdb.query_collation_options import Filter, QueryCollationOptions, SortDirection
-from primary.persistence.session_store.types import SessionSortBy
+from primary.persistence.session_store.types import SessionContentEncoding, SessionSortBy
 from primary.persistence.cosmosdb.exceptions import DatabaseAccessError
 from primary.persistence.cosmosdb.error_converter import raise_service_error_from_database_access
 
-from .documents import SessionDocument, SessionMetadata
+from .content_codec import decode_session_content, encode_session_content
+from .documents import SessionDocument, SessionMetadata, SessionMetadataProjection
 
 # CosmosDB has a 2MB document size limit
-# We use 1.5MB to leave room for metadata and safety margin
+# We use 1.5MB to leave room for metadata and safety margin. The limit applies to the stored, possibly compressed, content
 _MAX_CONTENT_SIZE_BYTES = 1.5 * 1024 * 1024  # 1.5MB
 
 # Pagination limits
 _MAX_PAGE_SIZE = 100
 _DEFAULT_PAGE_SIZE = 20
 
+# Metadata list queries only select these fields, leaving out the potentially large content
+_METADATA_PROJECTION_QUERY = "SELECT c.id, c.owner_id, c.metadata FROM c"
+
+# Serializes patched timestamps the same way as model_dump(mode="json") does for inserted documents
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Short lived per-user cache of metadata list pages, keyed on the user id and the query arguments.
+# Entries for a user are invalidated by create, update and delete through this process, while the short TTL bounds
+# how long changes made through other processes can go unnoticed.
+_SESSION_METADATA_LIST_CACHE: LruCache[tuple, tuple[list[SessionMetadataProjection], str | None]] = LruCache(
+    name="session_metadata_list", max_entries=512, ttl_s=15
+)
+
+
+def _invalidate_metadata_list_cache_for_user(user_id: str) -> None:
+    _SESSION_METADATA_LIST_CACHE.pop_matching(lambda key: key[0] == user_id)
+
+
+def _encode_and_validate_content(content: str) -> tuple[str, SessionContentEncoding | None]:
+    """Encode content for storage, raising if the stored content would exceed the maximum allowed size"""
+    stored_content, content_encoding = encode_session_content(content)
+
+    stored_size = len(stored_content.encode("utf-8"))
+    if stored_size > _MAX_CONTENT_SIZE_BYTES:
+        raise ServiceRequestError(
+            f"Stored session content size ({stored_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
+            Service.DATABASE,
+        )
+
+    return stored_content, content_encoding
+
+
+def _with_decoded_content(document: SessionDocument) -> SessionDocument:
+    if document.content_encoding is None:
+        return document
+
+    decoded_content = decode_session_content(document.content, document.content_encoding)
+    return document.model_copy(update={"content": decoded_content, "content_encoding": None})
+
 
 class SessionStore:
     """
@@ -44,16 +86,10 @@ class SessionStore:
             The ID of the created session
 
         Raises:
-            ServiceRequestError: If content size exceeds maximum allowed size
+            ServiceRequestError: If stored content size exceeds maximum allowed size
             DatabaseAccessError: If the database operation fails
         """
-        # Validate content size
-        content_size = len(content.encode("utf-8"))
-        if content_size > _MAX_CONTENT_SIZE_BYTES:
-            raise ServiceRequestError(
-                f"Session content size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
-                Service.DATABASE,
-            )
+        stored_content, content_encoding = _encode_and_validate_content(content)
 
         try:
             now = datetime.now(timezone.utc)
@@ -72,10 +108,13 @@ class SessionStore:
                     content_hash=hash_session_content_string(content),
                     version=1,
                 ),
-                content=content,
+                content=stored_content,
+                content_encoding=content_encoding,
             )
 
-            return await self._session_container.insert_item_async(session)
+            new_session_id = await self._session_container.insert_item_async(session)
+            _invalidate_metadata_list_cache_for_user(self._user_id)
+            return new_session_id
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
 
@@ -87,7 +126,7 @@ class SessionStore:
             session_id: The ID of the session to retrieve
 
         Returns:
-            The session document
+            The session document, with the content decoded
 
         Raises:
             ServiceRequestError: If the user doesn't own the session
@@ -103,11 +142,11 @@ class SessionStore:
                     Service.DATABASE,
                 )
 
-            return document
+            return _with_decoded_content(document)
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
 
-    async def get_many_async(
+    async def get_many_metadata_async(
         self,
         page_token: Optional[str] = None,
         page_size: Optional[int] = None,
@@ -115,7 +154,7 @@ class SessionStore:
         sort_direction: Optional[SortDirection] = None,
         sort_lowercase: bool = False,
         filters: Optional[List[Filter]] = None,
-    ) -> Tuple[List[SessionDocument], Optional[str]]:
+    ) -> Tuple[List[SessionMetadataProjection], Optional[str]]:
         """
         Read multiple sessions with support for pagination, sorting, filtering, and limits.
 
@@ -128,7 +167,7 @@ class SessionStore:
             filters: List of filters to apply
 
         Returns:
-            Tuple of (list of session documents, continuation token for next page)
+            Tuple of (list of session metadata projections, continuation token for next page)
 
         Raises:
             DatabaseAccessError: If the database operation fails
@@ -141,6 +180,19 @@ class SessionStore:
         elif page_size < 1:
             page_size = 1
 
+        cache_key = make_list_query_cache_key(
+            self._user_id,
+            page_token,
+            page_size,
+            sort_by.value if sort_by else None,
+            sort_direction.value if sort_direction else None,
+            sort_lowercase,
+            filters,
+        )
+        cached_page = _SESSION_METADATA_LIST_CACHE.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
         try:
             # Always filter by owner_id
             filter_list = filters or []
@@ -155,19 +207,22 @@ class SessionStore:
                 document_model=SessionDocument,
             )
 
-            query = "SELECT * FROM c"
+            query = _METADATA_PROJECTION_QUERY
             params = collation_options.make_query_params()
             search_options = collation_options.to_sql_query_string()
 
             if search_options:
                 query = f"{query} {search_options}"
 
-            return await self._session_container.query_items_by_page_token_async(
+            page = await self._session_container.query_projection_by_page_token_async(
                 query=query,
+                page_token=page_token,
+                projection_model=SessionMetadataProjection,
                 parameters=params,
                 page_size=page_size,
-                page_token=page_token,
             )
+            _SESSION_METADATA_LIST_CACHE.set(cache_key, page)
+            return page
 
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
@@ -188,50 +243,68 @@ class SessionStore:
             description: The new description for the session
             content: The new content for the session
 
+        Only changed fields are written. If nothing changed, e.g. an autosave of unchanged content,
+        no write is done and the version is not incremented.
+
         Returns:
-            The updated session document
+            The updated session document, with the content decoded
 
         Raises:
-            ServiceRequestError: If the user doesn't own the session or content size exceeds limit
+            ServiceRequestError: If the user doesn't own the session or stored content size exceeds limit
             DatabaseAccessError: If the database operation fails
             ValidationError: If updates contain invalid field names or values
         """
-        # Validate content size if content is being updated
-        if content is not None:
-            content_size = len(content.encode("utf-8"))
-            if content_size > _MAX_CONTENT_SIZE_BYTES:
-                raise ServiceRequestError(
-                    f"Session content size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size of {_MAX_CONTENT_SIZE_BYTES / (1024*1024):.1f}MB",
-                    Service.DATABASE,
-                )
-
         try:
             # Verify ownership and get existing document
             existing = await self.get_async(session_id)
 
-            # Apply partial updates
-            updated_session = existing.model_copy()
+            updated_session = existing.model_copy(deep=True)
+            patch_operations: list[dict] = []
 
-            if title is not None:
+            if title is not None and title != existing.metadata.title:
                 updated_session.metadata.title = title
+                patch_operations.append({"op": "set", "path": "/metadata/title", "value": title})
+                patch_operations.append({"op": "set", "path": "/metadata/title__lower", "value": title.lower()})
 
-            if description is not None:
+            if description is not None and description != existing.metadata.description:
                 updated_session.metadata.description = description
+                patch_operations.append({"op": "set", "path": "/metadata/description", "value": description})
+                patch_operations.append(
+                    {"op": "set", "path": "/metadata/description__lower", "value": description.lower()}
+                )
 
-            # Ensure critical fields are preserved
-            updated_session.id = session_id
-            updated_session.owner_id = self._user_id
+            if content is not None:
+                content_hash = hash_session_content_string(content)
+                if content_hash != existing.metadata.content_hash:
+                    stored_content, content_encoding = _encode_and_validate_content(content)
+                    updated_session.content = content
+                    updated_session.metadata.content_hash = content_hash
+                    patch_operations.append({"op": "set", "path": "/content", "value": stored_content})
+                    patch_operations.append(
+                        {
+                            "op": "set",
+                            "path": "/content_encoding",
+                            "value": content_encoding.value if content_encoding else None,
+                        }
+                    )
+                    patch_operations.append({"op": "set", "path": "/metadata/content_hash", "value": content_hash})
+
+            # Autosave frequently sends unchanged sessions, these should not cost a write or bump the version
+            if not patch_operations:
+                return existing
 
             # Update managed metadata fields
             updated_session.metadata.updated_at = datetime.now(timezone.utc)
             updated_session.metadata.version = existing.metadata.version + 1
+            updated_at_json = _DATETIME_ADAPTER.dump_python(updated_session.metadata.updated_at, mode="json")
+            patch_operations.append({"op": "set", "path": "/metadata/updated_at", "value": updated_at_json})
+            patch_operations.append({"op": "incr", "path": "/metadata/version", "value": 1})
 
-            # Recompute hash if content changed
-            if content is not None:
-                updated_session.content = content
-                updated_session.metadata.content_hash = hash_session_content_string(content)
-
-            await self._session_container.update_item_async(session_id, updated_session)
+            # Patching only sends the changed fields, so metadata-only updates do not rewrite the content
+            await self._session_container.patch_item_async(
+                item_id=session_id, partition_key=self._user_id, patch_operations=patch_operations
+            )
+            _invalidate_metadata_list_cache_for_user(self._user_id)
 
             return updated_session
         except DatabaseAccessError as err:
@@ -253,5 +326,6 @@ class SessionStore:
             await self.get_async(session_id)
 
             await self._session_container.delete_item_async(session_id, partition_key=self._user_id)
+            _invalidate_metadata_list_cache_for_user(self._user_id)
         except DatabaseAccessError as err:
             raise_service_error_from_database_access(err)
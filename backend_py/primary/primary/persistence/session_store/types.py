@@ -5,3 +5,9 @@ class SessionSortBy(str, Enum):
     CREATED_AT = "metadata.created_at"
     UPDATED_AT = "metadata.updated_at"
     TITLE = "metadata.title"
+
+
+class SessionContentEncoding(str, Enum):
+    """Encoding of the stored session content, versioned so the storage format can evolve without migrating data"""
+
+    ZLIB_BASE64_V1 = "zlib_base64_v1"
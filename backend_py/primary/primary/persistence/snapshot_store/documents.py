@@ -37,6 +37,16 @@ class SnapshotDocument(BaseModel):
     content: str
 
 
+class SnapshotMetadataProjection(BaseModel):
+    """Projection of a snapshot document without the content, as returned by metadata list queries"""
+
+    model_config = ConfigDict(extra="ignore")
+
+    id: str
+    owner_id: str
+    metadata: SnapshotMetadata
+
+
 class SnapshotAccessLogDocument(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
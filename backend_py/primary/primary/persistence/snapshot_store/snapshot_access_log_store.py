@@ -167,28 +167,57 @@ class SnapshotAccessLogStore:
         - Sets the first visited timestamp if this is the first visit
         - Persists the changes to the database
 
+        Visits in the request path of snapshot reads should rather be recorded through the
+        SnapshotVisitAggregator, which batches them in the background.
+
         Args:
             snapshot_id: The ID of the snapshot being visited
             snapshot_owner_id: The owner ID of the snapshot
 
-        Returns:
-            The updated access log document
-
         Raises:
             ServiceRequestError: If the database operation fails
         """
         timestamp = datetime.now(timezone.utc)
+        await self.log_snapshot_visits_async(
+            snapshot_id,
+            snapshot_owner_id,
+            visit_count=1,
+            first_visited_at=timestamp,
+            last_visited_at=timestamp,
+        )
+
+    async def log_snapshot_visits_async(
+        self,
+        snapshot_id: str,
+        snapshot_owner_id: str,
+        visit_count: int,
+        first_visited_at: datetime,
+        last_visited_at: datetime,
+    ) -> None:
+        """
+        Log a number of coalesced visits to a snapshot, creating or updating the access log.
+
+        Args:
+            snapshot_id: The ID of the snapshot being visited
+            snapshot_owner_id: The owner ID of the snapshot
+            visit_count: Number of visits to add to the visit count
+            first_visited_at: Time of the earliest visit, only used if the log has no first visit yet
+            last_visited_at: Time of the latest visit
+
+        Raises:
+            ServiceRequestError: If the database operation fails
+        """
         item_id = _make_access_log_item_id(snapshot_id, self._user_id)
 
         # Patch ops that are ALWAYS safe to apply (atomic counter + last visited)
         base_ops: list[dict] = [
-            {"op": "incr", "path": "/visits", "value": 1},
-            {"op": "set", "path": "/last_visited_at", "value": timestamp.isoformat()},
+            {"op": "incr", "path": "/visits", "value": visit_count},
+            {"op": "set", "path": "/last_visited_at", "value": last_visited_at.isoformat()},
         ]
 
         # Patch ops only for the very first visit
         first_visit_ops: list[dict] = base_ops + [
-            {"op": "set", "path": "/first_visited_at", "value": timestamp.isoformat()},
+            {"op": "set", "path": "/first_visited_at", "value": first_visited_at.isoformat()},
         ]
 
         # Cosmos filter predicate syntax: depends on SDK version; commonly:
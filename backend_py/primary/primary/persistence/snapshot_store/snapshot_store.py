@@ -1,15 +1,16 @@
 from typing import List, Optional, Tuple
 from datetime import datetime, timezone
 from nanoid import generate
+from webviz_core_utils.lru_cache import LruCache
 from webviz_services.service_exceptions import Service, ServiceRequestError
 
-from primary.persistence._utils import hash_session_content_string
+from primary.persistence._utils import hash_session_content_string, make_list_query_cache_key
 from primary.persistence.cosmosdb.query_collation_options import Filter, QueryCollationOptions, SortDirection
 from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
 from primary.persistence.cosmosdb.exceptions import DatabaseAccessError, DatabaseAccessNotFoundError
 from primary.persistence.cosmosdb.error_converter import raise_service_error_from_database_access
 
-from .documents import SnapshotDocument, SnapshotMetadata
+from .documents import SnapshotDocument, SnapshotMetadata, SnapshotMetadataProjection
 from .types import SnapshotSortBy
 
 # CosmosDB has a 2MB document size limit
@@ -20,6 +21,32 @@ _MAX_CONTENT_SIZE_BYTES = 1.5 * 1024 * 1024  # 1.5MB
 _MAX_PAGE_SIZE = 100
 _DEFAULT_PAGE_SIZE = 20
 
+# Metadata list queries only select these fields, leaving out the potentially large content
+_METADATA_PROJECTION_QUERY = "SELECT c.id, c.owner_id, c.metadata FROM c"
+
+# Short lived per-user cache of metadata list pages, keyed on the user id and the query arguments.
+# Entries for a user are invalidated by create, update and delete through this process, while the short TTL bounds
+# how long changes made through other processes can go unnoticed.
+_SNAPSHOT_METADATA_LIST_CACHE: LruCache[tuple, tuple[list[SnapshotMetadataProjection], str | None]] = LruCache(
+    name="snapshot_metadata_list", max_entries=512, ttl_s=15
+)
+
+# In-process read-through cache of snapshot documents, keyed on snapshot id.
+# Snapshots are immutable once created, so the only way an entry can go stale is through deletion. Deletions are
+# evicted by delete_async(), while the TTL bounds how long a snapshot deleted through another process can be served.
+# The cached documents are shared between requests and must not be modified.
+_SNAPSHOT_DOCUMENT_CACHE: LruCache[str, SnapshotDocument] = LruCache(
+    name="snapshot_document",
+    max_entries=512,
+    ttl_s=10 * 60,
+    max_total_size=256 * 1024 * 1024,
+    size_func=lambda doc: len(doc.content),
+)
+
+
+def _invalidate_metadata_list_cache_for_user(user_id: str) -> None:
+    _SNAPSHOT_METADATA_LIST_CACHE.pop_matching(lambda key: key[0] == user_id)
+
 
 class SnapshotStore:
     """
@@ -78,7 +105,12 @@ class SnapshotStore:
                 content=content,
             )
 
-            return await self._snapshot_container.insert_item_async(snapshot)
+            new_snapshot_id = await self._snapshot_container.insert_item_async(snapshot)
+
+            # A new snapshot is likely to be read shortly after, e.g. when a link to it is shared
+            _SNAPSHOT_DOCUMENT_CACHE.set(new_snapshot_id, snapshot)
+            _invalidate_metadata_list_cache_for_user(self._user_id)
+            return new_snapshot_id
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
 
@@ -86,6 +118,8 @@ class SnapshotStore:
         """
         Get a single snapshot by ID.
 
+        Snapshots are served from an in-process cache when possible, the returned document must not be modified.
+
         Args:
             snapshot_id: The ID of the snapshot to retrieve
 
@@ -96,8 +130,13 @@ class SnapshotStore:
             ServiceRequestError: If the snapshot is not found or user doesn't own it
             DatabaseAccessError: If the database operation fails
         """
+        cached_document = _SNAPSHOT_DOCUMENT_CACHE.get(snapshot_id)
+        if cached_document is not None:
+            return cached_document
+
         try:
             document = await self._snapshot_container.get_item_async(item_id=snapshot_id, partition_key=snapshot_id)
+            _SNAPSHOT_DOCUMENT_CACHE.set(snapshot_id, document)
             return document
         except DatabaseAccessNotFoundError as e:
             raise ServiceRequestError(
@@ -107,7 +146,7 @@ class SnapshotStore:
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
 
-    async def get_many_async(
+    async def get_many_metadata_async(
         self,
         page_token: Optional[str] = None,
         page_size: Optional[int] = None,
@@ -115,7 +154,7 @@ class SnapshotStore:
         sort_direction: Optional[SortDirection] = None,
         sort_lowercase: bool = False,
         filters: Optional[List[Filter]] = None,
-    ) -> Tuple[List[SnapshotDocument], Optional[str]]:
+    ) -> Tuple[List[SnapshotMetadataProjection], Optional[str]]:
         """
         Get multiple snapshots with support for pagination, sorting, filtering, and limits.
 
@@ -128,7 +167,7 @@ class SnapshotStore:
             filters: List of filters to apply
 
         Returns:
-            Tuple of (list of snapshot documents, continuation token for next page)
+            Tuple of (list of snapshot metadata projections, continuation token for next page)
 
         Raises:
             DatabaseAccessError: If the database operation fails
@@ -141,6 +180,19 @@ class SnapshotStore:
         elif page_size < 1:
             page_size = 1
 
+        cache_key = make_list_query_cache_key(
+            self._user_id,
+            page_token,
+            page_size,
+            sort_by.value if sort_by else None,
+            sort_direction.value if sort_direction else None,
+            sort_lowercase,
+            filters,
+        )
+        cached_page = _SNAPSHOT_METADATA_LIST_CACHE.get(cache_key)
+        if cached_page is not None:
+            return cached_page
+
         try:
             # Always filter by owner_id
             filter_list = filters or []
@@ -155,19 +207,22 @@ class SnapshotStore:
                 document_model=SnapshotDocument,
             )
 
-            query = "SELECT * FROM c"
+            query = _METADATA_PROJECTION_QUERY
             params = collation_options.make_query_params()
             search_options = collation_options.to_sql_query_string()
 
             if search_options:
                 query = f"{query} {search_options}"
 
-            return await self._snapshot_container.query_items_by_page_token_async(
+            page = await self._snapshot_container.query_projection_by_page_token_async(
                 query=query,
+                page_token=page_token,
+                projection_model=SnapshotMetadataProjection,
                 parameters=params,
                 page_size=page_size,
-                page_token=page_token,
             )
+            _SNAPSHOT_METADATA_LIST_CACHE.set(cache_key, page)
+            return page
 
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
@@ -192,6 +247,11 @@ class SnapshotStore:
                     Service.DATABASE,
                 )
 
-            await self._snapshot_container.delete_item_async(snapshot_id, partition_key=snapshot_id)
+            try:
+                await self._snapshot_container.delete_item_async(snapshot_id, partition_key=snapshot_id)
+            finally:
+                # Also evict if the deletion failed, e.g. because the snapshot was already deleted by another process
+                _SNAPSHOT_DOCUMENT_CACHE.pop(snapshot_id)
+                _invalidate_metadata_list_cache_for_user(self._user_id)
         except DatabaseAccessError as e:
             raise_service_error_from_database_access(e)
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+from webviz_services.service_exceptions import ServiceLayerException
+
+from .snapshot_access_log_store import SnapshotAccessLogStore
+
+LOGGER = logging.getLogger(__name__)
+
+# How often buffered visits are written to the database
+_FLUSH_INTERVAL_S = 10
+
+# Upper bound on the number of distinct (visitor, snapshot) pairs buffered between flushes.
+# Visits to new pairs are dropped while the buffer is full, which bounds both memory use and
+# the number of visits lost if the process dies before a flush.
+_MAX_PENDING_ENTRIES = 10_000
+
+# Limit concurrent writes during a flush to avoid RU spikes/throttling
+_MAX_CONCURRENT_FLUSH_OPS = 16
+
+
+@dataclass(kw_only=True)
+class _PendingVisits:
+    snapshot_owner_id: str
+    visit_count: int
+    first_visited_at: datetime
+    last_visited_at: datetime
+
+
+class SnapshotVisitAggregator:
+    """
+    Write-behind buffer for snapshot visit logging.
+
+    Visits are recorded in memory, with repeated visits by the same user to the same snapshot coalesced
+    into one entry, and written to the access log container in batches by a background task.
+    The buffer is flushed periodically and when the aggregator is stopped on shutdown. Visits still
+    buffered if the process terminates abruptly are lost.
+    """
+
+    def __init__(self, access_log_store_factory: Callable[[str], SnapshotAccessLogStore]) -> None:
+        self._access_log_store_factory = access_log_store_factory
+        self._pending: dict[tuple[str, str], _PendingVisits] = {}
+        self._flush_task: asyncio.Task | None = None
+        self._stop_event = asyncio.Event()
+        self._dropped_visit_count = 0
+
+    def record_visit(self, visitor_id: str, snapshot_id: str, snapshot_owner_id: str) -> None:
+        """Record a visit to be written in the next flush. Must be called from within a running event loop."""
+        now = datetime.now(timezone.utc)
+        key = (visitor_id, snapshot_id)
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            pending.visit_count += 1
+            pending.last_visited_at = now
+        elif len(self._pending) >= _MAX_PENDING_ENTRIES:
+            self._dropped_visit_count += 1
+        else:
+            self._pending[key] = _PendingVisits(
+                snapshot_owner_id=snapshot_owner_id, visit_count=1, first_visited_at=now, last_visited_at=now
+            )
+
+        self._ensure_flush_task_started()
+
+    async def flush_async(self) -> None:
+        """Write all buffered visits to the database"""
+        if self._dropped_visit_count > 0:
+            LOGGER.warning("Dropped %d snapshot visits due to full visit buffer", self._dropped_visit_count)
+            self._dropped_visit_count = 0
+
+        if not self._pending:
+            return
+
+        # Swap out the buffer so visits recorded during the flush go into the next batch
+        batch = self._pending
+        self._pending = {}
+
+        sem = asyncio.Semaphore(_MAX_CONCURRENT_FLUSH_OPS)
+
+        async def _write_one_async(visitor_id: str, snapshot_id: str, pending: _PendingVisits) -> bool:
+            async with sem:
+                try:
+                    await self._access_log_store_factory(visitor_id).log_snapshot_visits_async(
+                        snapshot_id,
+                        pending.snapshot_owner_id,
+                        visit_count=pending.visit_count,
+                        first_visited_at=pending.first_visited_at,
+                        last_visited_at=pending.last_visited_at,
+                    )
+                    return True
+                except ServiceLayerException as e:
+                    # Do not re-raise - visit logging is best effort and we want to continue with other items
+                    LOGGER.warning("Failed to log visits to snapshot '%s' for visitor: %s", snapshot_id, e)
+                    return False
+
+        results = await asyncio.gather(
+            *(
+                _write_one_async(visitor_id, snapshot_id, pending)
+                for (visitor_id, snapshot_id), pending in batch.items()
+            )
+        )
+
+        fail = sum(1 for ok in results if not ok)
+        LOGGER.debug("Flushed %d snapshot access logs (failures=%d)", len(batch), fail)
+
+    async def stop_async(self) -> None:
+        """Stop the background flushing and write any remaining buffered visits"""
+        # Let an ongoing flush complete rather than cancelling it, since its batch is already taken out of the buffer
+        self._stop_event.set()
+        if self._flush_task is not None:
+            await self._flush_task
+            self._flush_task = None
+
+        await self.flush_async()
+
+    def _ensure_flush_task_started(self) -> None:
+        if self._stop_event.is_set():
+            return
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._run_periodic_flush_async())
+
+    async def _run_periodic_flush_async(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=_FLUSH_INTERVAL_S)
+            except TimeoutError:
+                pass
+
+            try:
+                await self.flush_async()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Keep the flush loop alive, the failed batch is lost
+                LOGGER.exception("Unexpected error while flushing snapshot visits")
@@ -1,12 +1,15 @@
 import asyncio
 import datetime
+from dataclasses import asdict
 import logging
 from typing import Annotated, Literal
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
+from fastapi.responses import PlainTextResponse
 
 from webviz_core_utils.background_tasks import run_in_background_task
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY
 from webviz_services.user_session_manager.user_session_manager import UserSessionManager
 from webviz_services.user_session_manager.user_session_manager import UserComponent
 from webviz_services.user_session_manager.user_session_manager import _USER_SESSION_DEFS
@@ -18,6 +21,9 @@ from webviz_services.utils.otel_span_tracing import start_otel_span_async
 from webviz_services.utils.task_meta_tracker import get_task_meta_tracker_for_user
 
 from primary.auth.auth_helper import AuthenticatedUser, AuthHelper
+from primary.utils.event_loop_monitor import EVENT_LOOP_MONITOR
+from primary.utils.memory_monitor import MEMORY_MONITOR
+from primary.utils.request_profile_store import REQUEST_PROFILE_STORE
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
 
 LOGGER = logging.getLogger(__name__)
@@ -228,6 +234,56 @@ async def get_usersession_dirdel(
     return "Session info deleted"
 
 
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics() -> PlainTextResponse:
+    """Metrics of this process in the Prometheus text format"""
+    return PlainTextResponse(METRICS_REGISTRY.to_prometheus_text(), media_type="text/plain; version=0.0.4")
+
+
+@router.get("/event_loop")
+async def get_event_loop(
+    limit: Annotated[int, Query(description="Max number of offending routes to return")] = 20,
+) -> dict:
+    """Event loop lag and the routes that have blocked the event loop the most"""
+    return {
+        "lag": asdict(EVENT_LOOP_MONITOR.get_lag_stats()),
+        "worst_offenders": [asdict(offender) for offender in EVENT_LOOP_MONITOR.get_worst_offenders(limit)],
+    }
+
+
+@router.get("/memory")
+async def get_memory(
+    limit: Annotated[int, Query(description="Max number of routes to return")] = 20,
+) -> list[dict]:
+    """The routes with the largest peak memory growth during a request, largest first"""
+    return [asdict(stats) for stats in MEMORY_MONITOR.get_top_routes(limit)]
+
+
+@router.get("/profiles")
+async def get_profiles(
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+) -> list[dict]:
+    """List the stored profiles of the user's requests profiled using the X-Webviz-Profile header, newest first"""
+    return [asdict(info) for info in REQUEST_PROFILE_STORE.get_infos(user_id=authenticated_user.get_user_id())]
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    profile_id: Annotated[str, Path(description="Id of the profile, as returned in the Server-Timing header")],
+) -> Response:
+    """Download a stored profile"""
+    profile = REQUEST_PROFILE_STORE.get(profile_id)
+    if profile is None or profile.info.user_id != authenticated_user.get_user_id():
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    return Response(
+        content=profile.content,
+        media_type=profile.info.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{profile.info.file_name}"'},
+    )
+
+
 @router.get("/bgtask")
 async def get_bgtask() -> str:
     LOGGER.debug(f"bgtask() - start")
@@ -10,6 +10,7 @@ from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 
 from . import schemas
 from . import converters
@@ -46,6 +47,9 @@ async def get_realization_flow_network(
 
     unique_node_types = {converters.from_api_node_type(elm) for elm in node_type_set}
 
+    # The ensemble fingerprint enables reuse of assembled flow networks across requests
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+
     # Create flow network assembler
     network_assembler = FlowNetworkAssembler(
         group_tree_access=group_tree_access,
@@ -54,6 +58,7 @@ async def get_realization_flow_network(
         summary_frequency=summary_frequency,
         selected_node_types=unique_node_types,
         flow_network_mode=NetworkModeOptions.SINGLE_REAL,
+        ensemble_fingerprint=ensemble_fp,
     )
     timer.lap_ms()
 
@@ -1,17 +1,23 @@
 import logging
-from typing import Annotated, List, Optional
+from collections.abc import AsyncIterator
+from typing import Annotated, List, Literal, Optional
 
 import numpy as np
 from fastapi import APIRouter, Depends, Query, Body
+from fastapi.responses import StreamingResponse
 
 from webviz_core_utils.perf_metrics import PerfMetrics
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_decode_int_array
-from webviz_core_utils.b64 import B64FloatArray, B64IntArray
+from webviz_core_utils.b64 import b64_encode_float_array_as_float32, b64_encode_float_array_with_value_encoding
+from webviz_core_utils.b64 import b64_encode_int_array_as_smallest_size
+from webviz_core_utils.b64 import b64_decode_float_array, b64_decode_int_array
+from webviz_core_utils.b64 import B64FloatArray, B64IntArray, B64QuantizedFloatArray, ValueEncoding
+from webviz_core_utils.binary_payload import BinaryPayloadWriter, make_length_prefixed_frame
 from webviz_services.sumo_access.grid3d_access import Grid3dAccess
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.user_grid3d_service.user_grid3d_service import (
     UserGrid3dService,
     IJKIndexFilter,
+    MappedGridPropertiesFrame,
     PolylineIntersection,
 )
 
@@ -68,6 +74,9 @@ async def get_grid_surface(
     j_max: Annotated[int, Query(description="Max j index")] = -1,
     k_min: Annotated[int, Query(description="Min k index")] = 0,
     k_max: Annotated[int, Query(description="Max k index")] = -1,
+    poly_layout: Annotated[
+        Literal["vtk", "quads"], Query(description="Layout of the polys array, see Grid3dGeometry")
+    ] = "vtk",
 ) -> schemas.Grid3dGeometry:
     """Get a grid"""
 
@@ -83,12 +92,14 @@ async def get_grid_surface(
         grid_name=grid_name,
         realization=realization_num,
         ijk_index_filter=ijk_index_filter,
+        poly_layout=poly_layout,
     )
     perf_metrics.record_lap("call-service")
 
     response = schemas.Grid3dGeometry(
         points_b64arr=grid_geometry.vertices_b64arr,
         polys_b64arr=grid_geometry.polys_b64arr,
+        poly_layout=grid_geometry.poly_layout,
         poly_source_cell_indices_b64arr=grid_geometry.poly_source_cell_indices_b64arr,
         origin_utm_x=grid_geometry.origin_utm_x,
         origin_utm_y=grid_geometry.origin_utm_y,
@@ -124,8 +135,17 @@ async def get_grid_parameter(
     j_max: Annotated[int, Query(description="Max j index")] = -1,
     k_min: Annotated[int, Query(description="Min k index")] = 0,
     k_max: Annotated[int, Query(description="Max k index")] = -1,
+    value_encoding: Annotated[
+        ValueEncoding, Query(description="Encoding of the property values")
+    ] = ValueEncoding.FLOAT32,
 ) -> schemas.Grid3dMappedProperty:
-    """Get a grid parameter"""
+    """Get a grid parameter
+
+    By default the property values are returned as float32. With the native_int encoding, discrete (integer) properties
+    are returned as integers of the smallest possible size. The quantized encodings (uint16q, uint8q) apply to
+    continuous properties and reduce the payload size at the cost of a bounded error, given by max_abs_error.
+    In all cases undefined integer values are returned as -1.
+    """
 
     perf_metrics = PerfMetrics()
 
@@ -144,12 +164,13 @@ async def get_grid_parameter(
     )
     perf_metrics.record_lap("call-service")
 
-    # Until the response schema is updated to support int b64 encoded array we force it to float
-    float_poly_props_b64arr = _hack_ensure_b64_property_array_is_float(
-        mapped_grid_properties.poly_props_b64arr, mapped_grid_properties.undefined_int_value
+    poly_props_b64arr = _encode_b64_property_array(
+        mapped_grid_properties.poly_props_b64arr, mapped_grid_properties.undefined_int_value, value_encoding
     )
+    perf_metrics.record_lap("encode")
+
     response = schemas.Grid3dMappedProperty(
-        poly_props_b64arr=float_poly_props_b64arr,
+        poly_props_b64arr=poly_props_b64arr,
         min_grid_prop_value=mapped_grid_properties.min_grid_prop_value,
         max_grid_prop_value=mapped_grid_properties.max_grid_prop_value,
     )
@@ -159,6 +180,65 @@ async def get_grid_parameter(
     return response
 
 
+@router.get("/grid_parameter_time_steps")
+# pylint: disable=too-many-arguments
+async def get_grid_parameter_time_steps(
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    grid_name: Annotated[str, Query(description="Grid name")],
+    parameter_name: Annotated[str, Query(description="Grid parameter")],
+    realization_num: Annotated[int, Query(description="Realization")],
+    parameter_time_or_interval_strs: Annotated[list[str], Query(description="Time points or time interval strings")],
+    i_min: Annotated[int, Query(description="Min i index")] = 0,
+    i_max: Annotated[int, Query(description="Max i index")] = -1,
+    j_min: Annotated[int, Query(description="Min j index")] = 0,
+    j_max: Annotated[int, Query(description="Max j index")] = -1,
+    k_min: Annotated[int, Query(description="Min k index")] = 0,
+    k_max: Annotated[int, Query(description="Max k index")] = -1,
+) -> StreamingResponse:
+    """Get a grid parameter for multiple time steps, e.g. for animation
+
+    The response is a binary stream of frames, one per time step, sent in order of completion rather than in the
+    requested order. Each frame is prefixed by its byte length as a little endian uint32. A frame consists of the
+    byte length of its header as a little endian uint32, a UTF-8 JSON header (Grid3dMappedPropertyFrameHeader)
+    and the raw little endian property values referenced by the header.
+
+    Property values are float32, with undefined integer values given as -1. There is one frame per unique
+    requested time step. Failures before streaming starts give a regular error response, while a time step that
+    fails after that gets a frame with error_message set and no property values.
+
+    The response is not cached by the browser, since failed time steps may succeed on a later request.
+    """
+
+    perf_metrics = PerfMetrics()
+
+    ijk_index_filter = IJKIndexFilter(min_i=i_min, max_i=i_max, min_j=j_min, max_j=j_max, min_k=k_min, max_k=k_max)
+
+    grid_service = await UserGrid3dService.create_async(authenticated_user, case_uuid)
+    perf_metrics.record_lap("create-service")
+
+    frame_iterator = await grid_service.get_mapped_grid_properties_for_time_steps_stream_async(
+        ensemble_name=ensemble_name,
+        grid_name=grid_name,
+        property_name=parameter_name,
+        property_time_or_interval_strs=parameter_time_or_interval_strs,
+        realization=realization_num,
+        ijk_index_filter=ijk_index_filter,
+    )
+    perf_metrics.record_lap("call-service")
+
+    async def _generate_frames_async() -> AsyncIterator[bytes]:
+        async for mapped_frame in frame_iterator:
+            yield make_length_prefixed_frame(_make_grid_parameter_frame_payload(mapped_frame))
+
+    LOGGER.debug(
+        f"------------------ GRID3D - grid_parameter_time_steps ready to stream after: {perf_metrics.to_string_s()}"
+    )
+
+    return StreamingResponse(_generate_frames_async(), media_type="application/octet-stream")
+
+
 @router.post("/get_polyline_intersection")
 async def post_get_polyline_intersection(
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
@@ -193,14 +273,46 @@ async def post_get_polyline_intersection(
     return polyline_intersection
 
 
-def _hack_ensure_b64_property_array_is_float(
-    props_b64arr: B64FloatArray | B64IntArray, undefined_int_value: int | None
-) -> B64FloatArray:
+def _make_grid_parameter_frame_payload(mapped_frame: MappedGridPropertiesFrame) -> bytes:
+    props_arr_np = mapped_frame.poly_props_arr
+    if props_arr_np is None:
+        error_header = schemas.Grid3dMappedPropertyFrameHeader(
+            time_or_interval_str=mapped_frame.property_time_or_interval_str,
+            poly_props=None,
+            min_grid_prop_value=None,
+            max_grid_prop_value=None,
+            error_message=mapped_frame.error_message or "No property values for time step",
+        )
+        return BinaryPayloadWriter().to_bytes(error_header)
+
+    if np.issubdtype(props_arr_np.dtype, np.integer):
+        props_arr_np = np.where(props_arr_np == mapped_frame.undefined_int_value, -1, props_arr_np)
+
+    payload_writer = BinaryPayloadWriter()
+    header = schemas.Grid3dMappedPropertyFrameHeader(
+        time_or_interval_str=mapped_frame.property_time_or_interval_str,
+        poly_props=payload_writer.add_array(np.asarray(props_arr_np, dtype=np.float32)),
+        min_grid_prop_value=mapped_frame.min_grid_prop_value,
+        max_grid_prop_value=mapped_frame.max_grid_prop_value,
+    )
+    return payload_writer.to_bytes(header)
+
+
+def _encode_b64_property_array(
+    props_b64arr: B64FloatArray | B64IntArray, undefined_int_value: int | None, value_encoding: ValueEncoding
+) -> B64FloatArray | B64IntArray | B64QuantizedFloatArray:
     if isinstance(props_b64arr, B64IntArray):
-        LOGGER.debug("Repacking B64 int array to float")
         int_arr_np = b64_decode_int_array(props_b64arr)
         int_arr_np = np.where(int_arr_np == undefined_int_value, -1, int_arr_np)
-        float_arr_np = np.asarray(int_arr_np, dtype=np.float32)
-        return b64_encode_float_array_as_float32(float_arr_np)
+
+        # Integer properties are discrete, so only the lossless encodings apply
+        if value_encoding == ValueEncoding.NATIVE_INT:
+            return b64_encode_int_array_as_smallest_size(int_arr_np)
+
+        LOGGER.debug("Repacking B64 int array to float")
+        return b64_encode_float_array_as_float32(np.asarray(int_arr_np, dtype=np.float32))
+
+    if value_encoding in (ValueEncoding.UINT16Q, ValueEncoding.UINT8Q):
+        return b64_encode_float_array_with_value_encoding(b64_decode_float_array(props_b64arr), value_encoding)
 
     return props_b64arr
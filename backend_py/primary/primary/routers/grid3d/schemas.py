@@ -1,14 +1,22 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel
-from webviz_core_utils.b64 import B64FloatArray, B64UintArray
+from webviz_core_utils.b64 import B64FloatArray, B64IntArray, B64QuantizedFloatArray, B64UintArray
+from webviz_core_utils.binary_payload import BinaryBufferRef
 
 from .._shared.schemas import BoundingBox3d
 
 
 # Rename?
 class Grid3dGeometry(BaseModel):
+    """
+    The layout of polys_b64arr is given by poly_layout:
+    - vtk: the vertex indices of each poly are prefixed by the poly's vertex count
+    - quads: four vertex indices per poly without count prefix
+    """
+
     polys_b64arr: B64UintArray
+    poly_layout: Literal["vtk", "quads"] = "vtk"
     points_b64arr: B64FloatArray
     poly_source_cell_indices_b64arr: B64UintArray
     origin_utm_x: float
@@ -23,11 +31,26 @@ class Grid3dGeometry(BaseModel):
 
 # Rename?
 class Grid3dMappedProperty(BaseModel):
-    poly_props_b64arr: B64FloatArray
+    poly_props_b64arr: B64FloatArray | B64IntArray | B64QuantizedFloatArray
     min_grid_prop_value: float
     max_grid_prop_value: float
 
 
+class Grid3dMappedPropertyFrameHeader(BaseModel):
+    """
+    Header of one frame in the streamed grid parameter time steps response.
+    The property values are given as a reference into the buffer section of the frame's binary payload.
+
+    For a time step that failed, error_message is set and the frame holds no property values.
+    """
+
+    time_or_interval_str: str
+    poly_props: BinaryBufferRef | None
+    min_grid_prop_value: float | None
+    max_grid_prop_value: float | None
+    error_message: str | None = None
+
+
 class Grid3dZone(BaseModel):
     """Named subset of 3D grid layers (Zone)"""
 
@@ -10,6 +10,7 @@ from webviz_services.sumo_access.inplace_volumes_table_access import InplaceVolu
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.middleware.ensemble_etag import ensemble_etag
 from primary.routers.inplace_volumes.converters import (
     convert_schema_to_indices,
     convert_schema_to_indices_with_values,
@@ -36,6 +37,7 @@ router = APIRouter()
 
 @router.get("/inplace_table_definitions/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 async def get_inplace_table_definitions(
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
     case_uuid: Annotated[str, Query(description="Sumo case uuid")],
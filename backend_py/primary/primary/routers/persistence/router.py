@@ -1,7 +1,7 @@
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query, Request, Response, status
 
 from primary.persistence.persistence_stores import PersistenceStoresSingleton
 from primary.persistence.session_store.documents import SessionDocument
@@ -15,6 +15,7 @@ from primary.persistence.snapshot_store.types import (
     SnapshotSortBy,
 )
 from primary.auth.auth_helper import AuthHelper, AuthenticatedUser
+from primary.utils.http_etag import make_strong_etag, is_etag_matched_by_if_none_match
 from .converters import (
     to_api_session_metadata,
     to_api_session,
@@ -65,7 +66,7 @@ async def get_sessions_metadata(
     if filter_updated_to:
         filters.append(filter_factory.create("metadata.updated_at", filter_updated_to, "LESS", "_to"))
 
-    items, token = await session_store.get_many_async(
+    items, token = await session_store.get_many_metadata_async(
         page_token=cursor,
         page_size=page_size,
         sort_by=sort_by,
@@ -169,6 +170,8 @@ async def update_session(
     - Recalculates the content hash if content changed
     - Preserves ownership and creation metadata
 
+    If none of the provided fields differ from the stored session, nothing is written and the version is unchanged.
+
     Returns the complete updated session.
 
     Only the session owner can update their sessions.
@@ -313,7 +316,7 @@ async def get_snapshots_metadata(
     if filter_created_to:
         filters.append(filter_factory.create("metadata.created_at", filter_created_to, "LESS", "_to"))
 
-    items, cont_token = await snapshot_store.get_many_async(
+    items, cont_token = await snapshot_store.get_many_metadata_async(
         page_token=cursor,
         page_size=page_size,
         sort_by=sort_by,
@@ -324,10 +327,13 @@ async def get_snapshots_metadata(
     return schemas.Page(items=[to_api_snapshot_metadata(item) for item in items], pageToken=cont_token)
 
 
-@router.get("/snapshots/{snapshot_id}")
+@router.get("/snapshots/{snapshot_id}", response_model=schemas.Snapshot)
 async def get_snapshot(
-    snapshot_id: str, authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user)
-) -> schemas.Snapshot:
+    request: Request,
+    response: Response,
+    snapshot_id: str,
+    authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
+) -> schemas.Snapshot | Response:
     """
     Retrieve a complete snapshot by its ID.
 
@@ -340,18 +346,34 @@ async def get_snapshot(
     - Updates the "last visited" timestamp
     - Creates an access log entry if this is your first visit
 
-    This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+    This allows you to see your viewing history in `/persistence/snapshot_access_logs`. Visits are written in
+    batches in the background, so they may take a few seconds to show up in the access logs.
 
     Any user with the snapshot ID can access snapshots (they are shareable).
+
+    Since snapshots are immutable, the response carries an ETag derived from the content hash. Clients that send
+    a matching `If-None-Match` header get an empty 304 response, which still counts as a visit.
     """
     persistence_stores = PersistenceStoresSingleton.get_instance()
     snapshot_store = persistence_stores.get_snapshot_store_for_user(authenticated_user.get_user_id())
-    log_store = persistence_stores.get_snapshot_access_log_store_for_user(authenticated_user.get_user_id())
 
     snapshot = await snapshot_store.get_async(snapshot_id)
     # Should we clear the log if a snapshot was not found? This could mean that the snapshot was
     # deleted but deletion of logs has failed
-    await log_store.log_snapshot_visit_async(snapshot_id, snapshot.owner_id)
+    # The visit is written to the access log in the background, keeping it out of the request latency
+    persistence_stores.get_snapshot_visit_aggregator().record_visit(
+        authenticated_user.get_user_id(), snapshot_id, snapshot.owner_id
+    )
+
+    # Let the browser store the snapshot, but always revalidate so that deleted snapshots are detected
+    validation_headers = {
+        "ETag": make_strong_etag(snapshot.metadata.content_hash),
+        "Cache-Control": "no-cache, private",
+    }
+    if is_etag_matched_by_if_none_match(request.headers.get("if-none-match"), validation_headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validation_headers)
+
+    response.headers.update(validation_headers)
     return to_api_snapshot(snapshot)
 
 
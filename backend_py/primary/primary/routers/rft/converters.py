@@ -1,4 +1,4 @@
-from webviz_services.sumo_access.rft_types import RftTableDefinition
+from webviz_services.sumo_access.rft_types import RftRealizationData, RftTableDefinition
 
 from . import schemas
 
@@ -17,3 +17,13 @@ def to_api_table_definition(
             for well_info in table_definition.well_infos
         ],
     )
+
+
+def to_api_realization_data(realization_data: RftRealizationData) -> schemas.RftRealizationData:
+    return schemas.RftRealizationData(
+        well_name=realization_data.well_name,
+        realization=realization_data.realization,
+        timestamp_utc_ms=realization_data.timestamp_utc_ms,
+        depth_arr=realization_data.depth_arr,
+        value_arr=realization_data.value_arr,
+    )
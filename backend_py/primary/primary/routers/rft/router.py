@@ -8,6 +8,7 @@ from webviz_services.utils.authenticated_user import AuthenticatedUser
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 from primary.utils.query_string_utils import decode_uint_list_str
 
 from . import schemas
@@ -53,7 +54,7 @@ async def get_rft_realization_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = RftAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    access = await _create_rft_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
     data = await access.get_rft_well_realization_data_async(
         well_name=well_name,
         response_name=response_name,
@@ -61,16 +62,47 @@ async def get_rft_realization_data(
         realizations=realizations,
     )
 
-    ret_data: list[schemas.RftRealizationData] = []
-    for item in data:
-        ret_data.append(
-            schemas.RftRealizationData(
-                well_name=item.well_name,
-                realization=item.realization,
-                timestamp_utc_ms=item.timestamp_utc_ms,
-                depth_arr=item.depth_arr,
-                value_arr=item.value_arr,
-            )
-        )
-
-    return ret_data
+    return [converters.to_api_realization_data(item) for item in data]
+
+
+@router.get("/rft_realization_data_for_wells")
+@cache_time(CacheTime.LONG)
+async def get_rft_realization_data_for_wells(
+    authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
+    case_uuid: Annotated[str, Query(description="Sumo case uuid")],
+    ensemble_name: Annotated[str, Query(description="Ensemble name")],
+    well_names: Annotated[list[str], Query(description="Well names")],
+    response_name: Annotated[str, Query(description="Response name")],
+    timestamps_utc_ms: Annotated[list[int] | None, Query(description="Timestamps utc ms")] = None,
+    realizations_encoded_as_uint_list_str: Annotated[
+        str | None,
+        Query(
+            description="Optional list of realizations encoded as string to include. If not specified, all realizations will be included."
+        ),
+    ] = None,
+) -> list[schemas.RftRealizationData]:
+    """Get a list of RFT data per realization for multiple wells and a given response, ordered by well."""
+    realizations: list[int] | None = None
+    if realizations_encoded_as_uint_list_str:
+        realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
+
+    access = await _create_rft_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
+    data = await access.get_rft_wells_realization_data_async(
+        well_names=well_names,
+        response_name=response_name,
+        timestamps_utc_ms=timestamps_utc_ms,
+        realizations=realizations,
+    )
+
+    return [converters.to_api_realization_data(item) for item in data]
+
+
+async def _create_rft_access_with_fingerprint_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> RftAccess:
+    # The ensemble fingerprint enables reuse of the indexed RFT data across requests
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+
+    return RftAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
@@ -1,6 +1,6 @@
 import numpy as np
 from numpy.typing import NDArray
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_core_utils.b64 import ValueEncoding, b64_encode_float_array_with_value_encoding
 
 from webviz_services.vds_access.response_types import VdsSliceMetadata
 from webviz_services.sumo_access.seismic_types import SeismicCubeMeta
@@ -40,10 +40,12 @@ def to_api_vds_cube_meta(seismic_meta: SeismicCubeMeta) -> schemas.SeismicCubeMe
 
 
 def to_api_vds_slice_data(
-    flattened_slice_traces_array: NDArray[np.float32], metadata: VdsSliceMetadata
+    flattened_slice_traces_array: NDArray[np.float32],
+    metadata: VdsSliceMetadata,
+    value_encoding: ValueEncoding = ValueEncoding.FLOAT32,
 ) -> schemas.SeismicSliceData:
     return schemas.SeismicSliceData(
-        slice_traces_b64arr=b64_encode_float_array_as_float32(flattened_slice_traces_array),
+        slice_traces_b64arr=b64_encode_float_array_with_value_encoding(flattened_slice_traces_array, value_encoding),
         bbox_utm=metadata.geospatial,
         u_min=metadata.x_axis.min,
         u_max=metadata.x_axis.max,
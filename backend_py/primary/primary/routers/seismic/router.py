@@ -1,16 +1,17 @@
-from typing import List, Optional, Tuple
+import asyncio
+from typing import List, Tuple
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query
 
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_core_utils.b64 import ValueEncoding, b64_encode_float_array_with_value_encoding
 from webviz_services.sumo_access.seismic_access import SeismicAccess, VdsHandle, SeismicRepresentation
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.vds_access.request_types import VdsCoordinates, VdsCoordinateSystem
-from webviz_services.vds_access.response_types import VdsMetadata
 from webviz_services.vds_access.vds_access import VdsAccess
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 
 from . import schemas
 from . import converters
@@ -50,42 +51,39 @@ async def get_seismic_slices(
     inline_number: int = Query(description="Inline number"),
     crossline_number: int = Query(description="Crossline number"),
     depth_slice_number: int = Query(description="Depth slice number"),
+    value_encoding: ValueEncoding = Query(ValueEncoding.FLOAT32, description="Encoding of the slice trace values"),
 ) -> Tuple[schemas.SeismicSliceData, schemas.SeismicSliceData, schemas.SeismicSliceData]:
-    """Get a seismic depth slice from a seismic cube."""
-    seismic_access = SeismicAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
-    )
-
-    vds_handle: Optional[VdsHandle] = None
-    try:
-        vds_handle = await seismic_access.get_vds_handle_async(
-            realization=realization_num,
-            seismic_attribute=seismic_attribute,
-            time_or_interval_str=time_or_interval_str,
-            representation=SeismicRepresentation(representation.value),
-        )
-    except ValueError as err:
-        raise HTTPException(status_code=404, detail=str(err)) from err
-
-    if vds_handle is None:
-        raise HTTPException(status_code=404, detail="Vds handle not found")
+    """Get a seismic depth slice from a seismic cube.
 
-    vds_access = VdsAccess(sas_token=vds_handle.sas_token, vds_url=vds_handle.vds_url)
+    The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+    given by max_abs_error of the returned arrays.
+    """
+    vds_access = await _create_vds_access_async(
+        authenticated_user,
+        case_uuid,
+        ensemble_name,
+        realization_num,
+        seismic_attribute,
+        time_or_interval_str,
+        representation,
+    )
 
-    inline_tuple = await vds_access.get_inline_slice_async(line_no=inline_number)
-    crossline_tuple = await vds_access.get_crossline_slice_async(line_no=crossline_number)
-    depth_slice_tuple = await vds_access.get_depth_slice_async(depth_slice_no=depth_slice_number)
+    # The slices are independent, so fetch them concurrently
+    inline_tuple, crossline_tuple, depth_slice_tuple = await asyncio.gather(
+        vds_access.get_inline_slice_async(line_no=inline_number),
+        vds_access.get_crossline_slice_async(line_no=crossline_number),
+        vds_access.get_depth_slice_async(depth_slice_no=depth_slice_number),
+    )
 
     return (
-        converters.to_api_vds_slice_data(flattened_slice_traces_array=inline_tuple[0], metadata=inline_tuple[1]),
-        converters.to_api_vds_slice_data(flattened_slice_traces_array=crossline_tuple[0], metadata=crossline_tuple[1]),
-        converters.to_api_vds_slice_data(
-            flattened_slice_traces_array=depth_slice_tuple[0], metadata=depth_slice_tuple[1]
-        ),
+        converters.to_api_vds_slice_data(inline_tuple[0], inline_tuple[1], value_encoding),
+        converters.to_api_vds_slice_data(crossline_tuple[0], crossline_tuple[1], value_encoding),
+        converters.to_api_vds_slice_data(depth_slice_tuple[0], depth_slice_tuple[1], value_encoding),
     )
 
 
 @router.post("/get_seismic_fence/")
+# pylint: disable=too-many-arguments
 async def post_get_seismic_fence(
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
     case_uuid: str = Query(description="Sumo case uuid"),
@@ -95,55 +93,88 @@ async def post_get_seismic_fence(
     time_or_interval_str: str = Query(description="Timestamp or timestep"),
     representation: schemas.SeismicRepresentation = Query(description="Seismic representation"),
     polyline: schemas.SeismicFencePolyline = Body(embed=True),
+    max_num_traces: int | None = Query(
+        None, ge=1, description="Optional max number of traces, decimates the polyline points if exceeded"
+    ),
+    value_encoding: ValueEncoding = Query(ValueEncoding.FLOAT32, description="Encoding of the fence trace values"),
 ) -> schemas.SeismicFenceData:
     """Get a fence of seismic data from a polyline defined by a set of (x, y) coordinates in domain coordinate system.
 
     The fence data contains a set of traces perpendicular to the polyline, with one trace per (x, y)-point in polyline.
     Each trace has equal number of samples, and is a set of sample values along the depth direction of the seismic cube.
 
+    If max_num_traces is given and the polyline has more points, the traces are taken at max_num_traces points evenly
+    spaced by index along the polyline, including the first and last point.
+
+    The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+    given by max_abs_error of the returned array.
+
     Returns:
     A SeismicFenceData object with fence traces in encoded 1D array, metadata for trace array decoding and fence min/max depth.
     """
-    seismic_access = SeismicAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
+    vds_access = await _create_vds_access_async(
+        authenticated_user,
+        case_uuid,
+        ensemble_name,
+        realization_num,
+        seismic_attribute,
+        time_or_interval_str,
+        representation,
     )
 
-    vds_handle: Optional[VdsHandle] = None
-    try:
-        vds_handle = await seismic_access.get_vds_handle_async(
-            realization=realization_num,
-            seismic_attribute=seismic_attribute,
-            time_or_interval_str=time_or_interval_str,
-            representation=SeismicRepresentation(representation.value),
-        )
-    except ValueError as err:
-        raise HTTPException(status_code=404, detail=str(err)) from err
-
-    if vds_handle is None:
-        raise HTTPException(status_code=404, detail="Vds handle not found")
-
-    vds_access = VdsAccess(sas_token=vds_handle.sas_token, vds_url=vds_handle.vds_url)
-
     # Retrieve fence and post as seismic intersection using cdp coordinates for vds-slice
     # NOTE: Correct coordinate format and scaling - see VdsCoordinateSystem?
-    [
-        flattened_fence_traces_array,
-        num_traces,
-        num_samples_per_trace,
-    ] = await vds_access.get_flattened_fence_traces_array_and_metadata_async(
-        coordinates=VdsCoordinates(polyline.x_points, polyline.y_points),
-        coordinate_system=VdsCoordinateSystem.CDP,
+    # The cube metadata is fetched concurrently with the fence
+    (flattened_fence_traces_array, num_traces, num_samples_per_trace), meta = await asyncio.gather(
+        vds_access.get_flattened_fence_traces_array_and_metadata_async(
+            coordinates=VdsCoordinates(polyline.x_points, polyline.y_points),
+            coordinate_system=VdsCoordinateSystem.CDP,
+            max_num_traces=max_num_traces,
+        ),
+        vds_access.get_metadata_async(),
     )
-    meta: VdsMetadata = await vds_access.get_metadata_async()
 
     if len(meta.axis) != 3:
         raise HTTPException(status_code=400, detail=f"Expected 3 axes, got {len(meta.axis)}")
     depth_axis_meta = meta.axis[2]
 
     return schemas.SeismicFenceData(
-        fence_traces_b64arr=b64_encode_float_array_as_float32(flattened_fence_traces_array),
+        fence_traces_b64arr=b64_encode_float_array_with_value_encoding(flattened_fence_traces_array, value_encoding),
         num_traces=num_traces,
         num_samples_per_trace=num_samples_per_trace,
         min_fence_depth=depth_axis_meta.min,
         max_fence_depth=depth_axis_meta.max,
     )
+
+
+# pylint: disable-next=too-many-arguments
+async def _create_vds_access_async(
+    authenticated_user: AuthenticatedUser,
+    case_uuid: str,
+    ensemble_name: str,
+    realization_num: int,
+    seismic_attribute: str,
+    time_or_interval_str: str,
+    representation: schemas.SeismicRepresentation,
+) -> VdsAccess:
+    # The ensemble fingerprint enables reuse of the VDS handle across requests
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+    seismic_access = SeismicAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
+
+    vds_handle: VdsHandle | None = None
+    try:
+        vds_handle = await seismic_access.get_vds_handle_async(
+            realization=realization_num,
+            seismic_attribute=seismic_attribute,
+            time_or_interval_str=time_or_interval_str,
+            representation=SeismicRepresentation(representation.value),
+        )
+    except ValueError as err:
+        raise HTTPException(status_code=404, detail=str(err)) from err
+
+    if vds_handle is None:
+        raise HTTPException(status_code=404, detail="Vds handle not found")
+
+    return VdsAccess(sas_token=vds_handle.sas_token, vds_url=vds_handle.vds_url)
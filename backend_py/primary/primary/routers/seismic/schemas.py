@@ -2,7 +2,7 @@ from typing import List
 from enum import StrEnum
 
 from pydantic import BaseModel
-from webviz_core_utils.b64 import B64FloatArray
+from webviz_core_utils.b64 import B64FloatArray, B64QuantizedFloatArray
 
 from .._shared.schemas import BoundingBox3d
 
@@ -87,7 +87,9 @@ class SeismicFenceData(BaseModel):
 
     `Properties:`
     - `fence_traces_b64arr`: The fence trace array is base64 encoded 1D float array - where data is stored trace by trace.
-    - `num_traces`: The number of traces in the fence trace array. Equals the number of (x, y) coordinates in requested polyline.
+    The array is quantized if a quantized value encoding is requested.
+    - `num_traces`: The number of traces in the fence trace array. Equals the number of (x, y) coordinates in requested polyline,
+    or the requested max number of traces if the polyline points are decimated.
     - `num_samples_per_trace`: The number of samples in each trace.
     - `min_fence_depth`: The minimum depth value of the fence.
     - `max_fence_depth`: The maximum depth value of the fence.
@@ -102,7 +104,7 @@ class SeismicFenceData(BaseModel):
     - VdsAxis: https://github.com/equinor/vds-slice/blob/ab6f39789bf3d3b59a8df14f1c4682d340dc0bf3/internal/core/core.go#L37-L55
     """
 
-    fence_traces_b64arr: B64FloatArray
+    fence_traces_b64arr: B64FloatArray | B64QuantizedFloatArray
     num_traces: int
     num_samples_per_trace: int
     min_fence_depth: float
@@ -118,6 +120,7 @@ class SeismicSliceData(BaseModel):
 
     `Properties:`
     - `slice_traces_b64arr`: The slice trace array is base64 encoded 1D float array - where data is stored trace by trace.
+    The array is quantized if a quantized value encoding is requested.
     - `bbox_utm`: The bounding box of the slice in UTM coordinates.
     - `u_min`: The minimum value of the u-axis.
     - `u_max`: The maximum value of the u-axis.
@@ -133,7 +136,7 @@ class SeismicSliceData(BaseModel):
     Fence traces 1D array: [trace_1_sample_1, trace_1_sample_2, ..., trace_1_sample_n, ..., trace_m_sample_1, trace_m_sample_2, ..., trace_m_sample_n]
     """
 
-    slice_traces_b64arr: B64FloatArray
+    slice_traces_b64arr: B64FloatArray | B64QuantizedFloatArray
     bbox_utm: List[List[float]]
     u_min: float
     u_max: float
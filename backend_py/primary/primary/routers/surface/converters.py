@@ -3,7 +3,7 @@ import base64
 import numpy as np
 import xtgeo
 from numpy.typing import NDArray
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32
+from webviz_core_utils.b64 import ValueEncoding, b64_encode_float_array_with_value_encoding
 
 from webviz_services.smda_access.types import StratigraphicSurface
 from webviz_services.sumo_access.surface_types import SurfaceMetaSet
@@ -44,13 +44,15 @@ def resample_to_surface_def(
     return target_surface
 
 
-def to_api_surface_data_float(xtgeo_surf: xtgeo.RegularSurface) -> schemas.SurfaceDataFloat:
+def to_api_surface_data_float(
+    xtgeo_surf: xtgeo.RegularSurface, value_encoding: ValueEncoding = ValueEncoding.FLOAT32
+) -> schemas.SurfaceDataFloat:
     """
-    Create API SurfaceDataFloat from xtgeo regular surface
+    Create API SurfaceDataFloat from xtgeo regular surface, with values encoded using the specified value encoding
     """
 
     float32_np_arr: NDArray[np.float32] = surface_to_float32_numpy_array(xtgeo_surf)
-    values_b64arr = b64_encode_float_array_as_float32(float32_np_arr)
+    values_b64arr = b64_encode_float_array_with_value_encoding(float32_np_arr, value_encoding)
 
     surface_def = schemas.SurfaceDef(
         npoints_x=xtgeo_surf.ncol,
@@ -5,6 +5,7 @@ from typing import Annotated, List, Optional, Literal
 import xtgeo
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, Body, status
 
+from webviz_core_utils.b64 import ValueEncoding
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_core_utils.type_utils import expect_type
 from webviz_services.sumo_access.case_inspector import CaseInspector
@@ -27,8 +28,10 @@ from webviz_services.utils.surfaces_well_trajectory_formation_segments import (
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, set_cache_time, CacheTime
+from primary.middleware.ensemble_etag import ensemble_etag
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
 from primary.utils.drogon import is_drogon_identifier
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 
 from .._shared.long_running_operations import LroInProgressResp, LroFailureResp, LroSuccessResp
 
@@ -74,6 +77,7 @@ encoded as a `UintListStr` or "*" to include all realizations.
 
 @router.get("/realization_surfaces_metadata/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 async def get_realization_surfaces_metadata(
     response: Response,
     authenticated_user: AuthenticatedUser = Depends(AuthHelper.get_authenticated_user),
@@ -168,6 +172,7 @@ async def get_surface_data(
     surf_addr_str: Annotated[str, Query(description="Surface address string, supported address types are *REAL*, *OBS* and *STAT*")],
     data_format: Annotated[Literal["float", "png"], Query(description="Format of binary data in the response")] = "float",
     resample_to: Annotated[schemas.SurfaceDef | None, Depends(dependencies.get_resample_to_param_from_keyval_str)] = None,
+    value_encoding: Annotated[ValueEncoding, Query(description="Encoding of the values if data format is *float*, the quantized encodings are lossy")] = ValueEncoding.FLOAT32,
     # fmt:on
 ) -> schemas.SurfaceDataFloat | schemas.SurfaceDataPng:
     perf_metrics = ResponsePerfMetrics(response)
@@ -186,7 +191,11 @@ async def get_surface_data(
         raise HTTPException(status_code=500, detail="Did not get a valid xtgeo surface from Sumo")
 
     surf_data_response = _resample_and_convert_to_surface_data_response(
-        xtgeo_surf=xtgeo_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
+        xtgeo_surf=xtgeo_surf,
+        resample_to=resample_to,
+        data_format=data_format,
+        value_encoding=value_encoding,
+        perf_metrics=perf_metrics,
     )
 
     LOGGER.info(f"Got {addr.address_type} surface in: {perf_metrics.to_string()}")
@@ -290,6 +299,7 @@ async def get_statistical_surface_data_hybrid(
     surf_addr_str: Annotated[str, Query(description="Surface address string, supported address type is *STAT*")],
     data_format: Annotated[Literal["float", "png"], Query(description="Format of binary data in the response")] = "float",
     resample_to: Annotated[schemas.SurfaceDef | None, Depends(dependencies.get_resample_to_param_from_keyval_str)] = None,
+    value_encoding: Annotated[ValueEncoding, Query(description="Encoding of the values if data format is *float*, the quantized encodings are lossy")] = ValueEncoding.FLOAT32,
     # fmt:on
 ) -> LroSuccessResp[schemas.SurfaceDataFloat | schemas.SurfaceDataPng] | LroInProgressResp | LroFailureResp:
 
@@ -341,7 +351,11 @@ async def get_statistical_surface_data_hybrid(
         # We should now be left with a xtgeo RegularSurface
         xtgeo_surf: xtgeo.RegularSurface = expect_type(maybe_xtgeo_surf, xtgeo.RegularSurface)
         api_surf_data = _resample_and_convert_to_surface_data_response(
-            xtgeo_surf=xtgeo_surf, resample_to=resample_to, data_format=data_format, perf_metrics=perf_metrics
+            xtgeo_surf=xtgeo_surf,
+            resample_to=resample_to,
+            data_format=data_format,
+            value_encoding=value_encoding,
+            perf_metrics=perf_metrics,
         )
 
         LOGGER.info(f"Got statistical surface data (hybrid) in: {perf_metrics.to_string()}")
@@ -372,7 +386,12 @@ async def post_get_surface_intersection(
     The surface intersection data for surface name contains: An array of z-points, i.e. one z-value/depth per (x, y)-point in polyline,
     and cumulative lengths, the accumulated length at each z-point in the array.
     """
-    access = SurfaceAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    # The polyline typically changes between successive requests while the surface stays the same. The ensemble
+    # fingerprint enables reuse of the surface across requests, so that only the sampling along the polyline is redone.
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+    access = SurfaceAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
 
     surface = await access.get_realization_surface_data_async(
         real_num=realization_num, name=name, attribute=attribute, time_or_interval_str=time_or_interval_str
@@ -478,6 +497,7 @@ def _resample_and_convert_to_surface_data_response(
     xtgeo_surf: xtgeo.RegularSurface,
     resample_to: schemas.SurfaceDef | None,
     data_format: Literal["float", "png"],
+    value_encoding: ValueEncoding,
     perf_metrics: ResponsePerfMetrics,
 ) -> schemas.SurfaceDataFloat | schemas.SurfaceDataPng:
     """
@@ -489,7 +509,7 @@ def _resample_and_convert_to_surface_data_response(
 
     surf_data_response: schemas.SurfaceDataFloat | schemas.SurfaceDataPng
     if data_format == "float":
-        surf_data_response = converters.to_api_surface_data_float(xtgeo_surf)
+        surf_data_response = converters.to_api_surface_data_float(xtgeo_surf, value_encoding)
     elif data_format == "png":
         surf_data_response = converters.to_api_surface_data_png(xtgeo_surf)
 
@@ -2,7 +2,7 @@ from enum import Enum
 from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
-from webviz_core_utils.b64 import B64FloatArray
+from webviz_core_utils.b64 import B64FloatArray, B64QuantizedFloatArray
 
 from webviz_services.sumo_access.generic_types import SumoContent
 
@@ -110,7 +110,7 @@ class SurfaceDataBase(BaseModel):
 
 class SurfaceDataFloat(SurfaceDataBase):
     format: Literal["float"] = "float"
-    values_b64arr: B64FloatArray
+    values_b64arr: B64FloatArray | B64QuantizedFloatArray
 
 
 class SurfaceDataPng(SurfaceDataBase):
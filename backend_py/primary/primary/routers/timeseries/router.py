@@ -12,7 +12,7 @@ from webviz_services.sumo_access.summary_access import Frequency, SummaryAccess
 from webviz_services.utils.authenticated_user import AuthenticatedUser
 from webviz_services.summary_delta_vectors import (
     DeltaVectorMetadata,
-    create_delta_vector_table,
+    create_aligned_delta_vectors_table,
     create_realization_delta_vector_list,
 )
 from webviz_services.summary_derived_vectors import (
@@ -29,6 +29,8 @@ from webviz_services.summary_derived_vectors import (
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.middleware.ensemble_etag import ensemble_etag
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 from primary.utils.response_perf_metrics import ResponsePerfMetrics
 from primary.utils.query_string_utils import decode_uint_list_str
 
@@ -42,6 +44,7 @@ router = APIRouter()
 
 @router.get("/vector_list/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 async def get_vector_list(
     response: Response,
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
@@ -83,6 +86,7 @@ async def get_vector_list(
 
 @router.get("/delta_ensemble_vector_list/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag(("comparison_case_uuid", "comparison_ensemble_name"), ("reference_case_uuid", "reference_ensemble_name"))
 async def get_delta_ensemble_vector_list(
     response: Response,
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
@@ -139,6 +143,7 @@ async def get_delta_ensemble_vector_list(
 
 @router.get("/realizations_vector_data/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 # pylint: disable-next=too-many-locals
 async def get_realizations_vector_data(
     # fmt:off
@@ -159,7 +164,8 @@ async def get_realizations_vector_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = SummaryAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    access = await _create_summary_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-access")
     sumo_freq = Frequency.from_string_value(resampling_frequency.value if resampling_frequency else "dummy")
 
     is_vector_derived = is_derived_vector(vector_name)
@@ -177,17 +183,17 @@ async def get_realizations_vector_data(
         ret_arr = converters.realization_vector_list_to_api_vector_realization_data_list(sumo_vec_arr)
     else:
         # Handle derived vectors
-        vector_table_pa, vector_metadata = await access.get_vector_table_async(
-            vector_name=vector_name_to_fetch,
+        derived_vector_table_pa, vector_metadata = await access.get_derived_vector_table_async(
+            derived_vector_name=vector_name,
             resampling_frequency=sumo_freq,
             realizations=realizations,
         )
+        perf_metrics.record_lap("get-derived-vector")
 
         derived_vector_type = get_derived_vector_type(vector_name)
         derived_vector_unit = create_derived_vector_unit(vector_metadata.unit, derived_vector_type)
         derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
 
-        derived_vector_table_pa = create_derived_vector_table_for_type(vector_table_pa, derived_vector_type)
         derived_realization_vector_list = create_derived_realization_vector_list(
             derived_vector_table_pa, vector_name, vector_metadata.is_rate, derived_vector_unit
         )
@@ -202,6 +208,7 @@ async def get_realizations_vector_data(
 
 @router.get("/delta_ensemble_realizations_vector_data/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag(("comparison_case_uuid", "comparison_ensemble_name"), ("reference_case_uuid", "reference_ensemble_name"))
 # pylint: disable-next=too-many-locals
 async def get_delta_ensemble_realizations_vector_data(
     # fmt:off
@@ -291,6 +298,7 @@ async def get_delta_ensemble_realizations_vector_data(
 
 @router.get("/historical_vector_data/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 # type: ignore [empty-body]
 async def get_historical_vector_data(
     authenticated_user: Annotated[AuthenticatedUser, Depends(AuthHelper.get_authenticated_user)],
@@ -319,6 +327,7 @@ async def get_historical_vector_data(
 
 @router.get("/statistical_vector_data/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 # pylint: disable-next=too-many-locals
 async def get_statistical_vector_data(
     # fmt:off
@@ -340,7 +349,8 @@ async def get_statistical_vector_data(
     if realizations_encoded_as_uint_list_str:
         realizations = decode_uint_list_str(realizations_encoded_as_uint_list_str)
 
-    access = SummaryAccess.from_ensemble_name(authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name)
+    access = await _create_summary_access_with_fingerprint_async(authenticated_user, case_uuid, ensemble_name)
+    perf_metrics.record_lap("get-access")
 
     service_freq = Frequency.from_string_value(resampling_frequency.value)
     service_stat_funcs_to_compute = converters.to_service_statistic_functions(statistic_functions)
@@ -348,12 +358,19 @@ async def get_statistical_vector_data(
     is_vector_derived = is_derived_vector(vector_name)
     vector_name_to_fetch = vector_name if not is_vector_derived else get_total_vector_name(vector_name)
 
-    # Get vector table
-    vector_table, vector_metadata = await access.get_vector_table_async(
-        vector_name=vector_name_to_fetch,
-        resampling_frequency=service_freq,
-        realizations=realizations,
-    )
+    # Get vector table, for derived vectors this is the table of the derived vector
+    if not is_vector_derived:
+        vector_table, vector_metadata = await access.get_vector_table_async(
+            vector_name=vector_name_to_fetch,
+            resampling_frequency=service_freq,
+            realizations=realizations,
+        )
+    else:
+        vector_table, vector_metadata = await access.get_derived_vector_table_async(
+            derived_vector_name=vector_name,
+            resampling_frequency=service_freq,
+            realizations=realizations,
+        )
     perf_metrics.record_lap("get-table")
 
     # Calculate statistics
@@ -369,8 +386,7 @@ async def get_statistical_vector_data(
         derived_vector_unit = create_derived_vector_unit(vector_metadata.unit, derived_vector_type)
         derived_vector_info = converters.to_api_derived_vector_info(derived_vector_type, vector_name_to_fetch)
 
-        derived_vector_table_pa = create_derived_vector_table_for_type(vector_table, derived_vector_type)
-        statistics = compute_vector_statistics(derived_vector_table_pa, vector_name, service_stat_funcs_to_compute)
+        statistics = compute_vector_statistics(vector_table, vector_name, service_stat_funcs_to_compute)
 
         if not statistics:
             raise HTTPException(status_code=404, detail="Could not compute statistics")
@@ -387,6 +403,7 @@ async def get_statistical_vector_data(
 
 @router.get("/delta_ensemble_statistical_vector_data/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag(("comparison_case_uuid", "comparison_ensemble_name"), ("reference_case_uuid", "reference_ensemble_name"))
 # pylint: disable=too-many-arguments
 # pylint: disable-next=too-many-locals
 async def get_delta_ensemble_statistical_vector_data(
@@ -480,6 +497,7 @@ async def get_delta_ensemble_statistical_vector_data(
 
 @router.get("/statistical_vector_data_per_sensitivity/")
 @cache_time(CacheTime.LONG)
+@ensemble_etag()
 # pylint: disable-next=too-many-locals
 async def get_statistical_vector_data_per_sensitivity(
     # fmt:off
@@ -551,6 +569,17 @@ async def get_statistical_vector_data_per_sensitivity(
     return ret_data
 
 
+async def _create_summary_access_with_fingerprint_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> SummaryAccess:
+    # The ensemble fingerprint enables reuse of vector tables and derived vector tables across requests
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+
+    return SummaryAccess.from_ensemble_name(
+        authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name, ensemble_fingerprint=ensemble_fp
+    )
+
+
 def _create_vector_descriptions_for_derived_vectors(
     vector_names: list[str] | set[str],
 ) -> list[schemas.VectorDescription]:
@@ -601,27 +630,29 @@ async def _get_vector_tables_and_create_delta_vector_table_and_metadata_async(
     """
     Get vector tables for comparison and reference ensembles and create delta ensemble vector table and metadata
     """
-    # Separate summary access to comparison and reference ensemble
-    comparison_ensemble_access = SummaryAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), comparison_case_uuid, comparison_ensemble_name
-    )
-    reference_ensemble_access = SummaryAccess.from_ensemble_name(
-        authenticated_user.get_sumo_access_token(), reference_case_uuid, reference_ensemble_name
+    # Separate summary access to comparison and reference ensemble, the accesses are created in parallel since each
+    # needs to look up its ensemble fingerprint
+    comparison_ensemble_access, reference_ensemble_access = await asyncio.gather(
+        _create_summary_access_with_fingerprint_async(
+            authenticated_user, comparison_case_uuid, comparison_ensemble_name
+        ),
+        _create_summary_access_with_fingerprint_async(authenticated_user, reference_case_uuid, reference_ensemble_name),
     )
 
-    # Get tables parallel
+    # Get aligned tables parallel
     # - Resampled data is assumed to be such that dates/timestamps are comparable between ensembles and cases, i.e. timestamps
     #   for a resampling of a daily vector in both ensembles should be the same
-    (comparison_vector_table_pa, comparison_metadata), (
-        reference_vector_table_pa,
+    # - The aligned tables are cached per ensemble, so the reference ensemble is reused when compared against many ensembles
+    (comparison_aligned_table, comparison_metadata), (
+        reference_aligned_table,
         reference_metadata,
     ) = await asyncio.gather(
-        comparison_ensemble_access.get_vector_table_async(
+        comparison_ensemble_access.get_aligned_vector_table_async(
             vector_name=vector_name,
             resampling_frequency=resampling_frequency,
             realizations=realizations,
         ),
-        reference_ensemble_access.get_vector_table_async(
+        reference_ensemble_access.get_aligned_vector_table_async(
             vector_name=vector_name,
             resampling_frequency=resampling_frequency,
             realizations=realizations,
@@ -644,8 +675,8 @@ async def _get_vector_tables_and_create_delta_vector_table_and_metadata_async(
     delta_vector_metadata = DeltaVectorMetadata(unit=reference_metadata.unit, is_rate=reference_metadata.is_rate)
 
     # Create delta ensemble table
-    delta_vector_table_pa = create_delta_vector_table(
-        comparison_vector_table_pa, reference_vector_table_pa, vector_name
+    delta_vector_table_pa = create_aligned_delta_vectors_table(
+        comparison_aligned_table, reference_aligned_table, [vector_name]
     )
 
     if perf_metrics:
@@ -8,6 +8,7 @@ from webviz_services.well_completions_assembler.well_completions_assembler impor
 
 from primary.auth.auth_helper import AuthHelper
 from primary.middleware.cache_control_middleware import cache_time, CacheTime
+from primary.utils.ensemble_fingerprint import get_ensemble_fingerprint_or_none_async
 from primary.utils.query_string_utils import decode_uint_list_str
 
 from . import converters
@@ -30,7 +31,11 @@ async def get_well_completions_data(
         authenticated_user.get_sumo_access_token(), case_uuid, ensemble_name
     )
 
-    well_completions_assembler = WellCompletionsAssembler(well_completions_access=access)
+    # The ensemble fingerprint enables reuse of assembled well completions data across requests
+    ensemble_fp = await get_ensemble_fingerprint_or_none_async(authenticated_user, case_uuid, ensemble_name)
+    well_completions_assembler = WellCompletionsAssembler(
+        well_completions_access=access, ensemble_fingerprint=ensemble_fp
+    )
 
     # Decode realizations if encoded string is provided
     realizations: list[int] | None = None
@@ -0,0 +1,27 @@
+import logging
+
+from webviz_services.sumo_access.sumo_fingerprinter import get_sumo_fingerprinter_for_user
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def get_ensemble_fingerprint_or_none_async(
+    authenticated_user: AuthenticatedUser, case_uuid: str, ensemble_name: str
+) -> str | None:
+    """
+    Get the ensemble fingerprint for use as key for in-process caching of ensemble data.
+
+    Returns None if the fingerprint could not be determined, in which case the caller should proceed without caching.
+    """
+    # For how long should we cache the ensemble fingerprint here?
+    # Note that the explore endpoint that calculates/refreshes fingerprints sets a TTL of 5 minutes.
+    # Be a bit defensive here and set a TTL of 2 minutes.
+    fingerprinter = get_sumo_fingerprinter_for_user(authenticated_user=authenticated_user, cache_ttl_s=2 * 60)
+
+    try:
+        return await fingerprinter.get_or_calc_ensemble_fp_async(case_uuid, ensemble_name)
+    # pylint: disable-next=broad-exception-caught
+    except Exception as exc:
+        LOGGER.warning(f"Unable to get fingerprint for ensemble {case_uuid=}, {ensemble_name=}: {exc}")
+        return None
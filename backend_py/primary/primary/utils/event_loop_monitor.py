@@ -0,0 +1,226 @@
+import asyncio
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable
+
+from starlette.types import Scope
+
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY
+
+from primary.utils.route_label import get_route_label
+
+LOGGER = logging.getLogger(__name__)
+
+# How often the scheduling lag of the event loop is sampled
+_LAG_SAMPLE_INTERVAL_S = 0.5
+
+# Callbacks running longer than this without yielding to the event loop are considered blocking
+_SLOW_CALLBACK_THRESHOLD_S = 0.1
+
+# How often a summary of the worst blocking routes is logged, if there were any blocking callbacks
+_SUMMARY_LOG_INTERVAL_S = 60
+
+# Upper bound on the number of distinct offenders tracked, further offenders are aggregated into one entry
+_MAX_TRACKED_OFFENDERS = 256
+_OTHER_OFFENDER = "<other>"
+
+# Label used for blocking callbacks not running on behalf of any request, e.g. background tasks
+_NO_REQUEST_LABEL = "<no request>"
+
+# Scope of the request the current task is handling, used for attributing blocking time to routes
+_ACTIVE_REQUEST_SCOPE: ContextVar[Scope | None] = ContextVar("_ACTIVE_REQUEST_SCOPE", default=None)
+
+
+@dataclass(kw_only=True)
+class SlowCallbackOffender:
+    route: str
+    slow_callback_count: int
+    total_blocked_ms: float
+    max_blocked_ms: float
+
+    # The coroutine of the slowest callback, if it was a task step
+    max_blocked_coroutine: str | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class EventLoopLagStats:
+    sample_count: int
+    last_lag_ms: float
+    max_lag_ms: float
+
+
+def attribute_event_loop_time_to_request(scope: Scope) -> None:
+    """
+    Attribute blocking callbacks run by the current task, and by tasks it spawns, to the request's route.
+
+    Must be called from the task handling the request. The attribution is deliberately not reset when the
+    request completes, since the final step of the request task, which may be the one doing all the blocking
+    work, ends after the request is complete. The request's task, and thereby its context, ends with the request.
+    """
+    _ACTIVE_REQUEST_SCOPE.set(scope)
+
+
+class EventLoopMonitor:
+    """
+    Monitors the health of the event loop.
+
+    A background task samples the scheduling lag of the event loop, i.e. how late a sleep wakes up compared
+    to the requested time, into the webviz_event_loop_lag_ms histogram.
+
+    All callbacks run by the event loop are timed, and callbacks running longer than a threshold without
+    yielding, typically CPU heavy work done directly in an async endpoint, are attributed to the route of
+    the request they were run on behalf of, see attribute_event_loop_time_to_request(). The worst offenders
+    are available through get_worst_offenders() and are periodically logged.
+
+    Timing of callbacks is done by wrapping asyncio.Handle._run, so it only works with the standard asyncio
+    event loop and adds the cost of two clock reads to each callback.
+    """
+
+    def __init__(
+        self,
+        lag_sample_interval_s: float = _LAG_SAMPLE_INTERVAL_S,
+        slow_callback_threshold_s: float = _SLOW_CALLBACK_THRESHOLD_S,
+        summary_log_interval_s: float = _SUMMARY_LOG_INTERVAL_S,
+    ) -> None:
+        self._lag_sample_interval_s = lag_sample_interval_s
+        self._slow_callback_threshold_s = slow_callback_threshold_s
+        self._summary_log_interval_s = summary_log_interval_s
+
+        self._offenders: dict[str, SlowCallbackOffender] = {}
+        self._offender_counts_since_summary: dict[str, int] = {}
+
+        self._lag_sample_count = 0
+        self._last_lag_ms = 0.0
+        self._max_lag_ms = 0.0
+
+        self._lag_task: asyncio.Task | None = None
+        self._original_handle_run: Callable[[asyncio.Handle], None] | None = None
+
+    def start(self) -> None:
+        """Start monitoring the running event loop"""
+        if self._lag_task is not None:
+            return
+
+        self._install_callback_timing()
+        self._lag_task = asyncio.create_task(self._run_lag_sampling_async())
+
+    async def stop_async(self) -> None:
+        if self._lag_task is None:
+            return
+
+        self._lag_task.cancel()
+        try:
+            await self._lag_task
+        except asyncio.CancelledError:
+            pass
+        self._lag_task = None
+
+        self._uninstall_callback_timing()
+
+    def get_worst_offenders(self, limit: int = 20) -> list[SlowCallbackOffender]:
+        """Get the routes with most blocking time, worst first"""
+        offenders = sorted(self._offenders.values(), key=lambda offender: offender.total_blocked_ms, reverse=True)
+        return offenders[:limit]
+
+    def get_lag_stats(self) -> EventLoopLagStats:
+        return EventLoopLagStats(
+            sample_count=self._lag_sample_count, last_lag_ms=self._last_lag_ms, max_lag_ms=self._max_lag_ms
+        )
+
+    def _install_callback_timing(self) -> None:
+        # pylint: disable=protected-access
+        original_handle_run = asyncio.Handle._run
+        threshold_s = self._slow_callback_threshold_s
+        record_slow_callback = self._record_slow_callback
+
+        def timed_handle_run(handle: asyncio.Handle) -> None:
+            start_time_s = time.perf_counter()
+            original_handle_run(handle)
+            duration_s = time.perf_counter() - start_time_s
+            if duration_s >= threshold_s:
+                record_slow_callback(handle, duration_s)
+
+        self._original_handle_run = original_handle_run
+        asyncio.Handle._run = timed_handle_run  # type: ignore[method-assign, assignment]
+
+    def _uninstall_callback_timing(self) -> None:
+        if self._original_handle_run is not None:
+            # pylint: disable-next=protected-access
+            asyncio.Handle._run = self._original_handle_run  # type: ignore[method-assign, assignment]
+            self._original_handle_run = None
+
+    def _record_slow_callback(self, handle: asyncio.Handle, duration_s: float) -> None:
+        # The callback has completed, but its context still holds any context variables it set
+        # pylint: disable-next=protected-access
+        request_scope = handle._context.get(_ACTIVE_REQUEST_SCOPE)  # type: ignore[attr-defined]
+        route = get_route_label(request_scope) if request_scope is not None else _NO_REQUEST_LABEL
+
+        if route not in self._offenders and len(self._offenders) >= _MAX_TRACKED_OFFENDERS:
+            route = _OTHER_OFFENDER
+
+        duration_ms = 1000 * duration_s
+        offender = self._offenders.get(route)
+        if offender is None:
+            offender = SlowCallbackOffender(
+                route=route, slow_callback_count=0, total_blocked_ms=0, max_blocked_ms=0, max_blocked_coroutine=None
+            )
+            self._offenders[route] = offender
+
+        offender.slow_callback_count += 1
+        offender.total_blocked_ms += duration_ms
+        if duration_ms > offender.max_blocked_ms:
+            offender.max_blocked_ms = duration_ms
+            offender.max_blocked_coroutine = _get_coroutine_name_or_none(handle)
+
+        self._offender_counts_since_summary[route] = self._offender_counts_since_summary.get(route, 0) + 1
+
+        METRICS_REGISTRY.increment_counter("webviz_event_loop_slow_callbacks_total", route=route)
+        METRICS_REGISTRY.increment_counter("webviz_event_loop_blocked_ms_total", duration_ms, route=route)
+
+    async def _run_lag_sampling_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_summary_time_s = loop.time()
+
+        while True:
+            start_time_s = loop.time()
+            await asyncio.sleep(self._lag_sample_interval_s)
+            now_s = loop.time()
+
+            lag_ms = max(0.0, 1000 * (now_s - start_time_s - self._lag_sample_interval_s))
+            self._lag_sample_count += 1
+            self._last_lag_ms = lag_ms
+            self._max_lag_ms = max(self._max_lag_ms, lag_ms)
+            METRICS_REGISTRY.observe_histogram("webviz_event_loop_lag_ms", lag_ms)
+
+            if now_s - last_summary_time_s >= self._summary_log_interval_s:
+                self._log_summary()
+                last_summary_time_s = now_s
+
+    def _log_summary(self) -> None:
+        if not self._offender_counts_since_summary:
+            return
+
+        counts = sorted(self._offender_counts_since_summary.items(), key=lambda item: item[1], reverse=True)
+        self._offender_counts_since_summary = {}
+
+        counts_str = ", ".join(f"{route}={count}" for route, count in counts[:5])
+        LOGGER.warning(
+            f"Event loop blocked by {sum(count for _route, count in counts)} slow callbacks "
+            f"(>{int(1000 * self._slow_callback_threshold_s)}ms) in the last period, worst routes: {counts_str}"
+        )
+
+
+def _get_coroutine_name_or_none(handle: asyncio.Handle) -> str | None:
+    # Steps of tasks are run as callbacks bound to the task
+    # pylint: disable-next=protected-access
+    task = getattr(handle._callback, "__self__", None)  # type: ignore[attr-defined]
+    if not isinstance(task, asyncio.Task):
+        return None
+
+    return getattr(task.get_coro(), "__qualname__", None)
+
+
+# The process wide event loop monitor
+EVENT_LOOP_MONITOR = EventLoopMonitor()
@@ -0,0 +1,34 @@
+def make_strong_etag(opaque_value: str) -> str:
+    """
+    Make a strong ETag header value from an opaque value, e.g. a content hash.
+    The value must not contain double quotes.
+    """
+    if '"' in opaque_value:
+        raise ValueError("ETag value must not contain double quotes")
+
+    return f'"{opaque_value}"'
+
+
+def is_etag_matched_by_if_none_match(if_none_match_header: str | None, etag: str) -> bool:
+    """
+    Check if the ETag is matched by the value of an If-None-Match request header.
+
+    Uses the weak comparison mandated for If-None-Match, so a weak validator (W/"...") from the client
+    matches a strong ETag with the same opaque value.
+    """
+    if not if_none_match_header:
+        return False
+
+    if if_none_match_header.strip() == "*":
+        return True
+
+    opaque_etag = _strip_weak_prefix(etag)
+    for candidate in if_none_match_header.split(","):
+        if _strip_weak_prefix(candidate.strip()) == opaque_etag:
+            return True
+
+    return False
+
+
+def _strip_weak_prefix(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
@@ -0,0 +1,191 @@
+import asyncio
+import os
+import resource
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import pyarrow as pa
+from starlette.types import Scope
+
+from webviz_core_utils.metrics_registry import CollectedMetricSample, METRICS_REGISTRY
+
+from primary.utils.route_label import get_route_label
+
+# How often memory usage is sampled while requests are in flight
+_SAMPLE_INTERVAL_S = 0.1
+
+_PAGE_SIZE_BYTES = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# ru_maxrss is reported in bytes on macOS, but in kilobytes on Linux
+_MAX_RSS_UNIT_BYTES = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass(frozen=True, kw_only=True)
+class _MemorySample:
+    rss_bytes: int | None
+    arrow_allocated_bytes: int
+
+
+@dataclass(kw_only=True)
+class _InFlightRequest:
+    scope: Scope
+    start_sample: _MemorySample
+    peak_rss_delta_bytes: int = 0
+    peak_arrow_delta_bytes: int = 0
+
+
+@dataclass(kw_only=True)
+class RouteMemoryStats:
+    route: str
+    request_count: int
+    max_peak_rss_delta_bytes: int
+    max_peak_arrow_delta_bytes: int
+    total_peak_rss_delta_bytes: int
+
+
+def _read_rss_bytes_or_none() -> int | None:
+    # Reading statm is considerably cheaper than going through psutil, but is only available on Linux
+    try:
+        with open("/proc/self/statm", "rb") as statm_file:
+            return int(statm_file.read().split()[1]) * _PAGE_SIZE_BYTES
+    except OSError:
+        return None
+
+
+def _take_memory_sample() -> _MemorySample:
+    return _MemorySample(rss_bytes=_read_rss_bytes_or_none(), arrow_allocated_bytes=pa.total_allocated_bytes())
+
+
+class MemoryMonitor:
+    """
+    Tracks memory usage of the process and attributes the peak memory growth during each request to its route.
+
+    While requests are in flight, the resident set size (RSS) of the process and the bytes allocated by the Arrow
+    memory pool are sampled periodically, and each request's peak growth relative to the start of the request is
+    recorded. This is an approximation: concurrent requests see each other's allocations, peaks between samples
+    are missed, and growth may be memory retained by the allocator or by caches rather than by the request itself.
+    The per-route maxima are still a useful guide for sizing workers and cache budgets.
+
+    The current process memory usage is exposed as gauges through collect_memory_metrics(), the per-route
+    stats through get_top_routes().
+    """
+
+    def __init__(self, sample_interval_s: float = _SAMPLE_INTERVAL_S) -> None:
+        self._sample_interval_s = sample_interval_s
+        self._in_flight: dict[int, _InFlightRequest] = {}
+        self._route_stats: dict[str, RouteMemoryStats] = {}
+        self._sampling_task: asyncio.Task | None = None
+        self._wake_event = asyncio.Event()
+
+    def start(self) -> None:
+        if self._sampling_task is None:
+            self._sampling_task = asyncio.create_task(self._run_sampling_async())
+
+    async def stop_async(self) -> None:
+        if self._sampling_task is None:
+            return
+
+        self._sampling_task.cancel()
+        try:
+            await self._sampling_task
+        except asyncio.CancelledError:
+            pass
+        self._sampling_task = None
+
+    @contextmanager
+    def track_request(self, scope: Scope) -> Iterator[None]:
+        """Track the memory growth within the context, attributed to the route of the request"""
+        request = _InFlightRequest(scope=scope, start_sample=_take_memory_sample())
+        request_key = id(request)
+        self._in_flight[request_key] = request
+
+        # Wake up the sampling, which idles while no requests are in flight
+        self._wake_event.set()
+
+        try:
+            yield
+        finally:
+            del self._in_flight[request_key]
+            _update_peaks(request, _take_memory_sample())
+            self._record_request(request)
+
+    def get_top_routes(self, limit: int = 20) -> list[RouteMemoryStats]:
+        """Get the routes with the largest peak memory growth during a request, largest first"""
+        route_stats = sorted(
+            self._route_stats.values(),
+            key=lambda stats: (stats.max_peak_rss_delta_bytes, stats.max_peak_arrow_delta_bytes),
+            reverse=True,
+        )
+        return route_stats[:limit]
+
+    def _record_request(self, request: _InFlightRequest) -> None:
+        route = get_route_label(request.scope)
+        stats = self._route_stats.get(route)
+        if stats is None:
+            stats = RouteMemoryStats(
+                route=route,
+                request_count=0,
+                max_peak_rss_delta_bytes=0,
+                max_peak_arrow_delta_bytes=0,
+                total_peak_rss_delta_bytes=0,
+            )
+            self._route_stats[route] = stats
+
+        stats.request_count += 1
+        stats.max_peak_rss_delta_bytes = max(stats.max_peak_rss_delta_bytes, request.peak_rss_delta_bytes)
+        stats.max_peak_arrow_delta_bytes = max(stats.max_peak_arrow_delta_bytes, request.peak_arrow_delta_bytes)
+        stats.total_peak_rss_delta_bytes += request.peak_rss_delta_bytes
+
+        METRICS_REGISTRY.set_gauge("webviz_route_max_peak_rss_delta_bytes", stats.max_peak_rss_delta_bytes, route=route)
+        METRICS_REGISTRY.set_gauge(
+            "webviz_route_max_peak_arrow_delta_bytes", stats.max_peak_arrow_delta_bytes, route=route
+        )
+
+    async def _run_sampling_async(self) -> None:
+        while True:
+            if not self._in_flight:
+                self._wake_event.clear()
+                await self._wake_event.wait()
+
+            await asyncio.sleep(self._sample_interval_s)
+
+            sample = _take_memory_sample()
+            for request in self._in_flight.values():
+                _update_peaks(request, sample)
+
+
+def _update_peaks(request: _InFlightRequest, sample: _MemorySample) -> None:
+    start_sample = request.start_sample
+    if sample.rss_bytes is not None and start_sample.rss_bytes is not None:
+        request.peak_rss_delta_bytes = max(request.peak_rss_delta_bytes, sample.rss_bytes - start_sample.rss_bytes)
+
+    arrow_delta_bytes = sample.arrow_allocated_bytes - start_sample.arrow_allocated_bytes
+    request.peak_arrow_delta_bytes = max(request.peak_arrow_delta_bytes, arrow_delta_bytes)
+
+
+def collect_memory_metrics() -> Iterable[CollectedMetricSample]:
+    """Samples of the current memory usage of the process and the Arrow memory pool"""
+    rss_bytes = _read_rss_bytes_or_none()
+    if rss_bytes is not None:
+        yield CollectedMetricSample(kind="gauge", name="webviz_process_rss_bytes", labels={}, value=rss_bytes)
+
+    peak_rss_bytes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAX_RSS_UNIT_BYTES
+    yield CollectedMetricSample(kind="gauge", name="webviz_process_peak_rss_bytes", labels={}, value=peak_rss_bytes)
+
+    pool = pa.default_memory_pool()
+    labels = {"backend": pool.backend_name}
+    yield CollectedMetricSample(
+        kind="gauge", name="webviz_arrow_pool_allocated_bytes", labels=labels, value=pool.bytes_allocated()
+    )
+    yield CollectedMetricSample(
+        kind="gauge", name="webviz_arrow_pool_max_allocated_bytes", labels=labels, value=pool.max_memory() or 0
+    )
+    yield CollectedMetricSample(
+        kind="gauge", name="webviz_arrow_total_allocated_bytes", labels={}, value=pa.total_allocated_bytes()
+    )
+
+
+# The process wide memory monitor
+MEMORY_MONITOR = MemoryMonitor()
@@ -0,0 +1,10 @@
+import importlib
+from types import ModuleType
+
+
+def import_optional_module(module_name: str) -> ModuleType | None:
+    """Import a module from an optional dependency, returns None if it is not installed"""
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
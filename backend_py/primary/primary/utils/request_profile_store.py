@@ -0,0 +1,61 @@
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+
+# Number of profiles kept, the oldest profile is discarded when a new one is added to a full store
+_MAX_STORED_PROFILES = 20
+
+
+@dataclass(frozen=True, kw_only=True)
+class StoredRequestProfileInfo:
+    profile_id: str
+    user_id: str
+    created_at: datetime
+    method: str
+    path: str
+    duration_ms: int
+    profiler: str
+    media_type: str
+    file_name: str
+    size_bytes: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class StoredRequestProfile:
+    info: StoredRequestProfileInfo
+    content: bytes
+
+
+def make_profile_id() -> str:
+    return uuid.uuid4().hex
+
+
+class RequestProfileStore:
+    """
+    In-memory ring buffer of request profiles, see ProfilingMiddleware.
+
+    Profiles are only kept in the process that handled the request, and are lost on restart.
+    """
+
+    def __init__(self, max_profiles: int = _MAX_STORED_PROFILES) -> None:
+        self._profiles: deque[StoredRequestProfile] = deque(maxlen=max_profiles)
+
+    def add(self, profile: StoredRequestProfile) -> None:
+        self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> StoredRequestProfile | None:
+        for profile in self._profiles:
+            if profile.info.profile_id == profile_id:
+                return profile
+        return None
+
+    def get_infos(self, user_id: str | None = None) -> list[StoredRequestProfileInfo]:
+        """Get info about the stored profiles, newest first, optionally only the ones of a specific user"""
+        return [
+            profile.info for profile in reversed(self._profiles) if user_id is None or profile.info.user_id == user_id
+        ]
+
+
+# The process wide profile store
+REQUEST_PROFILE_STORE = RequestProfileStore()
@@ -1,5 +1,6 @@
 from starlette.responses import MutableHeaders, Response
 
+from webviz_core_utils.metrics_registry import record_lap_metric
 from webviz_core_utils.perf_timer import PerfTimer
 
 
@@ -18,6 +19,7 @@ class ResponsePerfMetrics:
     def set_metric(self, metric_name: str, duration_ms: int | float) -> None:
         int_duration_ms = int(duration_ms)
         self._metrics_dict[metric_name] = int_duration_ms
+        record_lap_metric(metric_name, int_duration_ms)
 
         if self._headers is not None:
             self._headers.append("Server-Timing", f"{metric_name}; dur={int_duration_ms}")
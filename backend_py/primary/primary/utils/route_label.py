@@ -0,0 +1,14 @@
+from starlette.types import Scope
+
+# Label used for requests that did not match any route, to keep the number of label values bounded
+UNMATCHED_ROUTE_LABEL = "<unmatched>"
+
+
+def get_route_label(scope: Scope) -> str:
+    """
+    Get the path template of the route matched for the request, e.g. /surface/realization_surface_data/,
+    suitable for labelling metrics. The router stores the matched route in the scope, so this is only
+    available once the request has been routed.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE_LABEL
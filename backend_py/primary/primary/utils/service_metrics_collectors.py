@@ -0,0 +1,33 @@
+from collections.abc import Iterable
+
+from webviz_core_utils.lru_cache import get_all_named_cache_stats
+from webviz_core_utils.metrics_registry import CollectedMetricSample
+from webviz_services.utils.single_flight import get_all_single_flight_stats
+
+
+def collect_cache_metrics() -> Iterable[CollectedMetricSample]:
+    """Samples from the stats of all named in-process caches"""
+    for name, stats in get_all_named_cache_stats().items():
+        labels = {"cache": name}
+        yield CollectedMetricSample(kind="counter", name="webviz_cache_hits_total", labels=labels, value=stats.hits)
+        yield CollectedMetricSample(kind="counter", name="webviz_cache_misses_total", labels=labels, value=stats.misses)
+        yield CollectedMetricSample(
+            kind="counter", name="webviz_cache_evictions_total", labels=labels, value=stats.evictions
+        )
+        yield CollectedMetricSample(kind="gauge", name="webviz_cache_entries", labels=labels, value=stats.num_entries)
+        yield CollectedMetricSample(kind="gauge", name="webviz_cache_size", labels=labels, value=stats.total_size)
+
+
+def collect_single_flight_metrics() -> Iterable[CollectedMetricSample]:
+    """Samples from the stats of all single flight instances, i.e. the number of executed and coalesced loads"""
+    for name, stats in get_all_single_flight_stats().items():
+        labels = {"single_flight": name}
+        yield CollectedMetricSample(
+            kind="counter", name="webviz_single_flight_executed_total", labels=labels, value=stats.executed
+        )
+        yield CollectedMetricSample(
+            kind="counter", name="webviz_single_flight_coalesced_total", labels=labels, value=stats.coalesced
+        )
+        yield CollectedMetricSample(
+            kind="gauge", name="webviz_single_flight_in_flight", labels=labels, value=stats.in_flight
+        )
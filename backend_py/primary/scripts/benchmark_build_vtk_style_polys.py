@@ -0,0 +1,40 @@
+"""
+Benchmark of _build_vtk_style_polys() on synthetic input resembling the surface of a large grid.
+
+Not part of the unit tests, run manually from the primary directory with the primary environment active:
+    python scripts/benchmark_build_vtk_style_polys.py --num-polys 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from webviz_services.user_grid3d_service.user_grid3d_service import _build_vtk_style_polys
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--num-polys", type=int, default=1_000_000, help="Number of polys, mostly quads")
+    parser.add_argument("--repeats", type=int, default=5, help="Number of timed runs")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(seed=42)
+    vertices_per_poly = np.where(rng.random(args.num_polys) < 0.1, 3, 4).astype(np.uint8)
+    poly_indices = rng.integers(0, 4 * args.num_polys, size=int(vertices_per_poly.sum()), dtype=np.uint32)
+
+    elapsed_s_list: list[float] = []
+    for _ in range(args.repeats):
+        start_s = time.perf_counter()
+        polys_arr = _build_vtk_style_polys(poly_indices, vertices_per_poly)
+        elapsed_s_list.append(time.perf_counter() - start_s)
+
+    assert len(polys_arr) == args.num_polys + len(poly_indices)
+    print(
+        f"_build_vtk_style_polys() for {args.num_polys} polys: "
+        f"min {min(elapsed_s_list):.3f}s, median {float(np.median(elapsed_s_list)):.3f}s over {args.repeats} runs"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import datetime
+
+import numpy as np
+import polars as pl
+
+from webviz_services.flow_network_assembler.flow_network_assembler import _create_dated_networks
+from webviz_services.flow_network_assembler.flow_network_assembler import _estimate_flow_network_result_nbytes
+from webviz_services.flow_network_assembler.flow_network_types import (
+    DataType,
+    EdgeOrNode,
+    NodeClassification,
+    NodeType,
+    StaticNodeWorkingData,
+    SummaryVectorInfo,
+    TreeType,
+)
+
+
+def _create_working_data(node_name: str, summary_vectors_info: dict[str, SummaryVectorInfo]) -> StaticNodeWorkingData:
+    return StaticNodeWorkingData(
+        node_name=node_name,
+        node_classification=NodeClassification(IS_PROD=True, IS_INJ=False, IS_OTHER=False),
+        node_summary_vectors_info=summary_vectors_info,
+    )
+
+
+NODE_STATIC_WORKING_DATA = {
+    "FIELD": _create_working_data("FIELD", {"FPR": SummaryVectorInfo(DataType.PRESSURE, EdgeOrNode.NODE)}),
+    "GRP": _create_working_data(
+        "GRP",
+        {
+            "GPR:GRP": SummaryVectorInfo(DataType.PRESSURE, EdgeOrNode.NODE),
+            "GOPR:GRP": SummaryVectorInfo(DataType.OILRATE, EdgeOrNode.EDGE),
+        },
+    ),
+    "W1": _create_working_data(
+        "W1",
+        {
+            "WBHP:W1": SummaryVectorInfo(DataType.BHP, EdgeOrNode.NODE),
+            "WOPR:W1": SummaryVectorInfo(DataType.OILRATE, EdgeOrNode.EDGE),
+        },
+    ),
+}
+
+
+def _create_group_tree_df() -> pl.DataFrame:
+    # Identical group trees at the first two dates, W1 moved directly below FIELD at the last date
+    dates = [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1), datetime.datetime(2022, 1, 1)]
+    rows = [
+        (dates[0], "FIELD", None, "GRUPTREE"),
+        (dates[0], "GRP", "FIELD", "GRUPTREE"),
+        (dates[0], "W1", "GRP", "WELSPECS"),
+        (dates[1], "FIELD", None, "GRUPTREE"),
+        (dates[1], "GRP", "FIELD", "GRUPTREE"),
+        (dates[1], "W1", "GRP", "WELSPECS"),
+        (dates[2], "FIELD", None, "GRUPTREE"),
+        (dates[2], "W1", "FIELD", "WELSPECS"),
+    ]
+    date_col, child_col, parent_col, keyword_col = zip(*rows)
+    return pl.DataFrame({"DATE": date_col, "CHILD": child_col, "PARENT": parent_col, "KEYWORD": keyword_col})
+
+
+def _create_smry_df() -> pl.DataFrame:
+    smry_dates = [datetime.datetime(year, month, 1) for year in [2020, 2021, 2022] for month in [1, 7]]
+    return pl.DataFrame(
+        {
+            "DATE": smry_dates,
+            "FPR": [100.0, 101.0, 102.0, 103.0, 104.0, 105.0],
+            "GOPR:GRP": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "WOPR:W1": [1.111, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "WBHP:W1": [50.0, 51.0, 52.0, 53.0, 54.0, 55.0],
+        }
+    )
+
+
+def test_create_dated_networks() -> None:
+    dated_networks = _create_dated_networks(
+        _create_group_tree_df(),
+        _create_smry_df(),
+        NODE_STATIC_WORKING_DATA,
+        {NodeType.PROD},
+        "FIELD",
+        None,
+    )
+
+    assert [network.dates for network in dated_networks] == [
+        ["2020-01-01", "2020-07-01"],
+        ["2021-01-01", "2021-07-01"],
+        # The last summary date is not included for the last group tree
+        ["2022-01-01"],
+    ]
+
+    first_network = dated_networks[0].network
+    assert first_network.node_label == "FIELD"
+    assert first_network.node_data == {DataType.PRESSURE: [100.0, 101.0]}
+    group_node = first_network.children[0]
+    assert group_node.node_type == "Group"
+    assert group_node.edge_data == {DataType.OILRATE: [1.0, 2.0]}
+    assert np.isnan(group_node.node_data[DataType.PRESSURE]).all()
+    well_node = group_node.children[0]
+    assert well_node.node_type == "Well"
+    assert well_node.edge_data == {DataType.OILRATE: [1.11, 2.0]}
+    assert well_node.node_data == {DataType.BHP: [50.0, 51.0]}
+
+    # Same topology as the first date, but with separate nodes holding the values for its own dates
+    second_network = dated_networks[1].network
+    assert second_network.children[0].children[0].node_data == {DataType.BHP: [52.0, 53.0]}
+    assert second_network.children[0] is not group_node
+
+    third_network = dated_networks[2].network
+    assert [child.node_label for child in third_network.children] == ["W1"]
+    assert third_network.children[0].edge_data == {DataType.OILRATE: [5.0]}
+
+
+def test_create_dated_networks_with_data_types_of_interest() -> None:
+    dated_networks = _create_dated_networks(
+        _create_group_tree_df(),
+        _create_smry_df(),
+        NODE_STATIC_WORKING_DATA,
+        {NodeType.PROD},
+        "FIELD",
+        {DataType.OILRATE},
+    )
+
+    first_network = dated_networks[0].network
+    assert first_network.node_data == {}
+    assert first_network.children[0].children[0].edge_data == {DataType.OILRATE: [1.11, 2.0]}
+    assert first_network.children[0].children[0].node_data == {}
+
+
+def test_estimated_size_of_cached_result() -> None:
+    dated_networks = _create_dated_networks(
+        _create_group_tree_df(),
+        _create_smry_df(),
+        NODE_STATIC_WORKING_DATA,
+        {NodeType.PROD},
+        "FIELD",
+        None,
+    )
+
+    # Ten node and edge values for each of the first two networks, and three for the last one
+    assert _estimate_flow_network_result_nbytes({TreeType.GRUPTREE: (dated_networks, [], [])}) == 23 * 32
+    assert _estimate_flow_network_result_nbytes({}) == 0
@@ -0,0 +1,73 @@
+import gzip
+from collections.abc import AsyncIterator
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from primary.middleware.compression_middleware import CompressionMiddleware
+
+_LARGE_LIST = list(range(5000))
+
+
+def _make_client() -> TestClient:
+    app = FastAPI(default_response_class=ORJSONResponse)
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, excluded_path_prefixes=["/excluded"])
+
+    @app.get("/large")
+    async def get_large() -> list[int]:
+        return _LARGE_LIST
+
+    @app.get("/small")
+    async def get_small() -> list[int]:
+        return [1, 2, 3]
+
+    @app.get("/excluded/large")
+    async def get_excluded_large() -> list[int]:
+        return _LARGE_LIST
+
+    @app.get("/png")
+    async def get_png() -> Response:
+        return Response(content=bytes(4096), media_type="image/png")
+
+    @app.get("/stream")
+    async def get_stream() -> StreamingResponse:
+        async def _generate_async() -> AsyncIterator[bytes]:
+            for i in range(3):
+                yield f"line {i}\n".encode() * 100
+
+        return StreamingResponse(_generate_async(), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_large_json_is_compressed() -> None:
+    client = _make_client()
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert "compress;" in response.headers["server-timing"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json() == _LARGE_LIST
+
+
+def test_responses_not_compressed() -> None:
+    client = _make_client()
+
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/png", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/excluded/large", headers={"Accept-Encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "gzip;q=0"}).headers
+    assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+
+def test_streamed_response_is_compressed() -> None:
+    client = _make_client()
+
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw_body = b"".join(response.iter_raw())
+
+    expected = b"".join(f"line {i}\n".encode() * 100 for i in range(3))
+    assert gzip.decompress(raw_body) == expected
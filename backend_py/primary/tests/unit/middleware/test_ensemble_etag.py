@@ -0,0 +1,86 @@
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from primary.middleware import ensemble_etag as ensemble_etag_module
+from primary.middleware.cache_control_middleware import CacheControlMiddleware, CacheTime, cache_time
+from primary.middleware.ensemble_etag import ensemble_etag
+
+
+def _get_authenticated_user() -> str:
+    return "user"
+
+
+def _make_client(call_counter: list[int]) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CacheControlMiddleware)
+
+    @app.get("/data")
+    @cache_time(CacheTime.LONG)
+    @ensemble_etag()
+    async def get_data(
+        authenticated_user: Annotated[str, Depends(_get_authenticated_user)], case_uuid: str, ensemble_name: str
+    ) -> list[str]:
+        call_counter.append(1)
+        return [case_uuid, ensemble_name]
+
+    return TestClient(app)
+
+
+@pytest.fixture(name="fingerprints")
+def fixture_fingerprints(monkeypatch: pytest.MonkeyPatch) -> dict[tuple[str, str], str | None]:
+    fingerprints: dict[tuple[str, str], str | None] = {}
+
+    async def _get_fingerprint_async(_user: str, case_uuid: str, ensemble_name: str) -> str | None:
+        return fingerprints.get((case_uuid, ensemble_name))
+
+    monkeypatch.setattr(ensemble_etag_module, "get_ensemble_fingerprint_or_none_async", _get_fingerprint_async)
+    return fingerprints
+
+
+def test_not_modified_while_fingerprint_unchanged(fingerprints: dict[tuple[str, str], str | None]) -> None:
+    fingerprints[("case", "iter-0")] = "fp-1"
+    call_counter: list[int] = []
+    client = _make_client(call_counter)
+
+    response = client.get("/data", params={"case_uuid": "case", "ensemble_name": "iter-0"})
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    response = client.get(
+        "/data", params={"case_uuid": "case", "ensemble_name": "iter-0"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert "max-age" in response.headers["cache-control"]
+    assert len(call_counter) == 1
+
+    # Other query parameters give another ETag
+    response = client.get(
+        "/data", params={"case_uuid": "case", "ensemble_name": "iter-1"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+    # Changed ensemble data invalidates the ETag
+    fingerprints[("case", "iter-0")] = "fp-2"
+    response = client.get(
+        "/data", params={"case_uuid": "case", "ensemble_name": "iter-0"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_no_etag_without_fingerprint(fingerprints: dict[tuple[str, str], str | None]) -> None:
+    call_counter: list[int] = []
+    client = _make_client(call_counter)
+
+    response = client.get(
+        "/data", params={"case_uuid": "case", "ensemble_name": "iter-0"}, headers={"If-None-Match": "*"}
+    )
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert response.json() == ["case", "iter-0"]
+    assert not fingerprints
@@ -0,0 +1,35 @@
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from webviz_core_utils.metrics_registry import METRICS_REGISTRY
+
+from primary.middleware.metrics_middleware import MetricsMiddleware
+from primary.utils.response_perf_metrics import ResponsePerfMetrics
+
+
+def _make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str, response: Response) -> str:
+        perf_metrics = ResponsePerfMetrics(response)
+        perf_metrics.set_metric("load-item", 42)
+        return item_id
+
+    return TestClient(app)
+
+
+def test_request_metrics_are_labelled_with_route_template() -> None:
+    METRICS_REGISTRY.clear()
+    client = _make_client()
+
+    assert client.get("/items/a").status_code == 200
+    assert client.get("/items/b").status_code == 200
+    assert client.get("/does_not_exist").status_code == 404
+
+    text = METRICS_REGISTRY.to_prometheus_text()
+    assert 'webviz_lap_duration_ms_count{lap="load-item",route="/items/{item_id}"} 2' in text
+    assert 'webviz_http_request_duration_ms_count{method="GET",route="/items/{item_id}",status="2xx"} 2' in text
+    assert 'webviz_http_request_duration_ms_count{method="GET",route="<unmatched>",status="4xx"} 1' in text
+    assert "webviz_http_requests_in_flight 0" in text
@@ -0,0 +1,73 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from webviz_services.utils.authenticated_user import AuthenticatedUser
+
+from primary.middleware.profiling_middleware import ProfilingMiddleware
+from primary.utils.request_profile_store import RequestProfileStore
+
+
+class _FakeLoggedInMiddleware:
+    """Stands in for EnforceLoggedInMiddleware, providing the authenticated user in the request state"""
+
+    def __init__(self, app: ASGIApp, user_id: str) -> None:
+        self._app = app
+        self._user_id = user_id
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        user = AuthenticatedUser(user_id=self._user_id, username=self._user_id, access_tokens={})  # type: ignore
+        scope.setdefault("state", {})["authenticated_user_obj"] = user
+        await self._app(scope, receive, send)
+
+
+def _make_client(profile_store: RequestProfileStore, user_id: str) -> TestClient:
+    app = FastAPI(root_path="/api")
+    app.add_middleware(ProfilingMiddleware, allowed_user_ids=["allowed_user"], profile_store=profile_store)
+    app.add_middleware(_FakeLoggedInMiddleware, user_id=user_id)
+
+    @app.get("/work")
+    async def get_work() -> int:
+        return sum(i * i for i in range(10000))
+
+    return TestClient(app)
+
+
+def test_request_with_header_is_profiled_for_allowed_user() -> None:
+    profile_store = RequestProfileStore()
+    client = _make_client(profile_store, "allowed_user")
+
+    response = client.get("/work", headers={"X-Webviz-Profile": "1"})
+    assert response.status_code == 200
+
+    infos = profile_store.get_infos(user_id="allowed_user")
+    assert len(infos) == 1
+    assert infos[0].path.endswith("/work")
+    assert f'profile; desc="/api/dev/profiles/{infos[0].profile_id}"' in response.headers["server-timing"]
+
+    profile = profile_store.get(infos[0].profile_id)
+    assert profile is not None
+    assert len(profile.content) == infos[0].size_bytes > 0
+
+
+def test_request_is_not_profiled_without_header_or_for_other_users() -> None:
+    profile_store = RequestProfileStore()
+
+    allowed_client = _make_client(profile_store, "allowed_user")
+    assert "server-timing" not in allowed_client.get("/work").headers
+    assert "server-timing" not in allowed_client.get("/work", headers={"X-Webviz-Profile": "0"}).headers
+
+    other_client = _make_client(profile_store, "other_user")
+    assert "server-timing" not in other_client.get("/work", headers={"X-Webviz-Profile": "1"}).headers
+
+    assert not profile_store.get_infos()
+
+
+def test_profile_store_is_bounded() -> None:
+    profile_store = RequestProfileStore(max_profiles=2)
+    client = _make_client(profile_store, "allowed_user")
+
+    for _ in range(3):
+        client.get("/work", headers={"X-Webviz-Profile": "1"})
+
+    assert len(profile_store.get_infos()) == 2
@@ -0,0 +1,31 @@
+import json
+
+import pytest
+
+from primary.persistence.session_store.content_codec import decode_session_content, encode_session_content
+from primary.persistence.session_store.types import SessionContentEncoding
+
+
+def test_small_content_is_stored_as_plain_text() -> None:
+    content = json.dumps({"modules": []})
+
+    stored_content, encoding = encode_session_content(content)
+    assert encoding is None
+    assert stored_content == content
+    assert decode_session_content(stored_content, encoding) == content
+
+
+def test_large_content_round_trip() -> None:
+    content = json.dumps(
+        {"modules": [{"name": f"Module æøå {i}", "settings": {"ensemble": "iter-0"}} for i in range(200)]}
+    )
+
+    stored_content, encoding = encode_session_content(content)
+    assert encoding == SessionContentEncoding.ZLIB_BASE64_V1
+    assert len(stored_content) < len(content)
+    assert decode_session_content(stored_content, encoding) == content
+
+
+def test_decode_unsupported_encoding() -> None:
+    with pytest.raises(ValueError):
+        decode_session_content("abc", "unknown")  # type: ignore[arg-type]
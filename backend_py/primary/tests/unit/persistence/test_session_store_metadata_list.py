@@ -0,0 +1,127 @@
+from datetime import datetime, timezone
+from typing import Any, Type, cast
+
+import pytest
+
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.cosmosdb.query_collation_options import Filter, SortDirection
+from primary.persistence.session_store import session_store
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadata, SessionMetadataProjection
+from primary.persistence.session_store.session_store import SessionStore
+from primary.persistence.session_store.types import SessionSortBy
+
+
+class _FakeSessionContainer:
+    """Records the queries made and returns a single projected session per page"""
+
+    def __init__(self) -> None:
+        self.query_calls: list[dict[str, Any]] = []
+
+    async def query_projection_by_page_token_async(
+        self,
+        query: str,
+        page_token: str | None,
+        projection_model: Type[SessionMetadataProjection],
+        parameters: list[dict[str, object]] | None = None,
+        page_size: int | None = None,
+    ) -> tuple[list[SessionMetadataProjection], str | None]:
+        self.query_calls.append(
+            {
+                "query": query,
+                "page_token": page_token,
+                "projection_model": projection_model,
+                "parameters": parameters,
+                "page_size": page_size,
+            }
+        )
+
+        owner_id = cast(list[dict[str, object]], parameters)[0]["value"]
+        now = datetime.now(timezone.utc)
+        projection = projection_model(
+            id=f"session-{len(self.query_calls)}",
+            owner_id=str(owner_id),
+            metadata=SessionMetadata(
+                title="Title", description=None, created_at=now, updated_at=now, content_hash="hash", version=1
+            ),
+        )
+        return ([projection], "next-page-token")
+
+    async def insert_item_async(self, item: SessionDocument) -> str:
+        return item.id
+
+
+@pytest.fixture(name="container")
+def fixture_container() -> _FakeSessionContainer:
+    session_store._SESSION_METADATA_LIST_CACHE.clear()  # pylint: disable=protected-access
+    return _FakeSessionContainer()
+
+
+def _make_store(user_id: str, container: _FakeSessionContainer) -> SessionStore:
+    return SessionStore(user_id, cast(CosmosContainer[SessionDocument], container))
+
+
+async def test_metadata_list_query_projects_metadata_only(container: _FakeSessionContainer) -> None:
+    store = _make_store("user-a", container)
+
+    items, next_page_token = await store.get_many_metadata_async(
+        page_token="page-token",
+        page_size=500,
+        sort_by=SessionSortBy.UPDATED_AT,
+        sort_direction=SortDirection.DESC,
+        filters=[Filter("metadata.title__lower", "abc", "CONTAINS")],
+    )
+
+    assert next_page_token == "next-page-token"
+    assert [item.owner_id for item in items] == ["user-a"]
+
+    assert len(container.query_calls) == 1
+    query_call = container.query_calls[0]
+    assert query_call["query"] == (
+        "SELECT c.id, c.owner_id, c.metadata FROM c "
+        "WHERE c.owner_id = @owner_id AND CONTAINS(c.metadata.title__lower, @metadatatitle__lower) "
+        "ORDER BY c.metadata.updated_at desc"
+    )
+    assert query_call["parameters"] == [
+        {"name": "@owner_id", "value": "user-a"},
+        {"name": "@metadatatitle__lower", "value": "abc"},
+    ]
+    assert query_call["page_token"] == "page-token"
+    assert query_call["projection_model"] is SessionMetadataProjection
+
+    # The page size is clamped to the maximum
+    assert query_call["page_size"] == 100
+
+
+async def test_metadata_list_cache_is_per_user(container: _FakeSessionContainer) -> None:
+    store_a = _make_store("user-a", container)
+    store_b = _make_store("user-b", container)
+
+    page_a, _token = await store_a.get_many_metadata_async(sort_by=SessionSortBy.TITLE)
+    assert await store_a.get_many_metadata_async(sort_by=SessionSortBy.TITLE) == (page_a, "next-page-token")
+    assert len(container.query_calls) == 1
+
+    # The same query for another user must not be served from the first user's cached page
+    page_b, _token = await store_b.get_many_metadata_async(sort_by=SessionSortBy.TITLE)
+    assert len(container.query_calls) == 2
+    assert [item.owner_id for item in page_b] == ["user-b"]
+
+    # Other query arguments are cached separately
+    await store_a.get_many_metadata_async(sort_by=SessionSortBy.TITLE, page_token="page-token")
+    assert len(container.query_calls) == 3
+
+
+async def test_metadata_list_cache_is_invalidated_for_user_on_create(container: _FakeSessionContainer) -> None:
+    store_a = _make_store("user-a", container)
+    store_b = _make_store("user-b", container)
+
+    await store_a.get_many_metadata_async()
+    await store_b.get_many_metadata_async()
+    assert len(container.query_calls) == 2
+
+    await store_a.create_async(title="New session", description=None, content="{}")
+
+    # Only the creating user's pages are evicted
+    await store_a.get_many_metadata_async()
+    await store_b.get_many_metadata_async()
+    assert len(container.query_calls) == 3
+    assert container.query_calls[2]["parameters"][0]["value"] == "user-a"
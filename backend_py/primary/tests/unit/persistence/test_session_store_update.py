@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from typing import Any, cast
+
+import pytest
+
+from primary.persistence._utils import hash_session_content_string
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.session_store.documents import SessionDocument, SessionMetadata
+from primary.persistence.session_store.session_store import SessionStore
+
+
+class _FakeSessionContainer:
+    """Holds a single session document and records the patch operations applied to it"""
+
+    def __init__(self, document: SessionDocument) -> None:
+        self._document = document
+        self.patch_calls: list[list[dict[str, Any]]] = []
+
+    async def get_item_async(self, item_id: str, partition_key: str) -> SessionDocument:
+        assert (item_id, partition_key) == (self._document.id, self._document.owner_id)
+        return self._document.model_copy(deep=True)
+
+    async def patch_item_async(self, item_id: str, partition_key: str, patch_operations: list[dict[str, Any]]) -> None:
+        assert (item_id, partition_key) == (self._document.id, self._document.owner_id)
+        self.patch_calls.append(patch_operations)
+
+
+@pytest.fixture(name="container")
+def fixture_container() -> _FakeSessionContainer:
+    created_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    document = SessionDocument(
+        id="session-id",
+        owner_id="user-a",
+        metadata=SessionMetadata(
+            title="Title",
+            description=None,
+            created_at=created_at,
+            updated_at=created_at,
+            content_hash=hash_session_content_string("{}"),
+            version=1,
+        ),
+        content="{}",
+    )
+    return _FakeSessionContainer(document)
+
+
+def _make_store(container: _FakeSessionContainer) -> SessionStore:
+    return SessionStore("user-a", cast(CosmosContainer[SessionDocument], container))
+
+
+async def test_update_patches_updated_at_as_inserted_documents(container: _FakeSessionContainer) -> None:
+    updated_session = await _make_store(container).update_async("session-id", title="New title")
+
+    assert len(container.patch_calls) == 1
+    patch_values_by_path = {op["path"]: op["value"] for op in container.patch_calls[0]}
+
+    # The patched timestamp must be serialized as in documents written by model_dump(mode="json"), so string
+    # comparisons and sorting on updated_at stay consistent across inserted and updated documents
+    inserted_metadata_json = updated_session.metadata.model_dump(mode="json")
+    assert patch_values_by_path["/metadata/updated_at"] == inserted_metadata_json["updated_at"]
+    assert patch_values_by_path["/metadata/updated_at"].endswith("Z")
+
+    assert patch_values_by_path["/metadata/title"] == "New title"
+    assert updated_session.metadata.version == 2
+
+
+async def test_update_without_changes_does_not_write(container: _FakeSessionContainer) -> None:
+    unchanged_session = await _make_store(container).update_async("session-id", title="Title", content="{}")
+
+    assert not container.patch_calls
+    assert unchanged_session.metadata.version == 1
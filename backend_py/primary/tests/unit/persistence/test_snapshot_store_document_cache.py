@@ -0,0 +1,130 @@
+from datetime import datetime, timezone
+from typing import cast
+
+import pytest
+
+from webviz_services.service_exceptions import ServiceRequestError
+
+from primary.persistence.cosmosdb.cosmos_container import CosmosContainer
+from primary.persistence.cosmosdb.exceptions import DatabaseAccessError, DatabaseAccessNotFoundError
+from primary.persistence.snapshot_store import snapshot_store
+from primary.persistence.snapshot_store.documents import SnapshotDocument, SnapshotMetadata
+from primary.persistence.snapshot_store.snapshot_store import SnapshotStore
+
+
+class _FakeSnapshotContainer:
+    """Holds snapshot documents by id and records the calls made"""
+
+    def __init__(self) -> None:
+        self.documents: dict[str, SnapshotDocument] = {}
+        self.get_calls: list[str] = []
+        self.delete_calls: list[str] = []
+        self.delete_error: DatabaseAccessError | None = None
+
+    async def get_item_async(self, item_id: str, partition_key: str) -> SnapshotDocument:
+        assert item_id == partition_key
+        self.get_calls.append(item_id)
+        document = self.documents.get(item_id)
+        if document is None:
+            raise DatabaseAccessNotFoundError("Not found", status_code=404)
+        return document
+
+    async def insert_item_async(self, item: SnapshotDocument) -> str:
+        self.documents[item.id] = item
+        return item.id
+
+    async def delete_item_async(self, item_id: str, partition_key: str) -> None:
+        assert item_id == partition_key
+        self.delete_calls.append(item_id)
+        if self.delete_error is not None:
+            raise self.delete_error
+        del self.documents[item_id]
+
+
+def _make_snapshot(snapshot_id: str, owner_id: str) -> SnapshotDocument:
+    return SnapshotDocument(
+        id=snapshot_id,
+        owner_id=owner_id,
+        metadata=SnapshotMetadata(title="Title", created_at=datetime.now(timezone.utc), content_hash="hash"),
+        content="{}",
+    )
+
+
+@pytest.fixture(name="container")
+def fixture_container() -> _FakeSnapshotContainer:
+    snapshot_store._SNAPSHOT_DOCUMENT_CACHE.clear()  # pylint: disable=protected-access
+    container = _FakeSnapshotContainer()
+    container.documents["snapshot-id"] = _make_snapshot("snapshot-id", "user-a")
+    return container
+
+
+def _make_store(user_id: str, container: _FakeSnapshotContainer) -> SnapshotStore:
+    return SnapshotStore(user_id, cast(CosmosContainer[SnapshotDocument], container))
+
+
+async def test_get_reads_through_cache(container: _FakeSnapshotContainer) -> None:
+    # A miss populates the cache, which is shared between users since snapshots can be read by anyone with the id
+    document = await _make_store("user-a", container).get_async("snapshot-id")
+    assert container.get_calls == ["snapshot-id"]
+
+    # A hit does not go to the database
+    assert await _make_store("user-b", container).get_async("snapshot-id") is document
+    assert container.get_calls == ["snapshot-id"]
+
+
+async def test_missing_snapshot_is_not_cached(container: _FakeSnapshotContainer) -> None:
+    store = _make_store("user-a", container)
+
+    for _ in range(2):
+        with pytest.raises(ServiceRequestError, match="not found"):
+            await store.get_async("missing-snapshot-id")
+
+    assert container.get_calls == ["missing-snapshot-id", "missing-snapshot-id"]
+
+
+async def test_create_seeds_cache(container: _FakeSnapshotContainer) -> None:
+    store = _make_store("user-a", container)
+
+    snapshot_id = await store.create_async(title="New snapshot", description=None, content='{"a": 1}')
+
+    document = await store.get_async(snapshot_id)
+    assert document.content == '{"a": 1}'
+    assert not container.get_calls
+
+
+async def test_delete_evicts_cache(container: _FakeSnapshotContainer) -> None:
+    store = _make_store("user-a", container)
+    await store.get_async("snapshot-id")
+
+    await store.delete_async("snapshot-id")
+    assert container.delete_calls == ["snapshot-id"]
+
+    # The deleted snapshot is looked up in the database again, and is no longer found
+    with pytest.raises(ServiceRequestError, match="not found"):
+        await store.get_async("snapshot-id")
+    assert container.get_calls == ["snapshot-id", "snapshot-id"]
+
+
+async def test_delete_evicts_cache_when_delete_fails(container: _FakeSnapshotContainer) -> None:
+    store = _make_store("user-a", container)
+    await store.get_async("snapshot-id")
+
+    # E.g. the snapshot was already deleted through another process
+    container.delete_error = DatabaseAccessNotFoundError("Not found", status_code=404)
+    with pytest.raises(ServiceRequestError):
+        await store.delete_async("snapshot-id")
+
+    assert "snapshot-id" not in snapshot_store._SNAPSHOT_DOCUMENT_CACHE  # pylint: disable=protected-access
+
+    await store.get_async("snapshot-id")
+    assert container.get_calls == ["snapshot-id", "snapshot-id"]
+
+
+async def test_delete_by_other_user_is_rejected_and_keeps_cache(container: _FakeSnapshotContainer) -> None:
+    await _make_store("user-a", container).get_async("snapshot-id")
+
+    with pytest.raises(ServiceRequestError, match="permission"):
+        await _make_store("user-b", container).delete_async("snapshot-id")
+
+    assert not container.delete_calls
+    assert "snapshot-id" in snapshot_store._SNAPSHOT_DOCUMENT_CACHE  # pylint: disable=protected-access
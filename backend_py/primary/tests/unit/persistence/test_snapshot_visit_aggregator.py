@@ -0,0 +1,45 @@
+from datetime import datetime
+from typing import cast
+
+from primary.persistence.snapshot_store import SnapshotAccessLogStore, SnapshotVisitAggregator
+
+
+class _RecordingAccessLogStore:
+    def __init__(self, visitor_id: str, calls: list[tuple]) -> None:
+        self._visitor_id = visitor_id
+        self._calls = calls
+
+    async def log_snapshot_visits_async(
+        self,
+        snapshot_id: str,
+        snapshot_owner_id: str,
+        visit_count: int,
+        first_visited_at: datetime,
+        last_visited_at: datetime,
+    ) -> None:
+        assert first_visited_at <= last_visited_at
+        self._calls.append((self._visitor_id, snapshot_id, snapshot_owner_id, visit_count))
+
+
+async def test_visits_are_coalesced_and_flushed_on_stop() -> None:
+    calls: list[tuple] = []
+    aggregator = SnapshotVisitAggregator(
+        lambda visitor_id: cast(SnapshotAccessLogStore, _RecordingAccessLogStore(visitor_id, calls))
+    )
+
+    aggregator.record_visit("user-a", "snap-1", "owner")
+    aggregator.record_visit("user-a", "snap-1", "owner")
+    aggregator.record_visit("user-b", "snap-1", "owner")
+    aggregator.record_visit("user-a", "snap-2", "owner")
+    assert not calls
+
+    await aggregator.stop_async()
+    assert sorted(calls) == [
+        ("user-a", "snap-1", "owner", 2),
+        ("user-a", "snap-2", "owner", 1),
+        ("user-b", "snap-1", "owner", 1),
+    ]
+
+    # Nothing left to write on subsequent flushes
+    await aggregator.flush_async()
+    assert len(calls) == 3
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from primary.auth.auth_helper import AuthHelper
+from primary.persistence.persistence_stores import PersistenceStoresSingleton
+from primary.persistence.snapshot_store.documents import SnapshotDocument, SnapshotMetadata
+from primary.routers.persistence.router import router
+from primary.utils.http_etag import make_strong_etag
+
+_SNAPSHOT = SnapshotDocument(
+    id="snapshot-id",
+    owner_id="owner-id",
+    metadata=SnapshotMetadata(title="Title", created_at=datetime(2024, 1, 1, tzinfo=timezone.utc), content_hash="hash"),
+    content='{"a": 1}',
+)
+
+
+class _FakeUser:
+    def get_user_id(self) -> str:
+        return "visitor-id"
+
+
+class _FakeSnapshotStore:
+    async def get_async(self, snapshot_id: str) -> SnapshotDocument:
+        assert snapshot_id == _SNAPSHOT.id
+        return _SNAPSHOT
+
+
+class _FakeVisitAggregator:
+    def __init__(self) -> None:
+        self.visits: list[tuple[str, str, str]] = []
+
+    def record_visit(self, visitor_id: str, snapshot_id: str, snapshot_owner_id: str) -> None:
+        self.visits.append((visitor_id, snapshot_id, snapshot_owner_id))
+
+
+class _FakePersistenceStores:
+    def __init__(self) -> None:
+        self.visit_aggregator = _FakeVisitAggregator()
+
+    def get_snapshot_store_for_user(self, user_id: str) -> _FakeSnapshotStore:
+        assert user_id == "visitor-id"
+        return _FakeSnapshotStore()
+
+    def get_snapshot_visit_aggregator(self) -> _FakeVisitAggregator:
+        return self.visit_aggregator
+
+
+@pytest.fixture(name="persistence_stores")
+def fixture_persistence_stores(monkeypatch: pytest.MonkeyPatch) -> _FakePersistenceStores:
+    persistence_stores = _FakePersistenceStores()
+    monkeypatch.setattr(PersistenceStoresSingleton, "_instance", persistence_stores)
+    return persistence_stores
+
+
+@pytest.fixture(name="client")
+def fixture_client() -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[AuthHelper.get_authenticated_user] = _FakeUser
+    return TestClient(app)
+
+
+def test_snapshot_response_carries_validation_headers(
+    client: TestClient, persistence_stores: _FakePersistenceStores
+) -> None:
+    response = client.get("/snapshots/snapshot-id")
+
+    assert response.status_code == 200
+    assert response.json()["content"] == '{"a": 1}'
+    assert response.headers["etag"] == make_strong_etag("hash")
+    assert response.headers["cache-control"] == "no-cache, private"
+    assert persistence_stores.visit_aggregator.visits == [("visitor-id", "snapshot-id", "owner-id")]
+
+
+@pytest.mark.parametrize("if_none_match", ['"hash"', 'W/"hash"', '"other", "hash"', "*"])
+def test_matching_if_none_match_gives_empty_not_modified(
+    client: TestClient, persistence_stores: _FakePersistenceStores, if_none_match: str
+) -> None:
+    response = client.get("/snapshots/snapshot-id", headers={"If-None-Match": if_none_match})
+
+    assert response.status_code == 304
+    assert not response.content
+    assert response.headers["etag"] == make_strong_etag("hash")
+    assert response.headers["cache-control"] == "no-cache, private"
+
+    # A revalidated snapshot is still a visit
+    assert persistence_stores.visit_aggregator.visits == [("visitor-id", "snapshot-id", "owner-id")]
+
+
+def test_non_matching_if_none_match_gives_snapshot(
+    client: TestClient, persistence_stores: _FakePersistenceStores
+) -> None:
+    response = client.get("/snapshots/snapshot-id", headers={"If-None-Match": '"stale-hash"'})
+
+    assert response.status_code == 200
+    assert response.json()["content"] == '{"a": 1}'
+    assert response.headers["etag"] == make_strong_etag("hash")
+    assert len(persistence_stores.visit_aggregator.visits) == 1
@@ -0,0 +1,136 @@
+from typing import Any, cast
+
+import pytest
+from sumo.wrapper import SumoClient
+
+from webviz_services.service_exceptions import InvalidDataError, MultipleDataMatchesError
+from webviz_services.sumo_access.queries.grid3d import get_time_filter
+from webviz_services.sumo_access.queries.grid3d import get_grid_geometry_and_property_blob_ids_for_time_steps_async
+from webviz_services.sumo_access.queries.grid3d import _get_property_ids_by_time_ms, _make_time_filter_epoch_ms_key
+
+# 2018-01-01T00:00:00Z and 2018-07-01T00:00:00Z as epoch milliseconds
+_T_2018_01_MS = 1514764800000
+_T_2018_07_MS = 1530403200000
+
+
+class _FakeResponse:
+    def __init__(self, hits: list[dict[str, Any]]) -> None:
+        self._hits = hits
+
+    def json(self) -> dict[str, Any]:
+        return {"hits": {"hits": self._hits}}
+
+
+class _FakeSumoClient:
+    def __init__(self, hits: list[dict[str, Any]]) -> None:
+        self._hits = hits
+        self.posted_payloads: list[dict[str, Any]] = []
+
+    async def post_async(self, path: str, json: dict[str, Any]) -> _FakeResponse:
+        assert path == "/search"
+        self.posted_payloads.append(json)
+        return _FakeResponse(self._hits)
+
+
+def _grid_hit(object_id: str) -> dict[str, Any]:
+    return {"_id": object_id, "_source": {"class": "cpgrid"}}
+
+
+def _property_hit(object_id: str, t0_ms: int | None, t1_ms: int | None = None) -> dict[str, Any]:
+    # Sumo returns the docvalue fields formatted as epoch_millis as lists of strings
+    fields: dict[str, Any] = {}
+    if t0_ms is not None:
+        fields["data.time.t0.value"] = [str(t0_ms)]
+    if t1_ms is not None:
+        fields["data.time.t1.value"] = [str(t1_ms)]
+    return {"_id": object_id, "_source": {"class": "cpgrid_property"}, "fields": fields}
+
+
+@pytest.mark.parametrize(
+    "time_or_interval_str, expected_key",
+    [
+        (None, (None, None)),
+        ("2018-01-01T00:00:00", (_T_2018_01_MS, None)),
+        ("2018-01-01T00:00:00Z", (_T_2018_01_MS, None)),
+        ("2018-01-01T00:00:00/2018-07-01T00:00:00", (_T_2018_01_MS, _T_2018_07_MS)),
+    ],
+)
+def test_make_time_filter_epoch_ms_key(
+    time_or_interval_str: str | None, expected_key: tuple[int | None, int | None]
+) -> None:
+    assert _make_time_filter_epoch_ms_key(get_time_filter(time_or_interval_str)) == expected_key
+
+
+def test_get_property_ids_by_time_ms() -> None:
+    property_hits = [
+        _property_hit("id-static", None),
+        _property_hit("id-2018-01", _T_2018_01_MS),
+        _property_hit("id-interval", _T_2018_01_MS, _T_2018_07_MS),
+        # Fractional values should not prevent a match
+        {"_id": "id-2018-07", "fields": {"data.time.t0.value": [f"{_T_2018_07_MS}.0"]}},
+    ]
+
+    assert _get_property_ids_by_time_ms(property_hits, "PRESSURE") == {
+        (None, None): "id-static",
+        (_T_2018_01_MS, None): "id-2018-01",
+        (_T_2018_01_MS, _T_2018_07_MS): "id-interval",
+        (_T_2018_07_MS, None): "id-2018-07",
+    }
+
+
+def test_get_property_ids_by_time_ms_with_duplicate_time() -> None:
+    property_hits = [_property_hit("id-a", _T_2018_01_MS), _property_hit("id-b", _T_2018_01_MS)]
+
+    with pytest.raises(MultipleDataMatchesError):
+        _get_property_ids_by_time_ms(property_hits, "PRESSURE")
+
+
+async def test_get_blob_ids_for_time_steps() -> None:
+    sumo_client = _FakeSumoClient(
+        [
+            _property_hit("id-interval", _T_2018_01_MS, _T_2018_07_MS),
+            _grid_hit("id-grid"),
+            _property_hit("id-2018-07", _T_2018_07_MS),
+            _property_hit("id-2018-01", _T_2018_01_MS),
+        ]
+    )
+    time_strs = ["2018-01-01T00:00:00", "2018-07-01T00:00:00", "2018-01-01T00:00:00/2018-07-01T00:00:00"]
+
+    grid_id, property_ids_by_time_str = await get_grid_geometry_and_property_blob_ids_for_time_steps_async(
+        cast(SumoClient, sumo_client), "case-uuid", "iter-0", 1, "Geogrid", "PRESSURE", time_strs
+    )
+
+    assert grid_id == "id-grid"
+    assert property_ids_by_time_str == {
+        "2018-01-01T00:00:00": "id-2018-01",
+        "2018-07-01T00:00:00": "id-2018-07",
+        "2018-01-01T00:00:00/2018-07-01T00:00:00": "id-interval",
+    }
+
+    # A single query should be made, with room for the grid and all the time steps
+    assert len(sumo_client.posted_payloads) == 1
+    assert sumo_client.posted_payloads[0]["size"] == len(time_strs) + 1
+
+
+async def test_get_blob_ids_for_time_steps_with_missing_time_step() -> None:
+    sumo_client = _FakeSumoClient([_grid_hit("id-grid"), _property_hit("id-2018-01", _T_2018_01_MS)])
+
+    with pytest.raises(InvalidDataError):
+        await get_grid_geometry_and_property_blob_ids_for_time_steps_async(
+            cast(SumoClient, sumo_client),
+            "case-uuid",
+            "iter-0",
+            1,
+            "Geogrid",
+            "PRESSURE",
+            ["2018-01-01T00:00:00", "2018-07-01T00:00:00"],
+        )
+
+
+async def test_get_blob_ids_for_time_steps_with_missing_grid() -> None:
+    sumo_client = _FakeSumoClient([_property_hit("id-2018-01", _T_2018_01_MS)])
+
+    with pytest.raises(InvalidDataError):
+        await get_grid_geometry_and_property_blob_ids_for_time_steps_async(
+            cast(SumoClient, sumo_client), "case-uuid", "iter-0", 1, "Geogrid", "PRESSURE", ["2018-01-01T00:00:00"]
+        )
@@ -0,0 +1,84 @@
+import pyarrow as pa
+
+from webviz_services.sumo_access._rft_data_index import RftDataIndex
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+
+def _create_aggregated_rft_table() -> pa.Table:
+    # Rows are deliberately unsorted with respect to WELL, DATE and REAL
+    rows = [
+        # WELL, DATE, REAL, DEPTH, PRESSURE
+        ("W2", 1 * DAY_MS, 0, 1000.0, 200.0),
+        ("W1", 2 * DAY_MS, 1, 1000.0, 110.0),
+        ("W1", 1 * DAY_MS, 1, 1000.0, 100.0),
+        ("W1", 1 * DAY_MS, 0, 1000.0, 90.0),
+        ("W1", 1 * DAY_MS, 1, 1010.0, 101.0),
+        ("W1", 1 * DAY_MS, 0, 1010.0, 91.0),
+        ("W2", 1 * DAY_MS, 0, 1010.0, 201.0),
+        ("W1", 1 * DAY_MS, 1, 1020.0, 102.0),
+    ]
+    wells, dates, reals, depths, pressures = zip(*rows)
+    return pa.table(
+        {
+            "WELL": pa.array(wells, type=pa.string()),
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "REAL": pa.array(reals, type=pa.int16()),
+            "DEPTH": pa.array(depths, type=pa.float32()),
+            "PRESSURE": pa.array(pressures, type=pa.float32()),
+        }
+    )
+
+
+def test_well_names() -> None:
+    index = RftDataIndex(_create_aggregated_rft_table(), "PRESSURE")
+    assert index.get_well_names() == ["W1", "W2"]
+
+
+def test_well_date_table_is_contiguous_slice() -> None:
+    index = RftDataIndex(_create_aggregated_rft_table(), "PRESSURE")
+
+    well_date_table = index.get_well_date_table("W1", 1 * DAY_MS)
+    assert well_date_table is not None
+    assert well_date_table.num_rows == 5
+    assert well_date_table["REAL"].to_pylist() == [0, 0, 1, 1, 1]
+    # Original depth ordering within each realization is retained
+    assert well_date_table["DEPTH"].to_pylist() == [1000.0, 1010.0, 1000.0, 1010.0, 1020.0]
+
+    assert index.get_well_date_table("W2", 2 * DAY_MS) is None
+    assert index.get_well_date_table("W3", 1 * DAY_MS) is None
+
+
+def test_well_realization_data_all_dates_and_reals() -> None:
+    index = RftDataIndex(_create_aggregated_rft_table(), "PRESSURE")
+
+    data = index.get_well_realization_data("W1", timestamps_utc_ms=None, realizations=None)
+    assert [(item.realization, item.value_arr) for item in data] == [
+        (0, [90.0, 91.0]),
+        (1, [100.0, 101.0, 102.0]),
+        (1, [110.0]),
+    ]
+    assert data[0].well_name == "W1"
+    assert data[0].depth_arr == [1000.0, 1010.0]
+    assert data[0].timestamp_utc_ms == data[1].timestamp_utc_ms != data[2].timestamp_utc_ms
+
+
+def test_well_realization_data_filtered() -> None:
+    index = RftDataIndex(_create_aggregated_rft_table(), "PRESSURE")
+
+    data = index.get_well_realization_data("W1", timestamps_utc_ms=[1 * DAY_MS], realizations=[1])
+    assert len(data) == 1
+    assert data[0].realization == 1
+    assert data[0].value_arr == [100.0, 101.0, 102.0]
+
+    assert index.get_well_realization_data("W1", timestamps_utc_ms=[3 * DAY_MS], realizations=None) == []
+    assert index.get_well_realization_data("W2", timestamps_utc_ms=None, realizations=[1]) == []
+    assert index.get_well_realization_data("W3", timestamps_utc_ms=None, realizations=None) == []
+
+
+def test_empty_table() -> None:
+    empty_table = _create_aggregated_rft_table().slice(0, 0)
+    index = RftDataIndex(empty_table, "PRESSURE")
+
+    assert index.get_well_names() == []
+    assert index.get_well_realization_data("W1", timestamps_utc_ms=None, realizations=None) == []
@@ -0,0 +1,92 @@
+import datetime
+from typing import Any, cast
+
+import pytest
+from fmu.sumo.explorer.explorer import SumoClient
+
+from webviz_services.sumo_access import seismic_access
+from webviz_services.sumo_access.seismic_access import SeismicAccess, _calc_vds_handle_ttl_s
+from webviz_services.sumo_access.seismic_types import SeismicRepresentation
+
+
+def _create_sas_token(expiry_time: datetime.datetime) -> str:
+    return f"sv=2022-11-02&se={expiry_time.strftime('%Y-%m-%dT%H:%M:%SZ')}&sr=b&sp=r&sig=abc"
+
+
+def test_vds_handle_ttl_is_ahead_of_sas_expiry() -> None:
+    expiry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+    ttl_s = _calc_vds_handle_ttl_s(_create_sas_token(expiry_time))
+    assert 50 * 60 <= ttl_s <= 55 * 60
+
+
+def test_vds_handle_ttl_for_expired_or_soon_expiring_sas() -> None:
+    expiry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=1)
+    assert _calc_vds_handle_ttl_s(_create_sas_token(expiry_time)) <= 0
+
+
+def test_vds_handle_ttl_without_valid_expiry() -> None:
+    assert _calc_vds_handle_ttl_s("sv=2022-11-02&sig=abc") == 5 * 60
+    assert _calc_vds_handle_ttl_s("sv=2022-11-02&se=not-a-date&sig=abc") == 5 * 60
+
+
+class _FakeSumoClient:
+    def __init__(self, token_scope: str | None) -> None:
+        self.token_scope = token_scope
+
+
+class _FakeCube:
+    """Cube whose auth gives a SAS token issued for the user of the Sumo client that found it"""
+
+    def __init__(self, sumo_client: _FakeSumoClient) -> None:
+        self._sumo_client = sumo_client
+
+    @property
+    async def auth_async(self) -> tuple[str, str]:
+        expiry_time = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1)
+        sas_token = f"{_create_sas_token(expiry_time)}-{self._sumo_client.token_scope}"
+        return ("https://account.blob.core.windows.net/container/cube-uuid?param=1", sas_token)
+
+
+@pytest.fixture(name="cube_searches")
+def fixture_cube_searches(monkeypatch: pytest.MonkeyPatch) -> list[str | None]:
+    seismic_access._VDS_HANDLE_CACHE.clear()  # pylint: disable=protected-access
+    cube_searches: list[str | None] = []
+
+    def _get_cube_context(self: SeismicAccess, *_args: Any) -> _FakeSumoClient:
+        # pylint: disable-next=protected-access
+        return cast(_FakeSumoClient, self._sumo_client)
+
+    async def _find_matching_cube_async(cube_context: _FakeSumoClient, *_args: Any) -> _FakeCube:
+        cube_searches.append(cube_context.token_scope)
+        return _FakeCube(cube_context)
+
+    monkeypatch.setattr(SeismicAccess, "_get_cube_context", _get_cube_context)
+    monkeypatch.setattr(seismic_access, "_find_matching_cube_async", _find_matching_cube_async)
+    monkeypatch.setattr(seismic_access, "get_sumo_client_token_scope", lambda client: client.token_scope)
+    return cube_searches
+
+
+async def _get_vds_handle_sas_async(token_scope: str | None) -> str:
+    access = SeismicAccess(cast(SumoClient, _FakeSumoClient(token_scope)), "case-uuid", "iter-0", "fingerprint")
+    vds_handle = await access.get_vds_handle_async(
+        "amplitude", SeismicRepresentation.OBSERVED_IN_CASE, None, "2018-01-01T00:00:00"
+    )
+    return vds_handle.sas_token
+
+
+async def test_vds_handles_are_cached_per_token_scope(cube_searches: list[str | None]) -> None:
+    sas_a = await _get_vds_handle_sas_async("scope-a")
+    assert await _get_vds_handle_sas_async("scope-a") == sas_a
+    assert cube_searches == ["scope-a"]
+
+    # Another user must get a handle with their own SAS token, not the cached handle of the first user
+    sas_b = await _get_vds_handle_sas_async("scope-b")
+    assert sas_b != sas_a
+    assert sas_b.endswith("-scope-b")
+    assert cube_searches == ["scope-a", "scope-b"]
+
+
+async def test_vds_handles_are_not_cached_without_token_scope(cube_searches: list[str | None]) -> None:
+    await _get_vds_handle_sas_async(None)
+    await _get_vds_handle_sas_async(None)
+    assert cube_searches == [None, None]
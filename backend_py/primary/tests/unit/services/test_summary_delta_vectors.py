@@ -2,6 +2,8 @@ import pyarrow as pa
 
 
 from webviz_services.summary_delta_vectors import (
+    AlignedVectorTable,
+    create_aligned_delta_vectors_table,
     create_delta_vector_table,
     create_realization_delta_vector_list,
     RealizationDeltaVector,
@@ -76,6 +78,39 @@ def test_create_delta_vector_table_with_different_reals() -> None:
     assert result_table.equals(expected_delta_table)
 
 
+def test_create_delta_vector_table_with_unsorted_input_and_null_values() -> None:
+    comparison_data = {"DATE": [2, 1, 2, 1], "REAL": [2, 2, 1, 1], "vector": [40.0, 30.0, None, 10.0]}
+    comparison_vector_table = pa.table(comparison_data, schema=VECTOR_TABLE_SCHEMA)
+
+    reference_data = {"DATE": [1, 2, 1, 2], "REAL": [1, 1, 2, 2], "vector": [5.0, 15.0, 25.0, 35.0]}
+    reference_vector_table = pa.table(reference_data, schema=VECTOR_TABLE_SCHEMA)
+
+    expected_delta_data = {"DATE": [1, 2, 1, 2], "REAL": [1, 1, 2, 2], "vector": [5.0, None, 5.0, 5.0]}
+    expected_delta_table = pa.table(expected_delta_data, schema=VECTOR_TABLE_SCHEMA)
+
+    result_table = create_delta_vector_table(comparison_vector_table, reference_vector_table, "vector")
+
+    assert result_table.equals(expected_delta_table)
+
+
+def test_create_aligned_delta_vectors_table_with_multiple_vectors() -> None:
+    multi_vector_schema = pa.schema(VECTOR_TABLE_FIELDS + [("vector_b", pa.float32())])
+    comparison_data = {"DATE": [1, 2, 3], "REAL": [1, 1, 1], "vector": [10.0, 20.0, 30.0], "vector_b": [1.0, 2.0, 3.0]}
+    reference_data = {"DATE": [2, 3, 4], "REAL": [1, 1, 1], "vector": [5.0, 15.0, 25.0], "vector_b": [0.5, 1.0, 1.5]}
+
+    # The same aligned reference is reused for several comparisons
+    reference = AlignedVectorTable(pa.table(reference_data, schema=multi_vector_schema))
+    comparison = AlignedVectorTable(pa.table(comparison_data, schema=multi_vector_schema))
+
+    result_table = create_aligned_delta_vectors_table(comparison, reference, ["vector", "vector_b"])
+    expected_delta_data = {"DATE": [2, 3], "REAL": [1, 1], "vector": [15.0, 15.0], "vector_b": [1.5, 2.0]}
+    assert result_table.equals(pa.table(expected_delta_data, schema=multi_vector_schema))
+
+    result_table = create_aligned_delta_vectors_table(comparison, reference, ["vector_b"])
+    assert result_table.column_names == ["DATE", "REAL", "vector_b"]
+    assert result_table["vector_b"].to_pylist() == [1.5, 2.0]
+
+
 def test_create_realization_delta_vector_list() -> None:
     # Create sample data for delta_vector_table
     delta_data = {"DATE": [1, 2, 3, 4], "REAL": [1, 1, 2, 2], "vector": [5.0, 10.0, 15.0, 20.0]}
@@ -10,6 +10,7 @@ from webviz_services.summary_derived_vectors import (
     DerivedVectorType,
     create_derived_realization_vector_list,
     create_derived_vector_unit,
+    create_derived_vectors_table_pa,
     create_per_day_vector_table_pa,
     create_per_interval_vector_table_pa,
     create_per_day_vector_name,
@@ -278,6 +279,47 @@ def test_create_per_day_vector_table_pa_invalid_column_type() -> None:
         create_per_day_vector_table_pa(input_table)
 
 
+def test_create_derived_vectors_table_pa_multiple_vectors() -> None:
+    input_table = WEEKLY_TOTAL_VECTOR_TABLE.append_column(
+        "OTHER_TOTAL_VECTOR", pa.array([0.0, 7.0, 21.0, 0.0, 14.0, 28.0, 0.0, 0.0, 70.0], type=pa.float32())
+    )
+
+    per_interval_table = create_derived_vectors_table_pa(input_table, DerivedVectorType.PER_INTERVAL)
+    assert per_interval_table.column_names == ["DATE", "REAL", "PER_INTVL_TOTAL_VECTOR", "PER_INTVL_OTHER_TOTAL_VECTOR"]
+    assert per_interval_table["PER_INTVL_TOTAL_VECTOR"].to_pylist() == [50, 50, 0, 100, 100, 0, 200, 200, 0]
+    assert per_interval_table["PER_INTVL_OTHER_TOTAL_VECTOR"].to_pylist() == [7, 14, 0, 14, 14, 0, 0, 70, 0]
+
+    per_day_table = create_derived_vectors_table_pa(input_table, DerivedVectorType.PER_DAY)
+    assert per_day_table.column_names == ["DATE", "REAL", "PER_DAY_TOTAL_VECTOR", "PER_DAY_OTHER_TOTAL_VECTOR"]
+    assert per_day_table["PER_DAY_OTHER_TOTAL_VECTOR"].to_pylist() == [1, 2, 0, 2, 2, 0, 0, 10, 0]
+
+
+def test_create_derived_vectors_table_pa_unsorted_input() -> None:
+    # Reverse the row order so that both REAL and DATE are descending
+    reversed_table = WEEKLY_TOTAL_VECTOR_TABLE.take(pa.array(range(WEEKLY_TOTAL_VECTOR_TABLE.num_rows - 1, -1, -1)))
+
+    result_table = create_derived_vectors_table_pa(reversed_table, DerivedVectorType.PER_INTERVAL)
+
+    assert result_table["DATE"].equals(WEEKLY_TOTAL_VECTOR_TABLE["DATE"])
+    assert result_table["REAL"].equals(WEEKLY_TOTAL_VECTOR_TABLE["REAL"])
+    assert result_table["PER_INTVL_TOTAL_VECTOR"].to_pylist() == [50, 50, 0, 100, 100, 0, 200, 200, 0]
+
+
+def test_create_derived_vectors_table_pa_null_values() -> None:
+    input_table = pa.table(
+        {
+            "DATE": WEEKLY_TOTAL_VECTOR_TABLE["DATE"],
+            "REAL": WEEKLY_TOTAL_VECTOR_TABLE["REAL"],
+            "TOTAL_VECTOR": pa.array([50.0, None, 150.0, 300.0, 400.0, 500.0, 1000.0, 1200.0, None], type=pa.float32()),
+        }
+    )
+
+    result_table = create_derived_vectors_table_pa(input_table, DerivedVectorType.PER_INTERVAL)
+
+    # Intervals starting or ending in a null value are set to 0.0
+    assert result_table["PER_INTVL_TOTAL_VECTOR"].to_pylist() == [0, 0, 0, 100, 100, 0, 200, 0, 0]
+
+
 def test_create_derived_realization_vector_list() -> None:
     # Create a sample derived vector table
     derived_vector_table = pa.table(
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from webviz_services.user_grid3d_service.user_grid3d_service import _build_vtk_style_polys
+
+
+def _build_vtk_style_polys_reference(poly_indices: list[int], vertices_per_poly: list[int]) -> list[int]:
+    ret_list: list[int] = []
+    src_idx = 0
+    for num_verts in vertices_per_poly:
+        ret_list.append(num_verts)
+        ret_list.extend(poly_indices[src_idx : src_idx + num_verts])
+        src_idx += num_verts
+    return ret_list
+
+
+def test_mixed_polys() -> None:
+    vertices_per_poly = [3, 4, 5, 3]
+    poly_indices = list(range(100, 100 + sum(vertices_per_poly)))
+
+    polys_arr = _build_vtk_style_polys(poly_indices, vertices_per_poly)
+    assert polys_arr.dtype == np.uint32
+    assert polys_arr.tolist() == _build_vtk_style_polys_reference(poly_indices, vertices_per_poly)
+
+
+def test_empty_and_mismatched_input() -> None:
+    assert len(_build_vtk_style_polys([], [])) == 0
+
+    with pytest.raises(ValueError):
+        _build_vtk_style_polys([0, 1, 2], [4])
+
+
+def test_random_polys_match_reference() -> None:
+    rng = np.random.default_rng(seed=42)
+    num_polys = 1000
+    vertices_per_poly = np.where(rng.random(num_polys) < 0.1, 3, 4).astype(np.uint8)
+    poly_indices = rng.integers(0, 4 * num_polys, size=int(vertices_per_poly.sum()), dtype=np.uint32)
+
+    polys_arr = _build_vtk_style_polys(poly_indices, vertices_per_poly)
+    assert polys_arr.tolist() == _build_vtk_style_polys_reference(poly_indices.tolist(), vertices_per_poly.tolist())
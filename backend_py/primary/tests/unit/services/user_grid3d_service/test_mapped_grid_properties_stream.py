@@ -0,0 +1,216 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import cast
+
+import httpx
+import numpy as np
+import pytest
+from sumo.wrapper import SumoClient
+
+from webviz_core_utils.binary_payload import BinaryPayloadWriter, make_length_prefixed_frame
+from webviz_server_schemas.user_grid3d_ri import api_schemas as server_api_schemas
+
+from webviz_services.service_exceptions import ServiceRequestError, ServiceTimeoutError
+from webviz_services.user_grid3d_service import user_grid3d_service
+from webviz_services.user_grid3d_service.user_grid3d_service import MappedGridPropertiesFrame, UserGrid3dService
+
+# Time steps and the property blobs they resolve to, note that two time steps share a blob
+_PROPERTY_BLOB_IDS_BY_TIME = {
+    "2018-01-01T00:00:00": "blob-a",
+    "2018-01-01T00:00:00Z": "blob-a",
+    "2018-07-01T00:00:00": "blob-b",
+}
+
+_RequestHandler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+def _make_property_frame(blob_id: str, values: list[float]) -> bytes:
+    writer = BinaryPayloadWriter()
+    header = server_api_schemas.MappedGridPropertiesFrameHeader(
+        property_blob_object_uuid=blob_id,
+        poly_props=writer.add_array(np.array(values, dtype=np.float32)),
+        undefined_int_value=None,
+        min_grid_prop_value=min(values),
+        max_grid_prop_value=max(values),
+    )
+    return make_length_prefixed_frame(writer.to_bytes(header))
+
+
+def _make_error_frame(blob_id: str, error_message: str) -> bytes:
+    header = server_api_schemas.MappedGridPropertiesFrameHeader(
+        property_blob_object_uuid=blob_id,
+        poly_props=None,
+        undefined_int_value=None,
+        min_grid_prop_value=None,
+        max_grid_prop_value=None,
+        error_message=error_message,
+    )
+    return make_length_prefixed_frame(BinaryPayloadWriter().to_bytes(header))
+
+
+class _FakeUserSession:
+    """Stands in for the user session, and for the Sumo query resolving the blob ids"""
+
+    def __init__(self, handler: _RequestHandler) -> None:
+        self._handler = handler
+        self.requested_time_strs: list[str] = []
+        self.request_bodies: list[server_api_schemas.MappedGridPropertiesBatchRequest] = []
+
+    async def get_blob_ids_async(self, *args: object) -> tuple[str, dict[str, str]]:
+        time_strs = cast(list[str], args[-1])
+        self.requested_time_strs.extend(time_strs)
+        return ("grid-blob", {time_str: _PROPERTY_BLOB_IDS_BY_TIME[time_str] for time_str in time_strs})
+
+    async def handle_request_async(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        self.request_bodies.append(server_api_schemas.MappedGridPropertiesBatchRequest.model_validate_json(body))
+        return await self._handler(request)
+
+
+_PatchUserSession = Callable[[_RequestHandler], _FakeUserSession]
+
+
+@pytest.fixture(name="patch_user_session")
+def fixture_patch_user_session(
+    monkeypatch: pytest.MonkeyPatch,
+) -> _PatchUserSession:
+    def _patch(handler: _RequestHandler) -> _FakeUserSession:
+        user_session = _FakeUserSession(handler)
+        monkeypatch.setattr(
+            user_grid3d_service,
+            "get_grid_geometry_and_property_blob_ids_for_time_steps_async",
+            user_session.get_blob_ids_async,
+        )
+
+        real_async_client = httpx.AsyncClient
+
+        def _make_client(timeout: float) -> httpx.AsyncClient:
+            return real_async_client(transport=httpx.MockTransport(user_session.handle_request_async), timeout=timeout)
+
+        monkeypatch.setattr(user_grid3d_service.httpx, "AsyncClient", _make_client)
+        return user_session
+
+    return _patch
+
+
+async def _start_frame_stream_async(time_strs: list[str]) -> AsyncIterator[MappedGridPropertiesFrame]:
+    service = UserGrid3dService(
+        session_base_url="http://user-session",
+        sumo_client=cast(SumoClient, None),
+        case_uuid="case-uuid",
+        sas_token="sas-token",
+        blob_store_base_uri="https://blob-store",
+    )
+    return await service.get_mapped_grid_properties_for_time_steps_stream_async(
+        ensemble_name="iter-0",
+        realization=1,
+        grid_name="Geogrid",
+        property_name="PRESSURE",
+        property_time_or_interval_strs=time_strs,
+        ijk_index_filter=None,
+    )
+
+
+async def _get_frames_async(time_strs: list[str]) -> list[MappedGridPropertiesFrame]:
+    return [frame async for frame in await _start_frame_stream_async(time_strs)]
+
+
+async def test_one_frame_per_unique_time_step_when_time_steps_share_a_blob(
+    patch_user_session: _PatchUserSession,
+) -> None:
+    async def _handler_async(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=_make_property_frame("blob-b", [3.0]) + _make_property_frame("blob-a", [1.0])
+        )
+
+    user_session = patch_user_session(_handler_async)
+    time_strs = ["2018-01-01T00:00:00", "2018-07-01T00:00:00", "2018-01-01T00:00:00Z", "2018-07-01T00:00:00"]
+    frames = await _get_frames_async(time_strs)
+
+    # Duplicate time steps are requested once, and each blob is only requested once from the user session
+    assert user_session.requested_time_strs == ["2018-01-01T00:00:00", "2018-07-01T00:00:00", "2018-01-01T00:00:00Z"]
+    assert user_session.request_bodies[0].property_blob_object_uuids == ["blob-a", "blob-b"]
+
+    values_by_time_str = {frame.property_time_or_interval_str: frame.poly_props_arr for frame in frames}
+    assert len(frames) == 3
+    assert {time_str: cast(np.ndarray, values).tolist() for time_str, values in values_by_time_str.items()} == {
+        "2018-01-01T00:00:00": [1.0],
+        "2018-01-01T00:00:00Z": [1.0],
+        "2018-07-01T00:00:00": [3.0],
+    }
+    assert all(frame.error_message is None for frame in frames)
+
+
+async def test_user_session_error_frames_are_passed_on(patch_user_session: _PatchUserSession) -> None:
+    async def _handler_async(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=_make_error_frame("blob-a", "Failed") + _make_property_frame("blob-b", [3.0])
+        )
+
+    patch_user_session(_handler_async)
+    frames = await _get_frames_async(list(_PROPERTY_BLOB_IDS_BY_TIME))
+
+    errors_by_time_str = {frame.property_time_or_interval_str: frame.error_message for frame in frames}
+    assert errors_by_time_str == {
+        "2018-01-01T00:00:00": "Failed",
+        "2018-01-01T00:00:00Z": "Failed",
+        "2018-07-01T00:00:00": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "response_or_exception, expected_error",
+    [
+        (httpx.Response(500, text="Failed to download grid blob"), ServiceRequestError),
+        (httpx.ConnectError("Connection refused"), ServiceRequestError),
+        (httpx.ReadTimeout("Timed out"), ServiceTimeoutError),
+    ],
+)
+async def test_failure_to_start_stream_raises(
+    patch_user_session: _PatchUserSession,
+    response_or_exception: httpx.Response | Exception,
+    expected_error: type[Exception],
+) -> None:
+    async def _handler_async(_request: httpx.Request) -> httpx.Response:
+        if isinstance(response_or_exception, Exception):
+            raise response_or_exception
+        return response_or_exception
+
+    patch_user_session(_handler_async)
+
+    # Raised before any frame is iterated, so the router can still respond with an HTTP error
+    with pytest.raises(expected_error):
+        await _start_frame_stream_async(["2018-07-01T00:00:00"])
+
+
+async def test_failure_after_stream_started_gives_error_frames(patch_user_session: _PatchUserSession) -> None:
+    async def _broken_stream_async() -> AsyncIterator[bytes]:
+        yield _make_property_frame("blob-b", [3.0])
+        raise httpx.ReadError("Connection reset")
+
+    async def _handler_async(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_broken_stream_async())
+
+    patch_user_session(_handler_async)
+    frames = await _get_frames_async(list(_PROPERTY_BLOB_IDS_BY_TIME))
+
+    errors_by_time_str = {frame.property_time_or_interval_str: frame.error_message for frame in frames}
+    assert errors_by_time_str == {
+        "2018-07-01T00:00:00": None,
+        "2018-01-01T00:00:00": "Streaming from user session failed: ReadError",
+        "2018-01-01T00:00:00Z": "Streaming from user session failed: ReadError",
+    }
+
+
+async def test_time_steps_missing_from_stream_give_error_frames(patch_user_session: _PatchUserSession) -> None:
+    async def _handler_async(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=_make_property_frame("blob-b", [3.0]))
+
+    patch_user_session(_handler_async)
+    frames = await _get_frames_async(["2018-01-01T00:00:00", "2018-07-01T00:00:00"])
+
+    errors_by_time_str = {frame.property_time_or_interval_str: frame.error_message for frame in frames}
+    assert errors_by_time_str == {
+        "2018-07-01T00:00:00": None,
+        "2018-01-01T00:00:00": "No data received from user session",
+    }
+    assert frames[1].poly_props_arr is None
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from webviz_core_utils import b64
+from webviz_core_utils.binary_payload import BinaryPayloadWriter, split_binary_payload
+from webviz_core_utils.binary_payload import as_smallest_int_array, as_smallest_uint_array
+from webviz_server_schemas.user_grid3d_ri import api_schemas as server_api_schemas
+
+from webviz_services.user_grid3d_service.user_grid3d_service import _fence_mesh_section_from_binary_payload
+
+
+def _make_intersection_payload(poly_indices: list[int], poly_props_arr_np: np.ndarray) -> bytes:
+    # Assembled the same way as by the polyline intersection endpoint of the user session
+    writer = BinaryPayloadWriter()
+    section = server_api_schemas.FenceMeshSectionBinaryHeader(
+        vertices_uz=writer.add_array(np.array([0.0, -1000.5, 10.0, -1001.25], dtype=np.float32)),
+        poly_indices=writer.add_array(as_smallest_uint_array(poly_indices, max(poly_indices))),
+        vertices_per_poly=writer.add_array(np.array([3, 4], dtype=np.uint8)),
+        poly_source_cell_indices=writer.add_array(np.array([0, 2**32 - 1], dtype=np.uint32)),
+        poly_props=writer.add_array(poly_props_arr_np),
+        start_utm_x=1.0,
+        start_utm_y=2.0,
+        end_utm_x=3.0,
+        end_utm_y=4.0,
+    )
+    header = server_api_schemas.PolylineIntersectionBinaryHeader(
+        fence_mesh_sections=[section],
+        grid_dimensions=server_api_schemas.GridDimensions(i_count=10, j_count=20, k_count=30),
+        undefined_int_value=None,
+        min_grid_prop_value=-1,
+        max_grid_prop_value=1,
+        stats=None,
+    )
+    return writer.to_bytes(header)
+
+
+def _parse_intersection_payload(payload: bytes) -> server_api_schemas.PolylineIntersectionBinaryHeader:
+    header_bytes, _buffers_view = split_binary_payload(payload)
+    return server_api_schemas.PolylineIntersectionBinaryHeader.model_validate_json(header_bytes)
+
+
+@pytest.mark.parametrize(
+    "max_poly_index, expected_element_type", [(255, "uint8"), (65535, "uint16"), (65536, "uint32")]
+)
+def test_poly_indices_round_trip(max_poly_index: int, expected_element_type: str) -> None:
+    poly_indices = [0, 1, 2, 0, 1, max_poly_index - 1, max_poly_index]
+    payload = _make_intersection_payload(poly_indices, np.array([0.5, np.nan], dtype=np.float32))
+
+    header = _parse_intersection_payload(payload)
+    assert header.grid_dimensions.k_count == 30
+    assert len(header.fence_mesh_sections) == 1
+
+    _header_bytes, buffers_view = split_binary_payload(payload)
+    section = _fence_mesh_section_from_binary_payload(header.fence_mesh_sections[0], buffers_view)
+
+    assert section.poly_indices_b64arr.element_type == expected_element_type
+    assert b64.b64_decode_uint_array(section.poly_indices_b64arr).tolist() == poly_indices
+    assert b64.b64_decode_uint_array(section.vertices_per_poly_b64arr).tolist() == [3, 4]
+    assert b64.b64_decode_uint_array(section.poly_source_cell_indices_b64arr).tolist() == [0, 2**32 - 1]
+    assert b64.b64_decode_float_array(section.vertices_uz_b64arr).tolist() == [0.0, -1000.5, 10.0, -1001.25]
+    assert (section.start_utm_x, section.start_utm_y, section.end_utm_x, section.end_utm_y) == (1.0, 2.0, 3.0, 4.0)
+
+    props_arr = b64.b64_decode_float_array(section.poly_props_b64arr)
+    assert props_arr[0] == 0.5
+    assert np.isnan(props_arr[1])
+
+
+@pytest.mark.parametrize(
+    "min_value, max_value, expected_dtype",
+    [(-128, 127, np.int8), (-32768, 32767, np.int16), (-(2**31), 2**31 - 1, np.int32)],
+)
+def test_discrete_props_are_converted_to_float32(min_value: int, max_value: int, expected_dtype: type) -> None:
+    int_props_arr = as_smallest_int_array(np.array([min_value, max_value]), min_value, max_value)
+    assert int_props_arr.dtype == expected_dtype
+
+    payload = _make_intersection_payload([0, 1, 2, 0, 1, 2, 3], int_props_arr)
+    header = _parse_intersection_payload(payload)
+    assert header.fence_mesh_sections[0].poly_props.element_type == np.dtype(expected_dtype).name
+
+    _header_bytes, buffers_view = split_binary_payload(payload)
+    section = _fence_mesh_section_from_binary_payload(header.fence_mesh_sections[0], buffers_view)
+
+    assert section.poly_props_b64arr.element_type == "float32"
+    props_arr = b64.b64_decode_float_array(section.poly_props_b64arr)
+    assert props_arr.tolist() == np.array([min_value, max_value], dtype=np.float32).tolist()
+
+
+def test_truncated_payload() -> None:
+    payload = _make_intersection_payload([0, 1, 2, 0, 1, 2, 3], np.array([0.5, 1.5], dtype=np.float32))
+
+    with pytest.raises(ValueError):
+        split_binary_payload(payload[:12])
+
+    # The header is intact, but the buffers it references are not
+    header = _parse_intersection_payload(payload[:-4])
+    _header_bytes, buffers_view = split_binary_payload(payload[:-4])
+    with pytest.raises(ValueError):
+        _fence_mesh_section_from_binary_payload(header.fence_mesh_sections[0], buffers_view)
@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+
+from webviz_services.utils.single_flight import SingleFlight, SingleFlightStats, make_token_scope
+
+
+class _Work:
+    """Work function that blocks until released, counting how many times it has been started"""
+
+    def __init__(self, result: str = "result") -> None:
+        self.result = result
+        self.call_count = 0
+        self.release = asyncio.Event()
+        self.cancelled = False
+
+    async def __call__(self) -> str:
+        self.call_count += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.result
+
+
+class _WorkError(Exception):
+    pass
+
+
+async def test_concurrent_identical_keys_run_work_once() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_coalescing")
+    work = _Work()
+
+    tasks = [asyncio.create_task(single_flight.run_async("key", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    assert single_flight.get_stats() == SingleFlightStats(executed=1, coalesced=2, in_flight=1)
+
+    work.release.set()
+    assert await asyncio.gather(*tasks) == ["result", "result", "result"]
+    assert work.call_count == 1
+
+
+async def test_different_keys_run_separately() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_different_keys")
+    work_a = _Work("a")
+    work_b = _Work("b")
+    work_a.release.set()
+    work_b.release.set()
+
+    results = await asyncio.gather(single_flight.run_async("key-a", work_a), single_flight.run_async("key-b", work_b))
+
+    assert results == ["a", "b"]
+    assert (work_a.call_count, work_b.call_count) == (1, 1)
+    assert single_flight.get_stats() == SingleFlightStats(executed=2, coalesced=0, in_flight=0)
+
+
+async def test_exception_is_raised_for_all_waiters() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_exception_fan_out")
+    call_count = 0
+
+    async def _failing_work_async() -> str:
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0)
+        raise _WorkError("failed")
+
+    results = await asyncio.gather(
+        *[single_flight.run_async("key", _failing_work_async) for _ in range(3)], return_exceptions=True
+    )
+
+    assert call_count == 1
+    assert len(results) == 3
+    assert all(isinstance(result, _WorkError) for result in results)
+
+
+async def test_cancelling_one_waiter_leaves_work_and_other_waiters_running() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_cancel_waiter")
+    work = _Work()
+
+    cancelled_waiter = asyncio.create_task(single_flight.run_async("key", work))
+    other_waiter = asyncio.create_task(single_flight.run_async("key", work))
+    await asyncio.sleep(0)
+
+    cancelled_waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled_waiter
+
+    # The shared work is still in flight, and the remaining waiter gets its result
+    assert not work.cancelled
+    assert not other_waiter.done()
+    assert single_flight.get_stats().in_flight == 1
+
+    work.release.set()
+    assert await other_waiter == "result"
+    assert work.call_count == 1
+
+
+async def test_key_is_released_after_completion() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_key_cleanup")
+    work = _Work()
+    work.release.set()
+
+    assert await single_flight.run_async("key", work) == "result"
+    assert single_flight.get_stats().in_flight == 0
+
+    # A later call for the same key runs the work again rather than reusing the earlier result
+    assert await single_flight.run_async("key", work) == "result"
+    assert work.call_count == 2
+    assert single_flight.get_stats() == SingleFlightStats(executed=2, coalesced=0, in_flight=0)
+
+
+async def test_key_is_released_after_failure() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_key_cleanup_after_failure")
+
+    async def _failing_work_async() -> str:
+        raise _WorkError("failed")
+
+    with pytest.raises(_WorkError):
+        await single_flight.run_async("key", _failing_work_async)
+
+    # Failures are not cached, so a retry runs the work again
+    work = _Work()
+    work.release.set()
+    assert await single_flight.run_async("key", work) == "result"
+    assert single_flight.get_stats().in_flight == 0
+
+
+async def test_token_scopes_are_isolated() -> None:
+    single_flight: SingleFlight[str] = SingleFlight("test_token_scope")
+    work_token_a = _Work("token-a")
+    work_token_b = _Work("token-b")
+
+    scope_a = make_token_scope("token-a")
+    scope_b = make_token_scope("token-b")
+    assert scope_a == make_token_scope("token-a")
+    assert scope_a != scope_b
+    assert "token-a" not in scope_a
+
+    tasks = [
+        asyncio.create_task(single_flight.run_async((scope_a, "key"), work_token_a)),
+        asyncio.create_task(single_flight.run_async((scope_a, "key"), work_token_a)),
+        asyncio.create_task(single_flight.run_async((scope_b, "key"), work_token_b)),
+    ]
+    await asyncio.sleep(0)
+
+    # Calls are only coalesced within the same token scope
+    assert single_flight.get_stats() == SingleFlightStats(executed=2, coalesced=1, in_flight=2)
+
+    work_token_a.release.set()
+    work_token_b.release.set()
+    assert await asyncio.gather(*tasks) == ["token-a", "token-a", "token-b"]
+    assert (work_token_a.call_count, work_token_b.call_count) == (1, 1)
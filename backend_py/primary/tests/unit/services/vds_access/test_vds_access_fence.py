@@ -0,0 +1,96 @@
+import asyncio
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from webviz_services.vds_access import vds_access
+from webviz_services.vds_access.request_types import VdsCoordinates, VdsFenceRequest, VdsRequestedResource
+from webviz_services.vds_access.vds_access import VdsAccess
+
+NUM_SAMPLES_PER_TRACE = 3
+FILL_VALUE = -999.25
+
+
+def _create_fence_response(request: VdsFenceRequest) -> httpx.Response:
+    """Fake fence response where the samples of a trace are (x, y, fill value), i.e. the last sample is outside the cube"""
+    x_points = np.asarray(request.coordinates.x_points, dtype=np.float32)
+    y_points = np.asarray(request.coordinates.y_points, dtype=np.float32)
+    traces = np.column_stack([x_points, y_points, np.full_like(x_points, FILL_VALUE)])
+
+    metadata = json.dumps({"format": "<f4", "shape": list(traces.shape)}).encode()
+    boundary = b"fence-boundary"
+    content = (
+        b"--" + boundary + b"\r\nContent-Type: application/json\r\n\r\n" + metadata + b"\r\n"
+        b"--"
+        + boundary
+        + b"\r\nContent-Type: application/octet-stream\r\n\r\n"
+        + traces.astype("<f4").tobytes()
+        + b"\r\n"
+        b"--" + boundary + b"--\r\n"
+    )
+    return httpx.Response(200, content=content, headers={"Content-Type": "multipart/mixed; boundary=fence-boundary"})
+
+
+@pytest.fixture(name="fence_requests")
+def fixture_fence_requests(monkeypatch: pytest.MonkeyPatch) -> list[VdsFenceRequest]:
+    fence_requests: list[VdsFenceRequest] = []
+
+    async def fake_query_async(_endpoint: str, request: VdsRequestedResource) -> httpx.Response:
+        assert isinstance(request, VdsFenceRequest)
+        fence_requests.append(request)
+        return _create_fence_response(request)
+
+    monkeypatch.setattr(VdsAccess, "_query_async", staticmethod(fake_query_async))
+    monkeypatch.setattr(vds_access, "_FENCE_CHUNK_NUM_TRACES", 4)
+    vds_access._FENCE_CHUNK_CACHE.clear()  # pylint: disable=protected-access
+    return fence_requests
+
+
+def test_fence_is_fetched_in_chunks_and_stitched(fence_requests: list[VdsFenceRequest]) -> None:
+    access = VdsAccess(sas_token="sas", vds_url="https://vds/chunks")
+    x_points = [float(i) for i in range(10)]
+    y_points = [float(i + 100) for i in range(10)]
+
+    traces, num_traces, num_samples_per_trace = asyncio.run(
+        access.get_flattened_fence_traces_array_and_metadata_async(VdsCoordinates(x_points, y_points))
+    )
+
+    assert [len(request.coordinates.x_points) for request in fence_requests] == [4, 4, 2]
+    assert num_traces == 10
+    assert num_samples_per_trace == NUM_SAMPLES_PER_TRACE
+
+    traces_2d = traces.reshape(num_traces, num_samples_per_trace)
+    assert traces_2d[:, 0].tolist() == x_points
+    assert traces_2d[:, 1].tolist() == y_points
+    assert np.isnan(traces_2d[:, 2]).all()
+
+
+def test_extended_fence_reuses_cached_chunks(fence_requests: list[VdsFenceRequest]) -> None:
+    access = VdsAccess(sas_token="sas", vds_url="https://vds/extend")
+    x_points = [float(i) for i in range(8)]
+
+    asyncio.run(access.get_flattened_fence_traces_array_and_metadata_async(VdsCoordinates(x_points, x_points)))
+    assert len(fence_requests) == 2
+
+    extended_x_points = x_points + [8.0, 9.0]
+    traces, num_traces, _ = asyncio.run(
+        access.get_flattened_fence_traces_array_and_metadata_async(VdsCoordinates(extended_x_points, extended_x_points))
+    )
+    assert len(fence_requests) == 3
+    assert fence_requests[-1].coordinates.x_points == [8.0, 9.0]
+    assert traces.reshape(num_traces, -1)[:, 0].tolist() == extended_x_points
+
+
+def test_fence_decimation(fence_requests: list[VdsFenceRequest]) -> None:
+    access = VdsAccess(sas_token="sas", vds_url="https://vds/decimate")
+    x_points = [float(i) for i in range(101)]
+
+    traces, num_traces, num_samples_per_trace = asyncio.run(
+        access.get_flattened_fence_traces_array_and_metadata_async(VdsCoordinates(x_points, x_points), max_num_traces=5)
+    )
+
+    assert len(fence_requests) == 2
+    assert num_traces == 5
+    assert traces.reshape(num_traces, num_samples_per_trace)[:, 0].tolist() == [0.0, 25.0, 50.0, 75.0, 100.0]
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+from primary.utils.event_loop_monitor import EventLoopMonitor, attribute_event_loop_time_to_request
+
+
+class _FakeRoute:
+    path = "/blocking/{item_id}"
+
+
+async def test_blocking_callbacks_are_attributed_to_route() -> None:
+    monitor = EventLoopMonitor(lag_sample_interval_s=0.01, slow_callback_threshold_s=0.05)
+    monitor.start()
+
+    async def handle_request_async() -> None:
+        attribute_event_loop_time_to_request({"type": "http", "route": _FakeRoute()})
+        await asyncio.sleep(0)
+        time.sleep(0.08)
+
+    async def background_work_async() -> None:
+        await asyncio.sleep(0)
+        time.sleep(0.06)
+
+    try:
+        await asyncio.create_task(handle_request_async())
+        await asyncio.create_task(background_work_async())
+        await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop_async()
+
+    offenders = monitor.get_worst_offenders()
+    assert [offender.route for offender in offenders] == ["/blocking/{item_id}", "<no request>"]
+    assert offenders[0].slow_callback_count == 1
+    assert offenders[0].max_blocked_ms >= 80
+    assert offenders[0].max_blocked_coroutine is not None
+    assert "handle_request_async" in offenders[0].max_blocked_coroutine
+
+    # The blocking should also have shown up as lag of the event loop
+    assert monitor.get_lag_stats().max_lag_ms >= 40
+
+
+async def test_callback_timing_is_uninstalled_on_stop() -> None:
+    # pylint: disable=protected-access
+    original_handle_run = asyncio.Handle._run
+
+    monitor = EventLoopMonitor()
+    monitor.start()
+    assert asyncio.Handle._run is not original_handle_run
+
+    await monitor.stop_async()
+    assert asyncio.Handle._run is original_handle_run
@@ -0,0 +1,24 @@
+import pytest
+
+from primary.utils.http_etag import make_strong_etag, is_etag_matched_by_if_none_match
+
+
+def test_make_strong_etag() -> None:
+    assert make_strong_etag("abc123") == '"abc123"'
+
+    with pytest.raises(ValueError):
+        make_strong_etag('abc"123')
+
+
+def test_if_none_match() -> None:
+    etag = make_strong_etag("abc123")
+
+    assert is_etag_matched_by_if_none_match('"abc123"', etag)
+    assert is_etag_matched_by_if_none_match('W/"abc123"', etag)
+    assert is_etag_matched_by_if_none_match('"other", "abc123"', etag)
+    assert is_etag_matched_by_if_none_match("*", etag)
+
+    assert not is_etag_matched_by_if_none_match(None, etag)
+    assert not is_etag_matched_by_if_none_match("", etag)
+    assert not is_etag_matched_by_if_none_match('"abc1234"', etag)
+    assert not is_etag_matched_by_if_none_match("abc123", etag)
@@ -0,0 +1,47 @@
+import asyncio
+
+import pyarrow as pa
+
+from webviz_core_utils.metrics_registry import MetricsRegistry
+
+from primary.utils.memory_monitor import MemoryMonitor, collect_memory_metrics
+
+
+class _FakeRoute:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+
+async def test_peak_arrow_allocation_is_attributed_to_route() -> None:
+    monitor = MemoryMonitor(sample_interval_s=0.01)
+    monitor.start()
+
+    try:
+        with monitor.track_request({"type": "http", "route": _FakeRoute("/large")}):
+            table = pa.table({"values": pa.array(range(1_000_000), type=pa.int64())})
+            await asyncio.sleep(0.05)
+            del table
+
+        with monitor.track_request({"type": "http", "route": _FakeRoute("/small")}):
+            await asyncio.sleep(0.05)
+    finally:
+        await monitor.stop_async()
+
+    top_routes = monitor.get_top_routes()
+    assert {stats.route for stats in top_routes} == {"/large", "/small"}
+
+    large_stats = next(stats for stats in top_routes if stats.route == "/large")
+    assert large_stats.request_count == 1
+    assert large_stats.max_peak_arrow_delta_bytes >= 8_000_000
+
+    small_stats = next(stats for stats in top_routes if stats.route == "/small")
+    assert small_stats.max_peak_arrow_delta_bytes == 0
+
+
+def test_memory_metrics_are_collected() -> None:
+    registry = MetricsRegistry()
+    registry.register_collector(collect_memory_metrics)
+
+    text = registry.to_prometheus_text()
+    assert "webviz_process_peak_rss_bytes " in text
+    assert "webviz_arrow_total_allocated_bytes " in text
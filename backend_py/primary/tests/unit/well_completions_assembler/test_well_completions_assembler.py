@@ -0,0 +1,117 @@
+import asyncio
+import datetime
+from typing import cast
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from webviz_services.sumo_access.well_completions_access import WellCompletionsAccess
+from webviz_services.well_completions_assembler.well_completions_assembler import WellCompletionsAssembler
+from webviz_services.well_completions_assembler.well_completions_assembler import (
+    _estimate_well_completions_data_nbytes,
+)
+
+
+class _FakeWellCompletionsAccess:
+    def __init__(self, table: pa.Table) -> None:
+        self.case_uuid = "case"
+        self.ensemble_name = "ens"
+        self.num_fetches = 0
+        self._table = table
+
+    async def get_well_completions_table_async(self) -> pa.Table:
+        self.num_fetches += 1
+        return self._table
+
+    async def get_well_completions_single_realization_table_async(self, realization: int) -> pa.Table:
+        self.num_fetches += 1
+        return self._table.filter(pc.is_in(self._table["REAL"], value_set=pa.array([realization])))
+
+
+def _create_well_completions_table() -> pa.Table:
+    date_1 = datetime.datetime(2020, 1, 1)
+    date_2 = datetime.datetime(2021, 1, 1)
+    rows = [
+        # WELL, DATE, ZONE, REAL, OP/SH, KH
+        ("W1", date_2, "Z1", 0, "SHUT", 2.0),
+        ("W1", date_1, "Z1", 0, "OPEN", 1.0),
+        ("W1", date_1, "Z1", 1, "OPEN", 2.0),
+        ("W1", date_2, "Z1", 1, "OPEN", None),
+        ("W1", date_1, "Z2", 0, "SHUT", 10.0),
+        ("W2", date_2, "Z1", 1, "OPEN", 5.0),
+    ]
+    wells, dates, zones, reals, op_sh, kh = zip(*rows)
+    return pa.table(
+        {
+            "WELL": wells,
+            "DATE": pa.array(dates, type=pa.timestamp("ms")),
+            "ZONE": zones,
+            "REAL": pa.array(reals, type=pa.int16()),
+            "OP/SH": op_sh,
+            "KH": pa.array(kh, type=pa.float32()),
+        }
+    )
+
+
+def _create_assembler(access: _FakeWellCompletionsAccess, ensemble_fingerprint: str | None) -> WellCompletionsAssembler:
+    return WellCompletionsAssembler(cast(WellCompletionsAccess, access), ensemble_fingerprint=ensemble_fingerprint)
+
+
+def test_create_well_completions_data() -> None:
+    assembler = _create_assembler(_FakeWellCompletionsAccess(_create_well_completions_table()), None)
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=None))
+    data = assembler.create_well_completions_data()
+
+    assert data.sorted_completion_dates == ["2020-01-01", "2021-01-01"]
+    assert [zone.name for zone in data.zones] == ["Z1", "Z2"]
+    assert [well.name for well in data.wells] == ["W1", "W2"]
+
+    w1_z1 = data.wells[0].completions["Z1"]
+    assert w1_z1.sorted_completion_date_indices == [0, 1]
+    assert w1_z1.open == [1.0, 0.5]
+    assert w1_z1.shut == [0.0, 0.5]
+    assert w1_z1.kh_mean == [1.5, 2.0]
+    assert w1_z1.kh_min == [1.0, 2.0]
+    assert w1_z1.kh_max == [2.0, 2.0]
+
+    w1_z2 = data.wells[0].completions["Z2"]
+    assert w1_z2.sorted_completion_date_indices == [0]
+    assert w1_z2.shut == [0.5]
+
+    w2_z1 = data.wells[1].completions["Z1"]
+    assert w2_z1.sorted_completion_date_indices == [1]
+    assert w2_z1.kh_mean == [5.0]
+
+
+def test_assembled_data_is_cached_per_fingerprint_and_realizations() -> None:
+    access = _FakeWellCompletionsAccess(_create_well_completions_table())
+
+    assembler = _create_assembler(access, "fp-cache-test")
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=[1, 0]))
+    first_data = assembler.create_well_completions_data()
+
+    assembler = _create_assembler(access, "fp-cache-test")
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=[0, 1]))
+    assert assembler.create_well_completions_data() is first_data
+    assert access.num_fetches == 1
+
+    assembler = _create_assembler(access, "fp-cache-test")
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=[1]))
+    assert assembler.create_well_completions_data().wells[0].completions["Z1"].open == [1.0, 1.0]
+    assert access.num_fetches == 2
+
+
+def test_single_realization_without_data_gives_no_wells() -> None:
+    assembler = _create_assembler(_FakeWellCompletionsAccess(_create_well_completions_table()), None)
+    asyncio.run(assembler.fetch_and_initialize_well_completions_single_realization_table_data_async(realization=5))
+
+    assert assembler.create_well_completions_data().wells == []
+
+
+def test_estimated_size_of_cached_data() -> None:
+    assembler = _create_assembler(_FakeWellCompletionsAccess(_create_well_completions_table()), None)
+    asyncio.run(assembler.fetch_and_initialize_well_completions_table_data_async(realizations=None))
+    data = assembler.create_well_completions_data()
+
+    # Six value lists for each of the four (well, zone, date) combinations
+    assert _estimate_well_completions_data_nbytes(data) == 6 * 4 * 32
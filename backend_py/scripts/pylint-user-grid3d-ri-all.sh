@@ -12,7 +12,8 @@ status=0
 for path in \
     libs/core_utils/src/webviz_core_utils \
     libs/server_schemas/src/webviz_server_schemas \
-    user_grid3d_ri/user_grid3d_ri
+    user_grid3d_ri/user_grid3d_ri \
+    user_grid3d_ri/tests
 do
     echo
     echo "Running pylint on: $path"
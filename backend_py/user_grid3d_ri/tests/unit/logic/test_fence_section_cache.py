@@ -0,0 +1,186 @@
+import numpy as np
+import pytest
+
+from user_grid3d_ri.logic import fence_section_cache
+from user_grid3d_ri.logic.fence_section_cache import FenceSectionGeometry, PolylineSegment
+from user_grid3d_ri.logic.fence_section_cache import assign_sections_to_segments, split_polyline_into_segments
+from user_grid3d_ri.logic.fence_section_cache import find_runs_of_missing_segments, store_run_sections
+from user_grid3d_ri.logic.fence_section_cache import get_cached_segment_sections
+
+_GRID_UUID = "grid-uuid"
+
+# Polyline with points at (0,0), (100,0), (100,100), (0,100) and (0,200)
+_POLYLINE_UTM_XY = [0.0, 0.0, 100.0, 0.0, 100.0, 100.0, 0.0, 100.0, 0.0, 200.0]
+
+
+@pytest.fixture(autouse=True)
+def fixture_clear_segment_sections_cache() -> None:
+    fence_section_cache._SEGMENT_SECTIONS_CACHE.clear()  # pylint: disable=protected-access
+
+
+def _make_section(start_xy: tuple[float, float], end_xy: tuple[float, float]) -> FenceSectionGeometry:
+    return FenceSectionGeometry(
+        vertices_uz=np.zeros(8, dtype=np.float32),
+        poly_indices=np.arange(4, dtype=np.uint32),
+        vertices_per_poly=np.array([4], dtype=np.uint8),
+        source_cell_indices=np.array([0], dtype=np.uint32),
+        start_utm_x=start_xy[0],
+        start_utm_y=start_xy[1],
+        end_utm_x=end_xy[0],
+        end_utm_y=end_xy[1],
+    )
+
+
+def _end_points(section: FenceSectionGeometry) -> tuple[float, float, float, float]:
+    return (section.start_utm_x, section.start_utm_y, section.end_utm_x, section.end_utm_y)
+
+
+def _cut_run(run_segments: list[PolylineSegment]) -> list[FenceSectionGeometry]:
+    """Stands in for ResInsight, giving two sections per segment, split at the segment's midpoint"""
+    sections: list[FenceSectionGeometry] = []
+    for x0, y0, x1, y1 in run_segments:
+        mid_xy = ((x0 + x1) / 2, (y0 + y1) / 2)
+        sections.append(_make_section((x0, y0), mid_xy))
+        sections.append(_make_section(mid_xy, (x1, y1)))
+    return sections
+
+
+def test_split_polyline_into_segments() -> None:
+    segments = split_polyline_into_segments(_POLYLINE_UTM_XY)
+    assert segments == [
+        (0.0, 0.0, 100.0, 0.0),
+        (100.0, 0.0, 100.0, 100.0),
+        (100.0, 100.0, 0.0, 100.0),
+        (0.0, 100.0, 0.0, 200.0),
+    ]
+
+    assert not split_polyline_into_segments([1.0, 2.0])
+    assert not split_polyline_into_segments([])
+
+    with pytest.raises(ValueError):
+        split_polyline_into_segments([0.0, 0.0, 1.0])
+
+
+def test_assign_sections_to_segments() -> None:
+    segments = split_polyline_into_segments(_POLYLINE_UTM_XY)
+
+    # No sections on the third segment, e.g. because it is outside the grid
+    sections = [
+        _make_section((10, 0), (50, 0)),
+        _make_section((50, 0), (100, 0)),
+        _make_section((100, 0), (100, 100)),
+        _make_section((0, 150), (0, 200.0005)),
+    ]
+    sections_per_segment = assign_sections_to_segments(segments, sections)
+
+    assert sections_per_segment is not None
+    assert [len(segment_sections) for segment_sections in sections_per_segment] == [2, 1, 0, 1]
+    assert sections_per_segment[0] == sections[0:2]
+    assert sections_per_segment[3] == [sections[3]]
+
+
+def test_assign_sections_to_segments_fails_for_unassignable_sections() -> None:
+    segments = split_polyline_into_segments(_POLYLINE_UTM_XY)
+
+    # Section spanning a polyline corner
+    assert assign_sections_to_segments(segments, [_make_section((50, 0), (100, 50))]) is None
+
+    # Section that is not on the polyline
+    assert assign_sections_to_segments(segments, [_make_section((50, 10), (60, 10))]) is None
+
+    # Sections out of polyline order
+    out_of_order_sections = [_make_section((100, 0), (100, 100)), _make_section((0, 0), (100, 0))]
+    assert assign_sections_to_segments(segments, out_of_order_sections) is None
+
+
+@pytest.mark.parametrize(
+    "cached_mask, expected_runs",
+    [
+        ([], []),
+        ([True, True, True], []),
+        ([False, False, False], [(0, 3)]),
+        ([False, True, False, False, True], [(0, 1), (2, 4)]),
+        ([True, False, True, False], [(1, 2), (3, 4)]),
+    ],
+)
+def test_find_runs_of_missing_segments(cached_mask: list[bool], expected_runs: list[tuple[int, int]]) -> None:
+    # Note that a cached segment may have an empty list of sections
+    sections_per_segment: list[list[FenceSectionGeometry] | None] = [[] if cached else None for cached in cached_mask]
+    assert find_runs_of_missing_segments(sections_per_segment) == expected_runs
+
+
+def test_store_run_sections_caches_per_segment() -> None:
+    segments = split_polyline_into_segments(_POLYLINE_UTM_XY)
+    sections_per_segment: list[list[FenceSectionGeometry] | None] = [None] * len(segments)
+
+    run_segments = segments[1:3]
+    run_sections = _cut_run(run_segments)
+    store_run_sections(_GRID_UUID, False, run_segments, 1, run_sections, sections_per_segment)
+
+    assert sections_per_segment == [None, run_sections[0:2], run_sections[2:4], None]
+    assert get_cached_segment_sections(_GRID_UUID, False, segments[1]) == run_sections[0:2]
+    assert get_cached_segment_sections(_GRID_UUID, False, segments[2]) == run_sections[2:4]
+
+    # The cache is specific to the grid and the inactive cells flag
+    assert get_cached_segment_sections(_GRID_UUID, True, segments[1]) is None
+    assert get_cached_segment_sections("other-grid-uuid", False, segments[1]) is None
+    assert get_cached_segment_sections(_GRID_UUID, False, segments[0]) is None
+
+
+def test_store_run_sections_without_caching_for_unassignable_sections() -> None:
+    segments = split_polyline_into_segments(_POLYLINE_UTM_XY)
+    sections_per_segment: list[list[FenceSectionGeometry] | None] = [None] * len(segments)
+
+    run_segments = segments[0:3]
+    run_sections = [_make_section((50, 0), (100, 50)), _make_section((100, 50), (50, 100))]
+    store_run_sections(_GRID_UUID, False, run_segments, 0, run_sections, sections_per_segment)
+
+    # All the sections are kept in order on the run's first segment, and nothing is cached
+    assert sections_per_segment == [run_sections, [], [], None]
+    for segment in run_segments:
+        assert get_cached_segment_sections(_GRID_UUID, False, segment) is None
+
+
+def _intersect_polyline(
+    polyline_utm_xy: list[float], cut_runs: list[list[PolylineSegment]]
+) -> list[FenceSectionGeometry]:
+    """Same steps as the polyline intersection endpoint, recording the runs that are cut"""
+    segments = split_polyline_into_segments(polyline_utm_xy)
+    sections_per_segment = [get_cached_segment_sections(_GRID_UUID, False, segment) for segment in segments]
+
+    for run_start, run_end in find_runs_of_missing_segments(sections_per_segment):
+        run_segments = segments[run_start:run_end]
+        cut_runs.append(run_segments)
+        store_run_sections(_GRID_UUID, False, run_segments, run_start, _cut_run(run_segments), sections_per_segment)
+
+    return [section for sections in sections_per_segment if sections for section in sections]
+
+
+def test_partial_cache_hit_for_edited_polyline() -> None:
+    cut_runs: list[list[PolylineSegment]] = []
+    full_sections = _intersect_polyline(_POLYLINE_UTM_XY, cut_runs)
+    assert cut_runs == [split_polyline_into_segments(_POLYLINE_UTM_XY)]
+    assert len(full_sections) == 8
+
+    # Moving the third point changes the second and third segments, splitting the cached segments in two runs
+    edited_polyline_utm_xy = list(_POLYLINE_UTM_XY)
+    edited_polyline_utm_xy[4:6] = [120.0, 100.0]
+    edited_segments = split_polyline_into_segments(edited_polyline_utm_xy)
+
+    cut_runs.clear()
+    edited_sections = _intersect_polyline(edited_polyline_utm_xy, cut_runs)
+    assert cut_runs == [edited_segments[1:3]]
+
+    # The sections of the unchanged segments come from the cache, and all are in polyline order
+    assert edited_sections[0:2] == full_sections[0:2]
+    assert edited_sections[6:8] == full_sections[6:8]
+    assert [_end_points(section) for section in edited_sections[2:6]] == [
+        _end_points(section) for section in _cut_run(edited_segments[1:3])
+    ]
+
+    # Extending the polyline only cuts the new segment
+    cut_runs.clear()
+    extended_sections = _intersect_polyline(edited_polyline_utm_xy + [50.0, 250.0], cut_runs)
+    assert cut_runs == [[(0.0, 200.0, 50.0, 250.0)]]
+    assert extended_sections[0:8] == edited_sections
+    assert len(extended_sections) == 10
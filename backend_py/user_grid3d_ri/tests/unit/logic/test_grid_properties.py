@@ -0,0 +1,136 @@
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xtgeo
+
+from user_grid3d_ri.logic import grid_properties
+from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
+
+
+@pytest.fixture(name="continuous_roff_file")
+def fixture_continuous_roff_file(tmp_path: Path) -> str:
+    values = np.ma.masked_array(np.arange(24, dtype=np.float64).reshape(2, 3, 4), mask=False)
+    values[0, 0, 0] = np.ma.masked
+
+    roff_file = str(tmp_path / "poro.roff")
+    xtgeo.GridProperty(ncol=2, nrow=3, nlay=4, values=values, name="poro").to_file(roff_file, fformat="roff")
+    return roff_file
+
+
+@pytest.fixture(name="discrete_roff_file")
+def fixture_discrete_roff_file(tmp_path: Path) -> str:
+    values = np.arange(24, dtype=np.int32).reshape(2, 3, 4) % 3 + 1
+
+    roff_file = str(tmp_path / "facies.roff")
+    xtg_prop = xtgeo.GridProperty(ncol=2, nrow=3, nlay=4, values=values, discrete=True, name="facies")
+    xtg_prop.to_file(roff_file, fformat="roff")
+    return roff_file
+
+
+@pytest.fixture(autouse=True)
+def fixture_clear_extractor_cache() -> None:
+    grid_properties._EXTRACTOR_CACHE.clear()  # pylint: disable=protected-access
+
+
+def _values_path(roff_file: str) -> str:
+    return roff_file + grid_properties._ARTIFACT_VALUES_SUFFIX  # pylint: disable=protected-access
+
+
+def _meta_path(roff_file: str) -> str:
+    return roff_file + grid_properties._ARTIFACT_META_SUFFIX  # pylint: disable=protected-access
+
+
+async def test_continuous_artifact_round_trip(continuous_roff_file: str) -> None:
+    parsed_extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+    assert os.path.isfile(_values_path(continuous_roff_file))
+    assert os.path.isfile(_meta_path(continuous_roff_file))
+
+    grid_properties._EXTRACTOR_CACHE.clear()  # pylint: disable=protected-access
+    loaded_extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+    assert loaded_extractor is not parsed_extractor
+
+    assert not loaded_extractor.is_discrete()
+    assert loaded_extractor.get_min_global_val() == 1.0
+    assert loaded_extractor.get_max_global_val() == 23.0
+    assert loaded_extractor.get_discrete_undef_value() is None
+
+    # The flattening is in Fortran order, the first cell is masked and filled with NaN
+    values_arr = loaded_extractor.get_float_prop_values_for_cells([0, 1, 2, 23])
+    assert values_arr.dtype == np.float32
+    assert np.isnan(values_arr[0])
+    assert values_arr[1:].tolist() == [12.0, 4.0, 23.0]
+
+
+async def test_discrete_artifact_round_trip(discrete_roff_file: str) -> None:
+    await GridPropertiesExtractor.from_roff_property_file_async(discrete_roff_file)
+
+    grid_properties._EXTRACTOR_CACHE.clear()  # pylint: disable=protected-access
+    loaded_extractor = await GridPropertiesExtractor.from_roff_property_file_async(discrete_roff_file)
+
+    assert loaded_extractor.is_discrete()
+    assert loaded_extractor.get_min_global_val() == 1
+    assert loaded_extractor.get_max_global_val() == 3
+    assert loaded_extractor.get_discrete_undef_value() == -1
+
+    values_arr = loaded_extractor.get_discrete_prop_values_for_cells([0, 1, 23])
+    assert values_arr.dtype == np.int32
+    assert values_arr.tolist() == [1, 1, 3]
+
+
+async def test_cached_extractor_is_memory_mapped(continuous_roff_file: str) -> None:
+    extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+
+    # Also when the ROFF file was just parsed, the cached extractor should be backed by the artifact on disk
+    assert isinstance(extractor._flat_prop_arr, np.memmap)  # pylint: disable=protected-access
+    assert await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file) is extractor
+
+
+async def test_extractor_is_not_cached_when_artifact_cannot_be_written(
+    continuous_roff_file: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(GridPropertiesExtractor, "write_artifact", lambda _self, _roff_prop_file: None)
+
+    extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+    assert not isinstance(extractor._flat_prop_arr, np.memmap)  # pylint: disable=protected-access
+    assert extractor.get_max_global_val() == 23.0
+    assert len(grid_properties._EXTRACTOR_CACHE) == 0  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "corrupt_artifact",
+    [
+        pytest.param(lambda roff_file: os.remove(_values_path(roff_file)), id="missing_values"),
+        pytest.param(lambda roff_file: Path(_values_path(roff_file)).write_bytes(b"garbage"), id="corrupt_values"),
+        pytest.param(lambda roff_file: Path(_meta_path(roff_file)).write_text("{not json"), id="corrupt_meta"),
+        pytest.param(lambda roff_file: Path(_meta_path(roff_file)).write_text("{}"), id="incomplete_meta"),
+    ],
+)
+async def test_falls_back_to_roff_file_for_bad_artifact(
+    continuous_roff_file: str, corrupt_artifact: Callable[[str], object]
+) -> None:
+    await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+    grid_properties._EXTRACTOR_CACHE.clear()  # pylint: disable=protected-access
+
+    corrupt_artifact(continuous_roff_file)
+    extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+
+    assert not extractor.is_discrete()
+    assert extractor.get_max_global_val() == 23.0
+    assert extractor.get_float_prop_values_for_cells([23]).tolist() == [23.0]
+
+    # The artifact should have been rewritten
+    assert isinstance(extractor._flat_prop_arr, np.memmap)  # pylint: disable=protected-access
+    # pylint: disable-next=protected-access
+    reloaded_extractor = grid_properties._load_extractor_from_artifact(continuous_roff_file)
+    assert reloaded_extractor is not None
+
+
+async def test_artifact_without_meta_file_is_ignored(continuous_roff_file: str) -> None:
+    # The meta file is written last, a values file on its own is an incomplete write that should not be used
+    np.save(_values_path(continuous_roff_file), np.zeros(24, dtype=np.float64))
+
+    extractor = await GridPropertiesExtractor.from_roff_property_file_async(continuous_roff_file)
+    assert extractor.get_float_prop_values_for_cells([23]).tolist() == [23.0]
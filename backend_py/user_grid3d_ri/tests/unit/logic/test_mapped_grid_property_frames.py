@@ -0,0 +1,158 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+import xtgeo
+
+from webviz_core_utils.binary_payload import get_numpy_array_view, iterate_length_prefixed_frames_async
+from webviz_core_utils.binary_payload import split_binary_payload
+from webviz_server_schemas.user_grid3d_ri import api_schemas
+
+from user_grid3d_ri.logic import grid_properties
+from user_grid3d_ri.logic.local_blob_cache import LocalBlobCache
+from user_grid3d_ri.logic.mapped_grid_property_frames import generate_mapped_grid_property_frames_async
+
+
+class _FakeBlobCache(LocalBlobCache):
+    """Serves property blobs from local ROFF files, blobs not in the dict fail to download"""
+
+    def __init__(self, roff_files_by_uuid: dict[str, str]) -> None:
+        super().__init__(sas_token="", blob_store_base_uri="")
+        self._roff_files_by_uuid = roff_files_by_uuid
+        self.download_delays_s: dict[str, float] = {}
+        self.requested_uuids: list[str] = []
+        self.cancelled_uuids: list[str] = []
+
+    async def ensure_property_blob_downloaded_async(self, object_uuid: str) -> str | None:
+        self.requested_uuids.append(object_uuid)
+        try:
+            await asyncio.sleep(self.download_delays_s.get(object_uuid, 0))
+        except asyncio.CancelledError:
+            self.cancelled_uuids.append(object_uuid)
+            raise
+        return self._roff_files_by_uuid.get(object_uuid)
+
+
+def _write_roff_file(path: Path, values: np.ndarray, discrete: bool = False) -> str:
+    xtg_prop = xtgeo.GridProperty(ncol=2, nrow=3, nlay=4, values=values, discrete=discrete, name=path.stem)
+    xtg_prop.to_file(str(path), fformat="roff")
+    return str(path)
+
+
+@pytest.fixture(name="blob_cache")
+def fixture_blob_cache(tmp_path: Path) -> _FakeBlobCache:
+    grid_properties._EXTRACTOR_CACHE.clear()  # pylint: disable=protected-access
+
+    float_values = np.arange(24, dtype=np.float64).reshape(2, 3, 4)
+    int_values = np.arange(24, dtype=np.int32).reshape(2, 3, 4) % 3 + 1
+    corrupt_file = tmp_path / "corrupt.roff"
+    corrupt_file.write_bytes(b"not a roff file")
+
+    return _FakeBlobCache(
+        {
+            "float-blob": _write_roff_file(tmp_path / "float.roff", float_values),
+            "int-blob": _write_roff_file(tmp_path / "int.roff", int_values, discrete=True),
+            "corrupt-blob": str(corrupt_file),
+        }
+    )
+
+
+async def _collect_frame_headers_async(
+    frame_stream: AsyncIterator[bytes],
+) -> list[tuple[api_schemas.MappedGridPropertiesFrameHeader, np.ndarray | None]]:
+    async def _as_one_chunk_async() -> AsyncIterator[bytes]:
+        yield b"".join([chunk async for chunk in frame_stream])
+
+    headers_and_values = []
+    async for frame in iterate_length_prefixed_frames_async(_as_one_chunk_async()):
+        header_bytes, buffers_view = split_binary_payload(frame)
+        header = api_schemas.MappedGridPropertiesFrameHeader.model_validate_json(header_bytes)
+        values = get_numpy_array_view(buffers_view, header.poly_props) if header.poly_props else None
+        headers_and_values.append((header, values))
+
+    return headers_and_values
+
+
+async def test_frames_for_float_and_discrete_properties(blob_cache: _FakeBlobCache) -> None:
+    source_cell_indices = np.array([0, 1, 23], dtype=np.uint32)
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache, ["float-blob", "int-blob"], source_cell_indices
+    )
+    headers_and_values = await _collect_frame_headers_async(frame_stream)
+
+    by_uuid = {header.property_blob_object_uuid: (header, values) for header, values in headers_and_values}
+    assert set(by_uuid) == {"float-blob", "int-blob"}
+
+    float_header, float_values = by_uuid["float-blob"]
+    assert float_header.error_message is None
+    assert float_header.undefined_int_value is None
+    assert (float_header.min_grid_prop_value, float_header.max_grid_prop_value) == (0.0, 23.0)
+    assert float_values is not None and float_values.dtype == np.float32
+    assert float_values.tolist() == [0.0, 12.0, 23.0]
+
+    int_header, int_values = by_uuid["int-blob"]
+    assert int_header.error_message is None
+    assert int_header.undefined_int_value == -1
+    assert (int_header.min_grid_prop_value, int_header.max_grid_prop_value) == (1, 3)
+    assert int_values is not None and int_values.dtype == np.int32
+    assert int_values.tolist() == [1, 1, 3]
+
+
+async def test_frames_are_sent_in_order_of_completion(blob_cache: _FakeBlobCache) -> None:
+    blob_cache.download_delays_s["float-blob"] = 0.05
+
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache, ["float-blob", "int-blob"], np.array([0], dtype=np.uint32)
+    )
+    headers_and_values = await _collect_frame_headers_async(frame_stream)
+
+    assert [header.property_blob_object_uuid for header, _values in headers_and_values] == ["int-blob", "float-blob"]
+
+
+async def test_failed_property_blobs_get_error_frames(blob_cache: _FakeBlobCache) -> None:
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache, ["float-blob", "missing-blob", "corrupt-blob"], np.array([0], dtype=np.uint32)
+    )
+    headers_and_values = await _collect_frame_headers_async(frame_stream)
+
+    by_uuid = {header.property_blob_object_uuid: (header, values) for header, values in headers_and_values}
+    assert set(by_uuid) == {"float-blob", "missing-blob", "corrupt-blob"}
+    assert by_uuid["float-blob"][0].error_message is None
+
+    for failed_uuid in ["missing-blob", "corrupt-blob"]:
+        header, values = by_uuid[failed_uuid]
+        assert header.error_message
+        assert header.poly_props is None
+        assert header.min_grid_prop_value is None and header.max_grid_prop_value is None
+        assert values is None
+
+
+async def test_duplicate_property_blobs_give_one_frame(blob_cache: _FakeBlobCache) -> None:
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache, ["int-blob", "int-blob", "float-blob"], np.array([0], dtype=np.uint32)
+    )
+    headers_and_values = await _collect_frame_headers_async(frame_stream)
+
+    assert sorted(header.property_blob_object_uuid for header, _values in headers_and_values) == [
+        "float-blob",
+        "int-blob",
+    ]
+    assert sorted(blob_cache.requested_uuids) == ["float-blob", "int-blob"]
+
+
+async def test_closing_stream_cancels_remaining_work(blob_cache: _FakeBlobCache) -> None:
+    blob_cache.download_delays_s["float-blob"] = 10
+
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache, ["float-blob", "int-blob"], np.array([0], dtype=np.uint32)
+    )
+    assert isinstance(frame_stream, AsyncGenerator)
+
+    # Stop after the first frame, as when the client disconnects
+    await anext(frame_stream)
+    await frame_stream.aclose()
+    await asyncio.sleep(0)
+
+    assert blob_cache.cancelled_uuids == ["float-blob"]
@@ -0,0 +1,126 @@
+import asyncio
+import itertools
+
+import pytest
+
+from user_grid3d_ri.logic import resinsight_manager
+from user_grid3d_ri.logic.resinsight_manager import ResInsightManager
+
+
+class _FakeChannel:
+    def __init__(self, target: str) -> None:
+        self.target = target
+        self.is_closed = False
+
+    async def close(self) -> None:
+        self.is_closed = True
+
+
+class _FakeRiProcesses:
+    """Stands in for launching and monitoring ResInsight processes"""
+
+    def __init__(self) -> None:
+        self._pid_counter = itertools.count(start=1000)
+        self.running_pids: set[int] = set()
+        self.launched_ports: list[int] = []
+        self.failing_ports: set[int] = set()
+
+    async def launch_async(self, port: int) -> int:
+        if port in self.failing_ports:
+            raise RuntimeError(f"Failed to launch on port {port}")
+
+        pid = next(self._pid_counter)
+        self.running_pids.add(pid)
+        self.launched_ports.append(port)
+        return pid
+
+    def is_running(self, pid: int) -> bool:
+        return pid in self.running_pids
+
+
+@pytest.fixture(name="fake_ri_processes")
+def fixture_fake_ri_processes(monkeypatch: pytest.MonkeyPatch) -> _FakeRiProcesses:
+    fake_processes = _FakeRiProcesses()
+
+    async def probe_async(_channel: _FakeChannel) -> bool:
+        return True
+
+    monkeypatch.setattr(resinsight_manager, "_launch_ri_instance_async", fake_processes.launch_async)
+    monkeypatch.setattr(resinsight_manager, "_is_process_running", fake_processes.is_running)
+    monkeypatch.setattr(resinsight_manager, "_kill_competing_ri_processes", lambda _port: None)
+    monkeypatch.setattr(resinsight_manager, "_probe_grpc_alive_async", probe_async)
+    monkeypatch.setattr(resinsight_manager.grpc.aio, "insecure_channel", lambda target, options: _FakeChannel(target))
+    return fake_processes
+
+
+async def test_round_robin_without_affinity_key(fake_ri_processes: _FakeRiProcesses) -> None:
+    manager = ResInsightManager(pool_size=3)
+    base_port = resinsight_manager._RI_BASE_PORT  # pylint: disable=protected-access
+
+    ports = [await manager.get_port_of_running_ri_instance_async() for _ in range(7)]
+    assert ports == [base_port, base_port + 1, base_port + 2, base_port, base_port + 1, base_port + 2, base_port]
+
+    # Instances are launched lazily, once per slot
+    assert sorted(fake_ri_processes.launched_ports) == [base_port, base_port + 1, base_port + 2]
+
+
+async def test_affinity_key_selects_same_instance(fake_ri_processes: _FakeRiProcesses) -> None:
+    manager = ResInsightManager(pool_size=4)
+
+    ports_by_key = {key: await manager.get_port_of_running_ri_instance_async(key) for key in ["a", "b", "c", "d"]}
+    for key, port in ports_by_key.items():
+        assert await manager.get_port_of_running_ri_instance_async(key) == port
+
+        # Round-robin requests in between should not affect the affinity
+        await manager.get_port_of_running_ri_instance_async()
+        assert await manager.get_port_of_running_ri_instance_async(key) == port
+
+    assert len(fake_ri_processes.launched_ports) <= 4
+
+
+async def test_dead_instance_is_restarted_by_monitoring(
+    fake_ri_processes: _FakeRiProcesses, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(resinsight_manager, "_HEALTH_CHECK_INTERVAL_S", 0.01)
+    manager = ResInsightManager(pool_size=2)
+    await manager.start_async()
+    assert len(fake_ri_processes.running_pids) == 2
+
+    first_channel = await manager.get_channel_for_running_ri_instance_async()
+    assert isinstance(first_channel, _FakeChannel)
+
+    monitor_task = manager._monitor_task  # pylint: disable=protected-access
+    assert monitor_task is not None
+
+    try:
+        # Kill all processes, the next health check should restart them
+        fake_ri_processes.running_pids.clear()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if len(fake_ri_processes.running_pids) == 2:
+                break
+    finally:
+        monitor_task.cancel()
+
+    assert len(fake_ri_processes.launched_ports) == 4
+    assert len(fake_ri_processes.running_pids) == 2
+    assert first_channel.is_closed
+
+    restarted_channel = await manager.get_channel_for_running_ri_instance_async()
+    assert isinstance(restarted_channel, _FakeChannel)
+    assert not restarted_channel.is_closed
+
+
+async def test_failed_restart_does_not_stop_monitoring(fake_ri_processes: _FakeRiProcesses) -> None:
+    manager = ResInsightManager(pool_size=2)
+    base_port = resinsight_manager._RI_BASE_PORT  # pylint: disable=protected-access
+    fake_ri_processes.failing_ports.add(base_port)
+
+    # The failing slot should neither raise nor prevent the other slot from being started
+    await manager._restart_unhealthy_instances_async()  # pylint: disable=protected-access
+    assert fake_ri_processes.launched_ports == [base_port + 1]
+
+    # The failing slot is retried on the next health check
+    fake_ri_processes.failing_ports.clear()
+    await manager._restart_unhealthy_instances_async()  # pylint: disable=protected-access
+    assert fake_ri_processes.launched_ports == [base_port + 1, base_port]
@@ -1,9 +1,14 @@
 import datetime
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
+from webviz_core_utils.background_tasks import run_in_background_task
 from webviz_core_utils.radix_utils import is_running_on_radix_platform
 
+from .logic.resinsight_manager import RESINSIGHT_MANAGER
+
 from .utils.inactivity_shutdown import InactivityShutdown
 from .utils.azure_monitor_setup import setup_azure_monitor_telemetry_for_user_grid3d_ri
 from .routers import health_router
@@ -21,7 +26,15 @@ logging.getLogger("xtgeo").setLevel(logging.INFO)
 LOGGER = logging.getLogger(__name__)
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan_handler_async(_fastapi_app: FastAPI) -> AsyncIterator[None]:
+    # Launch the ResInsight instances in the background so that the first request does not pay the startup cost.
+    # Requests arriving before the launch has finished will wait for it rather than launching another instance.
+    run_in_background_task(RESINSIGHT_MANAGER.start_async())
+    yield
+
+
+app = FastAPI(lifespan=lifespan_handler_async)
 
 setup_azure_monitor_telemetry_for_user_grid3d_ri(app)
 
@@ -0,0 +1,179 @@
+import logging
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from webviz_core_utils.lru_cache import LruCache
+
+LOGGER = logging.getLogger(__name__)
+
+# Polyline segment given as (start_x, start_y, end_x, end_y) in UTM coordinates
+PolylineSegment = tuple[float, float, float, float]
+
+# Tolerance in meters when deciding which polyline segment a fence mesh section belongs to
+_SEGMENT_MATCH_TOLERANCE = 1e-3
+
+
+@dataclass(frozen=True, kw_only=True)
+class FenceSectionGeometry:
+    """Geometry of one fence mesh section as returned by ResInsight, without any property values"""
+
+    vertices_uz: NDArray[np.float32]
+    poly_indices: NDArray[np.uint32]
+    vertices_per_poly: NDArray[np.uint8]
+    source_cell_indices: NDArray[np.uint32]
+    start_utm_x: float
+    start_utm_y: float
+    end_utm_x: float
+    end_utm_y: float
+
+    def nbytes(self) -> int:
+        return (
+            self.vertices_uz.nbytes
+            + self.poly_indices.nbytes
+            + self.vertices_per_poly.nbytes
+            + self.source_cell_indices.nbytes
+        )
+
+
+# The cut geometry of a segment only depends on the grid and the segment's end points, so a polyline that is edited
+# or extended only needs the changed segments cut by ResInsight. A segment that does not intersect the grid is
+# stored with an empty list of sections.
+# Key: (grid blob object uuid, include inactive cells, segment)
+_SEGMENT_SECTIONS_CACHE: LruCache[tuple[str, bool, PolylineSegment], list[FenceSectionGeometry]] = LruCache(
+    max_entries=4096,
+    max_total_size=512 * 1024 * 1024,
+    size_func=lambda sections: sum(section.nbytes() for section in sections),
+)
+
+# Grid dimensions are needed in the response even if all segments are found in the cache
+# Key: grid blob object uuid, value: (i_count, j_count, k_count)
+_GRID_DIMENSIONS_CACHE: LruCache[str, tuple[int, int, int]] = LruCache(max_entries=256)
+
+
+def split_polyline_into_segments(polyline_utm_xy: list[float]) -> list[PolylineSegment]:
+    if len(polyline_utm_xy) % 2 != 0:
+        raise ValueError("Polyline must contain an even number of coordinates")
+
+    num_points = len(polyline_utm_xy) // 2
+    segments: list[PolylineSegment] = []
+    for i in range(num_points - 1):
+        x0, y0, x1, y1 = polyline_utm_xy[2 * i : 2 * i + 4]
+        segments.append((x0, y0, x1, y1))
+
+    return segments
+
+
+def get_cached_segment_sections(
+    grid_blob_object_uuid: str, include_inactive_cells: bool, segment: PolylineSegment
+) -> list[FenceSectionGeometry] | None:
+    return _SEGMENT_SECTIONS_CACHE.get((grid_blob_object_uuid, include_inactive_cells, segment))
+
+
+def set_cached_segment_sections(
+    grid_blob_object_uuid: str,
+    include_inactive_cells: bool,
+    segment: PolylineSegment,
+    sections: list[FenceSectionGeometry],
+) -> None:
+    _SEGMENT_SECTIONS_CACHE.set((grid_blob_object_uuid, include_inactive_cells, segment), sections)
+
+
+def get_cached_grid_dimensions(grid_blob_object_uuid: str) -> tuple[int, int, int] | None:
+    return _GRID_DIMENSIONS_CACHE.get(grid_blob_object_uuid)
+
+
+def set_cached_grid_dimensions(grid_blob_object_uuid: str, grid_dimensions: tuple[int, int, int]) -> None:
+    _GRID_DIMENSIONS_CACHE.set(grid_blob_object_uuid, grid_dimensions)
+
+
+def assign_sections_to_segments(
+    segments: list[PolylineSegment], sections: list[FenceSectionGeometry]
+) -> list[list[FenceSectionGeometry]] | None:
+    """
+    Assign the fence mesh sections from cutting a run of consecutive segments to the individual segments.
+
+    The sections are expected in polyline order, with both end points lying on their segment.
+    Returns None if the sections cannot be unambiguously assigned, in which case they should not be cached.
+    """
+    sections_per_segment: list[list[FenceSectionGeometry]] = [[] for _ in segments]
+
+    segment_idx = 0
+    for section in sections:
+        while segment_idx < len(segments) and not _is_section_on_segment(section, segments[segment_idx]):
+            segment_idx += 1
+
+        if segment_idx >= len(segments):
+            LOGGER.debug("Unable to assign fence mesh section to polyline segment, skipping segment caching")
+            return None
+
+        sections_per_segment[segment_idx].append(section)
+
+    return sections_per_segment
+
+
+def find_runs_of_missing_segments(
+    sections_per_segment: list[list[FenceSectionGeometry] | None],
+) -> list[tuple[int, int]]:
+    """Find runs of consecutive segments that are missing from the cache, as (start, end) with end exclusive"""
+    runs: list[tuple[int, int]] = []
+    run_start: int | None = None
+    for idx, sections in enumerate(sections_per_segment):
+        if sections is None and run_start is None:
+            run_start = idx
+        elif sections is not None and run_start is not None:
+            runs.append((run_start, idx))
+            run_start = None
+
+    if run_start is not None:
+        runs.append((run_start, len(sections_per_segment)))
+
+    return runs
+
+
+def store_run_sections(
+    grid_blob_object_uuid: str,
+    include_inactive_cells: bool,
+    run_segments: list[PolylineSegment],
+    run_start: int,
+    run_sections: list[FenceSectionGeometry],
+    sections_per_segment: list[list[FenceSectionGeometry] | None],
+) -> None:
+    """
+    Put the sections from cutting a run of segments in place in sections_per_segment, starting at run_start.
+    The sections are cached per segment if they can be assigned to the individual segments.
+    """
+    sections_per_run_segment = assign_sections_to_segments(run_segments, run_sections)
+    if sections_per_run_segment is None:
+        # Keep the sections for this request in their original order, without caching
+        for idx in range(run_start, run_start + len(run_segments)):
+            sections_per_segment[idx] = []
+        if run_segments:
+            sections_per_segment[run_start] = run_sections
+        return
+
+    for idx, (segment, sections) in enumerate(zip(run_segments, sections_per_run_segment)):
+        set_cached_segment_sections(grid_blob_object_uuid, include_inactive_cells, segment, sections)
+        sections_per_segment[run_start + idx] = sections
+
+
+def _is_section_on_segment(section: FenceSectionGeometry, segment: PolylineSegment) -> bool:
+    return _is_point_on_segment(section.start_utm_x, section.start_utm_y, segment) and _is_point_on_segment(
+        section.end_utm_x, section.end_utm_y, segment
+    )
+
+
+def _is_point_on_segment(x: float, y: float, segment: PolylineSegment) -> bool:
+    x0, y0, x1, y1 = segment
+    dx = x1 - x0
+    dy = y1 - y0
+    length_sq = dx * dx + dy * dy
+
+    # Parameter of the closest point on the segment, clamped to the segment's end points
+    t = 0.0
+    if length_sq > 0:
+        t = min(max(((x - x0) * dx + (y - y0) * dy) / length_sq, 0.0), 1.0)
+
+    return math.hypot(x - (x0 + t * dx), y - (y0 + t * dy)) <= _SEGMENT_MATCH_TOLERANCE
@@ -1,15 +1,31 @@
+import asyncio
+import json
 import logging
 import io
+import os
+import tempfile
 import aiofiles
 
 import numpy as np
 import xtgeo
 from numpy.typing import NDArray
 
+from webviz_core_utils.lru_cache import LruCache
+from webviz_core_utils.perf_timer import PerfTimer
+
 LOGGER = logging.getLogger(__name__)
 
 _DISCRETE_PROP_UNDEF_VALUE: int = -1
 
+# The extracted property values are stored as artifacts alongside the ROFF file in the blob cache:
+# - a .npy file with the flattened, fill valued array that can be memory mapped
+# - a small JSON file with the global min/max values and the discrete flag, written last to mark completion
+_ARTIFACT_VALUES_SUFFIX = ".values.npy"
+_ARTIFACT_META_SUFFIX = ".meta.json"
+
+# Memory mapped extractors, keyed by the path of the ROFF file
+_EXTRACTOR_CACHE: LruCache[str, "GridPropertiesExtractor"] = LruCache(max_entries=32)
+
 
 class GridPropertiesExtractor:
     def __init__(
@@ -26,19 +42,54 @@ class GridPropertiesExtractor:
 
     @classmethod
     async def from_roff_property_file_async(cls, roff_prop_file: str) -> "GridPropertiesExtractor":
+        """
+        Get extractor for the property in the ROFF file.
+
+        On first access the property is parsed and its values are stored as a memory mappable artifact alongside
+        the ROFF file, later accesses only memory map the artifact.
+
+        Only extractors backed by a memory mapped artifact are cached, so the cache never holds on to fully
+        materialized arrays.
+        """
+        cached_extractor = _EXTRACTOR_CACHE.get(roff_prop_file)
+        if cached_extractor is not None:
+            return cached_extractor
+
+        timer = PerfTimer()
+        mapped_extractor = await asyncio.to_thread(_load_extractor_from_artifact, roff_prop_file)
+        if mapped_extractor is not None:
+            LOGGER.debug(f"Loaded grid property artifact in {timer.elapsed_s():.2f}s: {roff_prop_file}")
+        else:
+            parsed_extractor = await cls._parse_roff_property_file_async(roff_prop_file)
+            LOGGER.debug(f"Parsed grid property in {timer.lap_s():.2f}s: {roff_prop_file}")
+
+            await asyncio.to_thread(parsed_extractor.write_artifact, roff_prop_file)
+            LOGGER.debug(f"Wrote grid property artifact in {timer.lap_s():.2f}s: {roff_prop_file}")
+
+            # Re-open the written artifact so that the parsed array can be released
+            mapped_extractor = await asyncio.to_thread(_load_extractor_from_artifact, roff_prop_file)
+            if mapped_extractor is None:
+                return parsed_extractor
+
+        _EXTRACTOR_CACHE.set(roff_prop_file, mapped_extractor)
+        return mapped_extractor
+
+    @classmethod
+    async def _parse_roff_property_file_async(cls, roff_prop_file: str) -> "GridPropertiesExtractor":
         async with aiofiles.open(roff_prop_file, mode="rb") as f:
             file_contents: bytes = await f.read()
 
         byte_stream = io.BytesIO(file_contents)
         xtg_grid_prop: xtgeo.GridProperty = xtgeo.gridproperty_from_file(byte_stream, fformat="roff")
 
-        min_prop_val = xtg_grid_prop.values.min()
-        max_prop_val = xtg_grid_prop.values.max()
-
         # Note that the values array is masked
         # What is the correct fill value for discrete data?
         is_discrete = xtg_grid_prop.isdiscrete
         fill_value = _DISCRETE_PROP_UNDEF_VALUE if is_discrete else np.nan
+
+        min_prop_val = _masked_scalar_to_python(xtg_grid_prop.values.min(), is_discrete, fill_value)
+        max_prop_val = _masked_scalar_to_python(xtg_grid_prop.values.max(), is_discrete, fill_value)
+
         unmasked_value_arr = xtg_grid_prop.values.filled(fill_value=fill_value)
 
         # Flatten array
@@ -52,6 +103,26 @@ class GridPropertiesExtractor:
         )
         return new_object
 
+    def write_artifact(self, roff_prop_file: str) -> None:
+        # Write to temp files and rename, so that concurrent readers never see partially written files
+        meta_dict = {
+            "is_discrete": self._is_discrete,
+            "min_global_prop_val": self._min_global_prop_val,
+            "max_global_prop_val": self._max_global_prop_val,
+        }
+
+        cache_dir = os.path.dirname(roff_prop_file)
+        try:
+            with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".npy", delete=False) as values_tmp_file:
+                np.save(values_tmp_file, np.ascontiguousarray(self._flat_prop_arr))
+            os.replace(values_tmp_file.name, roff_prop_file + _ARTIFACT_VALUES_SUFFIX)
+
+            with tempfile.NamedTemporaryFile(mode="w", dir=cache_dir, suffix=".json", delete=False) as meta_tmp_file:
+                json.dump(meta_dict, meta_tmp_file)
+            os.replace(meta_tmp_file.name, roff_prop_file + _ARTIFACT_META_SUFFIX)
+        except OSError as exception:
+            LOGGER.warning(f"Failed to write grid property artifact for {roff_prop_file=} {exception=}")
+
     def is_discrete(self) -> bool:
         return self._is_discrete
 
@@ -88,3 +159,32 @@ class GridPropertiesExtractor:
 
     def get_max_global_val(self) -> float | int:
         return self._max_global_prop_val
+
+
+def _masked_scalar_to_python(value: np.generic, is_discrete: bool, fill_value: float | int) -> float | int:
+    # The min/max of a fully masked array is the masked constant
+    if value is np.ma.masked:
+        return fill_value
+    return int(value) if is_discrete else float(value)
+
+
+def _load_extractor_from_artifact(roff_prop_file: str) -> GridPropertiesExtractor | None:
+    meta_path = roff_prop_file + _ARTIFACT_META_SUFFIX
+    values_path = roff_prop_file + _ARTIFACT_VALUES_SUFFIX
+    if not os.path.isfile(meta_path):
+        return None
+
+    try:
+        with open(meta_path, mode="r", encoding="utf-8") as meta_file:
+            meta_dict = json.load(meta_file)
+        flat_prop_arr = np.load(values_path, mmap_mode="r")
+
+        return GridPropertiesExtractor(
+            flat_prop_arr=flat_prop_arr,
+            is_discrete=meta_dict["is_discrete"],
+            min_global_prop_val=meta_dict["min_global_prop_val"],
+            max_global_prop_val=meta_dict["max_global_prop_val"],
+        )
+    except (OSError, ValueError, KeyError) as exception:
+        LOGGER.warning(f"Failed to load grid property artifact, will parse ROFF file instead {exception=}")
+        return None
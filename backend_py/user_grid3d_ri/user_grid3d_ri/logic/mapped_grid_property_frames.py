@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from webviz_core_utils.binary_payload import BinaryPayloadWriter, make_length_prefixed_frame
+from webviz_core_utils.perf_timer import PerfTimer
+from webviz_server_schemas.user_grid3d_ri import api_schemas
+
+from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
+from user_grid3d_ri.logic.local_blob_cache import LocalBlobCache
+
+LOGGER = logging.getLogger(__name__)
+
+# Limits the number of concurrent property blob downloads when serving a batch request
+_MAX_CONCURRENT_PROPERTY_BLOB_DOWNLOADS = 8
+
+
+async def generate_mapped_grid_property_frames_async(
+    blob_cache: LocalBlobCache,
+    property_blob_object_uuids: list[str],
+    source_cell_indices_np: NDArray[np.unsignedinteger],
+) -> AsyncIterator[bytes]:
+    """
+    Map the property blobs onto the given source cells, yielding one length prefixed frame per unique property blob
+    in order of completion. A property blob that fails yields an error frame, so no property blob is silently left out.
+    """
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PROPERTY_BLOB_DOWNLOADS)
+
+    async def _make_frame_async(property_blob_object_uuid: str) -> bytes:
+        try:
+            async with semaphore:
+                property_path_name = await blob_cache.ensure_property_blob_downloaded_async(property_blob_object_uuid)
+            if property_path_name is None:
+                LOGGER.error(f"Failed to download property blob: {property_blob_object_uuid=}")
+                return _make_error_frame(property_blob_object_uuid, "Failed to download property blob")
+
+            prop_extractor = await GridPropertiesExtractor.from_roff_property_file_async(property_path_name)
+            return _make_mapped_grid_property_frame(property_blob_object_uuid, prop_extractor, source_cell_indices_np)
+        # pylint: disable-next=broad-exception-caught
+        except Exception as exc:
+            LOGGER.error(f"Failed to map property blob: {property_blob_object_uuid=}, {exc=}")
+            return _make_error_frame(property_blob_object_uuid, f"Failed to map property blob: {type(exc).__name__}")
+
+    timer = PerfTimer()
+    unique_blob_object_uuids = list(dict.fromkeys(property_blob_object_uuids))
+    tasks = [asyncio.create_task(_make_frame_async(blob_uuid)) for blob_uuid in unique_blob_object_uuids]
+    try:
+        for next_completed in asyncio.as_completed(tasks):
+            yield make_length_prefixed_frame(await next_completed)
+    finally:
+        # Make sure no work is left running if the client disconnects before all frames are sent
+        for task in tasks:
+            task.cancel()
+
+    LOGGER.debug(f"Streamed {len(tasks)} mapped grid property frames in {timer.elapsed_s():.2f}s")
+
+
+def _make_mapped_grid_property_frame(
+    property_blob_object_uuid: str,
+    prop_extractor: GridPropertiesExtractor,
+    source_cell_indices_np: NDArray[np.unsignedinteger],
+) -> bytes:
+    payload_writer = BinaryPayloadWriter()
+
+    undefined_int_value: int | None = None
+    if prop_extractor.is_discrete():
+        int_prop_arr_np = prop_extractor.get_discrete_prop_values_for_cells(source_cell_indices_np)
+        poly_props_ref = payload_writer.add_array(int_prop_arr_np)
+        undefined_int_value = prop_extractor.get_discrete_undef_value()
+    else:
+        float_prop_arr_np = prop_extractor.get_float_prop_values_for_cells(source_cell_indices_np)
+        poly_props_ref = payload_writer.add_array(float_prop_arr_np)
+
+    header = api_schemas.MappedGridPropertiesFrameHeader(
+        property_blob_object_uuid=property_blob_object_uuid,
+        poly_props=poly_props_ref,
+        undefined_int_value=undefined_int_value,
+        min_grid_prop_value=prop_extractor.get_min_global_val(),
+        max_grid_prop_value=prop_extractor.get_max_global_val(),
+    )
+    return payload_writer.to_bytes(header)
+
+
+def _make_error_frame(property_blob_object_uuid: str, error_message: str) -> bytes:
+    header = api_schemas.MappedGridPropertiesFrameHeader(
+        property_blob_object_uuid=property_blob_object_uuid,
+        poly_props=None,
+        undefined_int_value=None,
+        min_grid_prop_value=None,
+        max_grid_prop_value=None,
+        error_message=error_message,
+    )
+    return BinaryPayloadWriter().to_bytes(header)
@@ -3,6 +3,7 @@ import logging
 from dataclasses import dataclass
 import os
 import asyncio
+import zlib
 
 import grpc
 import psutil
@@ -10,13 +11,13 @@ import psutil
 from webviz_core_utils.background_tasks import run_in_background_task
 from webviz_core_utils.radix_utils import is_running_on_radix_platform, read_radix_job_payload_as_json
 
-from rips.generated import App_pb2_grpc, Definitions_pb2
-
 LOGGER = logging.getLogger(__name__)
 
 
 _RI_EXECUTABLE = os.environ["RESINSIGHT_EXECUTABLE"]
-_RI_PORT = 50099
+_RI_BASE_PORT = 50099
+_DEFAULT_POOL_SIZE = 2
+_HEALTH_CHECK_INTERVAL_S = 15
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -25,60 +26,50 @@ class _RiInstanceInfo:
     channel: grpc.aio.Channel
 
 
-class ResInsightManager:
-    def __init__(self) -> None:
+class _RiInstanceSlot:
+    """
+    One slot in the ResInsight pool, owning at most one running ResInsight process listening on the slot's port.
+    """
+
+    def __init__(self, port: int) -> None:
+        self._port = port
         self._ri_info: _RiInstanceInfo | None = None
         self._mutex_lock = asyncio.Lock()
 
-    async def get_channel_for_running_ri_instance_async(self) -> grpc.aio.Channel | None:
-        instance = await self._get_or_create_ri_instance_async()
-        if not instance:
-            return None
-
-        return instance.channel
-
-    async def get_port_of_running_ri_instance_async(self) -> int | None:
-        instance = await self._get_or_create_ri_instance_async()
-        if not instance:
-            return None
+    @property
+    def port(self) -> int:
+        return self._port
 
-        return _RI_PORT
-
-    async def _get_or_create_ri_instance_async(self) -> _RiInstanceInfo | None:
+    async def get_or_create_ri_instance_async(self) -> _RiInstanceInfo | None:
         async with self._mutex_lock:
             LOGGER.debug(
-                f"_get_or_create_ri_instance_async() - has registered instance: {'YES' if self._ri_info else 'NO'}"
+                f"get_or_create_ri_instance_async() - port={self._port}, has registered instance: {'YES' if self._ri_info else 'NO'}"
             )
             if self._ri_info:
-                try:
-                    process = psutil.Process(self._ri_info.pid)
-                    LOGGER.debug(f"_get_or_create_ri_instance_async() - {process=}")
-                    if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
-                        LOGGER.debug(
-                            f"_get_or_create_ri_instance_async() - process already running, pid={self._ri_info.pid}"
-                        )
-                        return self._ri_info
-                except psutil.NoSuchProcess:
-                    pass
-
-                LOGGER.debug(f"_get_or_create_ri_instance_async() - process is NOT running, pid={self._ri_info.pid}")
+                if _is_process_running(self._ri_info.pid):
+                    LOGGER.debug(
+                        f"get_or_create_ri_instance_async() - process already running, pid={self._ri_info.pid}"
+                    )
+                    return self._ri_info
+
+                LOGGER.debug(f"get_or_create_ri_instance_async() - process is NOT running, pid={self._ri_info.pid}")
 
             # Either we don't have a process or the process is dead, so we'll clean up and try to launch a new one
             if self._ri_info and self._ri_info.channel:
-                LOGGER.debug("_get_or_create_ri_instance_async() - trying to close existing grpc channel")
+                LOGGER.debug("get_or_create_ri_instance_async() - trying to close existing grpc channel")
                 await self._ri_info.channel.close()
 
             self._ri_info = None
-            _kill_competing_ri_processes()
+            _kill_competing_ri_processes(self._port)
 
-            LOGGER.debug("_get_or_create_ri_instance_async() - launching new ResInsight process")
-            new_pid = await _launch_ri_instance_async()
+            LOGGER.debug(f"get_or_create_ri_instance_async() - launching new ResInsight process on port {self._port}")
+            new_pid = await _launch_ri_instance_async(self._port)
             if new_pid < 0:
                 LOGGER.error("Failed to launch ResInsight process")
                 return None
 
             new_channel: grpc.aio.Channel = grpc.aio.insecure_channel(
-                f"localhost:{_RI_PORT}",
+                f"localhost:{self._port}",
                 options=[("grpc.enable_http_proxy", False), ("grpc.max_receive_message_length", 512 * 1024 * 1024)],
             )
             if not await _probe_grpc_alive_async(new_channel):
@@ -87,13 +78,100 @@ class ResInsightManager:
 
             self._ri_info = _RiInstanceInfo(pid=new_pid, channel=new_channel)
             LOGGER.debug(
-                f"_get_or_create_ri_instance_async() - successfully launched new ResInsight process, pid={self._ri_info.pid}"
+                f"get_or_create_ri_instance_async() - successfully launched new ResInsight process, pid={self._ri_info.pid}"
             )
 
             return self._ri_info
 
+    def is_healthy(self) -> bool:
+        return self._ri_info is not None and _is_process_running(self._ri_info.pid)
 
-def _kill_competing_ri_processes() -> None:
+
+class ResInsightManager:
+    """
+    Manages a pool of ResInsight processes, each serving gRPC requests on its own port.
+
+    Requests with an affinity key (typically the grid blob id) are always routed to the same instance, so that the
+    grid stays loaded in one instance. Other requests are distributed round-robin. Instances are launched lazily
+    on first use, or up front by calling start_async(), which also starts monitoring that restarts dead instances.
+    """
+
+    def __init__(self, pool_size: int) -> None:
+        if pool_size <= 0:
+            raise ValueError("pool_size must be a positive number")
+
+        self._slots = [_RiInstanceSlot(_RI_BASE_PORT + idx) for idx in range(pool_size)]
+        self._next_round_robin_idx = 0
+        self._monitor_task: asyncio.Task | None = None
+
+    async def start_async(self) -> None:
+        """Pre-launch all instances in the pool concurrently and start the health monitoring"""
+        LOGGER.debug(f"start_async() - launching {len(self._slots)} ResInsight instance(s)")
+        await asyncio.gather(*[slot.get_or_create_ri_instance_async() for slot in self._slots])
+
+        if self._monitor_task is None:
+            self._monitor_task = run_in_background_task(self._monitor_instances_async())
+
+    async def get_channel_for_running_ri_instance_async(
+        self, affinity_key: str | None = None
+    ) -> grpc.aio.Channel | None:
+        instance = await self._select_slot(affinity_key).get_or_create_ri_instance_async()
+        if not instance:
+            return None
+
+        return instance.channel
+
+    async def get_port_of_running_ri_instance_async(self, affinity_key: str | None = None) -> int | None:
+        slot = self._select_slot(affinity_key)
+        instance = await slot.get_or_create_ri_instance_async()
+        if not instance:
+            return None
+
+        return slot.port
+
+    def _select_slot(self, affinity_key: str | None) -> _RiInstanceSlot:
+        if affinity_key is not None:
+            # Use a stable hash, since the built-in hash of strings is randomized per process
+            return self._slots[zlib.crc32(affinity_key.encode()) % len(self._slots)]
+
+        slot = self._slots[self._next_round_robin_idx]
+        self._next_round_robin_idx = (self._next_round_robin_idx + 1) % len(self._slots)
+        return slot
+
+    async def _monitor_instances_async(self) -> None:
+        while True:
+            await asyncio.sleep(_HEALTH_CHECK_INTERVAL_S)
+            await self._restart_unhealthy_instances_async()
+
+    async def _restart_unhealthy_instances_async(self) -> None:
+        for slot in self._slots:
+            try:
+                if not slot.is_healthy():
+                    LOGGER.warning(f"ResInsight instance on port {slot.port} is not running, restarting it")
+                    await slot.get_or_create_ri_instance_async()
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Keep the monitoring alive, the restart is retried on the next health check
+                LOGGER.exception(f"Unexpected error while restarting ResInsight instance on port {slot.port}")
+
+
+def _is_process_running(pid: int) -> bool:
+    try:
+        process = psutil.Process(pid)
+        return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return False
+
+
+def _get_pool_size() -> int:
+    if is_running_on_radix_platform():
+        job_payload_dict = read_radix_job_payload_as_json()
+        if job_payload_dict and "ri_pool_size" in job_payload_dict:
+            return int(job_payload_dict["ri_pool_size"])
+
+    return _DEFAULT_POOL_SIZE
+
+
+def _kill_competing_ri_processes(port: int) -> None:
 
     terminated_procs: list[psutil.Process] = []
 
@@ -103,7 +181,7 @@ def _kill_competing_ri_processes() -> None:
         info_dict = proc.info  # type: ignore[attr-defined]
         if info_dict["exe"] == _RI_EXECUTABLE:
             cmd_line = info_dict.get("cmdline")
-            if cmd_line is not None and "--server" in cmd_line and f"{_RI_PORT}" in cmd_line:
+            if cmd_line is not None and "--server" in cmd_line and f"{port}" in cmd_line:
                 LOGGER.debug(f"Terminating ResInsight process with PID: {info_dict['pid']}")
                 proc.terminate()
                 terminated_procs.append(proc)
@@ -127,10 +205,10 @@ async def _stream_watcher_async(stream: asyncio.streams.StreamReader, stream_nam
     LOGGER.debug(f"_stream_watcher_async() for {stream_name=} exiting")
 
 
-async def _launch_ri_instance_async() -> int:
+async def _launch_ri_instance_async(port: int) -> int:
 
     # Quick and dirty, redirect to our own stdout
-    # proc: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(_RI_EXECUTABLE, "--console", "--server", f"{_RI_PORT}", stdout=sys.stdout, stderr=sys.stderr)
+    # proc: asyncio.subprocess.Process = await asyncio.create_subprocess_exec(_RI_EXECUTABLE, "--console", "--server", f"{port}", stdout=sys.stdout, stderr=sys.stderr)
 
     env_dict = None
     if is_running_on_radix_platform():
@@ -148,7 +226,7 @@ async def _launch_ri_instance_async() -> int:
         _RI_EXECUTABLE,
         "--console",
         "--server",
-        f"{_RI_PORT}",
+        f"{port}",
         stdout=asyncio.subprocess.PIPE,
         stderr=asyncio.subprocess.PIPE,
         env=env_dict,
@@ -166,6 +244,11 @@ async def _launch_ri_instance_async() -> int:
 
 
 async def _probe_grpc_alive_async(channel: grpc.aio.Channel) -> bool:
+    # The rips package is only available in the ResInsight image, importing it here keeps the rest of this module
+    # importable, e.g. by the unit tests, without it
+    # pylint: disable-next=import-outside-toplevel
+    from rips.generated import App_pb2_grpc, Definitions_pb2
+
     app_stub = App_pb2_grpc.AppStub(channel)
 
     try:
@@ -179,4 +262,4 @@ async def _probe_grpc_alive_async(channel: grpc.aio.Channel) -> bool:
     return False
 
 
-RESINSIGHT_MANAGER = ResInsightManager()
+RESINSIGHT_MANAGER = ResInsightManager(pool_size=_get_pool_size())
@@ -4,6 +4,8 @@ from typing import Any
 import grpc
 import numpy as np
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from numpy.typing import NDArray
 
 from rips.generated import GridGeometryExtraction_pb2, GridGeometryExtraction_pb2_grpc
 
@@ -16,6 +18,7 @@ from webviz_server_schemas.user_grid3d_ri import api_schemas
 from user_grid3d_ri.logic.data_cache import DataCache
 from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
 from user_grid3d_ri.logic.local_blob_cache import LocalBlobCache
+from user_grid3d_ri.logic.mapped_grid_property_frames import generate_mapped_grid_property_frames_async
 from user_grid3d_ri.logic.resinsight_manager import RESINSIGHT_MANAGER
 
 LOGGER = logging.getLogger(__name__)
@@ -30,6 +33,7 @@ def _proto_msg_as_oneliner(proto_msg: Any) -> str:
 
 
 @router.post("/get_grid_geometry")
+# pylint: disable-next=too-many-statements
 async def post_get_grid_geometry(
     req_body: api_schemas.GridGeometryRequest,
 ) -> api_schemas.GridGeometryResponse:
@@ -52,7 +56,9 @@ async def post_get_grid_geometry(
     LOGGER.debug(f"{myfunc} - {grid_path_name=}")
     perf_metrics.record_lap("get-blob")
 
-    grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async()
+    grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async(
+        affinity_key=req_body.grid_blob_object_uuid
+    )
     if grpc_channel is None:
         raise HTTPException(500, detail="Failed to get gRPC channel for ResInsight instance")
     perf_metrics.record_lap("get-ri")
@@ -101,9 +107,11 @@ async def post_get_grid_geometry(
 
     perf_metrics.record_lap("proc-verts")
 
+    # The grid surface consists of quads only, so the count prefix of the vtk layout is only added if requested
     poly_indices_np = np.asarray(grpc_response.quadIndicesArr, dtype=np.uint32)
-    poly_indices_np = poly_indices_np.reshape(-1, 4)
-    poly_indices_np = np.insert(poly_indices_np, 0, 4, axis=1).reshape(-1)
+    if req_body.poly_layout == "vtk":
+        poly_indices_np = poly_indices_np.reshape(-1, 4)
+        poly_indices_np = np.insert(poly_indices_np, 0, 4, axis=1).reshape(-1)
     perf_metrics.record_lap("proc-indices")
 
     source_cell_indices_np = np.asarray(grpc_response.sourceCellIndicesArr, dtype=np.uint32)
@@ -120,6 +128,7 @@ async def post_get_grid_geometry(
     ret_obj = api_schemas.GridGeometryResponse(
         vertices_b64arr=b64_encode_float_array_as_float32(vertices_np),
         polys_b64arr=b64_encode_uint_array_as_smallest_size(poly_indices_np),
+        poly_layout=req_body.poly_layout,
         poly_source_cell_indices_b64arr=b64_encode_uint_array_as_smallest_size(source_cell_indices_np),
         origin_utm_x=grpc_response.originUtmXy.x,
         origin_utm_y=grpc_response.originUtmXy.y,
@@ -156,7 +165,7 @@ async def post_get_grid_geometry(
 
 
 @router.post("/get_mapped_grid_properties")
-# pylint: disable-next=too-many-locals, too-many-statements
+# pylint: disable-next=too-many-locals
 async def post_get_mapped_grid_properties(
     req_body: api_schemas.MappedGridPropertiesRequest,
 ) -> api_schemas.MappedGridPropertiesResponse:
@@ -186,55 +195,19 @@ async def post_get_mapped_grid_properties(
     LOGGER.debug(f"{myfunc} - {property_path_name=}")
     perf_metrics.record_lap("get-blobs")
 
-    source_cell_indices_np = None
-    data_cache_key = _make_grid_geo_key(
+    source_cell_indices_np, grpc_time_elapsed_info = await _get_or_create_source_cell_indices_async(
+        grid_path_name=grid_path_name,
         grid_blob_object_uuid=req_body.grid_blob_object_uuid,
         include_inactive_cells=req_body.include_inactive_cells,
-        filt=req_body.ijk_index_filter,
+        ijk_index_filter=req_body.ijk_index_filter,
+        perf_metrics=perf_metrics,
     )
-    LOGGER.debug(f"{myfunc} - {data_cache_key=}")
-    source_cell_indices_np = DATA_CACHE.get_uint32_numpy_arr(data_cache_key)
-    perf_metrics.record_lap("read-cache")
 
     ri_total_time: int | None = None
     ri_perf_metrics: dict[str, int] | None = None
-
-    if source_cell_indices_np is None:
-        grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async()
-        if grpc_channel is None:
-            raise HTTPException(500, detail="Failed to get gRPC channel for ResInsight instance")
-        perf_metrics.record_lap("get-ri")
-
-        grpc_ijk_index_filter = None
-        if req_body.ijk_index_filter:
-            grpc_ijk_index_filter = GridGeometryExtraction_pb2.IJKIndexFilter(
-                iMin=req_body.ijk_index_filter.min_i,
-                iMax=req_body.ijk_index_filter.max_i,
-                jMin=req_body.ijk_index_filter.min_j,
-                jMax=req_body.ijk_index_filter.max_j,
-                kMin=req_body.ijk_index_filter.min_k,
-                kMax=req_body.ijk_index_filter.max_k,
-            )
-        LOGGER.debug(f"{myfunc} - grpc_ijk_index_filter: {_proto_msg_as_oneliner(grpc_ijk_index_filter)}")
-
-        request = GridGeometryExtraction_pb2.GetGridSurfaceRequest(
-            gridFilename=grid_path_name,
-            includeInactiveCells=req_body.include_inactive_cells,
-            ijkIndexFilter=grpc_ijk_index_filter,
-            cellIndexFilter=None,
-            propertyFilter=None,
-        )
-
-        geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
-        grpc_response = await geo_extraction_stub.GetGridSurface(request)
-
-        ri_total_time = grpc_response.timeElapsedInfo.totalTimeElapsedMs
-        ri_perf_metrics = dict(grpc_response.timeElapsedInfo.namedEventsAndTimeElapsedMs)
-        perf_metrics.record_lap("ri-grid-geo")
-
-        source_cell_indices_np = np.asarray(grpc_response.sourceCellIndicesArr, dtype=np.uint32)
-        DATA_CACHE.set_uint32_numpy_arr(data_cache_key, source_cell_indices_np)
-        perf_metrics.record_lap("write-cache")
+    if grpc_time_elapsed_info is not None:
+        ri_total_time = grpc_time_elapsed_info.totalTimeElapsedMs
+        ri_perf_metrics = dict(grpc_time_elapsed_info.namedEventsAndTimeElapsedMs)
 
     prop_extractor = await GridPropertiesExtractor.from_roff_property_file_async(property_path_name)
     perf_metrics.record_lap("read-props")
@@ -274,6 +247,107 @@ async def post_get_mapped_grid_properties(
     return ret_obj
 
 
+@router.post("/get_mapped_grid_properties_batch")
+async def post_get_mapped_grid_properties_batch(
+    req_body: api_schemas.MappedGridPropertiesBatchRequest,
+) -> StreamingResponse:
+    """
+    Get mapped grid properties for multiple property blobs, typically the time steps of a dynamic property.
+
+    The property blobs are downloaded concurrently and the response is streamed as length prefixed frames
+    (see webviz_core_utils.binary_payload), one frame per property blob in order of completion. Each frame is a
+    binary payload with a MappedGridPropertiesFrameHeader. Property blobs that fail get an error frame.
+    """
+
+    myfunc = "post_get_mapped_grid_properties_batch()"
+    LOGGER.debug(f"{myfunc} - {len(req_body.property_blob_object_uuids)=}")
+
+    perf_metrics = PerfMetrics()
+
+    blob_cache = LocalBlobCache(req_body.sas_token, req_body.blob_store_base_uri)
+
+    grid_path_name = await blob_cache.ensure_grid_blob_downloaded_async(req_body.grid_blob_object_uuid)
+    if grid_path_name is None:
+        raise HTTPException(500, detail=f"Failed to download grid blob: {req_body.grid_blob_object_uuid=}")
+    perf_metrics.record_lap("get-grid-blob")
+
+    source_cell_indices_np, _grpc_time_elapsed_info = await _get_or_create_source_cell_indices_async(
+        grid_path_name=grid_path_name,
+        grid_blob_object_uuid=req_body.grid_blob_object_uuid,
+        include_inactive_cells=req_body.include_inactive_cells,
+        ijk_index_filter=req_body.ijk_index_filter,
+        perf_metrics=perf_metrics,
+    )
+
+    LOGGER.debug(f"{myfunc} - Ready to stream mapped grid properties after: {perf_metrics.to_string_s()}")
+
+    frame_stream = generate_mapped_grid_property_frames_async(
+        blob_cache=blob_cache,
+        property_blob_object_uuids=req_body.property_blob_object_uuids,
+        source_cell_indices_np=source_cell_indices_np,
+    )
+    return StreamingResponse(frame_stream, media_type="application/octet-stream")
+
+
+async def _get_or_create_source_cell_indices_async(
+    grid_path_name: str,
+    grid_blob_object_uuid: str,
+    include_inactive_cells: bool,
+    ijk_index_filter: api_schemas.IJKIndexFilter | None,
+    perf_metrics: PerfMetrics,
+) -> tuple[NDArray[np.unsignedinteger], Any | None]:
+    """
+    Get the source cell indices of the grid surface polys, either from the data cache or by extracting
+    the grid surface using ResInsight. Also returns ResInsight's time elapsed info if an extraction was needed.
+    """
+    data_cache_key = _make_grid_geo_key(
+        grid_blob_object_uuid=grid_blob_object_uuid,
+        include_inactive_cells=include_inactive_cells,
+        filt=ijk_index_filter,
+    )
+    LOGGER.debug(f"_get_or_create_source_cell_indices_async() - {data_cache_key=}")
+    source_cell_indices_np = DATA_CACHE.get_uint32_numpy_arr(data_cache_key)
+    perf_metrics.record_lap("read-cache")
+    if source_cell_indices_np is not None:
+        return source_cell_indices_np, None
+
+    grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async(
+        affinity_key=grid_blob_object_uuid
+    )
+    if grpc_channel is None:
+        raise HTTPException(500, detail="Failed to get gRPC channel for ResInsight instance")
+    perf_metrics.record_lap("get-ri")
+
+    grpc_ijk_index_filter = None
+    if ijk_index_filter:
+        grpc_ijk_index_filter = GridGeometryExtraction_pb2.IJKIndexFilter(
+            iMin=ijk_index_filter.min_i,
+            iMax=ijk_index_filter.max_i,
+            jMin=ijk_index_filter.min_j,
+            jMax=ijk_index_filter.max_j,
+            kMin=ijk_index_filter.min_k,
+            kMax=ijk_index_filter.max_k,
+        )
+
+    request = GridGeometryExtraction_pb2.GetGridSurfaceRequest(
+        gridFilename=grid_path_name,
+        includeInactiveCells=include_inactive_cells,
+        ijkIndexFilter=grpc_ijk_index_filter,
+        cellIndexFilter=None,
+        propertyFilter=None,
+    )
+
+    geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
+    grpc_response = await geo_extraction_stub.GetGridSurface(request)
+    perf_metrics.record_lap("ri-grid-geo")
+
+    source_cell_indices_np = np.asarray(grpc_response.sourceCellIndicesArr, dtype=np.uint32)
+    DATA_CACHE.set_uint32_numpy_arr(data_cache_key, source_cell_indices_np)
+    perf_metrics.record_lap("write-cache")
+
+    return source_cell_indices_np, grpc_response.timeElapsedInfo
+
+
 def _make_grid_geo_key(
     grid_blob_object_uuid: str, include_inactive_cells: bool, filt: api_schemas.IJKIndexFilter | None
 ) -> str:
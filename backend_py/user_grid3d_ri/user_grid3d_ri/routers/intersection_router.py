@@ -1,17 +1,21 @@
 import logging
+from typing import Any
 
 import grpc
-from fastapi import APIRouter, HTTPException
+import numpy as np
+from fastapi import APIRouter, HTTPException, Response
+from numpy.typing import NDArray
 
 from rips.generated import GridGeometryExtraction_pb2, GridGeometryExtraction_pb2_grpc
 
-from webviz_core_utils.b64 import B64FloatArray, B64IntArray
-from webviz_core_utils.b64 import b64_encode_float_array_as_float32
-from webviz_core_utils.b64 import b64_encode_uint_array_as_uint32, b64_encode_uint_array_as_uint8
-from webviz_core_utils.b64 import b64_encode_uint_array_as_smallest_size, b64_encode_int_array_as_smallest_size
+from webviz_core_utils.binary_payload import BinaryPayloadWriter, as_smallest_int_array, as_smallest_uint_array
 from webviz_core_utils.perf_metrics import PerfMetrics
 from webviz_server_schemas.user_grid3d_ri import api_schemas
 
+from user_grid3d_ri.logic.fence_section_cache import FenceSectionGeometry
+from user_grid3d_ri.logic.fence_section_cache import find_runs_of_missing_segments, store_run_sections
+from user_grid3d_ri.logic.fence_section_cache import get_cached_segment_sections, split_polyline_into_segments
+from user_grid3d_ri.logic.fence_section_cache import get_cached_grid_dimensions, set_cached_grid_dimensions
 from user_grid3d_ri.logic.grid_properties import GridPropertiesExtractor
 from user_grid3d_ri.logic.local_blob_cache import LocalBlobCache
 from user_grid3d_ri.logic.resinsight_manager import RESINSIGHT_MANAGER
@@ -21,13 +25,16 @@ LOGGER = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.post("/get_polyline_intersection")
+@router.post("/get_polyline_intersection_binary", response_class=Response)
 # pylint: disable-next=too-many-locals, too-many-statements
-async def post_get_polyline_intersection(
-    req_body: api_schemas.PolylineIntersectionRequest,
-) -> api_schemas.PolylineIntersectionResponse:
-
-    myfunc = "post_get_polyline_intersection()"
+async def post_get_polyline_intersection_binary(req_body: api_schemas.PolylineIntersectionRequest) -> Response:
+    """
+    Get the intersection of a polyline with the grid as a binary payload, see webviz_core_utils.binary_payload.
+    The header is a PolylineIntersectionBinaryHeader, and the arrays are stored as raw buffers so that the
+    receiver can forward them without decoding.
+    """
+
+    myfunc = "post_get_polyline_intersection_binary()"
     LOGGER.debug(f"{myfunc}")
     # LOGGER.debug(f"{req_body.sas_token=}")
     # LOGGER.debug(f"{req_body.blob_store_base_uri=}")
@@ -52,22 +59,71 @@ async def post_get_polyline_intersection(
         raise HTTPException(500, detail=f"Failed to download property blob: {req_body.property_blob_object_uuid=}")
     perf_metrics.record_lap("get-prop-blob")
 
-    grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async()
-    if grpc_channel is None:
-        raise HTTPException(500, detail="Failed to get gRPC channel for ResInsight instance")
-    perf_metrics.record_lap("get-ri")
-
-    grpc_request = GridGeometryExtraction_pb2.CutAlongPolylineRequest(
-        gridFilename=grid_path_name,
-        includeInactiveCells=req_body.include_inactive_cells,
-        fencePolylineUtmXY=req_body.polyline_utm_xy,
-    )
-
-    geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
-    grpc_response = await geo_extraction_stub.CutAlongPolyline(grpc_request)
-    perf_metrics.record_lap("ri-cut")
-
-    LOGGER.debug(f"{myfunc} - {len(grpc_response.fenceMeshSections)=}")
+    # Only the segments that are not already in the cache need to be cut by ResInsight
+    try:
+        segments = split_polyline_into_segments(req_body.polyline_utm_xy)
+    except ValueError as exc:
+        raise HTTPException(400, detail=str(exc)) from exc
+    sections_per_segment: list[list[FenceSectionGeometry] | None] = [
+        get_cached_segment_sections(req_body.grid_blob_object_uuid, req_body.include_inactive_cells, segment)
+        for segment in segments
+    ]
+    missing_segment_runs = find_runs_of_missing_segments(sections_per_segment)
+    grid_dimensions = get_cached_grid_dimensions(req_body.grid_blob_object_uuid)
+    if grid_dimensions is None and not missing_segment_runs:
+        missing_segment_runs = [(0, len(segments))]
+    LOGGER.debug(f"{myfunc} - {len(segments)=}, {missing_segment_runs=}")
+    perf_metrics.record_lap("read-cache")
+
+    ri_total_time: int | None = None
+    ri_perf_metrics: dict[str, int] | None = None
+    if missing_segment_runs:
+        grpc_channel: grpc.aio.Channel | None = await RESINSIGHT_MANAGER.get_channel_for_running_ri_instance_async(
+            affinity_key=req_body.grid_blob_object_uuid
+        )
+        if grpc_channel is None:
+            raise HTTPException(500, detail="Failed to get gRPC channel for ResInsight instance")
+        perf_metrics.record_lap("get-ri")
+
+        geo_extraction_stub = GridGeometryExtraction_pb2_grpc.GridGeometryExtractionStub(grpc_channel)
+        ri_total_time = 0
+        for run_start, run_end in missing_segment_runs:
+            # A run of segments is cut as one polyline, made up of the run's segments' end points
+            grpc_request = GridGeometryExtraction_pb2.CutAlongPolylineRequest(
+                gridFilename=grid_path_name,
+                includeInactiveCells=req_body.include_inactive_cells,
+                fencePolylineUtmXY=req_body.polyline_utm_xy[2 * run_start : 2 * run_end + 2],
+            )
+            grpc_response = await geo_extraction_stub.CutAlongPolyline(grpc_request)
+
+            grid_dimensions = (
+                grpc_response.gridDimensions.i,
+                grpc_response.gridDimensions.j,
+                grpc_response.gridDimensions.k,
+            )
+            set_cached_grid_dimensions(req_body.grid_blob_object_uuid, grid_dimensions)
+            ri_total_time += grpc_response.timeElapsedInfo.totalTimeElapsedMs
+            ri_perf_metrics = dict(grpc_response.timeElapsedInfo.namedEventsAndTimeElapsedMs)
+
+            run_sections = [
+                _fence_section_geometry_from_grpc(grpc_section) for grpc_section in grpc_response.fenceMeshSections
+            ]
+            store_run_sections(
+                grid_blob_object_uuid=req_body.grid_blob_object_uuid,
+                include_inactive_cells=req_body.include_inactive_cells,
+                run_segments=segments[run_start:run_end],
+                run_start=run_start,
+                run_sections=run_sections,
+                sections_per_segment=sections_per_segment,
+            )
+
+        perf_metrics.record_lap("ri-cut")
+
+    if grid_dimensions is None:
+        raise HTTPException(500, detail="Failed to get grid dimensions for polyline intersection")
+
+    fence_sections = [section for sections in sections_per_segment if sections for section in sections]
+    LOGGER.debug(f"{myfunc} - {len(fence_sections)=}")
 
     prop_extractor = await GridPropertiesExtractor.from_roff_property_file_async(property_path_name)
     perf_metrics.record_lap("read-props")
@@ -83,65 +139,77 @@ async def post_get_polyline_intersection(
     LOGGER.debug(f"{myfunc} - {max_global_prop_value=}")
     LOGGER.debug(f"{myfunc} - {undefined_int_value=}")
 
-    ret_sections: list[api_schemas.FenceMeshSection] = []
+    payload_writer = BinaryPayloadWriter()
+    ret_sections: list[api_schemas.FenceMeshSectionBinaryHeader] = []
     tot_num_vertices: int = 0
     tot_num_polys: int = 0
-    for _fence_idx, grpc_section in enumerate(grpc_response.fenceMeshSections):
-        poly_props_b64arr: B64FloatArray | B64IntArray
+    for fence_section in fence_sections:
+        poly_props_arr_np: NDArray[np.integer] | NDArray[np.float32]
         if prop_extractor.is_discrete():
-            int_prop_arr_np = prop_extractor.get_discrete_prop_values_for_cells(grpc_section.sourceCellIndicesArr)
+            int_prop_arr_np = prop_extractor.get_discrete_prop_values_for_cells(fence_section.source_cell_indices)
             min_int_val = int(min_global_prop_value)
             max_int_val = int(max_global_prop_value)
-            poly_props_b64arr = b64_encode_int_array_as_smallest_size(int_prop_arr_np, min_int_val, max_int_val)
+            poly_props_arr_np = as_smallest_int_array(int_prop_arr_np, min_int_val, max_int_val)
         else:
-            float_prop_arr_np = prop_extractor.get_float_prop_values_for_cells(grpc_section.sourceCellIndicesArr)
-            poly_props_b64arr = b64_encode_float_array_as_float32(float_prop_arr_np)
-
-        max_vertex_index = int(len(grpc_section.vertexArrayUZ) / 2) - 1
-
-        section = api_schemas.FenceMeshSection(
-            vertices_uz_b64arr=b64_encode_float_array_as_float32(grpc_section.vertexArrayUZ),
-            poly_indices_b64arr=b64_encode_uint_array_as_smallest_size(grpc_section.polyIndicesArr, max_vertex_index),
-            vertices_per_poly_b64arr=b64_encode_uint_array_as_uint8(grpc_section.verticesPerPolygonArr),
-            poly_source_cell_indices_b64arr=b64_encode_uint_array_as_uint32(grpc_section.sourceCellIndicesArr),
-            poly_props_b64arr=poly_props_b64arr,
-            start_utm_x=grpc_section.startUtmXY.x,
-            start_utm_y=grpc_section.startUtmXY.y,
-            end_utm_x=grpc_section.endUtmXY.x,
-            end_utm_y=grpc_section.endUtmXY.y,
+            poly_props_arr_np = prop_extractor.get_float_prop_values_for_cells(fence_section.source_cell_indices)
+
+        num_vertices = int(len(fence_section.vertices_uz) / 2)
+        max_vertex_index = num_vertices - 1
+
+        section = api_schemas.FenceMeshSectionBinaryHeader(
+            vertices_uz=payload_writer.add_array(fence_section.vertices_uz),
+            poly_indices=payload_writer.add_array(as_smallest_uint_array(fence_section.poly_indices, max_vertex_index)),
+            vertices_per_poly=payload_writer.add_array(fence_section.vertices_per_poly),
+            poly_source_cell_indices=payload_writer.add_array(fence_section.source_cell_indices),
+            poly_props=payload_writer.add_array(poly_props_arr_np),
+            start_utm_x=fence_section.start_utm_x,
+            start_utm_y=fence_section.start_utm_y,
+            end_utm_x=fence_section.end_utm_x,
+            end_utm_y=fence_section.end_utm_y,
         )
         ret_sections.append(section)
 
-        tot_num_vertices += int(len(grpc_section.vertexArrayUZ) / 2)
-        tot_num_polys += len(grpc_section.sourceCellIndicesArr)
+        tot_num_vertices += num_vertices
+        tot_num_polys += len(fence_section.source_cell_indices)
 
     perf_metrics.record_lap("process-sections")
 
-    # This actually takes a bit of time (for many sections) - could use model_construct() for a slight perf gain
-    ret_obj = api_schemas.PolylineIntersectionResponse(
+    header = api_schemas.PolylineIntersectionBinaryHeader(
         fence_mesh_sections=ret_sections,
         undefined_int_value=undefined_int_value,
         min_grid_prop_value=min_global_prop_value,
         max_grid_prop_value=max_global_prop_value,
         grid_dimensions=api_schemas.GridDimensions(
-            i_count=grpc_response.gridDimensions.i,
-            j_count=grpc_response.gridDimensions.j,
-            k_count=grpc_response.gridDimensions.k,
+            i_count=grid_dimensions[0],
+            j_count=grid_dimensions[1],
+            k_count=grid_dimensions[2],
         ),
         stats=None,
     )
-    perf_metrics.record_lap("make-response")
+    perf_metrics.record_lap("make-header")
 
-    grpc_time_elapsed_info = grpc_response.timeElapsedInfo
-    ret_obj.stats = api_schemas.Stats(
+    header.stats = api_schemas.Stats(
         total_time=perf_metrics.get_elapsed_ms(),
         perf_metrics=perf_metrics.to_dict(),
-        ri_total_time=grpc_time_elapsed_info.totalTimeElapsedMs,
-        ri_perf_metrics=dict(grpc_time_elapsed_info.namedEventsAndTimeElapsedMs),
+        ri_total_time=ri_total_time,
+        ri_perf_metrics=ri_perf_metrics,
         vertex_count=tot_num_vertices,
         poly_count=tot_num_polys,
     )
 
     LOGGER.debug(f"{myfunc} - Got polyline intersection in: {perf_metrics.to_string_s()}")
 
-    return ret_obj
+    return Response(content=payload_writer.to_bytes(header), media_type="application/octet-stream")
+
+
+def _fence_section_geometry_from_grpc(grpc_section: Any) -> FenceSectionGeometry:
+    return FenceSectionGeometry(
+        vertices_uz=np.asarray(grpc_section.vertexArrayUZ, dtype=np.float32),
+        poly_indices=np.asarray(grpc_section.polyIndicesArr, dtype=np.uint32),
+        vertices_per_poly=np.asarray(grpc_section.verticesPerPolygonArr, dtype=np.uint8),
+        source_cell_indices=np.asarray(grpc_section.sourceCellIndicesArr, dtype=np.uint32),
+        start_utm_x=grpc_section.startUtmXY.x,
+        start_utm_y=grpc_section.startUtmXY.y,
+        end_utm_x=grpc_section.endUtmXY.x,
+        end_utm_y=grpc_section.endUtmXY.y,
+    )
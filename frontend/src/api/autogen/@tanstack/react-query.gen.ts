@@ -32,6 +32,7 @@ import {
     getFieldScreens,
     getGridModelsInfo,
     getGridParameter,
+    getGridParameterTimeSteps,
     getGridSurface,
     getHistoricalVectorData,
     getInjectionData,
@@ -50,6 +51,7 @@ import {
     getRealizationSurfacesMetadata,
     getRealizationsVectorData,
     getRftRealizationData,
+    getRftRealizationDataForWells,
     getRftTableDefinition,
     getSeismicCubeMetaList,
     getSeismicSlices,
@@ -147,6 +149,9 @@ import type {
     GetGridParameterData_api,
     GetGridParameterError_api,
     GetGridParameterResponse_api,
+    GetGridParameterTimeStepsData_api,
+    GetGridParameterTimeStepsError_api,
+    GetGridParameterTimeStepsResponse_api,
     GetGridSurfaceData_api,
     GetGridSurfaceError_api,
     GetGridSurfaceResponse_api,
@@ -200,6 +205,9 @@ import type {
     GetRealizationsVectorDataResponse_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataError_api,
+    GetRftRealizationDataForWellsData_api,
+    GetRftRealizationDataForWellsError_api,
+    GetRftRealizationDataForWellsResponse_api,
     GetRftRealizationDataResponse_api,
     GetRftTableDefinitionData_api,
     GetRftTableDefinitionError_api,
@@ -1378,6 +1386,11 @@ export const getGridParameterQueryKey = (options: Options<GetGridParameterData_a
  * Get Grid Parameter
  *
  * Get a grid parameter
+ *
+ * By default the property values are returned as float32. With the native_int encoding, discrete (integer) properties
+ * are returned as integers of the smallest possible size. The quantized encodings (uint16q, uint8q) apply to
+ * continuous properties and reduce the payload size at the cost of a bounded error, given by max_abs_error.
+ * In all cases undefined integer values are returned as -1.
  */
 export const getGridParameterOptions = (options: Options<GetGridParameterData_api>) =>
     queryOptions<
@@ -1398,6 +1411,44 @@ export const getGridParameterOptions = (options: Options<GetGridParameterData_ap
         queryKey: getGridParameterQueryKey(options),
     });
 
+export const getGridParameterTimeStepsQueryKey = (options: Options<GetGridParameterTimeStepsData_api>) =>
+    createQueryKey("getGridParameterTimeSteps", options);
+
+/**
+ * Get Grid Parameter Time Steps
+ *
+ * Get a grid parameter for multiple time steps, e.g. for animation
+ *
+ * The response is a binary stream of frames, one per time step, sent in order of completion rather than in the
+ * requested order. Each frame is prefixed by its byte length as a little endian uint32. A frame consists of the
+ * byte length of its header as a little endian uint32, a UTF-8 JSON header (Grid3dMappedPropertyFrameHeader)
+ * and the raw little endian property values referenced by the header.
+ *
+ * Property values are float32, with undefined integer values given as -1. There is one frame per unique
+ * requested time step. Failures before streaming starts give a regular error response, while a time step that
+ * fails after that gets a frame with error_message set and no property values.
+ *
+ * The response is not cached by the browser, since failed time steps may succeed on a later request.
+ */
+export const getGridParameterTimeStepsOptions = (options: Options<GetGridParameterTimeStepsData_api>) =>
+    queryOptions<
+        GetGridParameterTimeStepsResponse_api,
+        AxiosError<GetGridParameterTimeStepsError_api>,
+        GetGridParameterTimeStepsResponse_api,
+        ReturnType<typeof getGridParameterTimeStepsQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getGridParameterTimeSteps({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getGridParameterTimeStepsQueryKey(options),
+    });
+
 export const postGetPolylineIntersectionQueryKey = (options: Options<PostGetPolylineIntersectionData_api>) =>
     createQueryKey("postGetPolylineIntersection", options);
 
@@ -1978,6 +2029,9 @@ export const getSeismicSlicesQueryKey = (options: Options<GetSeismicSlicesData_a
  * Get Seismic Slices
  *
  * Get a seismic depth slice from a seismic cube.
+ *
+ * The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+ * given by max_abs_error of the returned arrays.
  */
 export const getSeismicSlicesOptions = (options: Options<GetSeismicSlicesData_api>) =>
     queryOptions<
@@ -2009,6 +2063,12 @@ export const postGetSeismicFenceQueryKey = (options: Options<PostGetSeismicFence
  * The fence data contains a set of traces perpendicular to the polyline, with one trace per (x, y)-point in polyline.
  * Each trace has equal number of samples, and is a set of sample values along the depth direction of the seismic cube.
  *
+ * If max_num_traces is given and the polyline has more points, the traces are taken at max_num_traces points evenly
+ * spaced by index along the polyline, including the first and last point.
+ *
+ * The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+ * given by max_abs_error of the returned array.
+ *
  * Returns:
  * A SeismicFenceData object with fence traces in encoded 1D array, metadata for trace array decoding and fence min/max depth.
  */
@@ -2039,6 +2099,12 @@ export const postGetSeismicFenceOptions = (options: Options<PostGetSeismicFenceD
  * The fence data contains a set of traces perpendicular to the polyline, with one trace per (x, y)-point in polyline.
  * Each trace has equal number of samples, and is a set of sample values along the depth direction of the seismic cube.
  *
+ * If max_num_traces is given and the polyline has more points, the traces are taken at max_num_traces points evenly
+ * spaced by index along the polyline, including the first and last point.
+ *
+ * The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+ * given by max_abs_error of the returned array.
+ *
  * Returns:
  * A SeismicFenceData object with fence traces in encoded 1D array, metadata for trace array decoding and fence min/max depth.
  */
@@ -2249,6 +2315,33 @@ export const getRftRealizationDataOptions = (options: Options<GetRftRealizationD
         queryKey: getRftRealizationDataQueryKey(options),
     });
 
+export const getRftRealizationDataForWellsQueryKey = (options: Options<GetRftRealizationDataForWellsData_api>) =>
+    createQueryKey("getRftRealizationDataForWells", options);
+
+/**
+ * Get Rft Realization Data For Wells
+ *
+ * Get a list of RFT data per realization for multiple wells and a given response, ordered by well.
+ */
+export const getRftRealizationDataForWellsOptions = (options: Options<GetRftRealizationDataForWellsData_api>) =>
+    queryOptions<
+        GetRftRealizationDataForWellsResponse_api,
+        AxiosError<GetRftRealizationDataForWellsError_api>,
+        GetRftRealizationDataForWellsResponse_api,
+        ReturnType<typeof getRftRealizationDataForWellsQueryKey>
+    >({
+        queryFn: async ({ queryKey, signal }) => {
+            const { data } = await getRftRealizationDataForWells({
+                ...options,
+                ...queryKey[0],
+                signal,
+                throwOnError: true,
+            });
+            return data;
+        },
+        queryKey: getRftRealizationDataForWellsQueryKey(options),
+    });
+
 export const getVfpTableNamesQueryKey = (options: Options<GetVfpTableNamesData_api>) =>
     createQueryKey("getVfpTableNames", options);
 
@@ -2586,6 +2679,8 @@ export const getSessionOptions = (options: Options<GetSessionData_api>) =>
  * - Recalculates the content hash if content changed
  * - Preserves ownership and creation metadata
  *
+ * If none of the provided fields differ from the stored session, nothing is written and the version is unchanged.
+ *
  * Returns the complete updated session.
  *
  * Only the session owner can update their sessions.
@@ -2985,9 +3080,13 @@ export const getSnapshotQueryKey = (options: Options<GetSnapshotData_api>) => cr
  * - Updates the "last visited" timestamp
  * - Creates an access log entry if this is your first visit
  *
- * This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+ * This allows you to see your viewing history in `/persistence/snapshot_access_logs`. Visits are written in
+ * batches in the background, so they may take a few seconds to show up in the access logs.
  *
  * Any user with the snapshot ID can access snapshots (they are shareable).
+ *
+ * Since snapshots are immutable, the response carries an ETag derived from the content hash. Clients that send
+ * a matching `If-None-Match` header get an empty 304 response, which still counts as a visit.
  */
 export const getSnapshotOptions = (options: Options<GetSnapshotData_api>) =>
     queryOptions<
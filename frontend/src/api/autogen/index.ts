@@ -42,6 +42,8 @@ export {
     getGridModelsInfoQueryKey,
     getGridParameterOptions,
     getGridParameterQueryKey,
+    getGridParameterTimeStepsOptions,
+    getGridParameterTimeStepsQueryKey,
     getGridSurfaceOptions,
     getGridSurfaceQueryKey,
     getHistoricalVectorDataOptions,
@@ -76,6 +78,8 @@ export {
     getRealizationSurfacesMetadataQueryKey,
     getRealizationsVectorDataOptions,
     getRealizationsVectorDataQueryKey,
+    getRftRealizationDataForWellsOptions,
+    getRftRealizationDataForWellsQueryKey,
     getRftRealizationDataOptions,
     getRftRealizationDataQueryKey,
     getRftTableDefinitionOptions,
@@ -197,6 +201,7 @@ export {
     getFieldScreens,
     getGridModelsInfo,
     getGridParameter,
+    getGridParameterTimeSteps,
     getGridSurface,
     getHistoricalVectorData,
     getInjectionData,
@@ -215,6 +220,7 @@ export {
     getRealizationSurfacesMetadata,
     getRealizationsVectorData,
     getRftRealizationData,
+    getRftRealizationDataForWells,
     getRftTableDefinition,
     getSeismicCubeMetaList,
     getSeismicSlices,
@@ -263,6 +269,8 @@ export {
     type AuthorizedCallbackRouteData_api,
     type AuthorizedCallbackRouteResponses_api,
     type B64FloatArray_api,
+    type B64IntArray_api,
+    type B64QuantizedFloatArray_api,
     type B64UintArray_api,
     type BodyPostGetAggregatedPerRealizationInplaceTableData_api,
     type BodyPostGetAggregatedStatisticalInplaceTableData_api,
@@ -384,6 +392,11 @@ export {
     type GetGridParameterErrors_api,
     type GetGridParameterResponse_api,
     type GetGridParameterResponses_api,
+    type GetGridParameterTimeStepsData_api,
+    type GetGridParameterTimeStepsError_api,
+    type GetGridParameterTimeStepsErrors_api,
+    type GetGridParameterTimeStepsResponse_api,
+    type GetGridParameterTimeStepsResponses_api,
     type GetGridSurfaceData_api,
     type GetGridSurfaceError_api,
     type GetGridSurfaceErrors_api,
@@ -472,6 +485,11 @@ export {
     type GetRftRealizationDataData_api,
     type GetRftRealizationDataError_api,
     type GetRftRealizationDataErrors_api,
+    type GetRftRealizationDataForWellsData_api,
+    type GetRftRealizationDataForWellsError_api,
+    type GetRftRealizationDataForWellsErrors_api,
+    type GetRftRealizationDataForWellsResponse_api,
+    type GetRftRealizationDataForWellsResponses_api,
     type GetRftRealizationDataResponse_api,
     type GetRftRealizationDataResponses_api,
     type GetRftTableDefinitionData_api,
@@ -751,6 +769,7 @@ export {
     type UpdateSessionResponses_api,
     type UserInfo_api,
     type ValidationError_api,
+    ValueEncoding_api,
     type VectorDescription_api,
     type VectorHistoricalData_api,
     type VectorRealizationData_api,
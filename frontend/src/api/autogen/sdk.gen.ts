@@ -61,6 +61,9 @@ import type {
     GetGridParameterData_api,
     GetGridParameterErrors_api,
     GetGridParameterResponses_api,
+    GetGridParameterTimeStepsData_api,
+    GetGridParameterTimeStepsErrors_api,
+    GetGridParameterTimeStepsResponses_api,
     GetGridSurfaceData_api,
     GetGridSurfaceErrors_api,
     GetGridSurfaceResponses_api,
@@ -114,6 +117,9 @@ import type {
     GetRealizationsVectorDataResponses_api,
     GetRftRealizationDataData_api,
     GetRftRealizationDataErrors_api,
+    GetRftRealizationDataForWellsData_api,
+    GetRftRealizationDataForWellsErrors_api,
+    GetRftRealizationDataForWellsResponses_api,
     GetRftRealizationDataResponses_api,
     GetRftTableDefinitionData_api,
     GetRftTableDefinitionErrors_api,
@@ -786,6 +792,11 @@ export const getGridSurface = <ThrowOnError extends boolean = false>(
  * Get Grid Parameter
  *
  * Get a grid parameter
+ *
+ * By default the property values are returned as float32. With the native_int encoding, discrete (integer) properties
+ * are returned as integers of the smallest possible size. The quantized encodings (uint16q, uint8q) apply to
+ * continuous properties and reduce the payload size at the cost of a bounded error, given by max_abs_error.
+ * In all cases undefined integer values are returned as -1.
  */
 export const getGridParameter = <ThrowOnError extends boolean = false>(
     options: Options<GetGridParameterData_api, ThrowOnError>,
@@ -796,6 +807,35 @@ export const getGridParameter = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Grid Parameter Time Steps
+ *
+ * Get a grid parameter for multiple time steps, e.g. for animation
+ *
+ * The response is a binary stream of frames, one per time step, sent in order of completion rather than in the
+ * requested order. Each frame is prefixed by its byte length as a little endian uint32. A frame consists of the
+ * byte length of its header as a little endian uint32, a UTF-8 JSON header (Grid3dMappedPropertyFrameHeader)
+ * and the raw little endian property values referenced by the header.
+ *
+ * Property values are float32, with undefined integer values given as -1. There is one frame per unique
+ * requested time step. Failures before streaming starts give a regular error response, while a time step that
+ * fails after that gets a frame with error_message set and no property values.
+ *
+ * The response is not cached by the browser, since failed time steps may succeed on a later request.
+ */
+export const getGridParameterTimeSteps = <ThrowOnError extends boolean = false>(
+    options: Options<GetGridParameterTimeStepsData_api, ThrowOnError>,
+) =>
+    (options.client ?? client).get<
+        GetGridParameterTimeStepsResponses_api,
+        GetGridParameterTimeStepsErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/grid3d/grid_parameter_time_steps",
+        ...options,
+    });
+
 /**
  * Post Get Polyline Intersection
  *
@@ -1129,6 +1169,9 @@ export const getSeismicCubeMetaList = <ThrowOnError extends boolean = false>(
  * Get Seismic Slices
  *
  * Get a seismic depth slice from a seismic cube.
+ *
+ * The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+ * given by max_abs_error of the returned arrays.
  */
 export const getSeismicSlices = <ThrowOnError extends boolean = false>(
     options: Options<GetSeismicSlicesData_api, ThrowOnError>,
@@ -1147,6 +1190,12 @@ export const getSeismicSlices = <ThrowOnError extends boolean = false>(
  * The fence data contains a set of traces perpendicular to the polyline, with one trace per (x, y)-point in polyline.
  * Each trace has equal number of samples, and is a set of sample values along the depth direction of the seismic cube.
  *
+ * If max_num_traces is given and the polyline has more points, the traces are taken at max_num_traces points evenly
+ * spaced by index along the polyline, including the first and last point.
+ *
+ * The quantized value encodings (uint16q, uint8q) reduce the payload size at the cost of a bounded error,
+ * given by max_abs_error of the returned array.
+ *
  * Returns:
  * A SeismicFenceData object with fence traces in encoded 1D array, metadata for trace array decoding and fence min/max depth.
  */
@@ -1257,6 +1306,24 @@ export const getRftRealizationData = <ThrowOnError extends boolean = false>(
         ...options,
     });
 
+/**
+ * Get Rft Realization Data For Wells
+ *
+ * Get a list of RFT data per realization for multiple wells and a given response, ordered by well.
+ */
+export const getRftRealizationDataForWells = <ThrowOnError extends boolean = false>(
+    options: Options<GetRftRealizationDataForWellsData_api, ThrowOnError>,
+) =>
+    (options.client ?? client).get<
+        GetRftRealizationDataForWellsResponses_api,
+        GetRftRealizationDataForWellsErrors_api,
+        ThrowOnError
+    >({
+        responseType: "json",
+        url: "/rft/rft_realization_data_for_wells",
+        ...options,
+    });
+
 /**
  * Get Vfp Table Names
  *
@@ -1395,6 +1462,8 @@ export const getSession = <ThrowOnError extends boolean = false>(options: Option
  * - Recalculates the content hash if content changed
  * - Preserves ownership and creation metadata
  *
+ * If none of the provided fields differ from the stored session, nothing is written and the version is unchanged.
+ *
  * Returns the complete updated session.
  *
  * Only the session owner can update their sessions.
@@ -1561,9 +1630,13 @@ export const deleteSnapshot = <ThrowOnError extends boolean = false>(
  * - Updates the "last visited" timestamp
  * - Creates an access log entry if this is your first visit
  *
- * This allows you to see your viewing history in `/persistence/snapshot_access_logs`.
+ * This allows you to see your viewing history in `/persistence/snapshot_access_logs`. Visits are written in
+ * batches in the background, so they may take a few seconds to show up in the access logs.
  *
  * Any user with the snapshot ID can access snapshots (they are shareable).
+ *
+ * Since snapshots are immutable, the response carries an ETag derived from the content hash. Clients that send
+ * a matching `If-None-Match` header get an empty 304 response, which still counts as a visit.
  */
 export const getSnapshot = <ThrowOnError extends boolean = false>(
     options: Options<GetSnapshotData_api, ThrowOnError>,
@@ -43,6 +43,55 @@ export type B64FloatArray_api = {
     data_b64str: string;
 };
 
+/**
+ * B64IntArray
+ */
+export type B64IntArray_api = {
+    /**
+     * Element Type
+     */
+    element_type: "int8" | "int16" | "int32";
+    /**
+     * Data B64Str
+     */
+    data_b64str: string;
+};
+
+/**
+ * B64QuantizedFloatArray
+ *
+ * Float array quantized to unsigned integers, decoded as: value = offset + scale * quantized_value
+ *
+ * The max value of the element type is reserved for undefined (non-finite) values, which decode to NaN.
+ * The absolute error of every decoded defined value is at most max_abs_error.
+ */
+export type B64QuantizedFloatArray_api = {
+    /**
+     * Element Type
+     */
+    element_type: "uint8" | "uint16";
+    /**
+     * Data B64Str
+     */
+    data_b64str: string;
+    /**
+     * Scale
+     */
+    scale: number;
+    /**
+     * Offset
+     */
+    offset: number;
+    /**
+     * Undefined Value
+     */
+    undefined_value: number;
+    /**
+     * Max Abs Error
+     */
+    max_abs_error: number;
+};
+
 /**
  * B64UintArray
  */
@@ -652,9 +701,17 @@ export type Grid3dDimensions_api = {
 
 /**
  * Grid3dGeometry
+ *
+ * The layout of polys_b64arr is given by poly_layout:
+ * - vtk: the vertex indices of each poly are prefixed by the poly's vertex count
+ * - quads: four vertex indices per poly without count prefix
  */
 export type Grid3dGeometry_api = {
     polys_b64arr: B64UintArray_api;
+    /**
+     * Poly Layout
+     */
+    poly_layout?: "vtk" | "quads";
     points_b64arr: B64FloatArray_api;
     poly_source_cell_indices_b64arr: B64UintArray_api;
     /**
@@ -713,7 +770,10 @@ export type Grid3dInfo_api = {
  * Grid3dMappedProperty
  */
 export type Grid3dMappedProperty_api = {
-    poly_props_b64arr: B64FloatArray_api;
+    /**
+     * Poly Props B64Arr
+     */
+    poly_props_b64arr: B64FloatArray_api | B64IntArray_api | B64QuantizedFloatArray_api;
     /**
      * Min Grid Prop Value
      */
@@ -1538,7 +1598,9 @@ export type SeismicCubeSpec_api = {
  *
  * `Properties:`
  * - `fence_traces_b64arr`: The fence trace array is base64 encoded 1D float array - where data is stored trace by trace.
- * - `num_traces`: The number of traces in the fence trace array. Equals the number of (x, y) coordinates in requested polyline.
+ * The array is quantized if a quantized value encoding is requested.
+ * - `num_traces`: The number of traces in the fence trace array. Equals the number of (x, y) coordinates in requested polyline,
+ * or the requested max number of traces if the polyline points are decimated.
  * - `num_samples_per_trace`: The number of samples in each trace.
  * - `min_fence_depth`: The minimum depth value of the fence.
  * - `max_fence_depth`: The maximum depth value of the fence.
@@ -1555,7 +1617,10 @@ export type SeismicCubeSpec_api = {
  * - VdsAxis: https://github.com/equinor/vds-slice/blob/ab6f39789bf3d3b59a8df14f1c4682d340dc0bf3/internal/core/core.go#L37-L55
  */
 export type SeismicFenceData_api = {
-    fence_traces_b64arr: B64FloatArray_api;
+    /**
+     * Fence Traces B64Arr
+     */
+    fence_traces_b64arr: B64FloatArray_api | B64QuantizedFloatArray_api;
     /**
      * Num Traces
      */
@@ -1618,6 +1683,7 @@ export enum SeismicRepresentation_api {
  *
  * `Properties:`
  * - `slice_traces_b64arr`: The slice trace array is base64 encoded 1D float array - where data is stored trace by trace.
+ * The array is quantized if a quantized value encoding is requested.
  * - `bbox_utm`: The bounding box of the slice in UTM coordinates.
  * - `u_min`: The minimum value of the u-axis.
  * - `u_max`: The maximum value of the u-axis.
@@ -1633,7 +1699,10 @@ export enum SeismicRepresentation_api {
  * Fence traces 1D array: [trace_1_sample_1, trace_1_sample_2, ..., trace_1_sample_n, ..., trace_m_sample_1, trace_m_sample_2, ..., trace_m_sample_n]
  */
 export type SeismicSliceData_api = {
-    slice_traces_b64arr: B64FloatArray_api;
+    /**
+     * Slice Traces B64Arr
+     */
+    slice_traces_b64arr: B64FloatArray_api | B64QuantizedFloatArray_api;
     /**
      * Bbox Utm
      */
@@ -2005,7 +2074,10 @@ export type SurfaceDataFloat_api = {
      * Value Max
      */
     value_max: number;
-    values_b64arr: B64FloatArray_api;
+    /**
+     * Values B64Arr
+     */
+    values_b64arr: B64FloatArray_api | B64QuantizedFloatArray_api;
 };
 
 /**
@@ -2335,6 +2407,23 @@ export type ValidationError_api = {
     };
 };
 
+/**
+ * ValueEncoding
+ *
+ * Encoding options for value arrays in responses
+ *
+ * * float32: 32bit float values, the default
+ * * uint16q: float values quantized to 16 bit, lossy
+ * * uint8q: float values quantized to 8 bit, lossy
+ * * native_int: integer values are kept as integers of the smallest possible size, float values are sent as float32
+ */
+export enum ValueEncoding_api {
+    FLOAT32 = "float32",
+    UINT16Q = "uint16q",
+    UINT8Q = "uint8q",
+    NATIVE_INT = "native_int",
+}
+
 /**
  * VectorDescription
  */
@@ -4179,6 +4268,10 @@ export type GetSurfaceDataData_api = {
          * Format of binary data in the response
          */
         data_format?: "float" | "png";
+        /**
+         * Encoding of the values if data format is *float*, the quantized encodings are lossy
+         */
+        value_encoding?: ValueEncoding_api;
         /**
          * Resample To Def Str
          *
@@ -4269,6 +4362,10 @@ export type GetStatisticalSurfaceDataHybridData_api = {
          * Format of binary data in the response
          */
         data_format?: "float" | "png";
+        /**
+         * Encoding of the values if data format is *float*, the quantized encodings are lossy
+         */
+        value_encoding?: ValueEncoding_api;
         /**
          * Resample To Def Str
          *
@@ -4699,6 +4796,12 @@ export type GetGridSurfaceData_api = {
          * Max k index
          */
         k_max?: number;
+        /**
+         * Poly Layout
+         *
+         * Layout of the polys array, see Grid3dGeometry
+         */
+        poly_layout?: "vtk" | "quads";
         zCacheBust?: string;
     };
     url: "/grid3d/grid_surface";
@@ -4798,6 +4901,10 @@ export type GetGridParameterData_api = {
          * Max k index
          */
         k_max?: number;
+        /**
+         * Encoding of the property values
+         */
+        value_encoding?: ValueEncoding_api;
         zCacheBust?: string;
     };
     url: "/grid3d/grid_parameter";
@@ -4821,6 +4928,105 @@ export type GetGridParameterResponses_api = {
 
 export type GetGridParameterResponse_api = GetGridParameterResponses_api[keyof GetGridParameterResponses_api];
 
+export type GetGridParameterTimeStepsData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Grid Name
+         *
+         * Grid name
+         */
+        grid_name: string;
+        /**
+         * Parameter Name
+         *
+         * Grid parameter
+         */
+        parameter_name: string;
+        /**
+         * Realization Num
+         *
+         * Realization
+         */
+        realization_num: number;
+        /**
+         * Parameter Time Or Interval Strs
+         *
+         * Time points or time interval strings
+         */
+        parameter_time_or_interval_strs: Array<string>;
+        /**
+         * I Min
+         *
+         * Min i index
+         */
+        i_min?: number;
+        /**
+         * I Max
+         *
+         * Max i index
+         */
+        i_max?: number;
+        /**
+         * J Min
+         *
+         * Min j index
+         */
+        j_min?: number;
+        /**
+         * J Max
+         *
+         * Max j index
+         */
+        j_max?: number;
+        /**
+         * K Min
+         *
+         * Min k index
+         */
+        k_min?: number;
+        /**
+         * K Max
+         *
+         * Max k index
+         */
+        k_max?: number;
+        zCacheBust?: string;
+    };
+    url: "/grid3d/grid_parameter_time_steps";
+};
+
+export type GetGridParameterTimeStepsErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetGridParameterTimeStepsError_api = GetGridParameterTimeStepsErrors_api[keyof GetGridParameterTimeStepsErrors_api];
+
+export type GetGridParameterTimeStepsResponses_api = {
+    /**
+     * Successful Response
+     */
+    200: unknown;
+};
+
+export type GetGridParameterTimeStepsResponse_api = GetGridParameterTimeStepsResponses_api[keyof GetGridParameterTimeStepsResponses_api];
+
 export type PostGetPolylineIntersectionData_api = {
     body: BodyPostGetPolylineIntersection_api;
     path?: never;
@@ -5737,6 +5943,10 @@ export type GetSeismicSlicesData_api = {
          * Depth slice number
          */
         depth_slice_number: number;
+        /**
+         * Encoding of the slice trace values
+         */
+        value_encoding?: ValueEncoding_api;
         zCacheBust?: string;
     };
     url: "/seismic/get_seismic_slices/";
@@ -5800,6 +6010,16 @@ export type PostGetSeismicFenceData_api = {
          * Seismic representation
          */
         representation: SeismicRepresentation_api;
+        /**
+         * Max Num Traces
+         *
+         * Optional max number of traces, decimates the polyline points if exceeded
+         */
+        max_num_traces?: number | null;
+        /**
+         * Encoding of the fence trace values
+         */
+        value_encoding?: ValueEncoding_api;
         zCacheBust?: string;
     };
     url: "/seismic/get_seismic_fence/";
@@ -6132,6 +6352,73 @@ export type GetRftRealizationDataResponses_api = {
 export type GetRftRealizationDataResponse_api =
     GetRftRealizationDataResponses_api[keyof GetRftRealizationDataResponses_api];
 
+export type GetRftRealizationDataForWellsData_api = {
+    body?: never;
+    path?: never;
+    query: {
+        /**
+         * Case Uuid
+         *
+         * Sumo case uuid
+         */
+        case_uuid: string;
+        /**
+         * Ensemble Name
+         *
+         * Ensemble name
+         */
+        ensemble_name: string;
+        /**
+         * Well Names
+         *
+         * Well names
+         */
+        well_names: Array<string>;
+        /**
+         * Response Name
+         *
+         * Response name
+         */
+        response_name: string;
+        /**
+         * Timestamps Utc Ms
+         *
+         * Timestamps utc ms
+         */
+        timestamps_utc_ms?: Array<number> | null;
+        /**
+         * Realizations Encoded As Uint List Str
+         *
+         * Optional list of realizations encoded as string to include. If not specified, all realizations will be included.
+         */
+        realizations_encoded_as_uint_list_str?: string | null;
+        zCacheBust?: string;
+    };
+    url: "/rft/rft_realization_data_for_wells";
+};
+
+export type GetRftRealizationDataForWellsErrors_api = {
+    /**
+     * Validation Error
+     */
+    422: HTTPValidationError_api;
+};
+
+export type GetRftRealizationDataForWellsError_api =
+    GetRftRealizationDataForWellsErrors_api[keyof GetRftRealizationDataForWellsErrors_api];
+
+export type GetRftRealizationDataForWellsResponses_api = {
+    /**
+     * Response Get Rft Realization Data For Wells
+     *
+     * Successful Response
+     */
+    200: Array<RftRealizationData_api>;
+};
+
+export type GetRftRealizationDataForWellsResponse_api =
+    GetRftRealizationDataForWellsResponses_api[keyof GetRftRealizationDataForWellsResponses_api];
+
 export type GetVfpTableNamesData_api = {
     body?: never;
     path?: never;
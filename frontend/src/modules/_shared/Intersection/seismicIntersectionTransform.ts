@@ -1,6 +1,6 @@
 import type { SeismicFenceData_api } from "@api";
 
-import { b64DecodeFloatArrayToFloat32 } from "../base64";
+import { b64DecodeValueArrayToFloat32 } from "../base64";
 
 /**
  * The transformed fence data, with the fence traces decoded as a Float32Array.
@@ -19,7 +19,7 @@ export type SeismicFenceData_trans = Omit<SeismicFenceData_api, "fence_traces_b6
 export function transformSeismicFenceData(apiData: SeismicFenceData_api): SeismicFenceData_trans {
     const { fence_traces_b64arr, ...untransformedData } = apiData;
 
-    const dataFloat32Arr = b64DecodeFloatArrayToFloat32(fence_traces_b64arr);
+    const dataFloat32Arr = b64DecodeValueArrayToFloat32(fence_traces_b64arr);
     return {
         ...untransformedData,
         fenceTracesFloat32Arr: dataFloat32Arr,
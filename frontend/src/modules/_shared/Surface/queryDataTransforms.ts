@@ -1,5 +1,5 @@
 import type { SurfaceDataFloat_api, SurfaceDataPng_api } from "@api";
-import { b64DecodeFloatArrayToFloat32 } from "@modules_shared/base64";
+import { b64DecodeValueArrayToFloat32 } from "@modules_shared/base64";
 
 // Data structure for transformed data
 // Remove the base64 encoded data and replace with a Float32Array
@@ -14,7 +14,7 @@ export function transformSurfaceData(
 
     if ("values_b64arr" in apiData) {
         const { values_b64arr, ...untransformedData } = apiData;
-        const dataFloat32Arr = b64DecodeFloatArrayToFloat32(values_b64arr);
+        const dataFloat32Arr = b64DecodeValueArrayToFloat32(values_b64arr);
 
         console.debug(`transformSurfaceData() took: ${(performance.now() - startTS).toFixed(1)}ms`);
 
@@ -1,4 +1,4 @@
-import type { B64FloatArray_api, B64UintArray_api } from "@api";
+import type { B64FloatArray_api, B64IntArray_api, B64QuantizedFloatArray_api, B64UintArray_api } from "@api";
 
 export function b64DecodeUintArray(
     base64Arr: B64UintArray_api,
@@ -67,6 +67,59 @@ export function b64DecodeFloatArrayToFloat32(base64Arr: B64FloatArray_api): Floa
     }
 }
 
+export function b64DecodeIntArray(base64Arr: B64IntArray_api): Int8Array | Int16Array | Int32Array {
+    const arrayBuffer = base64StringToArrayBuffer(base64Arr.data_b64str);
+    switch (base64Arr.element_type) {
+        case "int8":
+            return new Int8Array(arrayBuffer);
+        case "int16":
+            return new Int16Array(arrayBuffer);
+        case "int32":
+            return new Int32Array(arrayBuffer);
+        default:
+            throw new Error(`Unknown element_type: ${base64Arr.element_type}`);
+    }
+}
+
+// Decodes as value = offset + scale * quantized_value, with the undefined value decoded to NaN
+export function b64DecodeQuantizedFloatArrayToFloat32(base64Arr: B64QuantizedFloatArray_api): Float32Array {
+    const arrayBuffer = base64StringToArrayBuffer(base64Arr.data_b64str);
+
+    let quantizedArr: Uint8Array | Uint16Array;
+    switch (base64Arr.element_type) {
+        case "uint8":
+            quantizedArr = new Uint8Array(arrayBuffer);
+            break;
+        case "uint16":
+            quantizedArr = new Uint16Array(arrayBuffer);
+            break;
+        default:
+            throw new Error(`Unknown element_type: ${base64Arr.element_type}`);
+    }
+
+    const { scale, offset, undefined_value } = base64Arr;
+    const float32Arr = new Float32Array(quantizedArr.length);
+    for (let i = 0; i < quantizedArr.length; i++) {
+        const quantizedValue = quantizedArr[i];
+        float32Arr[i] = quantizedValue === undefined_value ? NaN : offset + scale * quantizedValue;
+    }
+
+    return float32Arr;
+}
+
+// Decodes any of the value array encodings that the backend may return, see ValueEncoding_api
+export function b64DecodeValueArrayToFloat32(
+    base64Arr: B64FloatArray_api | B64IntArray_api | B64QuantizedFloatArray_api,
+): Float32Array {
+    if ("scale" in base64Arr) {
+        return b64DecodeQuantizedFloatArrayToFloat32(base64Arr);
+    }
+    if (base64Arr.element_type === "float32" || base64Arr.element_type === "float64") {
+        return b64DecodeFloatArrayToFloat32(base64Arr);
+    }
+    return new Float32Array(b64DecodeIntArray(base64Arr));
+}
+
 function base64StringToArrayBuffer(base64Str: string): ArrayBuffer {
     const binString = atob(base64Str);
 
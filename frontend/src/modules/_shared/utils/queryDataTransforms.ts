@@ -8,6 +8,7 @@ import {
     b64DecodeFloatArrayToFloat32,
     b64DecodeUintArrayToUint32,
     b64DecodeUintArrayToUint32OrLess,
+    b64DecodeValueArrayToFloat32,
 } from "@modules_shared/base64";
 
 // Data structure for the transformed GridSurface data
@@ -47,7 +48,7 @@ export function transformGridMappedProperty(apiData: Grid3dMappedProperty_api):
     const startTS = performance.now();
 
     const { poly_props_b64arr, ...untransformedData } = apiData;
-    const polyPropsFloat32Arr = b64DecodeFloatArrayToFloat32(poly_props_b64arr);
+    const polyPropsFloat32Arr = b64DecodeValueArrayToFloat32(poly_props_b64arr);
 
     console.debug(`transformGridProperty() took: ${(performance.now() - startTS).toFixed(1)}ms`);
 
@@ -0,0 +1,78 @@
+import { describe, it, expect } from "vitest";
+
+import { b64DecodeQuantizedFloatArrayToFloat32, b64DecodeValueArrayToFloat32 } from "@modules/_shared/base64";
+
+function typedArrayToBase64(typedArray: ArrayBufferView): string {
+    const bytes = new Uint8Array(typedArray.buffer, typedArray.byteOffset, typedArray.byteLength);
+    let binString = "";
+    for (const byte of bytes) {
+        binString += String.fromCharCode(byte);
+    }
+    return btoa(binString);
+}
+
+describe("base64", () => {
+    describe("b64DecodeQuantizedFloatArrayToFloat32", () => {
+        it("should decode quantized values with scale and offset", () => {
+            const decoded = b64DecodeQuantizedFloatArrayToFloat32({
+                element_type: "uint16",
+                data_b64str: typedArrayToBase64(new Uint16Array([0, 1, 10, 65534])),
+                scale: 0.5,
+                offset: -2,
+                undefined_value: 65535,
+                max_abs_error: 0.25,
+            });
+
+            expect(Array.from(decoded)).toEqual([-2, -1.5, 3, 32765]);
+        });
+
+        it("should decode the undefined value to NaN", () => {
+            const decoded = b64DecodeQuantizedFloatArrayToFloat32({
+                element_type: "uint8",
+                data_b64str: typedArrayToBase64(new Uint8Array([255, 2, 255])),
+                scale: 1,
+                offset: 100,
+                undefined_value: 255,
+                max_abs_error: 0.5,
+            });
+
+            expect(decoded[0]).toBeNaN();
+            expect(decoded[1]).toBe(102);
+            expect(decoded[2]).toBeNaN();
+        });
+    });
+
+    describe("b64DecodeValueArrayToFloat32", () => {
+        it("should return float32 arrays as is", () => {
+            const decoded = b64DecodeValueArrayToFloat32({
+                element_type: "float32",
+                data_b64str: typedArrayToBase64(new Float32Array([1.5, -2.25])),
+            });
+
+            expect(decoded).toBeInstanceOf(Float32Array);
+            expect(Array.from(decoded)).toEqual([1.5, -2.25]);
+        });
+
+        it("should convert integer arrays to float32", () => {
+            const decoded = b64DecodeValueArrayToFloat32({
+                element_type: "int16",
+                data_b64str: typedArrayToBase64(new Int16Array([-1, 0, 32767])),
+            });
+
+            expect(Array.from(decoded)).toEqual([-1, 0, 32767]);
+        });
+
+        it("should dequantize quantized arrays", () => {
+            const decoded = b64DecodeValueArrayToFloat32({
+                element_type: "uint8",
+                data_b64str: typedArrayToBase64(new Uint8Array([0, 4])),
+                scale: 0.25,
+                offset: 1,
+                undefined_value: 255,
+                max_abs_error: 0.125,
+            });
+
+            expect(Array.from(decoded)).toEqual([1, 2]);
+        });
+    });
+});